@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.city.models import Building, BuildingType, Terrain, Tile
+from apps.city.models import Building, BuildingType, CityStats, Terrain, Tile
 
 
 @admin.register(Tile)
@@ -26,3 +26,10 @@ class BuildingTypeAdmin(admin.ModelAdmin):
     list_display = ("name", "is_country", "is_city", "is_house", "is_wall", "is_unique")
     list_filter = ("is_country", "is_city", "is_house", "is_wall", "is_unique")
     inlines = (BuildingInline,)
+
+
+@admin.register(CityStats)
+class CityStatsAdmin(admin.ModelAdmin):
+    list_display = ("savegame", "housing_space", "taxes", "maintenance_costs", "prestige", "defense")
+    list_select_related = ("savegame",)
+    readonly_fields = ("defense_map_revision",)
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CityConfig(AppConfig):
     name = "apps.city"
+
+    def ready(self) -> None:
+        # Register signal receivers
+        from apps.city import signals  # noqa: F401
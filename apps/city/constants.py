@@ -8,3 +8,6 @@ INITIAL_COUNTRY_BUILDINGS = 3
 
 # Wall hitpoints
 WALL_DECAY_PER_ROUND = 10
+
+# Maximum number of map revisions a client may lag behind to receive only the changed tiles instead of the whole map
+MAP_DELTA_MAX_REVISIONS = 50
@@ -0,0 +1,15 @@
+from apps.city.models import Tile
+from apps.city.services.wall.damage import WallDamageService
+from apps.savegame.models import Savegame
+
+
+class DamageWalls:
+    def __init__(self, *, tiles: list[Tile], damage: int):
+        self.tiles = tiles
+        self.damage = damage
+
+    def process(self, *, savegame: Savegame | None = None) -> None:
+        if not self.tiles:
+            return
+
+        WallDamageService(savegame=savegame or self.tiles[0].savegame, damage=self.damage, tiles=self.tiles).process()
@@ -1,4 +1,6 @@
-from apps.city.models import BuildingType, Tile
+from apps.city.models import BuildingType, CityStats, Tile
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.savegame.models import Savegame
 
 
 class RemoveBuilding:
@@ -10,7 +12,13 @@ class RemoveBuilding:
     def process(self, *, savegame=None):
         # Replace the building with ruins instead of removing it entirely
         # This ensures that damaged buildings leave ruins that need to be demolished
-        ruins_type = BuildingType.objects.get(type=BuildingType.Type.RUINS)
-        ruins = ruins_type.buildings.first()
+        catalog = get_game_catalog()
+        if catalog.ruins_building_type is None:
+            raise BuildingType.DoesNotExist("No RUINS BuildingType found. Check that fixtures are loaded.")
+        ruins = catalog.ruins_building
+        old_building = self.tile.building
         self.tile.building = ruins
         self.tile.save()
+        savegame = savegame or self.tile.savegame
+        Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[self.tile.id])
+        CityStats.objects.apply_building_change(savegame=savegame, old_building=old_building, new_building=ruins)
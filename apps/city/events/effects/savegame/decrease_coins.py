@@ -9,4 +9,3 @@ class DecreaseCoins:
 
     def process(self, *, savegame: Savegame):
         savegame.coins -= self.coins
-        savegame.save()
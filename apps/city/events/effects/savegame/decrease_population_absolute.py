@@ -9,4 +9,3 @@ class DecreasePopulationAbsolute:
 
     def process(self, *, savegame: Savegame):
         savegame.population = max(savegame.population - self.lost_population, 0)
-        savegame.save()
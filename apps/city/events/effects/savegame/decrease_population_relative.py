@@ -9,4 +9,3 @@ class DecreasePopulationRelative:
 
     def process(self, *, savegame: Savegame):
         savegame.population = max(round(savegame.population * (1 - self.lost_population)), 0)
-        savegame.save()
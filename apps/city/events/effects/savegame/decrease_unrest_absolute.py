@@ -9,4 +9,3 @@ class DecreaseUnrestAbsolute:
 
     def process(self, *, savegame: Savegame):
         savegame.unrest = max(savegame.unrest - self.lost_unrest, 0)
-        savegame.save()
@@ -9,4 +9,3 @@ class IncreaseCoins:
 
     def process(self, *, savegame: Savegame):
         savegame.coins += self.coins
-        savegame.save()
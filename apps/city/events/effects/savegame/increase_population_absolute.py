@@ -1,4 +1,4 @@
-from apps.city.services.building.housing import BuildingHousingService
+from apps.city.selectors.city_stats import get_city_stats
 from apps.savegame.models import Savegame
 
 
@@ -9,6 +9,5 @@ class IncreasePopulationAbsolute:
         self.new_population = new_population
 
     def process(self, *, savegame: Savegame):
-        max_population_housing = BuildingHousingService(savegame=savegame).calculate_max_space()
+        max_population_housing = get_city_stats(savegame=savegame).housing_space
         savegame.population = min(savegame.population + self.new_population, max_population_housing)
-        savegame.save()
@@ -9,4 +9,3 @@ class IncreaseUnrestAbsolute:
 
     def process(self, *, savegame: Savegame):
         savegame.unrest = min(savegame.unrest + self.additional_unrest, 100)
-        savegame.save()
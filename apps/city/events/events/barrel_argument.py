@@ -1,5 +1,6 @@
 from django.contrib import messages
 
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -9,11 +10,12 @@ class Event(BaseEvent):
     LEVEL = messages.INFO
     TITLE = "The Barrel Argument"
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
 
-    def get_probability(self) -> int | float:
-        return super().get_probability() if self.savegame.population > 0 else 0
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        return super().get_probability(context=context) if context.savegame.population > 0 else 0
 
     def get_verbose_text(self) -> str:
         return (
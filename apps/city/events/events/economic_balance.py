@@ -2,9 +2,9 @@ from django.contrib import messages
 
 from apps.city.events.effects.savegame.decrease_coins import DecreaseCoins
 from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
-from apps.savegame.selectors.savegame import get_balance_data
 
 
 class Event(BaseEvent):
@@ -16,16 +16,18 @@ class Event(BaseEvent):
     taxes: int
     maintenance: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
-        balance_data = get_balance_data(savegame=savegame)
-        self.balance = balance_data["balance"]
-        self.taxes = balance_data["taxes"]
-        self.maintenance = balance_data["maintenance"]
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
+        city_stats = self.context.city_stats
+        self.taxes = city_stats.taxes
+        self.maintenance = city_stats.maintenance_costs
+        self.balance = self.taxes - self.maintenance
 
-    def get_probability(self) -> int | float:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
         # Only trigger if there's a non-zero balance
-        return super().get_probability() if self.balance != 0 else 0
+        city_stats = context.city_stats
+        return super().get_probability(context=context) if city_stats.taxes != city_stats.maintenance_costs else 0
 
     def _prepare_effect_adjust_coins(self) -> IncreaseCoins | DecreaseCoins | None:
         if self.balance > 0:
@@ -1,10 +1,9 @@
-import random
-
 from django.contrib import messages
 
 from apps.city.events.effects.building.remove_building import RemoveBuilding
 from apps.city.events.effects.savegame.decrease_population_absolute import DecreasePopulationAbsolute
 from apps.city.models import Tile
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -18,15 +17,16 @@ class Event(BaseEvent):
     lost_population: int
     affected_tile: Tile
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_population = self.savegame.population
 
-        self.lost_population = random.randint(10, 50)
-        self.affected_tile = self.savegame.tiles.filter(building__building_type__is_house=True).first()
+        self.lost_population = self.context.rng.randint(10, 50)
+        self.affected_tile = next(iter(self.context.house_tiles), None)
 
-    def get_probability(self) -> int | float:
-        return super().get_probability() if self.savegame.population > 0 else 0
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        return super().get_probability(context=context) if context.savegame.population > 0 else 0
 
     def _prepare_effect_decrease_population(self) -> DecreasePopulationAbsolute:
         return DecreasePopulationAbsolute(lost_population=self.lost_population)
@@ -37,7 +37,6 @@ class Event(BaseEvent):
         return None
 
     def get_verbose_text(self) -> str:
-        self.savegame.refresh_from_db()
         message = (
             f"Due to general neglect, a fire raged throughout the city, killing "
             f"{self.initial_population - self.savegame.population} citizens."
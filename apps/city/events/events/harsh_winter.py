@@ -1,9 +1,8 @@
-import random
-
 from django.contrib import messages
 
-from apps.city.events.effects.building.damage_wall import DamageWall
+from apps.city.events.effects.building.damage_walls import DamageWalls
 from apps.city.models import Tile
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -16,21 +15,19 @@ class Event(BaseEvent):
     wall_tiles: list[Tile]
     damage: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
-        self.damage = random.randint(15, 20)
-        self.wall_tiles = list(
-            self.savegame.tiles.filter(building__building_type__is_wall=True)
-            .exclude(wall_hitpoints=None)
-            .select_related("building", "building__building_type")
-        )
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
+        self.damage = self.context.rng.randint(15, 20)
+        self.wall_tiles = [tile for tile in self.context.wall_tiles if tile.wall_hitpoints is not None]
 
-    def get_probability(self) -> int | float:
-        wall_tiles_exist = self.savegame.tiles.filter(building__building_type__is_wall=True).exists()
-        return super().get_probability() if wall_tiles_exist else 0
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        return super().get_probability(context=context) if context.wall_tiles else 0
 
     def get_effects(self) -> list:
-        return [DamageWall(tile=tile, damage=self.damage) for tile in self.wall_tiles]
+        if not self.wall_tiles:
+            return []
+        return [DamageWalls(tiles=self.wall_tiles, damage=self.damage)]
 
     def get_verbose_text(self) -> str:
         count = len(self.wall_tiles)
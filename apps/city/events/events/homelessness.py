@@ -1,9 +1,7 @@
-import random
-
 from django.contrib import messages
 
 from apps.city.events.effects.savegame.increase_unrest_absolute import IncreaseUnrestAbsolute
-from apps.city.services.building.housing import BuildingHousingService
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -15,16 +13,16 @@ class Event(BaseEvent):
 
     initial_unrest: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_unrest = self.savegame.unrest
-        self.additional_unrest = random.randint(5, 8)
+        self.additional_unrest = self.context.rng.randint(5, 8)
 
-    def get_probability(self) -> int | float:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
         return (
-            super().get_probability()
-            if self.savegame.population > BuildingHousingService(savegame=self.savegame).calculate_max_space()
-            and self.savegame.unrest < 100
+            super().get_probability(context=context)
+            if context.savegame.population > context.city_stats.housing_space and context.savegame.unrest < 100
             else 0
         )
 
@@ -32,7 +30,6 @@ class Event(BaseEvent):
         return IncreaseUnrestAbsolute(additional_unrest=self.additional_unrest)
 
     def get_verbose_text(self) -> str:
-        self.savegame.refresh_from_db()
         return (
             f"Beggars and homeless folk are crowding the streets. The situation grows tenser by the day. The citys "
             f"unrest increased by {self.savegame.unrest - self.initial_unrest}%."
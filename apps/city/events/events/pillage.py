@@ -1,5 +1,3 @@
-import random
-
 from django.contrib import messages
 from django.template.defaultfilters import pluralize
 
@@ -7,6 +5,7 @@ from apps.city.events.effects.building.remove_building import RemoveBuilding
 from apps.city.events.effects.savegame.decrease_coins import DecreaseCoins
 from apps.city.events.effects.savegame.decrease_population_absolute import DecreasePopulationAbsolute
 from apps.city.models import Tile
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -22,44 +21,39 @@ class Event(BaseEvent):
     affected_tiles: list[Tile]
     destroyed_building_count: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_coins = self.savegame.coins
 
         # Lose between 10-30% of current coins, minimum 50
-        loss_percentage = random.randint(10, 30) / 100
+        loss_percentage = self.context.rng.randint(10, 30) / 100
         self.lost_coins = max(int(self.savegame.coins * loss_percentage), 50)
 
         # Kill between 5-15% of population, minimum 5
-        population_loss_percentage = random.randint(5, 15) / 100
+        population_loss_percentage = self.context.rng.randint(5, 15) / 100
         self.lost_population = max(int(self.savegame.population * population_loss_percentage), 5)
 
         # Calculate how many buildings to destroy based on total buildings
         # Destroy 10-25% of city buildings, minimum 1, maximum 5
         # Only target pure city buildings (exclude walls, country buildings, unique buildings)
-        eligible_tiles = (
-            self.savegame.tiles.filter(building__isnull=False)
-            .filter(building__building_type__is_city=True)
-            .exclude(building__building_type__is_wall=True)
-            .exclude(building__building_type__is_country=True)
-            .exclude(building__building_type__is_unique=True)
-        )
-        total_eligible_buildings = eligible_tiles.count()
+        eligible_tiles = self.context.city_building_tiles
+        total_eligible_buildings = len(eligible_tiles)
 
         if total_eligible_buildings > 0:
-            destruction_percentage = random.randint(10, 25) / 100
+            destruction_percentage = self.context.rng.randint(10, 25) / 100
             buildings_to_destroy = max(1, min(5, int(total_eligible_buildings * destruction_percentage)))
         else:
             buildings_to_destroy = 0
 
         # Select random city buildings to destroy
-        self.affected_tiles = list(eligible_tiles.order_by("?")[:buildings_to_destroy])
+        self.affected_tiles = self.context.rng.sample(eligible_tiles, buildings_to_destroy)
 
         self.destroyed_building_count = len(self.affected_tiles)
 
-    def get_probability(self) -> int | float:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
         # Only occurs when city is not enclosed by walls
-        return super().get_probability() if not self.savegame.is_enclosed else 0
+        return super().get_probability(context=context) if not context.savegame.is_enclosed else 0
 
     def _prepare_effect_decrease_coins(self) -> DecreaseCoins:
         return DecreaseCoins(coins=self.lost_coins)
@@ -80,7 +74,6 @@ class Event(BaseEvent):
         return effects
 
     def get_verbose_text(self) -> str:
-        self.savegame.refresh_from_db()
         message = (
             f"Without a protective wall, raiders pillaged the city! "
             f"They stole {self.initial_coins - self.savegame.coins} coins and killed "
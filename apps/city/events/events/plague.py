@@ -1,8 +1,7 @@
-import random
-
 from django.contrib import messages
 
 from apps.city.events.effects.savegame.decrease_population_relative import DecreasePopulationRelative
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -14,12 +13,13 @@ class Event(BaseEvent):
 
     lost_population_percentage: float
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
-        self.lost_population_percentage = random.randint(10, 25) / 100
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
+        self.lost_population_percentage = self.context.rng.randint(10, 25) / 100
 
-    def get_probability(self) -> int | float:
-        return super().get_probability() if self.savegame.population > 0 else 0
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        return super().get_probability(context=context) if context.savegame.population > 0 else 0
 
     def get_effects(self) -> tuple[DecreasePopulationRelative]:
         return (DecreasePopulationRelative(lost_population_percentage=self.lost_population_percentage),)
@@ -3,7 +3,7 @@ from math import ceil
 from django.contrib import messages
 
 from apps.city.events.effects.savegame.increase_population_absolute import IncreasePopulationAbsolute
-from apps.city.services.building.housing import BuildingHousingService
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -17,15 +17,16 @@ class Event(BaseEvent):
 
     new_population: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_population = self.savegame.population
         self.new_population = max(ceil(self.savegame.population * self.YEARLY_POP_INCREASE_FACTOR), 1)
 
-    def get_probability(self) -> int | float:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
         return (
-            super().get_probability()
-            if self.initial_population < BuildingHousingService(savegame=self.savegame).calculate_max_space()
+            super().get_probability(context=context)
+            if context.savegame.population < context.city_stats.housing_space
             else 0
         )
 
@@ -1,9 +1,8 @@
-import random
-
 from django.contrib import messages
 
 from apps.city.events.effects.savegame.decrease_coins import DecreaseCoins
 from apps.city.events.effects.savegame.decrease_population_absolute import DecreasePopulationAbsolute
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -18,18 +17,19 @@ class Event(BaseEvent):
     lost_population: int
     lost_coins: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_population = self.savegame.population
         self.initial_coins = self.savegame.coins
-        self.lost_population = random.randint(1, 5)
-        self.lost_coins = random.randint(10, 30)
+        self.lost_population = self.context.rng.randint(1, 5)
+        self.lost_coins = self.context.rng.randint(10, 30)
 
-    def get_probability(self) -> int | float:
-        if self.savegame.population > 0 and 25 <= self.savegame.unrest < 75:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        if context.savegame.population > 0 and 25 <= context.savegame.unrest < 75:
             # Scale probability based on unrest level (0% at unrest 25, 100% at unrest 74)
-            unrest_factor = (self.savegame.unrest - 25) / 50
-            return super().get_probability() * unrest_factor
+            unrest_factor = (context.savegame.unrest - 25) / 50
+            return super().get_probability(context=context) * unrest_factor
         return 0
 
     def _prepare_effect_decrease_population(self) -> DecreasePopulationAbsolute:
@@ -39,7 +39,6 @@ class Event(BaseEvent):
         return DecreaseCoins(coins=self.lost_coins)
 
     def get_verbose_text(self) -> str:
-        self.savegame.refresh_from_db()
         population_loss = self.initial_population - self.savegame.population
         coins_loss = self.initial_coins - self.savegame.coins
 
@@ -1,4 +1,3 @@
-import random
 from math import ceil
 
 from django.contrib import messages
@@ -6,6 +5,7 @@ from django.contrib import messages
 from apps.city.events.effects.building.remove_building import RemoveBuilding
 from apps.city.events.effects.savegame.decrease_population_absolute import DecreasePopulationAbsolute
 from apps.city.models import Tile
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -19,28 +19,24 @@ class Event(BaseEvent):
     lost_population: int
     demolished_buildings_count: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.initial_population = self.savegame.population
-        self.lost_population = ceil((random.randint(5, 10) / 100) * self.initial_population)
-        self.demolished_buildings_count = random.randint(0, 2)
+        self.lost_population = ceil((self.context.rng.randint(5, 10) / 100) * self.initial_population)
+        self.demolished_buildings_count = self.context.rng.randint(0, 2)
         self.affected_tiles = self._get_affected_tiles()
 
-    def get_probability(self) -> int | float:
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
         return (
-            super().get_probability() * self.savegame.unrest / 100
-            if self.savegame.population > 0 and self.savegame.unrest >= 75
+            super().get_probability(context=context) * context.savegame.unrest / 100
+            if context.savegame.population > 0 and context.savegame.unrest >= 75
             else 0
         )
 
     def _get_affected_tiles(self) -> list[Tile]:
         """Get list of tiles with non-unique buildings that can be demolished."""
-        tiles = list(
-            self.savegame.tiles.filter(building__isnull=False, building__building_type__is_unique=False)[
-                : self.demolished_buildings_count
-            ]
-        )
-        return tiles
+        return self.context.non_unique_building_tiles[: self.demolished_buildings_count]
 
     def _prepare_effect_decrease_population(self) -> DecreasePopulationAbsolute:
         return DecreasePopulationAbsolute(lost_population=self.lost_population)
@@ -64,7 +60,6 @@ class Event(BaseEvent):
         return None
 
     def get_verbose_text(self) -> str:
-        self.savegame.refresh_from_db()
         message = (
             f"The people have enough! Outraged mobs started fights in the streets which lead to the loss of "
             f"{self.initial_population - self.savegame.population} human lives."
@@ -1,10 +1,9 @@
-import random
-
 from django.contrib import messages
 from django.template.defaultfilters import pluralize
 
-from apps.city.events.effects.building.damage_wall import DamageWall
+from apps.city.events.effects.building.damage_walls import DamageWalls
 from apps.city.models import Tile
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.savegame.models import Savegame
 
@@ -17,27 +16,23 @@ class Event(BaseEvent):
     affected_tiles: list[Tile]
     damage_per_tile: int
 
-    def __init__(self, *, savegame: Savegame):
-        super().__init__(savegame=savegame)
-        self.damage_per_tile = random.randint(30, 50)
+    def __init__(self, *, savegame: Savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
+        self.damage_per_tile = self.context.rng.randint(30, 50)
 
-        eligible_tiles = list(
-            self.savegame.tiles.filter(
-                building__building_type__is_wall=True,
-            )
-            .exclude(wall_hitpoints=None)
-            .select_related("building", "building__building_type")
-        )
+        eligible_tiles = [tile for tile in self.context.wall_tiles if tile.wall_hitpoints is not None]
 
-        count = random.randint(1, min(3, len(eligible_tiles))) if eligible_tiles else 0
-        self.affected_tiles = random.sample(eligible_tiles, count) if count else []
+        count = self.context.rng.randint(1, min(3, len(eligible_tiles))) if eligible_tiles else 0
+        self.affected_tiles = self.context.rng.sample(eligible_tiles, count) if count else []
 
-    def get_probability(self) -> int | float:
-        wall_tiles_exist = self.savegame.tiles.filter(building__building_type__is_wall=True).exists()
-        return super().get_probability() if wall_tiles_exist else 0
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        return super().get_probability(context=context) if context.wall_tiles else 0
 
     def get_effects(self) -> list:
-        return [DamageWall(tile=tile, damage=self.damage_per_tile) for tile in self.affected_tiles]
+        if not self.affected_tiles:
+            return []
+        return [DamageWalls(tiles=self.affected_tiles, damage=self.damage_per_tile)]
 
     def get_verbose_text(self) -> str:
         count = len(self.affected_tiles)
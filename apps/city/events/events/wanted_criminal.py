@@ -1,8 +1,7 @@
-import random
-
 from django.contrib import messages
 
 from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 
 
@@ -13,9 +12,9 @@ class Event(BaseEvent):
 
     bounty: int
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
-        self.bounty = random.randint(100, 300)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
+        self.bounty = self.context.rng.randint(100, 300)
 
     def _prepare_effect_increase_coins(self) -> IncreaseCoins:
         return IncreaseCoins(coins=self.bounty)
@@ -1,6 +1,31 @@
+from django.core.exceptions import ValidationError
 from django.forms import ModelChoiceField
 
+from apps.city.models import Building
+
 
 class BuildingModelChoiceField(ModelChoiceField):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._buildings = None
+
     def label_from_instance(self, obj) -> str:
         return f"{obj.name} ({obj.building_costs} coins)"
+
+    def set_buildings(self, *, buildings: list[Building]) -> None:
+        """
+        Offer the given, already loaded buildings, e.g. from the game catalog.
+        Neither rendering nor validating the field queries them again.
+        """
+        self._buildings = {str(building.pk): building for building in buildings}
+        self.queryset = Building.objects.filter(id__in=self._buildings.keys())
+        self.choices = [(building.pk, self.label_from_instance(building)) for building in buildings]
+
+    def to_python(self, value) -> Building | None:
+        if self._buildings is None or value in self.empty_values:
+            return super().to_python(value)
+
+        building = self._buildings.get(str(value.pk if isinstance(value, Building) else value))
+        if building is None:
+            raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice", params={"value": value})
+        return building
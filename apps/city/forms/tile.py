@@ -3,7 +3,8 @@ from django import forms
 from django.core.exceptions import ValidationError
 
 from apps.city.fields.building import BuildingModelChoiceField
-from apps.city.models import Building, BuildingType, Tile
+from apps.city.models import Building, Tile
+from apps.city.selectors.game_catalog import get_game_catalog
 
 
 class TileBuildingForm(forms.ModelForm):
@@ -33,32 +34,39 @@ class TileBuildingForm(forms.ModelForm):
         self.fields["tile"].initial = self.instance
         self.fields["current_building"].initial = self.instance.building
 
+        # Buildings are taken from the game catalog, only the state of the map is queried
+        catalog = get_game_catalog()
+
         # If we already have a building, only allow upgrading to the next level
         if self.instance.building:
-            buildings = Building.objects.filter(
-                building_type=self.instance.building.building_type, level=self.instance.building.level + 1
-            ).select_related("building_type")
+            next_level = catalog.get_building(
+                building_type_id=self.instance.building.building_type_id, level=self.instance.building.level + 1
+            )
+            buildings = [next_level] if next_level else []
         else:
-            # Get IDs of unique buildings already built (more efficient than subquery in exclude)
-            unique_building_ids = list(
+            # Get IDs of unique buildings already built
+            unique_building_ids = set(
                 Tile.objects.filter(savegame=self.instance.savegame, building__building_type__is_unique=True)
                 .values_list("building_id", flat=True)
                 .distinct()
             )
 
-            # Get all non-unique buildings allowed by this tile terrain, having level one
-            buildings = (
-                Building.objects.filter(building_type__allowed_terrains=self.instance.terrain, level=1)
-                .exclude(id__in=unique_building_ids)
-                .exclude(building_type__type=BuildingType.Type.RUINS)
-                .select_related("building_type")
-            )
+            # Get all buildings allowed by this tile terrain, having level one, except unique ones already built
+            buildings = [
+                building
+                for building in catalog.get_buildable_buildings(terrain_id=self.instance.terrain_id)
+                if building.id not in unique_building_ids
+            ]
 
             # If this tile is not adjacent to a city-tile, we can't build city-buildings
             if not self.instance.is_adjacent_to_city_building():
-                buildings = buildings.exclude(building_type__is_city=True, building_type__is_country=False)
+                buildings = [
+                    building
+                    for building in buildings
+                    if not (building.building_type.is_city and not building.building_type.is_country)
+                ]
 
-        self.fields["building"].queryset = buildings.distinct()
+        self.fields["building"].set_buildings(buildings=buildings)
 
     def clean_building(self) -> Building | None:
         building = self.cleaned_data["building"]
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from apps.city.models import CityStats
+from apps.city.services.city_stats import CityStatsCalculationService
+from apps.savegame.models import Savegame
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized city statistics of all savegames and report the ones which were out of date"
+
+    def handle(self, *args, **options):
+        existing_stats = {stats.savegame_id: stats for stats in CityStats.objects.all()}
+
+        rebuilt_stats = []
+        outdated_savegame_ids = []
+        for savegame in Savegame.objects.all().order_by("id"):
+            stats = CityStatsCalculationService(savegame=savegame).process()
+            rebuilt_stats.append(stats)
+            if not self.is_consistent(existing=existing_stats.get(savegame.id), rebuilt=stats):
+                outdated_savegame_ids.append(savegame.id)
+
+        CityStats.objects.bulk_create(
+            rebuilt_stats,
+            update_conflicts=True,
+            unique_fields=("savegame",),
+            update_fields=(*CityStats.BUILDING_FIELDS, "defense", "defense_map_revision"),
+        )
+
+        for savegame_id in outdated_savegame_ids:
+            self.stdout.write(f"Statistics of savegame #{savegame_id} were out of date.")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt statistics of {len(rebuilt_stats)} savegames, {len(outdated_savegame_ids)} were out of date."
+            )
+        )
+
+    @staticmethod
+    def is_consistent(*, existing: CityStats | None, rebuilt: CityStats) -> bool:
+        if existing is None:
+            return False
+        return all(
+            getattr(existing, field_name) == getattr(rebuilt, field_name) for field_name in CityStats.BUILDING_FIELDS
+        )
@@ -0,0 +1,43 @@
+import typing
+from collections.abc import Iterable
+
+from django.db import models
+from django.db.models import F
+
+if typing.TYPE_CHECKING:
+    from apps.city.models import Building
+    from apps.savegame.models import Savegame
+
+
+class CityStatsQuerySet(models.QuerySet):
+    pass
+
+
+class CityStatsManager(models.Manager):
+    def apply_building_change(
+        self, *, savegame: "Savegame", old_building: "Building | None", new_building: "Building | None"
+    ) -> None:
+        """
+        Apply the difference of replacing the building of a single tile to the stored statistics.
+        Savegames without statistics are skipped, they are calculated completely on first access.
+        """
+        self.apply_building_changes(savegame=savegame, changes=[(old_building, new_building)])
+
+    def apply_building_changes(
+        self, *, savegame: "Savegame", changes: Iterable[tuple["Building | None", "Building | None"]]
+    ) -> None:
+        """
+        Apply the differences of replacing the buildings of several tiles to the stored statistics in a single UPDATE.
+        Every change is a pair of the old and the new building of a tile.
+        """
+        deltas = dict.fromkeys(self.model.BUILDING_FIELDS, 0)
+        for old_building, new_building in changes:
+            for field_name in self.model.BUILDING_FIELDS:
+                deltas[field_name] += getattr(new_building, field_name, 0) - getattr(old_building, field_name, 0)
+
+        updates = {field_name: F(field_name) + delta for field_name, delta in deltas.items() if delta}
+        if updates:
+            self.filter(savegame=savegame).update(**updates)
+
+
+CityStatsManager = CityStatsManager.from_queryset(CityStatsQuerySet)
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('city', '0051_tile_wall_hitpoints_data'),
+        ('savegame', '0006_savegame_map_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CityStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('housing_space', models.IntegerField(default=0, verbose_name='Housing space')),
+                ('taxes', models.IntegerField(default=0, verbose_name='Taxes')),
+                ('maintenance_costs', models.IntegerField(default=0, verbose_name='Maintenance costs')),
+                ('prestige', models.IntegerField(default=0, verbose_name='Prestige')),
+                ('defense', models.IntegerField(default=0, verbose_name='Defense')),
+                ('defense_map_revision', models.PositiveIntegerField(default=0, help_text='Map revision of the savegame the defense was calculated for.', verbose_name='Defense map revision')),
+                ('savegame', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='city_stats', to='savegame.savegame', verbose_name='Savegame')),
+            ],
+            options={
+                'verbose_name': 'City statistics',
+                'verbose_name_plural': 'City statistics',
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 from apps.city.models.building import Building
 from apps.city.models.building_type import BuildingType
+from apps.city.models.city_stats import CityStats
 from apps.city.models.terrain import Terrain
 from apps.city.models.tile import Tile
 
-__all__ = ["Building", "BuildingType", "Terrain", "Tile"]
+__all__ = ["Building", "BuildingType", "CityStats", "Terrain", "Tile"]
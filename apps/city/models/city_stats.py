@@ -0,0 +1,37 @@
+from django.db import models
+
+from apps.city.managers.city_stats import CityStatsManager
+from apps.savegame.models import Savegame
+
+
+class CityStats(models.Model):
+    """
+    Materialized statistics of the city of a savegame, calculated on first access via `get_city_stats()`.
+
+    The building sums are updated incrementally whenever the building of a tile changes. Defense depends on the shape
+    and condition of the whole wall, therefore it's recalculated once at the end of every change of the map.
+    """
+
+    # Values which are the plain sum of the same field of all buildings on the map
+    BUILDING_FIELDS = ("housing_space", "taxes", "maintenance_costs", "prestige")
+
+    savegame = models.OneToOneField(
+        Savegame, verbose_name="Savegame", on_delete=models.CASCADE, related_name="city_stats"
+    )
+    housing_space = models.IntegerField("Housing space", default=0)
+    taxes = models.IntegerField("Taxes", default=0)
+    maintenance_costs = models.IntegerField("Maintenance costs", default=0)
+    prestige = models.IntegerField("Prestige", default=0)
+    defense = models.IntegerField("Defense", default=0)
+    defense_map_revision = models.PositiveIntegerField(
+        "Defense map revision", default=0, help_text="Map revision of the savegame the defense was calculated for."
+    )
+
+    objects = CityStatsManager()
+
+    class Meta:
+        verbose_name = "City statistics"
+        verbose_name_plural = "City statistics"
+
+    def __str__(self) -> str:
+        return f"Statistics of savegame #{self.savegame_id}"
@@ -1,5 +1,8 @@
+from functools import cache
+
 from django.db import models
 from django.template.loader import render_to_string
+from django.templatetags.static import static
 
 from apps.city.managers.tile import TileManager
 from apps.city.models.building import Building
@@ -7,6 +10,18 @@ from apps.city.models.terrain import Terrain
 from apps.savegame.models import Savegame
 
 
+@cache
+def get_color_class(*, template_name: str) -> str:
+    """Render a tile class template once per process, its content is static."""
+    return render_to_string(template_name)
+
+
+@cache
+def get_terrain_image_url(*, image_filename: str) -> str:
+    """Resolve the static URL of a terrain image once per process."""
+    return static(f"img/tiles/{image_filename}")
+
+
 class Tile(models.Model):
     savegame = models.ForeignKey(Savegame, on_delete=models.CASCADE)
     terrain = models.ForeignKey(Terrain, on_delete=models.CASCADE)
@@ -33,20 +48,18 @@ class Tile(models.Model):
         # Only used for buildings now - terrain uses background images instead
         if self.building:
             if self.building.building_type.is_wall:
-                return render_to_string("city/classes/_tile_city_wall.txt")
+                return get_color_class(template_name="city/classes/_tile_city_wall.txt")
             elif self.building.building_type.is_country and self.building.building_type.is_city:
-                return render_to_string("city/classes/_tile_both.txt")
+                return get_color_class(template_name="city/classes/_tile_both.txt")
             elif self.building.building_type.is_country:
-                return render_to_string("city/classes/_tile_country.txt")
+                return get_color_class(template_name="city/classes/_tile_country.txt")
             else:
-                return render_to_string("city/classes/_tile_city.txt")
+                return get_color_class(template_name="city/classes/_tile_city.txt")
         return ""
 
     def terrain_image_url(self) -> str:
         """Return the URL path to the terrain image."""
-        from django.templatetags.static import static
-
-        return static(f"img/tiles/{self.terrain.image_filename}")
+        return get_terrain_image_url(image_filename=self.terrain.image_filename)
 
     def is_adjacent_to_city_building(self) -> bool:
         return Tile.objects.has_adjacent_city_building(tile=self)
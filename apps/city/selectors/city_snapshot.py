@@ -0,0 +1,44 @@
+from apps.city.constants import MAP_SIZE
+from apps.city.models import Tile
+from apps.city.selectors.game_catalog import get_game_catalog, invalidate_game_catalog
+from apps.city.services.map.snapshot import CitySnapshot, SnapshotBuilding
+from apps.savegame.models import Savegame
+
+
+def get_city_snapshot(*, savegame: Savegame) -> CitySnapshot:
+    """
+    Load the map of a savegame into a CitySnapshot.
+
+    Runs one flat tile query independent of the map size, the buildings are taken from the game catalog.
+    """
+    rows = list(
+        Tile.objects.filter(savegame=savegame).values_list(
+            "id", "x", "y", "terrain_id", "building_id", "wall_hitpoints"
+        )
+    )
+
+    building_ids = {row[4] for row in rows if row[4] is not None}
+    catalog = get_game_catalog()
+    if not building_ids <= catalog.buildings.keys():
+        # The building was added by another process without noticing it yet, e.g. without a shared cache
+        invalidate_game_catalog()
+        catalog = get_game_catalog()
+    buildings = {
+        building_id: SnapshotBuilding.from_building(building=catalog.buildings[building_id])
+        for building_id in building_ids
+    }
+
+    width = max([MAP_SIZE, *(row[1] + 1 for row in rows)])
+    height = max([MAP_SIZE, *(row[2] + 1 for row in rows)])
+
+    snapshot = CitySnapshot(width=width, height=height, buildings=buildings)
+    for tile_id, x, y, terrain_id, building_id, wall_hitpoints in rows:
+        snapshot.add_tile(
+            tile_id=tile_id,
+            x=x,
+            y=y,
+            terrain_id=terrain_id,
+            building_id=building_id,
+            wall_hitpoints=wall_hitpoints,
+        )
+    return snapshot
@@ -0,0 +1,23 @@
+from django.db import IntegrityError, transaction
+
+from apps.city.models import CityStats
+from apps.city.services.city_stats import CityStatsCalculationService
+from apps.savegame.models import Savegame
+
+
+def get_city_stats(*, savegame: Savegame) -> CityStats:
+    """
+    Load the materialized statistics of a savegame.
+
+    Runs a single query once the statistics exist. Missing statistics are calculated completely. If a concurrent request
+    stored them in the meantime, its row is used instead.
+    """
+    stats = CityStats.objects.filter(savegame=savegame).first()
+    if stats is None:
+        stats = CityStatsCalculationService(savegame=savegame).process()
+        try:
+            with transaction.atomic():
+                stats.save()
+        except IntegrityError:
+            stats = CityStats.objects.get(savegame=savegame)
+    return stats
@@ -0,0 +1,48 @@
+from collections import defaultdict
+
+from apps.city.models import Building, BuildingType, Terrain
+from apps.city.services.catalog import GameCatalog
+from apps.core.caching.process_cache import ProcessCache
+
+# Shared between all processes, a new version makes every process reload its catalog
+CATALOG_VERSION_CACHE_KEY = "game-catalog-version"
+
+
+def get_game_catalog() -> GameCatalog:
+    """
+    Return the catalog of terrains, building types and buildings of this process.
+
+    Costs a single lookup in the shared cache as long as the reference data didn't change, it's only loaded from the
+    database (four queries) after `invalidate_game_catalog()` was called in any process.
+    """
+    return _catalog_cache.get()
+
+
+def get_game_catalog_version() -> str:
+    """Current version of the reference data, e.g. to invalidate cached data which was derived from it."""
+    return _catalog_cache.get_version()
+
+
+def invalidate_game_catalog() -> None:
+    """Make all processes reload the catalog on next access. Called whenever reference data is changed."""
+    _catalog_cache.invalidate()
+
+
+def _load_game_catalog() -> GameCatalog:
+    allowed_terrain_ids = defaultdict(set)
+    for building_type_id, terrain_id in BuildingType.allowed_terrains.through.objects.values_list(
+        "buildingtype_id", "terrain_id"
+    ):
+        allowed_terrain_ids[building_type_id].add(terrain_id)
+
+    return GameCatalog(
+        terrains={terrain.id: terrain for terrain in Terrain.objects.order_by("id")},
+        building_types={building_type.id: building_type for building_type in BuildingType.objects.order_by("id")},
+        buildings={building.id: building for building in Building.objects.order_by("id")},
+        allowed_terrain_ids={
+            building_type_id: frozenset(terrain_ids) for building_type_id, terrain_ids in allowed_terrain_ids.items()
+        },
+    )
+
+
+_catalog_cache = ProcessCache(version_cache_key=CATALOG_VERSION_CACHE_KEY, loader=_load_game_catalog)
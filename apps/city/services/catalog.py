@@ -0,0 +1,64 @@
+from dataclasses import dataclass, field
+
+from apps.city.models import Building, BuildingType, Terrain
+
+
+@dataclass(kw_only=True)
+class GameCatalog:
+    """
+    In-memory index of the static reference data of the game: terrains, building types and buildings.
+
+    These rows are loaded from fixtures and only change via the admin, so they are loaded once per process via
+    `get_game_catalog()`. Buildings are linked to the building type instances of the catalog, so accessing
+    `building.building_type` doesn't query. All instances are shared and must be treated as read-only.
+
+    All dicts are expected to be ordered by id, lookups return the row with the lowest id like `.first()` does.
+    """
+
+    terrains: dict[int, Terrain]
+    building_types: dict[int, BuildingType]
+    buildings: dict[int, Building]
+    # Building type id -> ids of the terrains the building type can be built on
+    allowed_terrain_ids: dict[int, frozenset[int]]
+
+    ruins_building_type: BuildingType | None = field(init=False)
+    ruins_building: Building | None = field(init=False)
+    _buildings_by_type_level: dict[tuple[int, int], Building] = field(init=False, repr=False)
+    _buildable_buildings: dict[int, list[Building]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.ruins_building_type = next(
+            (bt for bt in self.building_types.values() if bt.type == BuildingType.Type.RUINS), None
+        )
+        self.ruins_building = None
+        self._buildings_by_type_level = {}
+        # Terrain id -> all level one buildings which can be built on it, ruins only emerge from destruction
+        self._buildable_buildings = {terrain_id: [] for terrain_id in self.terrains}
+
+        for building in self.buildings.values():
+            building.building_type = self.building_types[building.building_type_id]
+            self._buildings_by_type_level.setdefault((building.building_type_id, building.level), building)
+
+            if building.building_type is self.ruins_building_type:
+                self.ruins_building = self.ruins_building or building
+            elif building.level == 1:
+                for terrain_id in self.allowed_terrain_ids.get(building.building_type_id, ()):
+                    self._buildable_buildings[terrain_id].append(building)
+
+    def get_terrain_by_name(self, *, name: str) -> Terrain | None:
+        return next((terrain for terrain in self.terrains.values() if terrain.name == name), None)
+
+    def get_building(self, *, building_type_id: int, level: int) -> Building | None:
+        return self._buildings_by_type_level.get((building_type_id, level))
+
+    def get_building_types(self, **flags: bool) -> list[BuildingType]:
+        """Return all building types matching the given flags, e.g. `is_country=True`."""
+        return [
+            building_type
+            for building_type in self.building_types.values()
+            if all(getattr(building_type, flag) == value for flag, value in flags.items())
+        ]
+
+    def get_buildable_buildings(self, *, terrain_id: int) -> list[Building]:
+        """Return all level one buildings which can be built on the given terrain."""
+        return self._buildable_buildings.get(terrain_id, [])
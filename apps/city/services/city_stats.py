@@ -0,0 +1,55 @@
+from apps.city.models import CityStats
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.defense.calculation import DefenseCalculationService
+from apps.city.services.map.snapshot import CitySnapshot
+from apps.savegame.models import Savegame
+
+
+class CityStatsCalculationService:
+    """
+    Service to calculate the materialized statistics of a savegame from scratch.
+
+    Used to create the statistics of a savegame once and to rebuild them for consistency checks. Afterwards, the
+    building sums are kept up to date via `CityStats.objects.apply_building_change()`.
+    """
+
+    def __init__(self, *, savegame: Savegame, snapshot: CitySnapshot | None = None) -> None:
+        self.savegame = savegame
+        self.snapshot = snapshot
+
+    def process(self) -> CityStats:
+        """
+        Calculate the statistics of the savegame. The returned instance is not stored.
+        """
+        snapshot = self.snapshot or get_city_snapshot(savegame=self.savegame)
+
+        stats = CityStats(
+            savegame=self.savegame,
+            defense=DefenseCalculationService(savegame=self.savegame, snapshot=snapshot).process(),
+            defense_map_revision=self.savegame.map_revision,
+        )
+        for tile in snapshot.iter_building_tiles():
+            for field_name in CityStats.BUILDING_FIELDS:
+                setattr(stats, field_name, getattr(stats, field_name) + getattr(tile.building, field_name))
+        return stats
+
+
+class CityStatsDefenseRefreshService:
+    """
+    Service to recalculate the stored defense of a savegame for its current map revision.
+
+    Runs once at the end of every change of the map, like building on a tile or finishing a round, so reading the
+    statistics never has to write. Savegames without statistics are skipped, they are calculated completely on first
+    access.
+    """
+
+    def __init__(self, *, savegame: Savegame) -> None:
+        self.savegame = savegame
+
+    def process(self) -> None:
+        stats = CityStats.objects.filter(savegame=self.savegame)
+        if stats.exists():
+            stats.update(
+                defense=DefenseCalculationService(savegame=self.savegame).process(),
+                defense_map_revision=self.savegame.map_revision,
+            )
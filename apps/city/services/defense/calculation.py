@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 
-from apps.city.models import Tile
+from django.utils.functional import SimpleLazyObject
+
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.map.snapshot import CitySnapshot
 from apps.city.services.wall.enclosure import WallEnclosureService
 from apps.city.services.wall.shape_bonus import WallShapeBonusService
 from apps.city.services.wall.spike_malus import WallSpikeMalusService
+from apps.city.services.wall.topology import WallTopologyService
 from apps.savegame.models import Savegame
 
 
@@ -39,11 +43,20 @@ class DefenseCalculationService:
         enclosure_service: WallEnclosureService | None = None,
         shape_bonus_service: WallShapeBonusService | None = None,
         spike_malus_service: WallSpikeMalusService | None = None,
+        snapshot: CitySnapshot | None = None,
     ):
         self.savegame = savegame
-        self.enclosure_service = enclosure_service or WallEnclosureService(savegame=savegame)
-        self.shape_bonus_service = shape_bonus_service or WallShapeBonusService(savegame=savegame)
-        self.spike_malus_service = spike_malus_service or WallSpikeMalusService(savegame=savegame)
+        # Share one snapshot between all sub-services, only loaded once it is accessed
+        self.snapshot = snapshot or SimpleLazyObject(lambda: get_city_snapshot(savegame=savegame))
+        self.enclosure_service = enclosure_service or WallEnclosureService(savegame=savegame, snapshot=self.snapshot)
+        # Bonus and malus are both derived from the same wall topology, which is only analysed once
+        topology_service = WallTopologyService(savegame=savegame, snapshot=self.snapshot)
+        self.shape_bonus_service = shape_bonus_service or WallShapeBonusService(
+            savegame=savegame, topology_service=topology_service
+        )
+        self.spike_malus_service = spike_malus_service or WallSpikeMalusService(
+            savegame=savegame, topology_service=topology_service
+        )
 
     def process(self) -> int:
         """
@@ -91,14 +104,10 @@ class DefenseCalculationService:
 
         Wall tiles are scaled by their current hitpoints ratio.
         """
-        tiles_with_buildings = Tile.objects.filter(savegame=self.savegame, building__isnull=False).select_related(
-            "building", "building__building_type"
-        )
-
         total_defense = 0
-        for tile in tiles_with_buildings:
+        for tile in self.snapshot.iter_building_tiles():
             defense = tile.building.defense_value
-            if tile.building.building_type.is_wall and tile.wall_hitpoints is not None:
+            if tile.building.is_wall and tile.wall_hitpoints is not None:
                 max_hp = tile.wall_hitpoints_max
                 defense = int(defense * tile.wall_hitpoints / max_hp)
             total_defense += defense
@@ -1,134 +1,162 @@
 import random
-from random import randint
 
 from apps.city.constants import INITIAL_COUNTRY_BUILDINGS, MAP_SIZE
-from apps.city.models import Building, BuildingType, Terrain, Tile
+from apps.city.models import CityStats, Terrain, Tile
+from apps.city.selectors.game_catalog import get_game_catalog
 from apps.city.services.map.coordinates import MapCoordinatesService
 from apps.savegame.models import Savegame
 
 
 class MapGenerationService:
+    """
+    Generates the map of a savegame.
+
+    The whole map is built in memory from the terrains and buildings of the game catalog and written with a single
+    bulk insert, so the number of queries does not depend on the map size. All random decisions are drawn from the
+    "map" stream of the savegame, so the same seed generates the same map.
+    """
+
     savegame: Savegame
     map_size: int
 
-    def __init__(self, *, savegame: Savegame, map_size: int = MAP_SIZE):
+    def __init__(self, *, savegame: Savegame, map_size: int = MAP_SIZE, rng: random.Random | None = None):
         self.savegame = savegame
         self.map_size = map_size
+        self.rng = rng or savegame.get_random(stream="map")
+        # Lookup table: dice value (1-100) -> all terrains whose probability is at least the dice value
+        self._terrain_table = None
+
+    def _get_terrain_table(self) -> list[list[Terrain]]:
+        if self._terrain_table is None:
+            terrains = [terrain for terrain in get_game_catalog().terrains.values() if terrain.name != "River"]
+            self._terrain_table = [
+                [terrain for terrain in terrains if terrain.probability >= dice] for dice in range(101)
+            ]
+        return self._terrain_table
 
     def get_terrain(self) -> Terrain:
-        terrain = None
-        while terrain is None:
-            dice = randint(1, 100)
-            terrain = Terrain.objects.filter(probability__gte=dice).exclude(name="River").order_by("?").first()
-        return terrain
+        terrain_table = self._get_terrain_table()
+        candidates = []
+        while not candidates:
+            dice = self.rng.randint(1, 100)
+            candidates = terrain_table[dice]
+        return self.rng.choice(candidates)
 
     def _is_edge_tile(self, *, tile: Tile) -> bool:
         """Check if a tile is on the edge of the map based on the current map size."""
         max_coord = self.map_size - 1
         return tile.x == 0 or tile.y == 0 or tile.x == max_coord or tile.y == max_coord
 
-    def _draw_river(self):
+    def _build_tiles(self) -> dict[tuple[int, int], Tile]:
+        """Create all (unsaved) tiles of the map, keyed by their coordinates."""
+        return {
+            (x, y): Tile(savegame=self.savegame, x=x, y=y, terrain=self.get_terrain())
+            for x in range(self.map_size)
+            for y in range(self.map_size)
+        }
+
+    def _draw_river(self, *, tiles: dict[tuple[int, int], Tile]) -> None:
         """
         Draw a river
         Attention: We don't let the river start at 0/0 to avoid odd behaviour
         """
-        dice = randint(1, 2)
+        dice = self.rng.randint(1, 2)
         # Decide if the river starts on the x- or y-axis
         if dice == 1:
-            start_coordinates = MapCoordinatesService.Coordinates(x=0, y=randint(1, self.map_size - 1))
+            start_coordinates = MapCoordinatesService.Coordinates(x=0, y=self.rng.randint(1, self.map_size - 1))
         else:
-            start_coordinates = MapCoordinatesService.Coordinates(x=randint(1, self.map_size - 1), y=0)
+            start_coordinates = MapCoordinatesService.Coordinates(x=self.rng.randint(1, self.map_size - 1), y=0)
 
         # Fetch river terrain
-        terrain_river = Terrain.objects.filter(name="River").first()
+        terrain_river = get_game_catalog().get_terrain_by_name(name="River")
         if not terrain_river:
             raise ValueError("River terrain not found. Please ensure River terrain exists in the database.")
 
+        service = MapCoordinatesService()
         iter_coordinates = start_coordinates
         while iter_coordinates:
             # Create river tile
-            Tile.objects.filter_savegame(savegame=self.savegame).filter(
-                x=iter_coordinates.x, y=iter_coordinates.y
-            ).update(terrain=terrain_river)
+            tiles[(iter_coordinates.x, iter_coordinates.y)].terrain = terrain_river
 
             # If we have reached the other end of the map, we are done
             if iter_coordinates.x == self.map_size - 1 or iter_coordinates.y == self.map_size - 1:
                 break
 
             # Get the next field which should become a river
-            service = MapCoordinatesService()
             forward_adjacent_fields = service.get_forward_adjacent_fields(x=iter_coordinates.x, y=iter_coordinates.y)
-            iter_coordinates = random.choice(forward_adjacent_fields)
+            iter_coordinates = self.rng.choice(forward_adjacent_fields)
 
-    def _place_random_country_buildings(self) -> None:
+    def _place_random_country_buildings(self, *, tiles: dict[tuple[int, int], Tile]) -> None:
         """
         Place random country buildings on the map at valid locations.
         All buildings are placed at level 1.
         Buildings cannot be placed on edge tiles.
         Excludes buildings that are both city and country buildings.
         """
-        # Get all country building types that have allowed terrains, excluding buildings that are also city buildings
-        country_building_types = BuildingType.objects.filter(is_country=True, is_city=False).prefetch_related(
-            "allowed_terrains"
-        )
+        # Get all country building types, excluding buildings that are also city buildings
+        catalog = get_game_catalog()
+        country_building_types = catalog.get_building_types(is_country=True, is_city=False)
 
-        if not country_building_types.exists():
+        if not country_building_types:
             return
 
-        # Get all non-edge tiles that could potentially have buildings
-        tiles = list(self.savegame.tiles.select_related("terrain").all())
         # Filter out edge tiles
-        tiles = [t for t in tiles if not self._is_edge_tile(tile=t)]
+        candidate_tiles = [t for t in tiles.values() if not self._is_edge_tile(tile=t)]
 
-        if not tiles:
+        if not candidate_tiles:
             return
 
         placed_count = 0
         attempts = 0
-        max_attempts = len(tiles) * 2  # Prevent infinite loops
+        max_attempts = len(candidate_tiles) * 2  # Prevent infinite loops
 
         while placed_count < INITIAL_COUNTRY_BUILDINGS and attempts < max_attempts:
             attempts += 1
 
             # Pick a random tile
-            tile = random.choice(tiles)
+            tile = self.rng.choice(candidate_tiles)
 
             # Skip if tile already has a building
             if tile.building:
                 continue
 
             # Get building types that can be placed on this terrain
-            valid_building_types = [bt for bt in country_building_types if tile.terrain in bt.allowed_terrains.all()]
+            valid_building_types = [
+                bt for bt in country_building_types if tile.terrain_id in catalog.allowed_terrain_ids.get(bt.id, ())
+            ]
 
             if not valid_building_types:
                 continue
 
             # Pick a random valid building type
-            building_type = random.choice(valid_building_types)
+            building_type = self.rng.choice(valid_building_types)
 
             # Get level 1 building for this type
-            building = Building.objects.filter(building_type=building_type, level=1).first()
+            building = catalog.get_building(building_type_id=building_type.id, level=1)
 
             if not building:
                 continue
 
             # Place the building on the tile
             tile.building = building
-            tile.save(update_fields=["building"])
 
             placed_count += 1
 
-    def process(self):
+    def process(self) -> None:
         # Clear previous map
         self.savegame.tiles.all().delete()
 
-        # Generate map
-        for x in range(self.map_size):
-            for y in range(self.map_size):
-                Tile.objects.create(savegame=self.savegame, x=x, y=y, terrain=self.get_terrain())
+        # Generate map in memory
+        tiles = self._build_tiles()
 
         # Draw river
-        self._draw_river()
+        self._draw_river(tiles=tiles)
 
         # Place random country buildings
-        self._place_random_country_buildings()
+        self._place_random_country_buildings(tiles=tiles)
+
+        # Write the whole map at once
+        Tile.objects.bulk_create(tiles.values())
+        Savegame.objects.bump_map_revision(savegame=self.savegame)
+        # The statistics of the new map are calculated completely on first access
+        CityStats.objects.filter(savegame=self.savegame).delete()
@@ -0,0 +1,71 @@
+from django.core.cache import cache, caches
+from django.template.loader import get_template
+
+from apps.city.constants import MAP_DELTA_MAX_REVISIONS
+from apps.city.models import Tile
+from apps.savegame.models import Savegame
+
+
+class CityMapRenderService:
+    """
+    Service to render the tile grid of the city map.
+
+    The whole grid is cached per map revision, so re-rendering an unchanged map costs a single cache lookup. Otherwise,
+    the grid is assembled from per-tile fragments which are keyed by the content of the tile. Therefore, only tiles
+    which actually changed since the last rendering are rendered again.
+
+    Clients which already show the map can fetch only the tiles changed since the revision they know via
+    `render_changed_tiles()`.
+    """
+
+    CACHE_NAME = "map-grid"
+    # Separate cache for the per-tile fragments, so they don't evict other entries of the default cache
+    TILE_CACHE_ALIAS = "map_tiles"
+    TILE_TEMPLATE_NAME = "city/partials/city/_city_map_tile.html"
+
+    def __init__(self, *, savegame: Savegame) -> None:
+        self.savegame = savegame
+
+    def process(self) -> str:
+        cache_key = self.savegame.get_map_cache_key(name=self.CACHE_NAME)
+        grid = cache.get(cache_key)
+        if grid is None:
+            grid = self._render_grid()
+            cache.set(cache_key, grid)
+        return grid
+
+    def render_changed_tiles(self, *, since_revision: int) -> str | None:
+        """
+        Render the tiles changed after the given map revision as out-of-band swaps.
+        Returns None if the changes are unknown and the whole map has to be rendered instead.
+        """
+        tile_ids = Savegame.objects.get_changed_tile_ids(
+            savegame=self.savegame, since_revision=since_revision, max_revisions=MAP_DELTA_MAX_REVISIONS
+        )
+        if tile_ids is None:
+            return None
+
+        template = get_template(self.TILE_TEMPLATE_NAME)
+        tiles = self.savegame.tiles.filter(id__in=tile_ids).select_related("terrain", "building__building_type")
+        return "".join(template.render({"tile": tile, "swap_oob": True}) for tile in tiles)
+
+    def _render_grid(self) -> str:
+        tiles = list(self.savegame.tiles.select_related("terrain", "building__building_type"))
+        fragment_keys = [self._get_fragment_key(tile=tile) for tile in tiles]
+        tile_cache = caches[self.TILE_CACHE_ALIAS]
+        fragments = tile_cache.get_many(fragment_keys)
+
+        rendered_fragments = {}
+        template = get_template(self.TILE_TEMPLATE_NAME)
+        for tile, fragment_key in zip(tiles, fragment_keys, strict=True):
+            if fragment_key not in fragments:
+                fragments[fragment_key] = rendered_fragments[fragment_key] = template.render({"tile": tile})
+        if rendered_fragments:
+            tile_cache.set_many(rendered_fragments)
+
+        return "".join(fragments[fragment_key] for fragment_key in fragment_keys)
+
+    @staticmethod
+    def _get_fragment_key(*, tile: Tile) -> str:
+        # Contains everything the fragment shows, so unchanged tiles are shared between map revisions
+        return f"city-map-tile-{tile.id}-{tile.terrain_id}-{tile.building_id}-{tile.wall_hitpoints}"
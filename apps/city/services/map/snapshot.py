@@ -0,0 +1,184 @@
+import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from apps.city.constants import MAP_SIZE
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnapshotBuilding:
+    """
+    Flat, read-only copy of a building joined with its building type.
+    """
+
+    id: int
+    name: str
+    level: int
+    taxes: int
+    building_costs: int
+    demolition_costs: int
+    maintenance_costs: int
+    housing_space: int
+    defense_value: int
+    prestige: int
+    building_type_id: int
+    building_type_name: str
+    is_country: bool
+    is_city: bool
+    is_house: bool
+    is_wall: bool
+    is_unique: bool
+    is_ruins: bool
+
+    @classmethod
+    def from_building(cls, *, building) -> "SnapshotBuilding":
+        building_type = building.building_type
+        return cls(
+            id=building.id,
+            name=building.name,
+            level=building.level,
+            taxes=building.taxes,
+            building_costs=building.building_costs,
+            demolition_costs=building.demolition_costs,
+            maintenance_costs=building.maintenance_costs,
+            housing_space=building.housing_space,
+            defense_value=building.defense_value,
+            prestige=building.prestige,
+            building_type_id=building_type.id,
+            building_type_name=building_type.name,
+            is_country=building_type.is_country,
+            is_city=building_type.is_city,
+            is_house=building_type.is_house,
+            is_wall=building_type.is_wall,
+            is_unique=building_type.is_unique,
+            is_ruins=building_type.type == building_type.Type.RUINS,
+        )
+
+    @property
+    def wall_hitpoints_max(self) -> int | None:
+        """Return max hitpoints for a wall building, or None if not a wall."""
+        return self.level * 100 if self.is_wall else None
+
+    def __str__(self) -> str:
+        return self.name
+
+
+@dataclass(frozen=True, kw_only=True)
+class SnapshotTile:
+    """
+    Read-only view of a single tile inside a CitySnapshot.
+    Mirrors the attributes of Tile used by templates and services.
+    """
+
+    id: int
+    x: int
+    y: int
+    terrain_id: int
+    building: SnapshotBuilding | None
+    wall_hitpoints: int | None
+
+    @property
+    def wall_hitpoints_max(self) -> int | None:
+        return self.building.wall_hitpoints_max if self.building else None
+
+    @property
+    def wall_repair_cost(self) -> int | None:
+        max_hp = self.wall_hitpoints_max
+        if max_hp is None or self.wall_hitpoints is None:
+            return None
+        missing_hp = max_hp - self.wall_hitpoints
+        return round(missing_hp / max_hp * self.building.building_costs)
+
+    def is_edge_tile(self) -> bool:
+        max_coord = MAP_SIZE - 1
+        return self.x == 0 or self.y == 0 or self.x == max_coord or self.y == max_coord
+
+    def __str__(self) -> str:
+        return f"{self.x}/{self.y}"
+
+
+class CitySnapshot:
+    """
+    Compact, in-memory read model of a savegame's map.
+
+    The map is stored as flat arrays indexed by `y * width + x`, holding the tile id, terrain id, building id and
+    wall hitpoints of every cell. Buildings are resolved via a pre-joined catalog, so consumers never have to touch
+    the database again once the snapshot has been loaded.
+    """
+
+    NO_VALUE = 0  # Used for missing tiles and empty building slots (database ids start at 1)
+    NO_HITPOINTS = -1
+
+    width: int
+    height: int
+    tile_ids: array.array
+    terrain_ids: array.array
+    building_ids: array.array
+    wall_hitpoints: array.array
+    buildings: dict[int, SnapshotBuilding]
+
+    def __init__(self, *, width: int, height: int, buildings: dict[int, SnapshotBuilding]) -> None:
+        self.width = width
+        self.height = height
+        self.buildings = buildings
+
+        cells = width * height
+        self.tile_ids = array.array("q", bytes(8 * cells))
+        self.terrain_ids = array.array("q", bytes(8 * cells))
+        self.building_ids = array.array("q", bytes(8 * cells))
+        self.wall_hitpoints = array.array("i", [self.NO_HITPOINTS]) * cells
+
+        # Indices of all cells carrying a building, to avoid scanning empty cells
+        self.building_indices: list[int] = []
+
+    def add_tile(
+        self, *, tile_id: int, x: int, y: int, terrain_id: int, building_id: int | None, wall_hitpoints: int | None
+    ) -> None:
+        index = self.get_index(x=x, y=y)
+        self.tile_ids[index] = tile_id
+        self.terrain_ids[index] = terrain_id
+        if building_id is not None:
+            self.building_ids[index] = building_id
+            self.building_indices.append(index)
+        if wall_hitpoints is not None:
+            self.wall_hitpoints[index] = wall_hitpoints
+
+    def get_index(self, *, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def contains(self, *, x: int, y: int) -> bool:
+        """Check if the coordinates are on the grid and a tile exists there."""
+        return 0 <= x < self.width and 0 <= y < self.height and self.tile_ids[y * self.width + x] != self.NO_VALUE
+
+    def get_building(self, *, x: int, y: int) -> SnapshotBuilding | None:
+        if not self.contains(x=x, y=y):
+            return None
+        return self.buildings.get(self.building_ids[y * self.width + x])
+
+    def is_wall(self, *, x: int, y: int) -> bool:
+        building = self.get_building(x=x, y=y)
+        return building is not None and building.is_wall
+
+    def get_tile(self, *, x: int, y: int) -> SnapshotTile | None:
+        if not self.contains(x=x, y=y):
+            return None
+        return self._build_tile(index=y * self.width + x)
+
+    def iter_building_tiles(self) -> Iterator[SnapshotTile]:
+        """Yield all tiles carrying a building, ordered by x and y."""
+        for index in sorted(self.building_indices, key=lambda i: (i % self.width, i // self.width)):
+            yield self._build_tile(index=index)
+
+    def get_wall_tiles(self) -> list[SnapshotTile]:
+        return [tile for tile in self.iter_building_tiles() if tile.building.is_wall]
+
+    def _build_tile(self, *, index: int) -> SnapshotTile:
+        hitpoints = self.wall_hitpoints[index]
+        return SnapshotTile(
+            id=self.tile_ids[index],
+            x=index % self.width,
+            y=index // self.width,
+            terrain_id=self.terrain_ids[index],
+            building=self.buildings.get(self.building_ids[index]),
+            wall_hitpoints=None if hitpoints == self.NO_HITPOINTS else hitpoints,
+        )
@@ -1,3 +1,5 @@
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.map.snapshot import CitySnapshot
 from apps.savegame.models import Savegame
 
 
@@ -6,15 +8,16 @@ class PrestigeCalculationService:
     Calculates the total prestige for a savegame based on buildings.
     """
 
-    def __init__(self, *, savegame: Savegame) -> None:
+    def __init__(self, *, savegame: Savegame, snapshot: CitySnapshot | None = None) -> None:
         self.savegame = savegame
+        self.snapshot = snapshot
 
     def process(self) -> int:
         """
         Calculate and return the total prestige from all buildings in the savegame.
         """
-        tiles_with_buildings = self.savegame.tiles.filter(building__isnull=False).select_related("building")
+        snapshot = self.snapshot or get_city_snapshot(savegame=self.savegame)
 
-        total_prestige = sum(tile.building.prestige for tile in tiles_with_buildings)
+        total_prestige = sum(tile.building.prestige for tile in snapshot.iter_building_tiles())
 
         return total_prestige
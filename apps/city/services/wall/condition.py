@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
-from apps.city.models import Tile
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.map.snapshot import CitySnapshot
 from apps.savegame.models import Savegame
 
 
@@ -14,15 +15,13 @@ class WallCondition:
 
 
 class WallConditionService:
-    def __init__(self, *, savegame: Savegame):
+    def __init__(self, *, savegame: Savegame, snapshot: CitySnapshot | None = None):
         self.savegame = savegame
+        self.snapshot = snapshot
 
     def process(self) -> WallCondition:
-        tiles = list(
-            Tile.objects.filter(savegame=self.savegame, building__building_type__is_wall=True)
-            .select_related("building", "building__building_type")
-            .order_by("x", "y")
-        )
+        snapshot = self.snapshot or get_city_snapshot(savegame=self.savegame)
+        tiles = snapshot.get_wall_tiles()
         total_hp = sum(t.wall_hitpoints for t in tiles if t.wall_hitpoints is not None)
         total_max_hp = sum(t.wall_hitpoints_max for t in tiles if t.wall_hitpoints_max is not None)
         health_percent = int(total_hp / total_max_hp * 100) if total_max_hp else 0
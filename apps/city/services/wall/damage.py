@@ -0,0 +1,82 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from apps.city.models import Building, BuildingType, CityStats, Tile
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.savegame.models import Savegame
+
+
+class WallDamageService:
+    """
+    Service to damage walls of a savegame with set-based updates.
+
+    One UPDATE lowers the hitpoints of all affected walls, a second one turns all collapsed walls into ruins. The
+    number of queries doesn't depend on the number of walls. Without explicit tiles, all walls of the savegame are
+    damaged. Passed tiles are updated in memory as well.
+    """
+
+    def __init__(self, *, savegame: Savegame, damage: int, tiles: list[Tile] | None = None):
+        self.savegame = savegame
+        self.damage = damage
+        self.tiles = tiles
+
+    def process(self) -> None:
+        walls = Tile.objects.filter(savegame=self.savegame, building__building_type__is_wall=True).exclude(
+            wall_hitpoints=None
+        )
+        if self.tiles is not None:
+            walls = walls.filter(id__in=[tile.id for tile in self.tiles])
+
+        damaged_walls = list(walls.values_list("id", "building_id", "wall_hitpoints"))
+        if not damaged_walls:
+            return
+
+        damaged_tile_ids = [tile_id for tile_id, _, _ in damaged_walls]
+        collapsed_walls = {
+            tile_id: building_id for tile_id, building_id, hitpoints in damaged_walls if hitpoints - self.damage <= 0
+        }
+        # Fail before writing anything if collapsed walls can't be turned into ruins
+        ruins_building = self._get_ruins_building() if collapsed_walls else None
+
+        Tile.objects.filter(id__in=damaged_tile_ids).update(
+            wall_hitpoints=Greatest(F("wall_hitpoints") - self.damage, 0)
+        )
+        if collapsed_walls:
+            Tile.objects.filter(id__in=collapsed_walls, wall_hitpoints=0).update(
+                building=ruins_building, wall_hitpoints=None
+            )
+            catalog = get_game_catalog()
+            CityStats.objects.apply_building_changes(
+                savegame=self.savegame,
+                changes=[
+                    (catalog.buildings.get(building_id), ruins_building) for building_id in collapsed_walls.values()
+                ],
+            )
+
+        Savegame.objects.bump_map_revision(savegame=self.savegame, changed_tile_ids=damaged_tile_ids)
+        self._update_tiles(
+            damaged_tile_ids=set(damaged_tile_ids),
+            collapsed_tile_ids=set(collapsed_walls),
+            ruins_building=ruins_building,
+        )
+
+    def _get_ruins_building(self) -> Building:
+        catalog = get_game_catalog()
+        if catalog.ruins_building_type is None:
+            raise BuildingType.DoesNotExist("No RUINS BuildingType found. Check that fixtures are loaded.")
+        if catalog.ruins_building is None:
+            raise Building.DoesNotExist("No building found for RUINS BuildingType. Check that fixtures are loaded.")
+        return catalog.ruins_building
+
+    def _update_tiles(
+        self, *, damaged_tile_ids: set[int], collapsed_tile_ids: set[int], ruins_building: Building | None
+    ) -> None:
+        """Mirror the applied damage on the passed tile instances."""
+        for tile in self.tiles or []:
+            if tile.id not in damaged_tile_ids:
+                continue
+            if tile.id in collapsed_tile_ids:
+                tile.building = ruins_building
+                tile.wall_hitpoints = None
+            else:
+                tile.wall_hitpoints = max(0, tile.wall_hitpoints - self.damage)
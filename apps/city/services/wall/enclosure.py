@@ -1,8 +1,131 @@
+from django.core.cache import caches
+
+from apps.city.constants import MAP_SIZE
 from apps.city.models import Tile
-from apps.city.services.map.coordinates import MapCoordinatesService
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.map.snapshot import CitySnapshot
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
 from apps.savegame.models import Savegame
 
 
+class EnclosureTracker:
+    """
+    Union-find over all passable (non-wall) cells of a map.
+
+    Every component knows if it touches the map edge and how many city buildings it contains. The city is enclosed if
+    all city buildings share one component which does not touch the edge.
+
+    Opening a cell (placing a non-wall building, demolishing a wall) only merges components and is applied
+    incrementally. Closing a cell (placing a wall) may split a component, which a union-find cannot undo, so the
+    components are rebuilt from the in-memory cell state.
+    """
+
+    # Forward neighbours, enough to connect all 8 directions when iterating over every cell
+    FORWARD_OFFSETS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+    ALL_OFFSETS = FORWARD_OFFSETS + tuple((-dx, -dy) for dx, dy in FORWARD_OFFSETS)
+
+    def __init__(self, *, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        cells = width * height
+        self.passable = bytearray(cells)
+        self.city = bytearray(cells)
+        self.parent = list(range(cells))
+        self.touches_edge = bytearray(cells)
+        self.city_count = [0] * cells
+        self.city_cells: set[int] = set()
+
+    @classmethod
+    def from_snapshot(cls, *, snapshot: CitySnapshot) -> "EnclosureTracker":
+        tracker = cls(width=snapshot.width, height=snapshot.height)
+        for index, tile_id in enumerate(snapshot.tile_ids):
+            if tile_id == snapshot.NO_VALUE:
+                continue
+            building = snapshot.buildings.get(snapshot.building_ids[index])
+            is_wall = building is not None and building.is_wall
+            tracker.passable[index] = not is_wall
+            tracker.city[index] = building is not None and building.is_city and not is_wall
+        tracker.rebuild()
+        return tracker
+
+    def rebuild(self) -> None:
+        """Recalculate all components from the cell state."""
+        self.parent = list(range(self.width * self.height))
+        self.touches_edge = bytearray(self.width * self.height)
+        self.city_count = [0] * (self.width * self.height)
+        self.city_cells = set()
+        passable_cells = [index for index in range(self.width * self.height) if self.passable[index]]
+        for index in passable_cells:
+            self._init_cell(index=index)
+        for index in passable_cells:
+            self._connect_cell(index=index, offsets=self.FORWARD_OFFSETS)
+
+    def set_cell(self, *, x: int, y: int, passable: bool, city: bool) -> None:
+        """Apply the changed state of a single cell."""
+        index = y * self.width + x
+        was_passable = self.passable[index]
+        self.passable[index] = passable
+        self.city[index] = city
+
+        if was_passable and not passable:
+            self.rebuild()
+        elif not was_passable and passable:
+            self._init_cell(index=index)
+            self._connect_cell(index=index, offsets=self.ALL_OFFSETS)
+        elif passable:
+            root = self._find(index=index)
+            if city and index not in self.city_cells:
+                self.city_cells.add(index)
+                self.city_count[root] += 1
+            elif not city and index in self.city_cells:
+                self.city_cells.discard(index)
+                self.city_count[root] -= 1
+
+    def is_enclosed(self) -> bool:
+        if not self.city_cells:
+            return False
+        root = self._find(index=next(iter(self.city_cells)))
+        return not self.touches_edge[root] and self.city_count[root] == len(self.city_cells)
+
+    def _init_cell(self, *, index: int) -> None:
+        """Register a passable cell as its own component."""
+        x, y = index % self.width, index // self.width
+        self.parent[index] = index
+        self.touches_edge[index] = x in (0, MAP_SIZE - 1) or y in (0, MAP_SIZE - 1)
+        self.city_count[index] = self.city[index]
+        if self.city[index]:
+            self.city_cells.add(index)
+
+    def _connect_cell(self, *, index: int, offsets: tuple[tuple[int, int], ...]) -> None:
+        """Merge a passable cell with its passable neighbours."""
+        x, y = index % self.width, index // self.width
+        # Like MapCoordinatesService, adjacency is limited to the map area
+        if x >= MAP_SIZE or y >= MAP_SIZE:
+            return
+        for dx, dy in offsets:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < MAP_SIZE and 0 <= ny < MAP_SIZE and self.passable[ny * self.width + nx]:
+                self._union(a=index, b=ny * self.width + nx)
+
+    def _find(self, *, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            # Path halving
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def _union(self, *, a: int, b: int) -> None:
+        root_a, root_b = self._find(index=a), self._find(index=b)
+        if root_a == root_b:
+            return
+        if self.city_count[root_a] < self.city_count[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.touches_edge[root_a] |= self.touches_edge[root_b]
+        self.city_count[root_a] += self.city_count[root_b]
+
+
 class WallEnclosureService:
     """
     Service to detect if all city buildings are enclosed by walls.
@@ -11,114 +134,57 @@ class WallEnclosureService:
     If there is a gap with water, the wall is not considered enclosed.
 
     Algorithm:
-    1. Find a city building (preferably unique building as starting point)
-    2. Mark all adjacent tiles that are not walls (including water tiles)
-    3. Repeat for all marked tiles until no new tiles can be marked
-    4. If any marked tile reaches the map edge, the city is not enclosed
-    5. If any city building is not reachable, it's outside the enclosure
+    1. Group all connected non-wall tiles (including water tiles) into components
+    2. If the component of the city buildings reaches the map edge, the city is not enclosed
+    3. If any city building is in another component, it's outside the enclosure
+
+    The components are cached per map revision in the cache shared by all processes. The tracker of a new revision is
+    produced by `update_tile()`, which applies the single changed tile to the tracker of the previous revision.
     """
 
-    def __init__(self, *, savegame: Savegame):
+    CACHE_NAME = "enclosure"
+
+    def __init__(self, *, savegame: Savegame, snapshot: CitySnapshot | None = None):
         self.savegame = savegame
-        self.map_service = MapCoordinatesService()
-        # Cache all tiles in memory to avoid N queries during flood fill
-        self._tiles_cache = None
+        # Shared in-memory map to avoid N queries, loaded lazily if not injected
+        self.snapshot = snapshot
 
     def process(self) -> bool:
         """
         Check if the city is enclosed by walls.
+        Reuses the cached components as long as the map has not changed, builds them from the whole map otherwise.
         """
-        # Prefetch all tiles once to avoid N queries during flood fill
-        self._load_tiles_cache()
-
-        # Get all city building tiles
-        city_tiles = self._get_city_building_tiles()
-
-        if not city_tiles:
-            # No city buildings means not enclosed
-            return False
+        tracker = caches[SHARED_CACHE_ALIAS].get(self.savegame.get_map_cache_key(name=self.CACHE_NAME))
+        if tracker is None:
+            tracker = self._build_tracker()
+        return tracker.is_enclosed()
 
-        # Start from a city building (preferably unique)
-        start_tile = self._get_starting_tile(city_tiles=city_tiles)
-
-        # Perform flood fill to find all reachable non-wall tiles
-        reachable_tiles = self._flood_fill(start_tile=start_tile)
-
-        # Check if we reached the edge of the map
-        if self._reached_map_edge(tiles=reachable_tiles):
-            return False
-
-        # Check if all city buildings are reachable
-        city_tile_ids = {tile.id for tile in city_tiles}
-        reachable_tile_ids = {tile.id for tile in reachable_tiles}
-
-        # All city buildings must be in the reachable set
-        return city_tile_ids.issubset(reachable_tile_ids)
-
-    def _load_tiles_cache(self) -> None:
-        """Load all tiles into memory cache to avoid N queries during flood fill."""
-        if self._tiles_cache is None:
-            tiles = Tile.objects.filter(savegame=self.savegame).select_related(
-                "building", "building__building_type", "terrain"
-            )
-            # Create a dictionary lookup by (x, y) coordinates
-            self._tiles_cache = {(tile.x, tile.y): tile for tile in tiles}
-
-    def _get_city_building_tiles(self) -> list[Tile]:
-        """Get all tiles with city buildings (excluding walls)."""
-        self._load_tiles_cache()
-        return [
-            tile
-            for tile in self._tiles_cache.values()
-            if tile.building and tile.building.building_type.is_city and not tile.building.building_type.is_wall
-        ]
-
-    def _get_starting_tile(self, *, city_tiles: list[Tile]) -> Tile:
-        """Get a starting tile for the flood fill (prefer unique buildings)."""
-        for tile in city_tiles:
-            if tile.building and tile.building.building_type.is_unique:
-                return tile
-        return city_tiles[0]
-
-    def _flood_fill(self, *, start_tile: Tile) -> list[Tile]:
+    def update_tile(self, *, tile: Tile) -> bool:
         """
-        Perform flood fill from start_tile, marking all reachable non-wall tiles.
-        Uses cached tiles to avoid N database queries.
+        Apply the change of a single tile and check if the city is enclosed by walls.
+        Expects the map revision to be bumped exactly once for this change, otherwise falls back to a full calculation.
         """
-        visited = set()
-        to_visit = [start_tile]
-        reachable = []
-
-        while to_visit:
-            current_tile = to_visit.pop(0)
-
-            # Skip if already visited
-            tile_key = (current_tile.x, current_tile.y)
-            if tile_key in visited:
-                continue
-
-            visited.add(tile_key)
-            reachable.append(current_tile)
-
-            # Get adjacent tiles
-            adjacent_coords = self.map_service.get_adjacent_coordinates(x=current_tile.x, y=current_tile.y)
-
-            for coord in adjacent_coords:
-                coord_key = (coord.x, coord.y)
-                if coord_key in visited:
-                    continue
-
-                # Get the tile from cache (no database query)
-                adjacent_tile = self._tiles_cache.get(coord_key)
-                if adjacent_tile and not self._is_wall(tile=adjacent_tile):
-                    to_visit.append(adjacent_tile)
-
-        return reachable
-
-    def _is_wall(self, *, tile: Tile) -> bool:
-        """Check if a tile has a wall building."""
-        return tile.building is not None and tile.building.building_type.is_wall
-
-    def _reached_map_edge(self, *, tiles: list[Tile]) -> bool:
-        """Check if any of the tiles are at the edge of the map."""
-        return any(tile.is_edge_tile() for tile in tiles)
+        tracker = caches[SHARED_CACHE_ALIAS].get(
+            self.savegame.get_map_cache_key(name=self.CACHE_NAME, revision=self.savegame.map_revision - 1)
+        )
+        if tracker is None or tile.x >= tracker.width or tile.y >= tracker.height:
+            return self._build_tracker().is_enclosed()
+
+        building_type = tile.building.building_type if tile.building else None
+        is_wall = building_type is not None and building_type.is_wall
+        tracker.set_cell(
+            x=tile.x,
+            y=tile.y,
+            passable=not is_wall,
+            city=building_type is not None and building_type.is_city and not is_wall,
+        )
+        caches[SHARED_CACHE_ALIAS].set(self.savegame.get_map_cache_key(name=self.CACHE_NAME), tracker)
+        return tracker.is_enclosed()
+
+    def _build_tracker(self) -> EnclosureTracker:
+        if self.snapshot is None:
+            self.snapshot = get_city_snapshot(savegame=self.savegame)
+
+        tracker = EnclosureTracker.from_snapshot(snapshot=self.snapshot)
+        caches[SHARED_CACHE_ALIAS].set(self.savegame.get_map_cache_key(name=self.CACHE_NAME), tracker)
+        return tracker
@@ -1,6 +1,7 @@
 from django.db import transaction
 
 from apps.city.models import Tile
+from apps.city.services.city_stats import CityStatsDefenseRefreshService
 from apps.savegame.models import Savegame
 
 
@@ -23,6 +24,8 @@ class WallRepairAllService:
                 tile.wall_hitpoints = tile.wall_hitpoints_max
 
             Tile.objects.bulk_update(tiles, ["wall_hitpoints"])
+            Savegame.objects.bump_map_revision(savegame=self.savegame, changed_tile_ids=[tile.id for tile in tiles])
+            CityStatsDefenseRefreshService(savegame=self.savegame).process()
 
             self.savegame.coins -= total_cost
             self.savegame.save()
@@ -1,4 +1,5 @@
-from apps.city.models import Tile
+from apps.city.services.map.snapshot import CitySnapshot
+from apps.city.services.wall.topology import WallTopologyService
 from apps.savegame.models import Savegame
 
 
@@ -10,16 +11,22 @@ class WallSpikeMalusService:
     These configurations are structurally weak and vulnerable.
 
     Algorithm:
-    1. Get all wall tiles
-    2. For each wall, count orthogonal (non-diagonal) wall neighbors
-    3. Apply malus for walls with 0-1 neighbors (spike configuration)
-    4. Return total malus points (as a negative value)
+    1. Get the orthogonal (non-diagonal) wall neighbor count of all walls from WallTopologyService
+    2. Apply malus for walls with 0-1 neighbors (spike configuration)
+    3. Return total malus points (as a negative value)
     """
 
     SPIKE_MALUS = -10  # Malus points per spike wall tile (negative)
 
-    def __init__(self, *, savegame: Savegame):
+    def __init__(
+        self,
+        *,
+        savegame: Savegame,
+        snapshot: CitySnapshot | None = None,
+        topology_service: WallTopologyService | None = None,
+    ):
         self.savegame = savegame
+        self.topology_service = topology_service or WallTopologyService(savegame=savegame, snapshot=snapshot)
 
     def process(self) -> int:
         """
@@ -28,58 +35,7 @@ class WallSpikeMalusService:
         Returns:
             Malus defense points (negative value) based on spike count
         """
-        wall_tiles = self._get_wall_tiles()
-
-        if not wall_tiles:
-            return 0
-
-        spike_count = 0
-
-        for tile in wall_tiles:
-            orthogonal_wall_neighbors = self._count_orthogonal_wall_neighbors(tile=tile)
-
-            # Apply malus for tiles with 0-1 neighbors (spikes)
-            if orthogonal_wall_neighbors <= 1:
-                spike_count += 1
+        topology = self.topology_service.process()
+        spike_count = topology.count_walls(max_neighbors=1)
 
         return spike_count * self.SPIKE_MALUS
-
-    def _get_wall_tiles(self) -> list[Tile]:
-        """Get all tiles with wall buildings."""
-        return list(
-            Tile.objects.filter(savegame=self.savegame, building__building_type__is_wall=True).select_related(
-                "building", "building__building_type"
-            )
-        )
-
-    def _count_orthogonal_wall_neighbors(self, *, tile: Tile) -> int:
-        """
-        Count how many orthogonal neighbors of this tile are also walls.
-
-        Only checks up, down, left, right (not diagonals).
-        """
-        orthogonal_offsets = [
-            (0, 1),  # up
-            (0, -1),  # down
-            (1, 0),  # right
-            (-1, 0),  # left
-        ]
-
-        wall_neighbor_count = 0
-
-        for dx, dy in orthogonal_offsets:
-            neighbor_x = tile.x + dx
-            neighbor_y = tile.y + dy
-
-            try:
-                neighbor_tile = Tile.objects.select_related("building", "building__building_type").get(
-                    savegame=self.savegame, x=neighbor_x, y=neighbor_y
-                )
-
-                if neighbor_tile.building and neighbor_tile.building.building_type.is_wall:
-                    wall_neighbor_count += 1
-
-            except Tile.DoesNotExist:
-                continue
-
-        return wall_neighbor_count
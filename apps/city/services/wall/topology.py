@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.map.snapshot import CitySnapshot
+from apps.savegame.models import Savegame
+
+
+@dataclass(kw_only=True)
+class WallTopology:
+    """Orthogonal wall neighbour count per wall tile, keyed by coordinates."""
+
+    neighbor_counts: dict[tuple[int, int], int]
+
+    def count_walls(self, *, min_neighbors: int = 0, max_neighbors: int = 4) -> int:
+        """Count the wall tiles whose number of orthogonal wall neighbours lies within the given range."""
+        return sum(1 for count in self.neighbor_counts.values() if min_neighbors <= count <= max_neighbors)
+
+
+class WallTopologyService:
+    """
+    Service to analyse how wall tiles are connected to each other.
+
+    Counts the orthogonal (up, down, left, right) wall neighbours of every wall tile in a single pass over the
+    in-memory wall mask of the city snapshot. The result is calculated once and shared by all consumers, like the
+    wall shape bonus and the wall spike malus.
+    """
+
+    def __init__(self, *, savegame: Savegame, snapshot: CitySnapshot | None = None):
+        self.savegame = savegame
+        self.snapshot = snapshot
+        self._topology = None
+
+    def process(self) -> WallTopology:
+        if self._topology is None:
+            self._topology = self._calculate()
+        return self._topology
+
+    def _calculate(self) -> WallTopology:
+        snapshot = self.snapshot or get_city_snapshot(savegame=self.savegame)
+        width, height = snapshot.width, snapshot.height
+
+        # Flat wall mask over the whole grid, neighbours are looked up via index offsets
+        wall_indices = [
+            index for index in snapshot.building_indices if snapshot.buildings[snapshot.building_ids[index]].is_wall
+        ]
+        wall_mask = bytearray(width * height)
+        for index in wall_indices:
+            wall_mask[index] = 1
+
+        neighbor_counts = {}
+        for index in wall_indices:
+            x, y = index % width, index // width
+            neighbor_counts[(x, y)] = (
+                (x > 0 and wall_mask[index - 1])
+                + (x < width - 1 and wall_mask[index + 1])
+                + (y > 0 and wall_mask[index - width])
+                + (y < height - 1 and wall_mask[index + width])
+            )
+        return WallTopology(neighbor_counts=neighbor_counts)
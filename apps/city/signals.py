@@ -0,0 +1,17 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.city.models import Building, BuildingType, Terrain
+from apps.city.selectors.game_catalog import invalidate_game_catalog
+
+
+@receiver(post_save, sender=Terrain)
+@receiver(post_save, sender=BuildingType)
+@receiver(post_save, sender=Building)
+@receiver(post_delete, sender=Terrain)
+@receiver(post_delete, sender=BuildingType)
+@receiver(post_delete, sender=Building)
+@receiver(m2m_changed, sender=BuildingType.allowed_terrains.through)
+def invalidate_game_catalog_on_change(**kwargs) -> None:
+    """Reload the game catalog in all processes once reference data is changed, e.g. via the admin or fixtures."""
+    invalidate_game_catalog()
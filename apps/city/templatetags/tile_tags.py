@@ -1,6 +1,9 @@
 from django import template
+from django.utils.safestring import mark_safe
 
 from apps.city.models import Tile
+from apps.city.services.map.rendering import CityMapRenderService
+from apps.savegame.models import Savegame
 
 register = template.Library()
 
@@ -11,3 +14,12 @@ def wall_hp_percent(tile: Tile) -> int | None:
     if tile.wall_hitpoints is None or tile.wall_hitpoints_max is None:
         return None
     return int(tile.wall_hitpoints / tile.wall_hitpoints_max * 100)
+
+
+@register.simple_tag
+def city_map_grid(savegame: Savegame | None) -> str:
+    """Render the tiles of the city map, reusing the cached grid of the current map revision."""
+    if savegame is None:
+        return ""
+    # Only contains fragments rendered from our own templates with autoescaping
+    return mark_safe(CityMapRenderService(savegame=savegame).process())
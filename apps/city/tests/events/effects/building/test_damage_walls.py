@@ -0,0 +1,71 @@
+import pytest
+
+from apps.city.events.effects.building.damage_walls import DamageWalls
+from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_damage_walls_init():
+    """Test DamageWalls initialization."""
+    wall_type = WallBuildingTypeFactory.create()
+    building = BuildingFactory.create(building_type=wall_type, level=1)
+    tile = TileFactory.create(building=building, wall_hitpoints=100)
+    effect = DamageWalls(tiles=[tile], damage=30)
+
+    assert effect.tiles == [tile]
+    assert effect.damage == 30
+
+
+@pytest.mark.django_db
+def test_damage_walls_process_reduces_hitpoints():
+    """Test process reduces wall_hitpoints of all tiles by the damage amount."""
+    wall_type = WallBuildingTypeFactory.create()
+    building = BuildingFactory.create(building_type=wall_type, level=1)
+    savegame = SavegameFactory.create()
+    tile1 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
+    tile2 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=50)
+
+    DamageWalls(tiles=[tile1, tile2], damage=30).process(savegame=savegame)
+
+    tile1.refresh_from_db()
+    tile2.refresh_from_db()
+    assert tile1.wall_hitpoints == 70
+    assert tile2.wall_hitpoints == 20
+
+
+@pytest.mark.django_db
+def test_damage_walls_process_converts_to_ruins(ruins_building):
+    """Test process converts walls to ruins when their hitpoints reach 0."""
+    wall_type = WallBuildingTypeFactory.create()
+    building = BuildingFactory.create(building_type=wall_type, level=1)
+    tile = TileFactory.create(building=building, wall_hitpoints=20)
+
+    DamageWalls(tiles=[tile], damage=50).process()
+
+    tile.refresh_from_db()
+    assert tile.wall_hitpoints is None
+    assert tile.building == ruins_building
+
+
+@pytest.mark.django_db
+def test_damage_walls_process_bumps_map_revision_of_tile_savegame():
+    """Test process falls back to the savegame of the first tile when no savegame is passed."""
+    building = BuildingFactory.create(building_type=WallBuildingTypeFactory.create(), level=1)
+    tile = TileFactory.create(building=building, wall_hitpoints=100)
+
+    DamageWalls(tiles=[tile], damage=10).process()
+
+    tile.savegame.refresh_from_db()
+    assert tile.savegame.map_revision == 1
+
+
+@pytest.mark.django_db
+def test_damage_walls_process_without_tiles(django_assert_num_queries):
+    """Test process does nothing without tiles."""
+    effect = DamageWalls(tiles=[], damage=10)
+
+    with django_assert_num_queries(0):
+        effect.process()
+
+    assert effect.tiles == []
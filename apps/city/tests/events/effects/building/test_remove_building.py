@@ -1,7 +1,9 @@
 import pytest
 
 from apps.city.events.effects.building.remove_building import RemoveBuilding
-from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.city.models import BuildingType
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory
+from apps.savegame.tests.factories import SavegameFactory
 
 
 @pytest.mark.django_db
@@ -73,3 +75,47 @@ def test_remove_building_process_saves_tile(ruins_building):
     tile.refresh_from_db()
     assert tile.building is not None
     assert tile.building.building_type.type == tile.building.building_type.Type.RUINS
+
+
+@pytest.mark.django_db
+def test_remove_building_process_bumps_map_revision(ruins_building):
+    """Test process bumps the map revision of the passed savegame."""
+    savegame = SavegameFactory.create()
+    tile = TileFactory(savegame=savegame, building=BuildingFactory.create())
+
+    RemoveBuilding(tile=tile).process(savegame=savegame)
+
+    assert savegame.map_revision == 1
+
+
+@pytest.mark.django_db
+def test_remove_building_process_bumps_map_revision_of_tile_savegame(ruins_building):
+    """Test process falls back to the savegame of the tile when no savegame is passed."""
+    tile = TileFactory(building=BuildingFactory.create())
+
+    RemoveBuilding(tile=tile).process()
+
+    tile.savegame.refresh_from_db()
+    assert tile.savegame.map_revision == 1
+
+
+@pytest.mark.django_db
+def test_remove_building_process_updates_city_stats(ruins_building):
+    """Test process replaces the values of the removed building with the ones of the ruins in the city statistics."""
+    stats = CityStatsFactory(housing_space=10, taxes=20)
+    tile = TileFactory(savegame=stats.savegame, building=BuildingFactory.create(housing_space=4, taxes=5))
+
+    RemoveBuilding(tile=tile).process(savegame=stats.savegame)
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 6 + ruins_building.housing_space
+    assert stats.taxes == 15 + ruins_building.taxes
+
+
+@pytest.mark.django_db
+def test_remove_building_process_raises_when_no_ruins_type():
+    """Test process raises DoesNotExist when no RUINS BuildingType exists."""
+    tile = TileFactory.create()
+
+    with pytest.raises(BuildingType.DoesNotExist):
+        RemoveBuilding(tile=tile).process()
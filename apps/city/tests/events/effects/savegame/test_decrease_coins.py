@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.decrease_coins import DecreaseCoins
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_decrease_coins_process_normal_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 125
 
 
@@ -32,7 +32,6 @@ def test_decrease_coins_process_negative_balance():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == -20
 
 
@@ -44,7 +43,6 @@ def test_decrease_coins_process_exact_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 0
 
 
@@ -56,7 +54,6 @@ def test_decrease_coins_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 0 - 25  # Default coins (0) - decreased amount
 
 
@@ -68,5 +65,16 @@ def test_decrease_coins_process_zero_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 150
+
+
+@pytest.mark.django_db
+def test_decrease_coins_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(coins=150)
+    effect = DecreaseCoins(coins=50)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.coins != 150
+    assert Savegame.objects.get(pk=savegame.pk).coins == 150
@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.decrease_population_absolute import DecreasePopulationAbsolute
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_decrease_population_absolute_process_normal_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 70
 
 
@@ -32,7 +32,6 @@ def test_decrease_population_absolute_process_minimum_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 0
 
 
@@ -44,7 +43,6 @@ def test_decrease_population_absolute_process_exact_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 0
 
 
@@ -56,7 +54,6 @@ def test_decrease_population_absolute_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == max(0 - 10, 0)  # Default population (0) - lost_population, min 0
 
 
@@ -68,5 +65,16 @@ def test_decrease_population_absolute_process_zero_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 80
+
+
+@pytest.mark.django_db
+def test_decrease_population_absolute_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(population=100)
+    effect = DecreasePopulationAbsolute(lost_population=20)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.population != 100
+    assert Savegame.objects.get(pk=savegame.pk).population == 100
@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.decrease_population_relative import DecreasePopulationRelative
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_decrease_population_relative_process_percentage_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 70  # 100 * (1 - 0.3) = 70
 
 
@@ -32,7 +32,6 @@ def test_decrease_population_relative_process_rounding():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 69  # round(77 * 0.9) = round(69.3) = 69
 
 
@@ -44,7 +43,6 @@ def test_decrease_population_relative_process_minimum_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 0
 
 
@@ -56,7 +54,6 @@ def test_decrease_population_relative_process_complete_loss():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 0
 
 
@@ -68,7 +65,6 @@ def test_decrease_population_relative_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     expected_population = max(round(0 * (1 - 0.2)), 0)  # Default population (0) * (1 - percentage)
     assert savegame.population == expected_population
 
@@ -81,7 +77,6 @@ def test_decrease_population_relative_process_zero_percentage():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 120
 
 
@@ -93,5 +88,16 @@ def test_decrease_population_relative_process_small_percentage():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.population == 950  # 1000 * 0.95 = 950
+
+
+@pytest.mark.django_db
+def test_decrease_population_relative_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(population=100)
+    effect = DecreasePopulationRelative(lost_population_percentage=0.5)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.population != 100
+    assert Savegame.objects.get(pk=savegame.pk).population == 100
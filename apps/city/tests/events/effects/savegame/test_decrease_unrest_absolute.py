@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.decrease_unrest_absolute import DecreaseUnrestAbsolute
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_decrease_unrest_absolute_process_normal_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 35
 
 
@@ -32,7 +32,6 @@ def test_decrease_unrest_absolute_process_minimum_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 0
 
 
@@ -44,7 +43,6 @@ def test_decrease_unrest_absolute_process_exact_zero():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 0
 
 
@@ -56,7 +54,6 @@ def test_decrease_unrest_absolute_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == max(0 - 5, 0)  # Default unrest (0) - lost_unrest, min 0
 
 
@@ -68,5 +65,16 @@ def test_decrease_unrest_absolute_process_zero_decrease():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 30
+
+
+@pytest.mark.django_db
+def test_decrease_unrest_absolute_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(unrest=50)
+    effect = DecreaseUnrestAbsolute(lost_unrest=10)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.unrest != 50
+    assert Savegame.objects.get(pk=savegame.pk).unrest == 50
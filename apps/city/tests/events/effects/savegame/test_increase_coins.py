@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_increase_coins_process_normal_increase():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 200
 
 
@@ -32,7 +32,6 @@ def test_increase_coins_process_from_negative():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 10
 
 
@@ -44,7 +43,6 @@ def test_increase_coins_process_large_increase():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 1100
 
 
@@ -56,7 +54,6 @@ def test_increase_coins_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 0 + 40  # Default coins (0) + increased amount
 
 
@@ -68,5 +65,16 @@ def test_increase_coins_process_zero_increase():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.coins == 250
+
+
+@pytest.mark.django_db
+def test_increase_coins_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(coins=150)
+    effect = IncreaseCoins(coins=50)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.coins != 150
+    assert Savegame.objects.get(pk=savegame.pk).coins == 150
@@ -3,6 +3,8 @@ from unittest import mock
 import pytest
 
 from apps.city.events.effects.savegame.increase_population_absolute import IncreasePopulationAbsolute
+from apps.city.tests.factories import CityStatsFactory
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -21,13 +23,12 @@ def test_increase_population_absolute_process_normal_increase():
     effect = IncreasePopulationAbsolute(new_population=25)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 200
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 200
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 85
 
 
@@ -38,13 +39,12 @@ def test_increase_population_absolute_process_housing_limit():
     effect = IncreasePopulationAbsolute(new_population=50)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 100  # Housing limit
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 100  # Housing limit
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 100  # Limited by housing capacity
 
 
@@ -55,13 +55,12 @@ def test_increase_population_absolute_process_exact_housing_limit():
     effect = IncreasePopulationAbsolute(new_population=25)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 100
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 100
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 100
 
 
@@ -72,13 +71,12 @@ def test_increase_population_absolute_process_creates_savegame():
     effect = IncreasePopulationAbsolute(new_population=30)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 150
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 150
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         expected_population = min(0 + 30, 150)  # Default population (0) + new_population, max housing
         assert savegame.population == expected_population
 
@@ -90,28 +88,39 @@ def test_increase_population_absolute_process_zero_increase():
     effect = IncreasePopulationAbsolute(new_population=0)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 200
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 200
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 90
 
 
 @pytest.mark.django_db
-def test_increase_population_absolute_process_calls_housing_service():
-    """Test process calls BuildingHousingService to calculate max space."""
+def test_increase_population_absolute_process_reads_city_stats():
+    """Test process reads the max space from the city statistics."""
     savegame = SavegameFactory(population=40)
     effect = IncreasePopulationAbsolute(new_population=20)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_absolute.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 150
+        "apps.city.events.effects.savegame.increase_population_absolute.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 150
 
         effect.process(savegame=savegame)
 
-        mock_service.assert_called_once()
-        mock_service.return_value.calculate_max_space.assert_called_once()
+        mock_get_city_stats.assert_called_once_with(savegame=savegame)
+
+
+@pytest.mark.django_db
+def test_increase_population_absolute_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(population=50)
+    CityStatsFactory(savegame=savegame, housing_space=200)
+    effect = IncreasePopulationAbsolute(new_population=20)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.population != 50
+    assert Savegame.objects.get(pk=savegame.pk).population == 50
@@ -3,6 +3,8 @@ from unittest import mock
 import pytest
 
 from apps.city.events.effects.savegame.increase_population_relative import IncreasePopulationRelative
+from apps.city.tests.factories import CityStatsFactory
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -21,13 +23,12 @@ def test_increase_population_relative_process_percentage_increase():
     effect = IncreasePopulationRelative(new_population_percentage=0.2)  # 20% increase
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 300
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 300
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 120  # 100 * (1 + 0.2) = 120
 
 
@@ -38,13 +39,12 @@ def test_increase_population_relative_process_rounding():
     effect = IncreasePopulationRelative(new_population_percentage=0.1)  # 10% increase
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 200
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 200
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 85  # round(77 * 1.1) = round(84.7) = 85
 
 
@@ -55,13 +55,12 @@ def test_increase_population_relative_process_housing_limit():
     effect = IncreasePopulationRelative(new_population_percentage=0.5)  # 50% increase
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 100  # Housing limit
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 100  # Housing limit
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 100  # Limited by housing capacity
 
 
@@ -72,13 +71,12 @@ def test_increase_population_relative_process_exact_housing_limit():
     effect = IncreasePopulationRelative(new_population_percentage=0.25)  # 25% increase
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 100
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 100
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 100  # 80 * 1.25 = 100, exactly at limit
 
 
@@ -89,13 +87,12 @@ def test_increase_population_relative_process_creates_savegame():
     effect = IncreasePopulationRelative(new_population_percentage=0.3)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 200
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 200
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         expected_population = min(round(0 * (1 + 0.3)), 200)  # Default population (0) * (1 + percentage)
         assert savegame.population == expected_population
 
@@ -107,28 +104,39 @@ def test_increase_population_relative_process_zero_percentage():
     effect = IncreasePopulationRelative(new_population_percentage=0.0)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 300
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 300
 
         effect.process(savegame=savegame)
 
-        savegame.refresh_from_db()
         assert savegame.population == 110
 
 
 @pytest.mark.django_db
-def test_increase_population_relative_process_calls_housing_service():
-    """Test process calls BuildingHousingService to calculate max space."""
+def test_increase_population_relative_process_reads_city_stats():
+    """Test process reads the max space from the city statistics."""
     savegame = SavegameFactory(population=60)
     effect = IncreasePopulationRelative(new_population_percentage=0.1)
 
     with mock.patch(
-        "apps.city.events.effects.savegame.increase_population_relative.BuildingHousingService"
-    ) as mock_service:
-        mock_service.return_value.calculate_max_space.return_value = 150
+        "apps.city.events.effects.savegame.increase_population_relative.get_city_stats"
+    ) as mock_get_city_stats:
+        mock_get_city_stats.return_value.housing_space = 150
 
         effect.process(savegame=savegame)
 
-        mock_service.assert_called_once()
-        mock_service.return_value.calculate_max_space.assert_called_once()
+        mock_get_city_stats.assert_called_once_with(savegame=savegame)
+
+
+@pytest.mark.django_db
+def test_increase_population_relative_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(population=50)
+    CityStatsFactory(savegame=savegame, housing_space=200)
+    effect = IncreasePopulationRelative(new_population_percentage=0.2)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.population != 50
+    assert Savegame.objects.get(pk=savegame.pk).population == 50
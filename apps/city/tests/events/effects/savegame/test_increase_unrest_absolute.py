@@ -1,6 +1,7 @@
 import pytest
 
 from apps.city.events.effects.savegame.increase_unrest_absolute import IncreaseUnrestAbsolute
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -20,7 +21,6 @@ def test_increase_unrest_absolute_process_normal_increase():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 50
 
 
@@ -32,7 +32,6 @@ def test_increase_unrest_absolute_process_maximum_hundred():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 100
 
 
@@ -44,7 +43,6 @@ def test_increase_unrest_absolute_process_exact_hundred():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 100
 
 
@@ -56,7 +54,6 @@ def test_increase_unrest_absolute_process_creates_savegame():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == min(0 + 25, 100)  # Default unrest (0) + additional, max 100
 
 
@@ -68,5 +65,16 @@ def test_increase_unrest_absolute_process_zero_increase():
 
     effect.process(savegame=savegame)
 
-    savegame.refresh_from_db()
     assert savegame.unrest == 40
+
+
+@pytest.mark.django_db
+def test_increase_unrest_absolute_process_does_not_save():
+    """Test process only changes the savegame in memory, persisting is up to the caller."""
+    savegame = SavegameFactory(unrest=50)
+    effect = IncreaseUnrestAbsolute(additional_unrest=10)
+
+    effect.process(savegame=savegame)
+
+    assert savegame.unrest != 50
+    assert Savegame.objects.get(pk=savegame.pk).unrest == 50
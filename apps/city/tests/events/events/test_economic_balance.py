@@ -6,6 +6,7 @@ from django.contrib import messages
 from apps.city.events.effects.savegame.decrease_coins import DecreaseCoins
 from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
 from apps.city.events.events.economic_balance import Event as EconomicBalanceEvent
+from apps.city.models import CityStats
 from apps.city.tests.factories import BuildingFactory, TerrainFactory, TileFactory
 from apps.savegame.tests.factories import SavegameFactory
 
@@ -14,14 +15,10 @@ from apps.savegame.tests.factories import SavegameFactory
 def test_economic_balance_event_init_positive_balance():
     """Test EconomicBalanceEvent initialization with positive balance."""
     savegame = SavegameFactory.create()
-    balance_data = {
-        "balance": 150,
-        "taxes": 200,
-        "maintenance": 50,
-    }
+    city_stats = CityStats(taxes=200, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
 
@@ -38,14 +35,10 @@ def test_economic_balance_event_init_positive_balance():
 def test_economic_balance_event_init_negative_balance():
     """Test EconomicBalanceEvent initialization with negative balance."""
     savegame = SavegameFactory.create()
-    balance_data = {
-        "balance": -75,
-        "taxes": 25,
-        "maintenance": 100,
-    }
+    city_stats = CityStats(taxes=25, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
 
@@ -58,13 +51,13 @@ def test_economic_balance_event_init_negative_balance():
 def test_economic_balance_event_get_probability_with_positive_balance():
     """Test get_probability returns base probability when balance is positive."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 100, "taxes": 150, "maintenance": 50}
+    city_stats = CityStats(taxes=150, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
-        probability = event.get_probability()
+        probability = event.get_probability(context=event.context)
 
         assert probability == 100
 
@@ -73,13 +66,13 @@ def test_economic_balance_event_get_probability_with_positive_balance():
 def test_economic_balance_event_get_probability_with_negative_balance():
     """Test get_probability returns base probability when balance is negative."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": -50, "taxes": 50, "maintenance": 100}
+    city_stats = CityStats(taxes=50, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
-        probability = event.get_probability()
+        probability = event.get_probability(context=event.context)
 
         assert probability == 100
 
@@ -88,13 +81,13 @@ def test_economic_balance_event_get_probability_with_negative_balance():
 def test_economic_balance_event_get_probability_zero_balance():
     """Test get_probability returns 0 when balance is zero."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 0, "taxes": 100, "maintenance": 100}
+    city_stats = CityStats(taxes=100, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
-        probability = event.get_probability()
+        probability = event.get_probability(context=event.context)
 
         assert probability == 0
 
@@ -103,10 +96,10 @@ def test_economic_balance_event_get_probability_zero_balance():
 def test_economic_balance_event_prepare_effect_positive_balance():
     """Test _prepare_effect_adjust_coins returns IncreaseCoins for positive balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 120, "taxes": 150, "maintenance": 30}
+    city_stats = CityStats(taxes=150, maintenance_costs=30)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         effect = event._prepare_effect_adjust_coins()
@@ -119,10 +112,10 @@ def test_economic_balance_event_prepare_effect_positive_balance():
 def test_economic_balance_event_prepare_effect_negative_balance():
     """Test _prepare_effect_adjust_coins returns DecreaseCoins for negative balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": -80, "taxes": 20, "maintenance": 100}
+    city_stats = CityStats(taxes=20, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         effect = event._prepare_effect_adjust_coins()
@@ -135,10 +128,10 @@ def test_economic_balance_event_prepare_effect_negative_balance():
 def test_economic_balance_event_prepare_effect_zero_balance():
     """Test _prepare_effect_adjust_coins returns None for zero balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 0, "taxes": 50, "maintenance": 50}
+    city_stats = CityStats(taxes=50, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         effect = event._prepare_effect_adjust_coins()
@@ -150,10 +143,10 @@ def test_economic_balance_event_prepare_effect_zero_balance():
 def test_economic_balance_event_get_verbose_text_positive():
     """Test get_verbose_text returns correct description for positive balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 100, "taxes": 150, "maintenance": 50}
+    city_stats = CityStats(taxes=150, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         verbose_text = event.get_verbose_text()
@@ -169,10 +162,10 @@ def test_economic_balance_event_get_verbose_text_positive():
 def test_economic_balance_event_get_verbose_text_negative():
     """Test get_verbose_text returns correct description for negative balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": -60, "taxes": 40, "maintenance": 100}
+    city_stats = CityStats(taxes=40, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         verbose_text = event.get_verbose_text()
@@ -188,16 +181,15 @@ def test_economic_balance_event_get_verbose_text_negative():
 def test_economic_balance_event_process_positive_balance():
     """Test full event processing workflow with positive balance."""
     savegame = SavegameFactory(coins=500)
-    balance_data = {"balance": 100, "taxes": 150, "maintenance": 50}
+    city_stats = CityStats(taxes=150, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         result_text = event.process()
 
         # Verify effect was applied
-        savegame.refresh_from_db()
         assert savegame.coins == 600  # 500 + 100 = 600
 
         # Verify result text is returned
@@ -209,16 +201,15 @@ def test_economic_balance_event_process_positive_balance():
 def test_economic_balance_event_process_negative_balance():
     """Test full event processing workflow with negative balance."""
     savegame = SavegameFactory(coins=300)
-    balance_data = {"balance": -75, "taxes": 25, "maintenance": 100}
+    city_stats = CityStats(taxes=25, maintenance_costs=100)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         result_text = event.process()
 
         # Verify effect was applied
-        savegame.refresh_from_db()
         assert savegame.coins == 225  # 300 - 75 = 225
 
         # Verify result text is returned
@@ -230,10 +221,10 @@ def test_economic_balance_event_process_negative_balance():
 def test_economic_balance_event_get_effects_positive():
     """Test get_effects returns list with IncreaseCoins effect for positive balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": 50, "taxes": 100, "maintenance": 50}
+    city_stats = CityStats(taxes=100, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         effects = event.get_effects()
@@ -247,10 +238,10 @@ def test_economic_balance_event_get_effects_positive():
 def test_economic_balance_event_get_effects_negative():
     """Test get_effects returns list with DecreaseCoins effect for negative balance."""
     savegame = SavegameFactory.create()
-    balance_data = {"balance": -30, "taxes": 20, "maintenance": 50}
+    city_stats = CityStats(taxes=20, maintenance_costs=50)
 
-    with mock.patch("apps.city.events.events.economic_balance.get_balance_data") as mock_balance:
-        mock_balance.return_value = balance_data
+    with mock.patch("apps.event.events.context.get_city_stats") as mock_get_city_stats:
+        mock_get_city_stats.return_value = city_stats
 
         event = EconomicBalanceEvent(savegame=savegame)
         effects = event.get_effects()
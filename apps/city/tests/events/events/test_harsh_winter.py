@@ -1,3 +1,4 @@
+import random
 from unittest import mock
 
 import pytest
@@ -5,6 +6,7 @@ from django.contrib import messages
 
 from apps.city.events.events.harsh_winter import Event as HarshWinterEvent
 from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.event.events.context import EventContext
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -28,8 +30,9 @@ def test_harsh_winter_event_init_collects_all_wall_tiles():
     tile1 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
     tile2 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=80)
 
-    with mock.patch("apps.city.events.events.harsh_winter.random.randint", return_value=15):
-        event = HarshWinterEvent(savegame=savegame)
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 15
+    event = HarshWinterEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
     assert event.damage == 15
     tile_ids = {t.id for t in event.wall_tiles}
@@ -45,31 +48,43 @@ def test_harsh_winter_event_init_ignores_tiles_without_hitpoints():
     building = BuildingFactory.create(building_type=wall_type, level=1)
     TileFactory.create(savegame=savegame, building=building, wall_hitpoints=None)
 
-    with mock.patch("apps.city.events.events.harsh_winter.random.randint", return_value=15):
-        event = HarshWinterEvent(savegame=savegame)
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 15
+    event = HarshWinterEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
     assert len(event.wall_tiles) == 0
 
 
 @pytest.mark.django_db
 def test_harsh_winter_event_get_effects_returns_damage_for_all_tiles():
-    """Test get_effects returns one DamageWall per wall tile."""
-    from apps.city.events.effects.building.damage_wall import DamageWall
+    """Test get_effects returns a single DamageWalls effect for all wall tiles."""
+    from apps.city.events.effects.building.damage_walls import DamageWalls
 
     savegame = SavegameFactory.create()
     wall_type = WallBuildingTypeFactory.create()
     building = BuildingFactory.create(building_type=wall_type, level=1)
-    TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
-    TileFactory.create(savegame=savegame, building=building, wall_hitpoints=80)
+    tile1 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
+    tile2 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=80)
 
-    with mock.patch("apps.city.events.events.harsh_winter.random.randint", return_value=15):
-        event = HarshWinterEvent(savegame=savegame)
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 15
+    event = HarshWinterEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
     effects = event.get_effects()
 
-    assert len(effects) == 2
-    assert all(isinstance(e, DamageWall) for e in effects)
-    assert all(e.damage == 15 for e in effects)
+    assert len(effects) == 1
+    assert isinstance(effects[0], DamageWalls)
+    assert effects[0].tiles == [tile1, tile2]
+    assert effects[0].damage == 15
+
+
+@pytest.mark.django_db
+def test_harsh_winter_event_get_effects_empty_without_walls():
+    """Test get_effects returns an empty list when no wall tiles exist."""
+    savegame = SavegameFactory.create()
+    event = HarshWinterEvent(savegame=savegame)
+
+    assert event.get_effects() == []
 
 
 @pytest.mark.django_db
@@ -81,9 +96,10 @@ def test_harsh_winter_event_process(ruins_building):
     tile1 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
     tile2 = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=50)
 
-    with mock.patch("apps.city.events.events.harsh_winter.random.randint", return_value=15):
-        event = HarshWinterEvent(savegame=savegame)
-        event.process()
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 15
+    event = HarshWinterEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    event.process()
 
     tile1.refresh_from_db()
     tile2.refresh_from_db()
@@ -97,7 +113,7 @@ def test_harsh_winter_event_get_probability_zero_without_walls():
     savegame = SavegameFactory.create()
     event = HarshWinterEvent(savegame=savegame)
 
-    assert event.get_probability() == 0
+    assert event.get_probability(context=event.context) == 0
 
 
 @pytest.mark.django_db
@@ -110,7 +126,7 @@ def test_harsh_winter_event_get_probability_nonzero_with_walls():
 
     event = HarshWinterEvent(savegame=savegame)
 
-    assert event.get_probability() == 15
+    assert event.get_probability(context=event.context) == 15
 
 
 @pytest.mark.django_db
@@ -121,8 +137,9 @@ def test_harsh_winter_event_get_verbose_text():
     building = BuildingFactory.create(building_type=wall_type, level=1)
     TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
 
-    with mock.patch("apps.city.events.events.harsh_winter.random.randint", return_value=15):
-        event = HarshWinterEvent(savegame=savegame)
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 15
+    event = HarshWinterEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
     text = event.get_verbose_text()
     assert "15" in text
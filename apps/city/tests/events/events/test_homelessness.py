@@ -1,3 +1,4 @@
+import random
 from unittest import mock
 
 import pytest
@@ -5,6 +6,7 @@ import pytest
 from apps.city.events.effects.savegame.increase_unrest_absolute import IncreaseUnrestAbsolute
 from apps.city.events.events.homelessness import Event as HomelessnessEvent
 from apps.city.tests.factories import BuildingFactory, HouseBuildingTypeFactory, TileFactory
+from apps.event.events.context import EventContext
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -13,16 +15,16 @@ def test_homelessness_event_init():
     """Test HomelessnessEvent initialization and class attributes."""
     savegame = SavegameFactory(unrest=25)
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint") as mock_randint:
-        mock_randint.return_value = 6
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 6
 
-        event = HomelessnessEvent(savegame=savegame)
+    event = HomelessnessEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.PROBABILITY == 90
-        assert event.TITLE == "Homelessness"
-        assert event.savegame.id == savegame.id
-        assert event.initial_unrest == 25
-        assert event.additional_unrest == 6
+    assert event.PROBABILITY == 90
+    assert event.TITLE == "Homelessness"
+    assert event.savegame.id == savegame.id
+    assert event.initial_unrest == 25
+    assert event.additional_unrest == 6
 
 
 @pytest.mark.django_db
@@ -30,12 +32,12 @@ def test_homelessness_event_init_creates_savegame():
     """Test HomelessnessEvent creates savegame if it doesn't exist."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint") as mock_randint:
-        mock_randint.return_value = 7
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 7
 
-        event = HomelessnessEvent(savegame=savegame)
+    event = HomelessnessEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.savegame.id == savegame.id
+    assert event.savegame.id == savegame.id
 
 
 @pytest.mark.django_db
@@ -46,11 +48,10 @@ def test_homelessness_event_get_probability_homeless_situation():
     building = BuildingFactory(building_type=building_type, housing_space=10)
     TileFactory(savegame=savegame, building=building, x=50, y=10)
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint"):
-        event = HomelessnessEvent(savegame=savegame)
-        probability = event.get_probability()
+    event = HomelessnessEvent(savegame=savegame)
+    probability = event.get_probability(context=event.context)
 
-        assert probability == 90
+    assert probability == 90
 
 
 @pytest.mark.django_db
@@ -61,11 +62,10 @@ def test_homelessness_event_get_probability_no_homelessness():
     building = BuildingFactory(building_type=building_type, housing_space=60)
     TileFactory(savegame=savegame, building=building, x=51, y=10)
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint"):
-        event = HomelessnessEvent(savegame=savegame)
-        probability = event.get_probability()
+    event = HomelessnessEvent(savegame=savegame)
+    probability = event.get_probability(context=event.context)
 
-        assert probability == 0
+    assert probability == 0
 
 
 @pytest.mark.django_db
@@ -76,11 +76,10 @@ def test_homelessness_event_get_probability_max_unrest():
     building = BuildingFactory(building_type=building_type, housing_space=10)
     TileFactory(savegame=savegame, building=building, x=52, y=10)
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint"):
-        event = HomelessnessEvent(savegame=savegame)
-        probability = event.get_probability()
+    event = HomelessnessEvent(savegame=savegame)
+    probability = event.get_probability(context=event.context)
 
-        assert probability == 0
+    assert probability == 0
 
 
 @pytest.mark.django_db
@@ -88,14 +87,14 @@ def test_homelessness_event_prepare_effect_decrease_population():
     """Test _prepare_effect_decrease_population returns correct effect."""
     savegame = SavegameFactory(unrest=20)
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint") as mock_randint:
-        mock_randint.return_value = 7
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 7
 
-        event = HomelessnessEvent(savegame=savegame)
-        effect = event._prepare_effect_decrease_population()
+    event = HomelessnessEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    effect = event._prepare_effect_decrease_population()
 
-        assert isinstance(effect, IncreaseUnrestAbsolute)
-        assert effect.additional_unrest == 7
+    assert isinstance(effect, IncreaseUnrestAbsolute)
+    assert effect.additional_unrest == 7
 
 
 @pytest.mark.django_db
@@ -105,23 +104,23 @@ def test_homelessness_event_get_verbose_text():
     savegame.unrest = 30
     savegame.save()
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint") as mock_randint:
-        mock_randint.return_value = 8
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 8
 
-        event = HomelessnessEvent(savegame=savegame)
-        initial_unrest = event.initial_unrest
+    event = HomelessnessEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    initial_unrest = event.initial_unrest
 
-        # Simulate effect processing (increase unrest)
-        savegame.unrest = min(savegame.unrest + 8, 100)
-        savegame.save()
+    # Simulate effect processing (increase unrest)
+    savegame.unrest = min(savegame.unrest + 8, 100)
+    savegame.save()
 
-        verbose_text = event.get_verbose_text()
+    verbose_text = event.get_verbose_text()
 
-        expected_text = (
-            "Beggars and homeless folk are crowding the streets. The situation grows tenser by the day. The citys "
-            f"unrest increased by {savegame.unrest - initial_unrest}%."
-        )
-        assert verbose_text == expected_text
+    expected_text = (
+        "Beggars and homeless folk are crowding the streets. The situation grows tenser by the day. The citys "
+        f"unrest increased by {savegame.unrest - initial_unrest}%."
+    )
+    assert verbose_text == expected_text
 
 
 @pytest.mark.django_db
@@ -129,9 +128,9 @@ def test_homelessness_event_random_range():
     """Test that random.randint is called with correct range."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.homelessness.random.randint") as mock_randint:
-        mock_randint.return_value = 6
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 6
 
-        HomelessnessEvent(savegame=savegame)
+    HomelessnessEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        mock_randint.assert_called_once_with(5, 8)
+    rng.randint.assert_called_once_with(5, 8)
@@ -63,7 +63,7 @@ def test_population_increase_event_get_probability_space_available():
     TileFactory(savegame=savegame, building=building, x=60, y=10)
 
     event = PopulationIncreaseEvent(savegame=savegame)
-    probability = event.get_probability()
+    probability = event.get_probability(context=event.context)
 
     assert probability == 100
 
@@ -78,7 +78,7 @@ def test_population_increase_event_get_probability_no_space():
     TileFactory(savegame=savegame, building=building, x=61, y=10)
 
     event = PopulationIncreaseEvent(savegame=savegame)
-    probability = event.get_probability()
+    probability = event.get_probability(context=event.context)
 
     assert probability == 0
 
@@ -92,7 +92,7 @@ def test_population_increase_event_get_probability_exact_capacity():
     TileFactory(savegame=savegame, building=building, x=62, y=10)
 
     event = PopulationIncreaseEvent(savegame=savegame)
-    probability = event.get_probability()
+    probability = event.get_probability(context=event.context)
 
     assert probability == 0
 
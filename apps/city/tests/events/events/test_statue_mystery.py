@@ -24,7 +24,7 @@ def test_statue_mystery_event_get_probability_with_population():
     savegame = SavegameFactory(population=50)
 
     event = StatueMysteryEvent(savegame=savegame)
-    probability = event.get_probability()
+    probability = event.get_probability(context=event.context)
 
     assert probability == 1
 
@@ -35,7 +35,7 @@ def test_statue_mystery_event_get_probability_zero_population():
     savegame = SavegameFactory(population=0)
 
     event = StatueMysteryEvent(savegame=savegame)
-    probability = event.get_probability()
+    probability = event.get_probability(context=event.context)
 
     assert probability == 0
 
@@ -1,3 +1,4 @@
+import random
 from unittest import mock
 
 import pytest
@@ -5,6 +6,7 @@ from django.contrib import messages
 
 from apps.city.events.events.wall_crumbles import Event as WallCrumblesEvent
 from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.event.events.context import EventContext
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -27,16 +29,13 @@ def test_wall_crumbles_event_init_selects_wall_tiles():
     building = BuildingFactory.create(building_type=wall_type, level=1)
     TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
 
-    with (
-        mock.patch("apps.city.events.events.wall_crumbles.random.randint") as mock_randint,
-        mock.patch("apps.city.events.events.wall_crumbles.random.sample") as mock_sample,
-    ):
-        mock_randint.return_value = 40
-        mock_sample.return_value = []  # return value doesn't matter for this test
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 40
+    rng.sample.return_value = []  # return value doesn't matter for this test
 
-        event = WallCrumblesEvent(savegame=savegame)
+    event = WallCrumblesEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.damage_per_tile == 40
+    assert event.damage_per_tile == 40
 
 
 @pytest.mark.django_db
@@ -45,7 +44,7 @@ def test_wall_crumbles_event_probability_zero_without_walls():
     savegame = SavegameFactory.create()
     event = WallCrumblesEvent(savegame=savegame)
 
-    assert event.get_probability() == 0
+    assert event.get_probability(context=event.context) == 0
 
 
 @pytest.mark.django_db
@@ -58,32 +57,29 @@ def test_wall_crumbles_event_probability_nonzero_with_walls():
 
     event = WallCrumblesEvent(savegame=savegame)
 
-    assert event.get_probability() == 20
+    assert event.get_probability(context=event.context) == 20
 
 
 @pytest.mark.django_db
 def test_wall_crumbles_event_get_effects_returns_damage_effects():
-    """Test get_effects returns DamageWall effects for affected tiles."""
-    from apps.city.events.effects.building.damage_wall import DamageWall
+    """Test get_effects returns a DamageWalls effect for the affected tiles."""
+    from apps.city.events.effects.building.damage_walls import DamageWalls
 
     savegame = SavegameFactory.create()
     wall_type = WallBuildingTypeFactory.create()
     building = BuildingFactory.create(building_type=wall_type, level=1)
     tile = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
 
-    with (
-        mock.patch("apps.city.events.events.wall_crumbles.random.randint") as mock_randint,
-        mock.patch("apps.city.events.events.wall_crumbles.random.sample") as mock_sample,
-    ):
-        mock_randint.return_value = 40
-        mock_sample.return_value = [tile]
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 40
+    rng.sample.return_value = [tile]
 
-        event = WallCrumblesEvent(savegame=savegame)
-        effects = event.get_effects()
+    event = WallCrumblesEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    effects = event.get_effects()
 
     assert len(effects) == 1
-    assert isinstance(effects[0], DamageWall)
-    assert effects[0].tile == tile
+    assert isinstance(effects[0], DamageWalls)
+    assert effects[0].tiles == [tile]
     assert effects[0].damage == 40
 
 
@@ -106,15 +102,12 @@ def test_wall_crumbles_event_process(ruins_building):
     building = BuildingFactory.create(building_type=wall_type, level=1)
     tile = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
 
-    with (
-        mock.patch("apps.city.events.events.wall_crumbles.random.randint") as mock_randint,
-        mock.patch("apps.city.events.events.wall_crumbles.random.sample") as mock_sample,
-    ):
-        mock_randint.return_value = 40
-        mock_sample.side_effect = lambda population, k: population[:k]
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 40
+    rng.sample.side_effect = lambda population, k: population[:k]
 
-        event = WallCrumblesEvent(savegame=savegame)
-        event.process()
+    event = WallCrumblesEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    event.process()
 
     tile.refresh_from_db()
     assert tile.wall_hitpoints == 60
@@ -128,14 +121,11 @@ def test_wall_crumbles_event_get_verbose_text():
     building = BuildingFactory.create(building_type=wall_type, level=1)
     tile = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=100)
 
-    with (
-        mock.patch("apps.city.events.events.wall_crumbles.random.randint") as mock_randint,
-        mock.patch("apps.city.events.events.wall_crumbles.random.sample") as mock_sample,
-    ):
-        mock_randint.return_value = 40
-        mock_sample.return_value = [tile]
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 40
+    rng.sample.return_value = [tile]
 
-        event = WallCrumblesEvent(savegame=savegame)
+    event = WallCrumblesEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
     text = event.get_verbose_text()
     assert "40" in text
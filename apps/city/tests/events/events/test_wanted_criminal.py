@@ -1,9 +1,11 @@
+import random
 from unittest import mock
 
 import pytest
 
 from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
 from apps.city.events.events.wanted_criminal import Event as WantedCriminalEvent
+from apps.event.events.context import EventContext
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -14,14 +16,14 @@ def test_wanted_criminal_event_init():
 
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 150
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 150
 
-        event = WantedCriminalEvent(savegame=savegame)
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.PROBABILITY == 20
-        assert event.TITLE == "Wanted criminal"
-        assert event.bounty == 150
+    assert event.PROBABILITY == 20
+    assert event.TITLE == "Wanted criminal"
+    assert event.bounty == 150
 
 
 @pytest.mark.django_db
@@ -29,14 +31,14 @@ def test_wanted_criminal_event_prepare_effect_increase_coins():
     """Test _prepare_effect_increase_coins returns correct effect."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 250
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 250
 
-        event = WantedCriminalEvent(savegame=savegame)
-        effect = event._prepare_effect_increase_coins()
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    effect = event._prepare_effect_increase_coins()
 
-        assert isinstance(effect, IncreaseCoins)
-        assert effect.coins == 250
+    assert isinstance(effect, IncreaseCoins)
+    assert effect.coins == 250
 
 
 @pytest.mark.django_db
@@ -44,17 +46,17 @@ def test_wanted_criminal_event_get_verbose_text():
     """Test get_verbose_text returns correct description."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 200
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 200
 
-        event = WantedCriminalEvent(savegame=savegame)
-        verbose_text = event.get_verbose_text()
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
+    verbose_text = event.get_verbose_text()
 
-        expected_text = (
-            "The magistrate caught a wanted criminal. The malefactor was handed over to the Kings guard, rewarding "
-            "you with 200 coin."
-        )
-        assert verbose_text == expected_text
+    expected_text = (
+        "The magistrate caught a wanted criminal. The malefactor was handed over to the Kings guard, rewarding "
+        "you with 200 coin."
+    )
+    assert verbose_text == expected_text
 
 
 @pytest.mark.django_db
@@ -62,12 +64,12 @@ def test_wanted_criminal_event_random_range():
     """Test that random.randint is called with correct range."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 175
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 175
 
-        WantedCriminalEvent(savegame=savegame)
+    WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        mock_randint.assert_called_once_with(100, 300)
+    rng.randint.assert_called_once_with(100, 300)
 
 
 @pytest.mark.django_db
@@ -75,12 +77,12 @@ def test_wanted_criminal_event_minimum_bounty():
     """Test WantedCriminalEvent with minimum bounty."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 100
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 100
 
-        event = WantedCriminalEvent(savegame=savegame)
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.bounty == 100
+    assert event.bounty == 100
 
 
 @pytest.mark.django_db
@@ -88,12 +90,12 @@ def test_wanted_criminal_event_maximum_bounty():
     """Test WantedCriminalEvent with maximum bounty."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 300
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 300
 
-        event = WantedCriminalEvent(savegame=savegame)
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.bounty == 300
+    assert event.bounty == 300
 
 
 @pytest.mark.django_db
@@ -101,9 +103,9 @@ def test_wanted_criminal_event_mid_range_bounty():
     """Test WantedCriminalEvent with mid-range bounty."""
     savegame = SavegameFactory.create()
 
-    with mock.patch("apps.city.events.events.wanted_criminal.random.randint") as mock_randint:
-        mock_randint.return_value = 225
+    rng = mock.Mock(wraps=random.Random(0))
+    rng.randint.return_value = 225
 
-        event = WantedCriminalEvent(savegame=savegame)
+    event = WantedCriminalEvent(savegame=savegame, context=EventContext(savegame=savegame, rng=rng))
 
-        assert event.bounty == 225
+    assert event.bounty == 225
@@ -1,6 +1,6 @@
 import factory
 
-from apps.city.models import Building, BuildingType, Terrain, Tile
+from apps.city.models import Building, BuildingType, CityStats, Terrain, Tile
 
 
 class TerrainFactory(factory.django.DjangoModelFactory):
@@ -59,6 +59,13 @@ class BuildingFactory(factory.django.DjangoModelFactory):
     housing_space = 2
 
 
+class CityStatsFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = CityStats
+
+    savegame = factory.SubFactory("apps.savegame.tests.factories.SavegameFactory")
+
+
 # Specialized factories
 class RiverTerrainFactory(TerrainFactory):
     name = "River"
@@ -1,6 +1,8 @@
 import pytest
+from django.core.exceptions import ValidationError
 
 from apps.city.fields.building import BuildingModelChoiceField
+from apps.city.models import Building
 from apps.city.tests.factories import BuildingFactory, BuildingTypeFactory
 
 
@@ -34,3 +36,52 @@ def test_building_model_choice_field_inheritance():
 
     field = BuildingModelChoiceField(queryset=None)
     assert isinstance(field, ModelChoiceField)
+
+
+@pytest.mark.django_db
+def test_building_model_choice_field_set_buildings():
+    """Test set_buildings offers exactly the given buildings."""
+    building = BuildingFactory(name="Manor House", building_costs=150)
+    BuildingFactory()
+
+    field = BuildingModelChoiceField(queryset=None)
+    field.set_buildings(buildings=[building])
+
+    assert list(field.queryset) == [building]
+    assert list(field.choices) == [(building.pk, "Manor House (150 coins)")]
+
+
+@pytest.mark.django_db
+def test_building_model_choice_field_to_python_uses_given_buildings(django_assert_num_queries):
+    """Test to_python resolves the given buildings by primary key or instance without querying."""
+    building = BuildingFactory()
+    field = BuildingModelChoiceField(queryset=None)
+    field.set_buildings(buildings=[building])
+
+    with django_assert_num_queries(0):
+        assert field.to_python(str(building.pk)) is building
+        assert field.to_python(building) is building
+        assert field.to_python("") is None
+
+
+@pytest.mark.django_db
+def test_building_model_choice_field_to_python_invalid_choice():
+    """Test to_python rejects buildings which are not offered."""
+    building = BuildingFactory()
+    other_building = BuildingFactory()
+    field = BuildingModelChoiceField(queryset=None)
+    field.set_buildings(buildings=[building])
+
+    with pytest.raises(ValidationError) as exc_info:
+        field.to_python(other_building.pk)
+
+    assert exc_info.value.code == "invalid_choice"
+
+
+@pytest.mark.django_db
+def test_building_model_choice_field_to_python_without_given_buildings():
+    """Test to_python falls back to the queryset if no buildings were given."""
+    building = BuildingFactory()
+    field = BuildingModelChoiceField(queryset=Building.objects.all())
+
+    assert field.to_python(building.pk) == building
@@ -0,0 +1,36 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.city.models import CityStats
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_rebuild_city_stats_command():
+    """Test rebuild_city_stats rebuilds all statistics and reports the outdated ones."""
+    building = BuildingFactory(housing_space=4, taxes=10, maintenance_costs=2, prestige=1)
+    consistent = CityStatsFactory(housing_space=4, taxes=10, maintenance_costs=2, prestige=1)
+    TileFactory(savegame=consistent.savegame, building=building)
+    outdated = CityStatsFactory(housing_space=99)
+    TileFactory(savegame=outdated.savegame, building=building)
+    missing_savegame = SavegameFactory()
+    TileFactory(savegame=missing_savegame, building=building)
+
+    out = StringIO()
+    call_command("rebuild_city_stats", stdout=out)
+
+    output = out.getvalue()
+    assert f"Statistics of savegame #{consistent.savegame_id} were out of date." not in output
+    assert f"Statistics of savegame #{outdated.savegame_id} were out of date." in output
+    assert f"Statistics of savegame #{missing_savegame.id} were out of date." in output
+    assert "Rebuilt statistics of 3 savegames, 2 were out of date." in output
+
+    assert CityStats.objects.count() == 3
+    for stats in CityStats.objects.all():
+        assert stats.housing_space == 4
+        assert stats.taxes == 10
+        assert stats.maintenance_costs == 2
+        assert stats.prestige == 1
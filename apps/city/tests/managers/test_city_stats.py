@@ -0,0 +1,82 @@
+import pytest
+
+from apps.city.models import CityStats
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_city_stats_manager_apply_building_change():
+    """Test apply_building_change applies the difference between the old and the new building."""
+    stats = CityStatsFactory(housing_space=10, taxes=20, maintenance_costs=5, prestige=3, defense=7)
+    old_building = BuildingFactory(housing_space=4, taxes=10, maintenance_costs=2, prestige=0)
+    new_building = BuildingFactory(housing_space=1, taxes=15, maintenance_costs=2, prestige=2)
+
+    CityStats.objects.apply_building_change(
+        savegame=stats.savegame, old_building=old_building, new_building=new_building
+    )
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 7
+    assert stats.taxes == 25
+    assert stats.maintenance_costs == 5
+    assert stats.prestige == 5
+    assert stats.defense == 7
+
+
+@pytest.mark.django_db
+def test_city_stats_manager_apply_building_change_without_buildings():
+    """Test apply_building_change handles building and demolishing on empty tiles."""
+    stats = CityStatsFactory(housing_space=10, taxes=20)
+    building = BuildingFactory(housing_space=4, taxes=10)
+
+    CityStats.objects.apply_building_change(savegame=stats.savegame, old_building=None, new_building=building)
+    stats.refresh_from_db()
+    assert stats.housing_space == 14
+    assert stats.taxes == 30
+
+    CityStats.objects.apply_building_change(savegame=stats.savegame, old_building=building, new_building=None)
+    stats.refresh_from_db()
+    assert stats.housing_space == 10
+    assert stats.taxes == 20
+
+
+@pytest.mark.django_db
+def test_city_stats_manager_apply_building_change_unchanged(django_assert_num_queries):
+    """Test apply_building_change doesn't query if the building stays the same."""
+    stats = CityStatsFactory()
+    building = BuildingFactory()
+
+    with django_assert_num_queries(0):
+        CityStats.objects.apply_building_change(savegame=stats.savegame, old_building=building, new_building=building)
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 0
+
+
+@pytest.mark.django_db
+def test_city_stats_manager_apply_building_change_without_stats():
+    """Test apply_building_change skips savegames whose statistics were never calculated."""
+    savegame = SavegameFactory()
+
+    CityStats.objects.apply_building_change(savegame=savegame, old_building=None, new_building=BuildingFactory())
+
+    assert not CityStats.objects.filter(savegame=savegame).exists()
+
+
+@pytest.mark.django_db
+def test_city_stats_manager_apply_building_changes(django_assert_num_queries):
+    """Test apply_building_changes sums up the differences of several tiles into a single UPDATE."""
+    stats = CityStatsFactory(housing_space=10, taxes=20, maintenance_costs=5)
+    house = BuildingFactory(housing_space=4, taxes=10, maintenance_costs=2)
+    ruins = BuildingFactory(housing_space=0, taxes=0, maintenance_costs=1)
+
+    with django_assert_num_queries(1):
+        CityStats.objects.apply_building_changes(
+            savegame=stats.savegame, changes=[(house, ruins), (house, ruins), (None, house)]
+        )
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 6
+    assert stats.taxes == 10
+    assert stats.maintenance_costs == 5
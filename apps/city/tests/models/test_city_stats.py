@@ -0,0 +1,11 @@
+import pytest
+
+from apps.city.tests.factories import CityStatsFactory
+
+
+@pytest.mark.django_db
+def test_city_stats_str():
+    """Test string representation of city statistics."""
+    stats = CityStatsFactory()
+
+    assert str(stats) == f"Statistics of savegame #{stats.savegame_id}"
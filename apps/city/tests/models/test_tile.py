@@ -3,6 +3,7 @@ from unittest import mock
 import pytest
 from django.db import IntegrityError
 
+from apps.city.models.tile import get_color_class, get_terrain_image_url
 from apps.city.tests.factories import (
     BuildingFactory,
     BuildingTypeFactory,
@@ -13,6 +14,13 @@ from apps.city.tests.factories import (
 from apps.savegame.tests.factories import SavegameFactory
 
 
+@pytest.fixture(autouse=True)
+def _clear_tile_memos():
+    """Forget the memoized class templates and image URLs, so mocked rendering is observable."""
+    get_color_class.cache_clear()
+    get_terrain_image_url.cache_clear()
+
+
 # Tile Model Tests
 @pytest.mark.django_db
 def test_tile_str_representation():
@@ -279,3 +287,29 @@ def test_tile_wall_repair_cost_for_non_wall():
     tile = TileFactory.create(building=building)
 
     assert tile.wall_repair_cost is None
+
+
+@pytest.mark.django_db
+def test_tile_color_class_renders_template_once():
+    """Test color_class renders each class template only once per process."""
+    wall_type = WallBuildingTypeFactory.create()
+    tiles = TileFactory.create_batch(3, building=BuildingFactory(building_type=wall_type))
+
+    with mock.patch("apps.city.models.tile.render_to_string", return_value="wall-classes") as mock_render:
+        results = [tile.color_class() for tile in tiles]
+
+    mock_render.assert_called_once_with("city/classes/_tile_city_wall.txt")
+    assert results == ["wall-classes"] * 3
+
+
+@pytest.mark.django_db
+def test_tile_terrain_image_url_resolves_once():
+    """Test terrain_image_url resolves the static URL only once per image."""
+    terrain = TerrainFactory(image_filename="grass.png")
+    tiles = TileFactory.create_batch(3, terrain=terrain)
+
+    with mock.patch("apps.city.models.tile.static", return_value="/static/grass.png") as mock_static:
+        results = [tile.terrain_image_url() for tile in tiles]
+
+    mock_static.assert_called_once_with("img/tiles/grass.png")
+    assert results == ["/static/grass.png"] * 3
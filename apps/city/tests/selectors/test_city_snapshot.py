@@ -0,0 +1,75 @@
+import pytest
+
+from apps.city.constants import MAP_SIZE
+from apps.city.models import Building, Tile
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_get_city_snapshot_loads_tiles_and_buildings(django_assert_num_queries):
+    """Test get_city_snapshot loads the map with one tile query, the buildings are taken from the game catalog."""
+    savegame = SavegameFactory.create()
+    wall = BuildingFactory.create(building_type=WallBuildingTypeFactory.create(), level=1)
+    wall_tile = TileFactory.create(savegame=savegame, x=1, y=2, building=wall, wall_hitpoints=60)
+    empty_tile = TileFactory.create(savegame=savegame, x=3, y=4, building=None)
+    TileFactory.create(x=1, y=2, building=BuildingFactory.create())
+    get_game_catalog()
+
+    with django_assert_num_queries(1):
+        snapshot = get_city_snapshot(savegame=savegame)
+
+    tile = snapshot.get_tile(x=1, y=2)
+    assert tile.id == wall_tile.id
+    assert tile.terrain_id == wall_tile.terrain_id
+    assert tile.building.id == wall.id
+    assert tile.wall_hitpoints == 60
+    assert snapshot.get_tile(x=3, y=4).id == empty_tile.id
+    assert snapshot.get_tile(x=0, y=0) is None
+    assert list(snapshot.buildings) == [wall.id]
+
+
+@pytest.mark.django_db
+def test_get_city_snapshot_empty_map(django_assert_num_queries):
+    """Test get_city_snapshot loads an empty map with one tile query."""
+    savegame = SavegameFactory.create()
+    get_game_catalog()
+
+    with django_assert_num_queries(1):
+        snapshot = get_city_snapshot(savegame=savegame)
+
+    assert snapshot.width == MAP_SIZE
+    assert snapshot.height == MAP_SIZE
+    assert list(snapshot.iter_building_tiles()) == []
+
+
+@pytest.mark.django_db
+def test_get_city_snapshot_reloads_outdated_game_catalog():
+    """Test get_city_snapshot reloads the game catalog once if a building on the map is not known yet."""
+    savegame = SavegameFactory.create()
+    building_type = WallBuildingTypeFactory.create()
+    tile = TileFactory.create(savegame=savegame, x=1, y=1, building=None)
+    get_game_catalog()
+    # Bulk creation skips the signals, like a change made by another process without a shared cache
+    (building,) = Building.objects.bulk_create([BuildingFactory.build(building_type=building_type)])
+    Tile.objects.filter(id=tile.id).update(building=building)
+
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    assert snapshot.get_tile(x=1, y=1).building.id == building.id
+    assert get_game_catalog().buildings[building.id].name == building.name
+
+
+@pytest.mark.django_db
+def test_get_city_snapshot_grows_grid_for_larger_coordinates():
+    """Test the grid covers tiles outside the default map size."""
+    savegame = SavegameFactory.create()
+    TileFactory.create(savegame=savegame, x=MAP_SIZE + 5, y=MAP_SIZE + 1)
+
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    assert snapshot.width == MAP_SIZE + 6
+    assert snapshot.height == MAP_SIZE + 2
+    assert snapshot.contains(x=MAP_SIZE + 5, y=MAP_SIZE + 1) is True
@@ -0,0 +1,64 @@
+from unittest import mock
+
+import pytest
+
+from apps.city.models import CityStats
+from apps.city.selectors.city_stats import get_city_stats
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_get_city_stats_calculates_missing_stats():
+    """Test get_city_stats calculates and stores the statistics on first access."""
+    savegame = SavegameFactory()
+    TileFactory(savegame=savegame, building=BuildingFactory(housing_space=4))
+
+    stats = get_city_stats(savegame=savegame)
+
+    assert stats.housing_space == 4
+    assert CityStats.objects.filter(savegame=savegame).exists()
+
+
+@pytest.mark.django_db
+def test_get_city_stats_reads_stored_stats(django_assert_num_queries):
+    """Test get_city_stats reads the stored row with a single query while the map is unchanged."""
+    stats = CityStatsFactory(housing_space=8, defense_map_revision=0)
+
+    with django_assert_num_queries(1):
+        result = get_city_stats(savegame=stats.savegame)
+
+    assert result == stats
+    assert result.housing_space == 8
+
+
+@pytest.mark.django_db
+def test_get_city_stats_does_not_write_outdated_defense(django_assert_num_queries):
+    """Test get_city_stats only reads, the defense is refreshed where the map revision is bumped."""
+    stats = CityStatsFactory(defense=5, defense_map_revision=0)
+    stats.savegame.map_revision = 1
+
+    with django_assert_num_queries(1):
+        result = get_city_stats(savegame=stats.savegame)
+
+    assert result.defense == 5
+
+
+@pytest.mark.django_db
+def test_get_city_stats_uses_stats_stored_by_concurrent_request():
+    """Test get_city_stats falls back to the row of a concurrent request, which stored the statistics first."""
+    savegame = SavegameFactory()
+    stored_stats = CityStatsFactory.build(savegame=savegame, housing_space=8)
+
+    def calculate_while_other_request_stores() -> CityStats:
+        CityStatsFactory(savegame=savegame, housing_space=3)
+        return stored_stats
+
+    with mock.patch(
+        "apps.city.selectors.city_stats.CityStatsCalculationService.process",
+        side_effect=calculate_while_other_request_stores,
+    ):
+        result = get_city_stats(savegame=savegame)
+
+    assert result.housing_space == 3
+    assert CityStats.objects.filter(savegame=savegame).count() == 1
@@ -0,0 +1,78 @@
+import pytest
+from django.core.cache import caches
+
+from apps.city.selectors.game_catalog import (
+    CATALOG_VERSION_CACHE_KEY,
+    get_game_catalog,
+    get_game_catalog_version,
+    invalidate_game_catalog,
+)
+from apps.city.tests.factories import BuildingFactory, TerrainFactory
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+
+
+@pytest.mark.django_db
+def test_get_game_catalog_loads_reference_data(django_assert_num_queries):
+    """Test get_game_catalog loads terrains, building types and buildings with four queries."""
+    building = BuildingFactory.create()
+    terrain = TerrainFactory.create()
+    invalidate_game_catalog()
+
+    with django_assert_num_queries(4):
+        catalog = get_game_catalog()
+
+    assert catalog.terrains[terrain.id] == terrain
+    assert catalog.building_types[building.building_type_id] == building.building_type
+    assert catalog.buildings[building.id] == building
+
+
+@pytest.mark.django_db
+def test_get_game_catalog_memoized(django_assert_num_queries):
+    """Test get_game_catalog returns the same catalog without queries as long as nothing changed."""
+    first = get_game_catalog()
+
+    with django_assert_num_queries(0):
+        second = get_game_catalog()
+
+    assert first is second
+
+
+@pytest.mark.django_db
+def test_get_game_catalog_reloads_after_invalidation():
+    """Test get_game_catalog reloads the catalog after invalidate_game_catalog() was called."""
+    first = get_game_catalog()
+
+    invalidate_game_catalog()
+
+    assert get_game_catalog() is not first
+
+
+@pytest.mark.django_db
+def test_get_game_catalog_reloads_on_new_version():
+    """Test get_game_catalog reloads the catalog if another process changed the version."""
+    first = get_game_catalog()
+
+    caches[SHARED_CACHE_ALIAS].set(CATALOG_VERSION_CACHE_KEY, "changed-by-another-process")
+
+    assert get_game_catalog() is not first
+    assert get_game_catalog() is get_game_catalog()
+
+
+@pytest.mark.django_db
+def test_get_game_catalog_reloads_on_missing_version():
+    """Test get_game_catalog reloads the catalog if the version was evicted from the cache."""
+    first = get_game_catalog()
+
+    caches[SHARED_CACHE_ALIAS].delete(CATALOG_VERSION_CACHE_KEY)
+
+    assert get_game_catalog() is not first
+    assert caches[SHARED_CACHE_ALIAS].get(CATALOG_VERSION_CACHE_KEY) is not None
+
+
+def test_get_game_catalog_version_changes_on_invalidation():
+    """Test get_game_catalog_version stays the same until the catalog is invalidated."""
+    version = get_game_catalog_version()
+
+    assert get_game_catalog_version() == version
+    invalidate_game_catalog()
+    assert get_game_catalog_version() != version
@@ -3,6 +3,8 @@ from unittest import mock
 import pytest
 
 from apps.city.models import Tile
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.selectors.game_catalog import get_game_catalog
 from apps.city.services.defense.calculation import DefenseCalculationService
 from apps.city.tests.factories import (
     BuildingFactory,
@@ -377,3 +379,36 @@ def test_defense_calculation_service_get_breakdown_not_enclosed():
     assert breakdown.spike_malus == -10
     assert breakdown.potential_total == 30  # 0 + 40 + (-10)
     assert breakdown.actual_total == 0  # 0 since not enclosed
+
+
+@pytest.mark.django_db
+def test_defense_calculation_service_shares_snapshot_with_default_services():
+    """Test that default sub-services receive the snapshot of the defense service."""
+    savegame = SavegameFactory.create()
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    service = DefenseCalculationService(savegame=savegame, snapshot=snapshot)
+
+    assert service.snapshot is snapshot
+    assert service.enclosure_service.snapshot is snapshot
+    assert service.shape_bonus_service.topology_service.snapshot is snapshot
+    assert service.spike_malus_service.topology_service is service.shape_bonus_service.topology_service
+
+
+@pytest.mark.django_db
+def test_defense_calculation_service_loads_snapshot_once(django_assert_num_queries):
+    """Test that a full breakdown loads the map only once for all sub-services."""
+    savegame = SavegameFactory.create()
+    wall = BuildingFactory(building_type=WallBuildingTypeFactory(), defense_value=5)
+    TileFactory.create(savegame=savegame, x=1, y=1, building=wall)
+    TileFactory.create(savegame=savegame, x=1, y=2, building=wall)
+
+    service = DefenseCalculationService(savegame=savegame)
+    get_game_catalog()
+
+    # One tile query, the buildings are taken from the game catalog
+    with django_assert_num_queries(1):
+        breakdown = service.get_breakdown()
+
+    assert breakdown.base_defense == 10
+    assert breakdown.spike_malus == -20
@@ -1,11 +1,15 @@
+import random
 from unittest import mock
 
 import pytest
 
+from apps.city.models import CityStats
+from apps.city.selectors.game_catalog import get_game_catalog
 from apps.city.services.map.coordinates import MapCoordinatesService
 from apps.city.services.map.generation import INITIAL_COUNTRY_BUILDINGS, MapGenerationService
 from apps.city.tests.factories import (
     BuildingFactory,
+    CityStatsFactory,
     CountryBuildingTypeFactory,
     RiverTerrainFactory,
     TerrainFactory,
@@ -15,16 +19,18 @@ from apps.city.tests.factories import (
 from apps.savegame.tests.factories import SavegameFactory
 
 
-def create_tiles_batch(savegame, size, terrain=None):
-    """Helper to batch create tiles for a square map."""
-    if terrain is None:
-        terrain = TerrainFactory.create()
+def build_tiles_map(savegame, size, terrain):
+    """Helper to build an unsaved in-memory map keyed by coordinates."""
+    return {
+        (x, y): TileFactory.build(savegame=savegame, terrain=terrain, x=x, y=y, building=None)
+        for x in range(size)
+        for y in range(size)
+    }
 
-    # Create tiles manually to avoid factory.Sequence global counter issues
-    # Using list comprehension with bulk_create for performance
-    tiles = [TileFactory.build(savegame=savegame, terrain=terrain, x=i % size, y=i // size) for i in range(size * size)]
 
-    return TileFactory._meta.model.objects.bulk_create(tiles)
+def get_placed_tiles(tiles):
+    """Helper to return all in-memory tiles carrying a building."""
+    return [tile for tile in tiles.values() if tile.building]
 
 
 @pytest.mark.django_db
@@ -41,45 +47,58 @@ def test_map_generation_service_init():
 def test_map_generation_service_get_terrain():
     """Test get_terrain returns terrain based on probability."""
     savegame = SavegameFactory.create()
-    service = MapGenerationService(savegame=savegame, map_size=3)
+    rng = mock.Mock(wraps=random.Random(0))
+    service = MapGenerationService(savegame=savegame, map_size=3, rng=rng)
 
     # Create terrains with different probabilities
     terrain1 = TerrainFactory(name="Forest", probability=50)
     terrain2 = TerrainFactory(name="Plains", probability=80)
 
-    with mock.patch("apps.city.services.map.generation.randint") as mock_randint:
-        mock_randint.return_value = 60  # Should match terrain2 (probability 80)
+    rng.randint.return_value = 60  # Should match terrain2 (probability 80)
 
-        result = service.get_terrain()
+    result = service.get_terrain()
 
-        # Should return terrain2 as its probability (80) >= dice (60)
-        assert result in [terrain1, terrain2]
+    # Should return terrain2 as its probability (80) >= dice (60)
+    assert result in [terrain1, terrain2]
 
 
 @pytest.mark.django_db
 def test_map_generation_service_get_terrain_retry():
     """Test get_terrain retries until finding valid terrain."""
     savegame = SavegameFactory.create()
-    service = MapGenerationService(savegame=savegame, map_size=3)
+    rng = mock.Mock(wraps=random.Random(0))
+    service = MapGenerationService(savegame=savegame, map_size=3, rng=rng)
 
     terrain = TerrainFactory(name="Forest", probability=50)
+    # Restrict the terrain table to the test terrain
+    service._terrain_table = [[terrain] if dice <= 50 else [] for dice in range(101)]
+
+    # First call returns 60 (no terrain matches), second call returns 10 (matches)
+    rng.randint.side_effect = [60, 10]
 
-    with mock.patch("apps.city.services.map.generation.randint") as mock_randint:
-        # First call returns 10 (no terrain matches), second call returns 60 (matches)
-        mock_randint.side_effect = [10, 60]
+    result = service.get_terrain()
 
-        # Mock the terrain queryset to return None first, then terrain
-        with mock.patch("apps.city.models.Terrain.objects.filter") as mock_filter:
-            mock_queryset = mock.Mock()
-            mock_filter.return_value = mock_queryset
-            mock_queryset.exclude.return_value = mock_queryset
-            mock_queryset.order_by.return_value = mock_queryset
-            mock_queryset.first.side_effect = [None, terrain]
+    assert result == terrain
+    assert rng.randint.call_count == 2
 
-            result = service.get_terrain()
 
-            assert result == terrain
-            assert mock_randint.call_count == 2
+@pytest.mark.django_db
+def test_map_generation_service_get_terrain_table_loaded_once(django_assert_num_queries):
+    """Test get_terrain builds the terrain table from the game catalog without queries and excludes the river."""
+    savegame = SavegameFactory.create()
+    service = MapGenerationService(savegame=savegame, map_size=3)
+
+    river = RiverTerrainFactory.create(probability=100)
+    terrain = TerrainFactory(name="Plains", probability=100)
+    get_game_catalog()
+
+    with django_assert_num_queries(0):
+        terrain_table = service._get_terrain_table()
+        service._get_terrain_table()
+
+    assert terrain in terrain_table[100]
+    assert river not in terrain_table[100]
+    assert len(terrain_table) == 101
 
 
 @pytest.mark.django_db
@@ -87,7 +106,8 @@ def test_map_generation_service_draw_river_y_axis():
     """Test _draw_river creates river tiles starting from y-axis."""
     map_size = 5
     savegame = SavegameFactory.create()
-    service = MapGenerationService(savegame=savegame, map_size=map_size)
+    rng = mock.Mock(wraps=random.Random(0))
+    service = MapGenerationService(savegame=savegame, map_size=map_size, rng=rng)
 
     # Clear any existing water terrains and create a unique one
     from apps.city.models import Terrain
@@ -96,24 +116,20 @@ def test_map_generation_service_draw_river_y_axis():
     river_terrain = RiverTerrainFactory.create()
     terrain = TerrainFactory.create()
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    with (
-        mock.patch("apps.city.services.map.generation.randint") as mock_randint,
-        mock.patch("apps.city.services.map.generation.random.choice") as mock_choice,
-    ):
-        # Set up river starting at (0, 2) and going to reach edge at x=map_size-1
-        mock_randint.side_effect = [1, 2]  # dice=1 means start on y-axis, y=2
+    # Set up river starting at (0, 2) and going to reach edge at x=map_size-1
+    rng.randint.side_effect = [1, 2]  # dice=1 means start on y-axis, y=2
 
-        # Mock coordinate choices for river path to reach edge at x=map_size-1
-        coords = [MapCoordinatesService.Coordinates(x=i + 1, y=2) for i in range(map_size - 1)]
-        mock_choice.side_effect = coords
+    # Mock coordinate choices for river path to reach edge at x=map_size-1
+    coords = [MapCoordinatesService.Coordinates(x=i + 1, y=2) for i in range(map_size - 1)]
+    rng.choice.side_effect = coords
 
-        service._draw_river()
+    service._draw_river(tiles=tiles)
 
-        # Verify river tiles were created at expected coordinates
-        river_tiles = savegame.tiles.filter(terrain=river_terrain)
-        assert river_tiles.count() >= 1
+    # Verify river tiles were created at expected coordinates
+    river_tiles = [tile for tile in tiles.values() if tile.terrain == river_terrain]
+    assert len(river_tiles) == map_size
 
 
 @pytest.mark.django_db
@@ -121,7 +137,8 @@ def test_map_generation_service_draw_river_x_axis():
     """Test _draw_river creates river tiles starting from x-axis."""
     map_size = 5
     savegame = SavegameFactory.create()
-    service = MapGenerationService(savegame=savegame, map_size=map_size)
+    rng = mock.Mock(wraps=random.Random(0))
+    service = MapGenerationService(savegame=savegame, map_size=map_size, rng=rng)
 
     # Clear any existing water terrains and create a unique one
     from apps.city.models import Terrain
@@ -130,24 +147,20 @@ def test_map_generation_service_draw_river_x_axis():
     river_terrain = RiverTerrainFactory.create()
     terrain = TerrainFactory.create()
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    with (
-        mock.patch("apps.city.services.map.generation.randint") as mock_randint,
-        mock.patch("apps.city.services.map.generation.random.choice") as mock_choice,
-    ):
-        # Set up river starting on x-axis - dice=2 triggers else branch (line 31)
-        mock_randint.side_effect = [2, 2]  # dice=2 means start on x-axis, x=2
+    # Set up river starting on x-axis - dice=2 triggers else branch (line 31)
+    rng.randint.side_effect = [2, 2]  # dice=2 means start on x-axis, x=2
 
-        # Mock coordinate choices for river path to reach edge at y=map_size-1
-        coords = [MapCoordinatesService.Coordinates(x=2, y=i + 1) for i in range(map_size - 1)]
-        mock_choice.side_effect = coords
+    # Mock coordinate choices for river path to reach edge at y=map_size-1
+    coords = [MapCoordinatesService.Coordinates(x=2, y=i + 1) for i in range(map_size - 1)]
+    rng.choice.side_effect = coords
 
-        service._draw_river()
+    service._draw_river(tiles=tiles)
 
-        # Verify river tiles were created at expected coordinates
-        river_tiles = savegame.tiles.filter(terrain=river_terrain)
-        assert river_tiles.count() >= 1
+    # Verify river tiles were created at expected coordinates
+    river_tiles = [tile for tile in tiles.values() if tile.terrain == river_terrain]
+    assert len(river_tiles) == map_size
 
 
 @pytest.mark.django_db
@@ -163,13 +176,13 @@ def test_map_generation_service_draw_river_missing_terrain():
     Terrain.objects.filter(is_water=True).delete()
     terrain = TerrainFactory.create()
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
     with pytest.raises(
         ValueError,
         match=r"River terrain not found\. Please ensure River terrain exists in the database\.",
     ):
-        service._draw_river()
+        service._draw_river(tiles=tiles)
 
 
 @pytest.mark.django_db
@@ -200,6 +213,40 @@ def test_map_generation_service_process():
         assert mock_get_terrain.call_count == 25
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("map_size", [5, 10])
+def test_map_generation_service_process_constant_queries(django_assert_max_num_queries, map_size):
+    """Test process builds the map in memory and writes it with a constant number of queries."""
+    savegame = SavegameFactory.create()
+    service = MapGenerationService(savegame=savegame, map_size=map_size)
+
+    terrain = TerrainFactory.create(probability=100)
+    RiverTerrainFactory.create()
+    country_building_type = CountryBuildingTypeFactory(allowed_terrains=[terrain])
+    BuildingFactory(building_type=country_building_type, level=1)
+
+    # Delete, terrain table, river, building types, allowed terrains, buildings, insert, revision, stats (+ savepoints)
+    with django_assert_max_num_queries(10):
+        service.process()
+
+    assert savegame.tiles.count() == map_size * map_size
+    assert savegame.tiles.filter(building__isnull=False).exists()
+    assert savegame.map_revision == 1
+
+
+@pytest.mark.django_db
+def test_map_generation_service_process_resets_city_stats():
+    """Test process drops the statistics of the old map, so they are calculated for the new one on first access."""
+    stats = CityStatsFactory(housing_space=10)
+    service = MapGenerationService(savegame=stats.savegame, map_size=2)
+    TerrainFactory.create(probability=100)
+    RiverTerrainFactory.create()
+
+    service.process()
+
+    assert not CityStats.objects.filter(savegame=stats.savegame).exists()
+
+
 @pytest.mark.django_db
 def test_map_generation_service_place_random_country_buildings():
     """Test _place_random_country_buildings places buildings on valid tiles."""
@@ -217,22 +264,17 @@ def test_map_generation_service_place_random_country_buildings():
     # Create level 1 building for this type
     BuildingFactory(building_type=country_building_type, level=1)
 
-    # Create tiles with alternating terrains using batch creation
-    tiles = []
-    for i in range(map_size * map_size):
-        x, y = i % map_size, i // map_size
-        tiles.append(
-            TileFactory.build(
-                savegame=savegame, x=x, y=y, terrain=terrain_grass if (x + y) % 2 == 0 else terrain_forest
-            )
-        )
-    TileFactory._meta.model.objects.bulk_create(tiles)
+    # Create tiles with alternating terrains
+    tiles = build_tiles_map(savegame, map_size, terrain_grass)
+    for (x, y), tile in tiles.items():
+        if (x + y) % 2:
+            tile.terrain = terrain_forest
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify that buildings were placed
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == INITIAL_COUNTRY_BUILDINGS
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == INITIAL_COUNTRY_BUILDINGS
 
     # Verify all buildings are level 1
     for tile in tiles_with_buildings:
@@ -255,13 +297,13 @@ def test_map_generation_service_place_random_country_buildings_no_building_types
     terrain = TerrainFactory.create()
 
     # Create tiles without any country building types
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify no buildings were placed
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == 0
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == 0
 
 
 @pytest.mark.django_db
@@ -280,17 +322,13 @@ def test_map_generation_service_place_random_country_buildings_no_valid_terrains
     BuildingFactory(building_type=country_building_type, level=1)
 
     # Create tiles with only water terrain (which isn't allowed)
-    tiles = [
-        TileFactory.build(savegame=savegame, x=i % map_size, y=i // map_size, terrain=terrain_water)
-        for i in range(map_size * map_size)
-    ]
-    TileFactory._meta.model.objects.bulk_create(tiles)
+    tiles = build_tiles_map(savegame, map_size, terrain_water)
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify no buildings were placed because no valid terrains available
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == 0
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == 0
 
 
 @pytest.mark.django_db
@@ -337,13 +375,13 @@ def test_map_generation_service_place_random_country_buildings_excludes_edge_til
     BuildingFactory(building_type=country_building_type, level=1)
 
     # Create tiles - all with same terrain
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify that buildings were placed
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == INITIAL_COUNTRY_BUILDINGS
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == INITIAL_COUNTRY_BUILDINGS
 
     # Verify none of the buildings are on edge tiles (map_size x map_size map has coordinates 0 to map_size-1)
     for tile in tiles_with_buildings:
@@ -375,20 +413,16 @@ def test_map_generation_service_place_random_country_buildings_no_tiles():
 
     # Create tiles - all non-edge tiles are water (incompatible terrain)
     # Only edge tiles are grass, so no buildings can be placed
-    tiles = []
-    for i in range(map_size * map_size):
-        x, y = i % map_size, i // map_size
-        is_edge = x == 0 or y == 0 or x == map_size - 1 or y == map_size - 1
-        tiles.append(
-            TileFactory.build(savegame=savegame, x=x, y=y, terrain=terrain_grass if is_edge else terrain_water)
-        )
-    TileFactory._meta.model.objects.bulk_create(tiles)
+    tiles = build_tiles_map(savegame, map_size, terrain_water)
+    for (x, y), tile in tiles.items():
+        if x == 0 or y == 0 or x == map_size - 1 or y == map_size - 1:
+            tile.terrain = terrain_grass
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify no buildings were placed because valid terrain only on edge tiles
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == 0
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == 0
 
 
 @pytest.mark.django_db
@@ -407,21 +441,22 @@ def test_map_generation_service_place_random_country_buildings_no_level_1_buildi
     # Create level 2 building for this type, but NO level 1
     BuildingFactory(building_type=country_building_type, level=2)
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify no buildings were placed because no level 1 building exists
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == 0
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == 0
 
 
 @pytest.mark.django_db
 def test_map_generation_service_place_random_country_buildings_skips_occupied_tiles():
-    """Test _place_random_country_buildings skips tiles that already have buildings (line 89)."""
+    """Test _place_random_country_buildings skips tiles that already have buildings."""
     map_size = 5
     savegame = SavegameFactory.create()
-    service = MapGenerationService(savegame=savegame, map_size=map_size)
+    rng = mock.Mock(wraps=random.Random(0))
+    service = MapGenerationService(savegame=savegame, map_size=map_size, rng=rng)
 
     # Create terrain
     terrain = TerrainFactory(name="Grass", probability=80)
@@ -432,38 +467,32 @@ def test_map_generation_service_place_random_country_buildings_skips_occupied_ti
     # Create level 1 building for this type
     building_level_1 = BuildingFactory(building_type=country_building_type, level=1)
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
     # Pre-place a building on a non-edge tile to occupy it
-    from apps.city.models import Tile
-
-    occupied_tile = Tile.objects.get(savegame=savegame, x=2, y=2)
+    occupied_tile = tiles[(2, 2)]
     occupied_tile.building = building_level_1
-    occupied_tile.save(update_fields=["building"])
 
     # Mock random.choice - it's called twice per iteration: once for tile, once for building_type
-    with mock.patch("apps.city.services.map.generation.random.choice") as mock_choice:
-        # Get the tiles list similar to how the service does it (non-edge tiles)
-        tiles = [t for t in savegame.tiles.select_related("terrain").all() if not t.is_edge_tile()]
-        # Filter out the occupied tile to get available tiles
-        available_tiles = [t for t in tiles if t != occupied_tile]
+    # Get the non-edge tiles without a building
+    available_tiles = [t for t in tiles.values() if not t.is_edge_tile() and t is not occupied_tile]
 
-        # Make the first call return the occupied tile (should be skipped due to line 89)
-        # Then provide enough tile and building_type choices for successful placements
-        # Pattern: tile, building_type, tile, building_type, ...
-        side_effects = [occupied_tile]  # First attempt - will hit line 89 and continue
-        for i in range(INITIAL_COUNTRY_BUILDINGS):
-            side_effects.append(available_tiles[i])  # Pick a tile
-            side_effects.append(country_building_type)  # Pick the building type
+    # Make the first call return the occupied tile (should be skipped)
+    # Then provide enough tile and building_type choices for successful placements
+    # Pattern: tile, building_type, tile, building_type, ...
+    side_effects = [occupied_tile]  # First attempt - will be skipped
+    for i in range(INITIAL_COUNTRY_BUILDINGS):
+        side_effects.append(available_tiles[i])  # Pick a tile
+        side_effects.append(country_building_type)  # Pick the building type
 
-        mock_choice.side_effect = side_effects
+    rng.choice.side_effect = side_effects
 
-        service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify that exactly INITIAL_COUNTRY_BUILDINGS new buildings were placed
     # (the occupied tile should be skipped and other tiles used instead)
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == INITIAL_COUNTRY_BUILDINGS + 1  # +1 for the pre-placed building
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == INITIAL_COUNTRY_BUILDINGS + 1  # +1 for the pre-placed building
 
 
 @pytest.mark.django_db
@@ -487,13 +516,13 @@ def test_map_generation_service_place_random_country_buildings_excludes_city_and
     country_only_building_type = CountryBuildingTypeFactory(allowed_terrains=[terrain])
     BuildingFactory(building_type=country_only_building_type, level=1)
 
-    create_tiles_batch(savegame, map_size, terrain)
+    tiles = build_tiles_map(savegame, map_size, terrain)
 
-    service._place_random_country_buildings()
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify that buildings were placed
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == INITIAL_COUNTRY_BUILDINGS
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == INITIAL_COUNTRY_BUILDINGS
 
     # Verify that none of the placed buildings are the city+country type
     for tile in tiles_with_buildings:
@@ -519,22 +548,30 @@ def test_map_generation_service_place_random_country_buildings_only_edge_tiles()
 
     # Create only edge tiles (tiles where x=0 or y=0 or x=map_size-1 or y=map_size-1)
     # After filtering out edge tiles in line 73, the tiles list will be empty
-    tiles = []
-    # Top row (y=0)
-    tiles.extend([TileFactory.build(savegame=savegame, x=x, y=0, terrain=terrain) for x in range(map_size)])
-    # Bottom row (y=map_size-1)
-    tiles.extend([TileFactory.build(savegame=savegame, x=x, y=map_size - 1, terrain=terrain) for x in range(map_size)])
-    # Left column (x=0, excluding corners already added)
-    tiles.extend([TileFactory.build(savegame=savegame, x=0, y=y, terrain=terrain) for y in range(1, map_size - 1)])
-    # Right column (x=map_size-1, excluding corners already added)
-    tiles.extend(
-        [TileFactory.build(savegame=savegame, x=map_size - 1, y=y, terrain=terrain) for y in range(1, map_size - 1)]
-    )
-
-    TileFactory._meta.model.objects.bulk_create(tiles)
-
-    service._place_random_country_buildings()
+    tiles = {
+        coordinates: tile
+        for coordinates, tile in build_tiles_map(savegame, map_size, terrain).items()
+        if service._is_edge_tile(tile=tile)
+    }
+
+    service._place_random_country_buildings(tiles=tiles)
 
     # Verify no buildings were placed because all tiles are edge tiles
-    tiles_with_buildings = savegame.tiles.filter(building__isnull=False)
-    assert tiles_with_buildings.count() == 0
+    tiles_with_buildings = get_placed_tiles(tiles)
+    assert len(tiles_with_buildings) == 0
+
+
+@pytest.mark.django_db
+def test_map_generation_service_same_seed_same_map():
+    """Test that savegames with the same seed get the same map."""
+    TerrainFactory.create(probability=50)
+    TerrainFactory.create(probability=100)
+    RiverTerrainFactory.create()
+
+    maps = []
+    for _ in range(2):
+        savegame = SavegameFactory.create(seed=42, current_year=1150)
+        MapGenerationService(savegame=savegame, map_size=5).process()
+        maps.append(list(savegame.tiles.order_by("x", "y").values_list("x", "y", "terrain_id", "building_id")))
+
+    assert maps[0] == maps[1]
@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+from django.template.loader import get_template
+from django.urls import reverse
+
+from apps.city.constants import MAP_SIZE
+from apps.city.models import Tile
+from apps.city.services.map.rendering import CityMapRenderService
+from apps.city.tests.factories import BuildingFactory, TerrainFactory, TileFactory
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+def render_counting(*, savegame):
+    """Helper to render the map grid while counting the rendered tile fragments."""
+    template = get_template(CityMapRenderService.TILE_TEMPLATE_NAME)
+    with (
+        mock.patch("apps.city.services.map.rendering.get_template", return_value=template),
+        mock.patch.object(template, "render", wraps=template.render) as mock_render,
+    ):
+        grid = CityMapRenderService(savegame=savegame).process()
+    return grid, mock_render.call_count
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_process():
+    """Test process renders one fragment per tile of the savegame."""
+    savegame = SavegameFactory()
+    tile = TileFactory(savegame=savegame, building=BuildingFactory(name="Townhouse"))
+    other_tile = TileFactory(savegame=savegame)
+    foreign_tile = TileFactory()
+
+    grid = CityMapRenderService(savegame=savegame).process()
+
+    assert reverse("city:tile-build", args=[tile.id]) in grid
+    assert reverse("city:tile-build", args=[other_tile.id]) in grid
+    assert reverse("city:tile-build", args=[foreign_tile.id]) not in grid
+    assert tile.building.building_type.name in grid
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_process_caches_grid(django_assert_num_queries):
+    """Test re-rendering an unchanged map neither queries nor renders any tile."""
+    savegame = SavegameFactory()
+    TileFactory.create_batch(3, savegame=savegame)
+    first_grid, _ = render_counting(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        second_grid, render_count = render_counting(savegame=savegame)
+
+    assert second_grid == first_grid
+    assert render_count == 0
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_process_reuses_unchanged_tiles():
+    """Test only changed tiles are rendered again after the map revision changed."""
+    savegame = SavegameFactory()
+    tiles = TileFactory.create_batch(3, savegame=savegame)
+    _, render_count = render_counting(savegame=savegame)
+    assert render_count == 3
+
+    tiles[0].building = BuildingFactory(name="Townhouse")
+    tiles[0].save()
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    grid, render_count = render_counting(savegame=savegame)
+
+    assert render_count == 1
+    assert tiles[0].building.building_type.name in grid
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_process_keeps_default_cache_entries():
+    """Test rendering a full map stores the tile fragments apart from the default cache without evicting its entries."""
+    savegame = SavegameFactory()
+    terrain = TerrainFactory()
+    Tile.objects.bulk_create(
+        TileFactory.build(savegame=savegame, terrain=terrain, building=None, x=x, y=y)
+        for x in range(MAP_SIZE)
+        for y in range(MAP_SIZE)
+    )
+    cache.set("unrelated", "value")
+
+    CityMapRenderService(savegame=savegame).process()
+
+    assert cache.get("unrelated") == "value"
+    tile = savegame.tiles.first()
+    assert caches[CityMapRenderService.TILE_CACHE_ALIAS].get(CityMapRenderService._get_fragment_key(tile=tile))
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_render_changed_tiles():
+    """Test render_changed_tiles renders only the changed tiles as out-of-band swaps."""
+    savegame = SavegameFactory()
+    changed_tile = TileFactory(savegame=savegame, x=3, y=4)
+    unchanged_tile = TileFactory(savegame=savegame, x=5, y=6)
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[changed_tile.id])
+
+    result = CityMapRenderService(savegame=savegame).render_changed_tiles(since_revision=0)
+
+    assert 'id="tile-3-4" hx-swap-oob="true"' in result
+    assert reverse("city:tile-build", args=[changed_tile.id]) in result
+    assert reverse("city:tile-build", args=[unchanged_tile.id]) not in result
+
+
+@pytest.mark.django_db
+def test_city_map_render_service_render_changed_tiles_unknown_changes():
+    """Test render_changed_tiles returns None if the changes since the revision are unknown."""
+    savegame = SavegameFactory()
+    TileFactory(savegame=savegame)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    assert CityMapRenderService(savegame=savegame).render_changed_tiles(since_revision=0) is None
@@ -0,0 +1,134 @@
+import pytest
+
+from apps.city.models import BuildingType
+from apps.city.services.map.snapshot import CitySnapshot, SnapshotBuilding, SnapshotTile
+from apps.city.tests.factories import BuildingFactory, WallBuildingTypeFactory
+
+
+def build_snapshot_building(**kwargs) -> SnapshotBuilding:
+    defaults = {
+        "id": 1,
+        "name": "Wall",
+        "level": 2,
+        "taxes": 0,
+        "building_costs": 50,
+        "demolition_costs": 0,
+        "maintenance_costs": 0,
+        "housing_space": 0,
+        "defense_value": 10,
+        "prestige": 0,
+        "building_type_id": 1,
+        "building_type_name": "Wall",
+        "is_country": False,
+        "is_city": True,
+        "is_house": False,
+        "is_wall": True,
+        "is_unique": False,
+        "is_ruins": False,
+    }
+    defaults.update(kwargs)
+    return SnapshotBuilding(**defaults)
+
+
+@pytest.mark.django_db
+def test_snapshot_building_from_building():
+    """Test SnapshotBuilding copies building and building type fields."""
+    wall_type = WallBuildingTypeFactory.create(name="Palisade")
+    building = BuildingFactory.create(building_type=wall_type, name="Small Palisade", level=2, defense_value=7)
+
+    result = SnapshotBuilding.from_building(building=building)
+
+    assert result.id == building.id
+    assert result.name == "Small Palisade"
+    assert result.defense_value == 7
+    assert result.building_type_id == wall_type.id
+    assert result.building_type_name == "Palisade"
+    assert result.is_wall is True
+    assert result.is_ruins is False
+    assert str(result) == "Small Palisade"
+
+
+@pytest.mark.django_db
+def test_snapshot_building_from_building_ruins():
+    """Test SnapshotBuilding flags ruins building types."""
+    building = BuildingFactory.create(building_type__type=BuildingType.Type.RUINS)
+
+    result = SnapshotBuilding.from_building(building=building)
+
+    assert result.is_ruins is True
+
+
+def test_snapshot_building_wall_hitpoints_max():
+    """Test wall_hitpoints_max scales with level for walls only."""
+    assert build_snapshot_building(level=3).wall_hitpoints_max == 300
+    assert build_snapshot_building(is_wall=False).wall_hitpoints_max is None
+
+
+def test_snapshot_tile_wall_values():
+    """Test SnapshotTile derives max hitpoints and repair cost like Tile."""
+    tile = SnapshotTile(id=1, x=0, y=0, terrain_id=1, building=build_snapshot_building(level=1), wall_hitpoints=50)
+
+    assert tile.wall_hitpoints_max == 100
+    assert tile.wall_repair_cost == 25
+    assert str(tile) == "0/0"
+
+
+def test_snapshot_tile_wall_values_without_building():
+    """Test SnapshotTile returns None for wall values on empty tiles."""
+    tile = SnapshotTile(id=1, x=0, y=0, terrain_id=1, building=None, wall_hitpoints=None)
+
+    assert tile.wall_hitpoints_max is None
+    assert tile.wall_repair_cost is None
+
+
+def test_snapshot_tile_is_edge_tile():
+    """Test is_edge_tile detects tiles on the map border."""
+    assert SnapshotTile(id=1, x=0, y=5, terrain_id=1, building=None, wall_hitpoints=None).is_edge_tile() is True
+    assert SnapshotTile(id=1, x=19, y=5, terrain_id=1, building=None, wall_hitpoints=None).is_edge_tile() is True
+    assert SnapshotTile(id=1, x=5, y=5, terrain_id=1, building=None, wall_hitpoints=None).is_edge_tile() is False
+
+
+def test_city_snapshot_add_and_get_tile():
+    """Test tiles added to the snapshot can be read back."""
+    wall = build_snapshot_building(id=7)
+    snapshot = CitySnapshot(width=3, height=3, buildings={7: wall})
+    snapshot.add_tile(tile_id=10, x=1, y=2, terrain_id=4, building_id=7, wall_hitpoints=80)
+    snapshot.add_tile(tile_id=11, x=0, y=0, terrain_id=5, building_id=None, wall_hitpoints=None)
+
+    tile = snapshot.get_tile(x=1, y=2)
+    empty_tile = snapshot.get_tile(x=0, y=0)
+
+    assert tile == SnapshotTile(id=10, x=1, y=2, terrain_id=4, building=wall, wall_hitpoints=80)
+    assert empty_tile.building is None
+    assert empty_tile.wall_hitpoints is None
+
+
+def test_city_snapshot_missing_tiles():
+    """Test lookups outside the grid or on missing tiles return empty values."""
+    snapshot = CitySnapshot(width=2, height=2, buildings={})
+    snapshot.add_tile(tile_id=1, x=0, y=0, terrain_id=1, building_id=None, wall_hitpoints=None)
+
+    assert snapshot.contains(x=0, y=0) is True
+    assert snapshot.contains(x=1, y=1) is False
+    assert snapshot.contains(x=-1, y=0) is False
+    assert snapshot.contains(x=0, y=2) is False
+    assert snapshot.get_tile(x=1, y=1) is None
+    assert snapshot.get_building(x=5, y=5) is None
+    assert snapshot.is_wall(x=0, y=0) is False
+
+
+def test_city_snapshot_iter_building_tiles_ordered():
+    """Test iter_building_tiles returns tiles with buildings ordered by x and y."""
+    wall = build_snapshot_building(id=1)
+    house = build_snapshot_building(id=2, is_wall=False)
+    snapshot = CitySnapshot(width=3, height=3, buildings={1: wall, 2: house})
+    snapshot.add_tile(tile_id=1, x=2, y=0, terrain_id=1, building_id=1, wall_hitpoints=100)
+    snapshot.add_tile(tile_id=2, x=0, y=2, terrain_id=1, building_id=2, wall_hitpoints=None)
+    snapshot.add_tile(tile_id=3, x=0, y=1, terrain_id=1, building_id=1, wall_hitpoints=100)
+    snapshot.add_tile(tile_id=4, x=1, y=1, terrain_id=1, building_id=None, wall_hitpoints=None)
+
+    result = [(tile.x, tile.y) for tile in snapshot.iter_building_tiles()]
+
+    assert result == [(0, 1), (0, 2), (2, 0)]
+    assert [tile.id for tile in snapshot.get_wall_tiles()] == [3, 1]
+    assert snapshot.is_wall(x=2, y=0) is True
@@ -0,0 +1,102 @@
+import pytest
+
+from apps.city.models import BuildingType
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.city.tests.factories import (
+    BuildingFactory,
+    BuildingTypeFactory,
+    CountryBuildingTypeFactory,
+    TerrainFactory,
+    WallBuildingTypeFactory,
+)
+
+
+@pytest.mark.django_db
+def test_game_catalog_links_building_types(django_assert_num_queries):
+    """Test buildings are linked to the building type instances of the catalog."""
+    building = BuildingFactory.create()
+
+    catalog = get_game_catalog()
+
+    with django_assert_num_queries(0):
+        assert catalog.buildings[building.id].building_type is catalog.building_types[building.building_type_id]
+
+
+@pytest.mark.django_db
+def test_game_catalog_ruins():
+    """Test the catalog knows the ruins building type and its first building."""
+    ruins_type = BuildingTypeFactory.create(type=BuildingType.Type.RUINS)
+    ruins = BuildingFactory.create(building_type=ruins_type)
+    BuildingFactory.create(building_type=ruins_type)
+
+    catalog = get_game_catalog()
+
+    assert catalog.ruins_building_type == ruins_type
+    assert catalog.ruins_building == ruins
+
+
+@pytest.mark.django_db
+def test_game_catalog_without_ruins():
+    """Test the catalog works without ruins."""
+    BuildingFactory.create()
+
+    catalog = get_game_catalog()
+
+    assert catalog.ruins_building_type is None
+    assert catalog.ruins_building is None
+
+
+@pytest.mark.django_db
+def test_game_catalog_get_terrain_by_name():
+    """Test get_terrain_by_name finds terrains by their name."""
+    terrain = TerrainFactory.create(name="Forest")
+
+    catalog = get_game_catalog()
+
+    assert catalog.get_terrain_by_name(name="Forest") == terrain
+    assert catalog.get_terrain_by_name(name="Desert") is None
+
+
+@pytest.mark.django_db
+def test_game_catalog_get_building():
+    """Test get_building finds buildings by building type and level."""
+    building_type = BuildingTypeFactory.create()
+    level_one = BuildingFactory.create(building_type=building_type, level=1)
+    level_two = BuildingFactory.create(building_type=building_type, level=2)
+
+    catalog = get_game_catalog()
+
+    assert catalog.get_building(building_type_id=building_type.id, level=1) == level_one
+    assert catalog.get_building(building_type_id=building_type.id, level=2) == level_two
+    assert catalog.get_building(building_type_id=building_type.id, level=3) is None
+
+
+@pytest.mark.django_db
+def test_game_catalog_get_building_types():
+    """Test get_building_types filters the building types by the given flags."""
+    country_type = CountryBuildingTypeFactory.create()
+    wall_type = WallBuildingTypeFactory.create()
+
+    catalog = get_game_catalog()
+
+    assert catalog.get_building_types(is_country=True) == [country_type]
+    assert catalog.get_building_types(is_wall=True, is_country=False) == [wall_type]
+    assert len(catalog.get_building_types()) == 2
+
+
+@pytest.mark.django_db
+def test_game_catalog_get_buildable_buildings():
+    """Test get_buildable_buildings returns the level one buildings allowed on a terrain, except ruins."""
+    terrain = TerrainFactory.create()
+    other_terrain = TerrainFactory.create()
+    building_type = BuildingTypeFactory.create(allowed_terrains=[terrain])
+    building = BuildingFactory.create(building_type=building_type, level=1)
+    BuildingFactory.create(building_type=building_type, level=2)
+    ruins_type = BuildingTypeFactory.create(type=BuildingType.Type.RUINS, allowed_terrains=[terrain])
+    BuildingFactory.create(building_type=ruins_type, level=1)
+
+    catalog = get_game_catalog()
+
+    assert catalog.get_buildable_buildings(terrain_id=terrain.id) == [building]
+    assert catalog.get_buildable_buildings(terrain_id=other_terrain.id) == []
+    assert catalog.get_buildable_buildings(terrain_id=0) == []
@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pytest
+
+from apps.city.models import CityStats
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.city_stats import CityStatsCalculationService, CityStatsDefenseRefreshService
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_city_stats_calculation_service_process():
+    """Test process sums up the values of all buildings without storing them."""
+    savegame = SavegameFactory(map_revision=3)
+    TileFactory(savegame=savegame, building=BuildingFactory(housing_space=4, taxes=10, maintenance_costs=2, prestige=1))
+    TileFactory(savegame=savegame, building=BuildingFactory(housing_space=2, taxes=5, maintenance_costs=3, prestige=0))
+    TileFactory(savegame=savegame)
+
+    with mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=12) as mock_defense:
+        stats = CityStatsCalculationService(savegame=savegame).process()
+
+    mock_defense.assert_called_once()
+    assert stats.pk is None
+    assert stats.savegame == savegame
+    assert stats.housing_space == 6
+    assert stats.taxes == 15
+    assert stats.maintenance_costs == 5
+    assert stats.prestige == 1
+    assert stats.defense == 12
+    assert stats.defense_map_revision == 3
+    assert not CityStats.objects.exists()
+
+
+@pytest.mark.django_db
+def test_city_stats_calculation_service_process_empty_map():
+    """Test process returns zero values for a map without buildings."""
+    savegame = SavegameFactory()
+    TileFactory(savegame=savegame)
+
+    stats = CityStatsCalculationService(savegame=savegame).process()
+
+    assert stats.housing_space == 0
+    assert stats.taxes == 0
+    assert stats.maintenance_costs == 0
+    assert stats.prestige == 0
+    assert stats.defense == 0
+
+
+@pytest.mark.django_db
+def test_city_stats_calculation_service_process_uses_injected_snapshot(django_assert_num_queries):
+    """Test process doesn't query if a snapshot is injected."""
+    savegame = SavegameFactory()
+    TileFactory(savegame=savegame, building=BuildingFactory(housing_space=4))
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with (
+        mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=0),
+        django_assert_num_queries(0),
+    ):
+        stats = CityStatsCalculationService(savegame=savegame, snapshot=snapshot).process()
+
+    assert stats.housing_space == 4
+
+
+@pytest.mark.django_db
+def test_city_stats_defense_refresh_service_process():
+    """Test process stores the defense of the current map revision."""
+    stats = CityStatsFactory(defense=5, defense_map_revision=0)
+    stats.savegame.map_revision = 2
+
+    with mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=9):
+        CityStatsDefenseRefreshService(savegame=stats.savegame).process()
+
+    stats.refresh_from_db()
+    assert stats.defense == 9
+    assert stats.defense_map_revision == 2
+
+
+@pytest.mark.django_db
+def test_city_stats_defense_refresh_service_process_skips_missing_stats():
+    """Test process doesn't calculate anything for savegames without statistics."""
+    savegame = SavegameFactory()
+
+    with mock.patch("apps.city.services.city_stats.DefenseCalculationService.process") as mock_defense:
+        CityStatsDefenseRefreshService(savegame=savegame).process()
+
+    mock_defense.assert_not_called()
+    assert not CityStats.objects.filter(savegame=savegame).exists()
@@ -1,5 +1,6 @@
 import pytest
 
+from apps.city.selectors.city_snapshot import get_city_snapshot
 from apps.city.services.prestige import PrestigeCalculationService
 from apps.city.tests.factories import BuildingFactory, TileFactory
 from apps.savegame.tests.factories import SavegameFactory
@@ -111,3 +112,17 @@ def test_prestige_calculation_only_specific_savegame():
 
     assert result1 == 5
     assert result2 == 10
+
+
+@pytest.mark.django_db
+def test_prestige_calculation_uses_injected_snapshot(django_assert_num_queries):
+    """Test prestige calculation reads from an injected snapshot without querying."""
+    savegame = SavegameFactory.create()
+    TileFactory.create(savegame=savegame, building=BuildingFactory.create(prestige=3))
+    TileFactory.create(savegame=savegame, building=BuildingFactory.create(prestige=4))
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = PrestigeCalculationService(savegame=savegame, snapshot=snapshot).process()
+
+    assert result == 7
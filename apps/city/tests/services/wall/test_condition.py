@@ -1,5 +1,6 @@
 import pytest
 
+from apps.city.selectors.city_snapshot import get_city_snapshot
 from apps.city.services.wall.condition import WallConditionService
 from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
 from apps.savegame.tests.factories import SavegameFactory
@@ -76,3 +77,21 @@ def test_wall_condition_service_skips_tiles_without_hitpoints():
     assert result.total_hp == 0
     assert result.total_max_hp == 100  # max_hp is still known from building level
     assert result.health_percent == 0
+
+
+@pytest.mark.django_db
+def test_wall_condition_service_uses_injected_snapshot(django_assert_num_queries):
+    """Test service reads wall tiles ordered by coordinates from an injected snapshot without querying."""
+    savegame = SavegameFactory.create()
+    wall_type = WallBuildingTypeFactory.create()
+    building = BuildingFactory.create(building_type=wall_type, level=1, building_costs=100)
+    tile_b = TileFactory.create(savegame=savegame, x=2, y=0, building=building, wall_hitpoints=50)
+    tile_a = TileFactory.create(savegame=savegame, x=1, y=3, building=building, wall_hitpoints=100)
+    TileFactory.create(savegame=savegame, x=0, y=0, building=BuildingFactory.create())
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = WallConditionService(savegame=savegame, snapshot=snapshot).process()
+
+    assert [t.id for t in result.tiles] == [tile_a.id, tile_b.id]
+    assert result.total_repair_cost == 50
@@ -0,0 +1,158 @@
+import pytest
+
+from apps.city.models import Building, BuildingType
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.city.services.wall.damage import WallDamageService
+from apps.city.tests.factories import (
+    BuildingFactory,
+    BuildingTypeFactory,
+    CityStatsFactory,
+    TileFactory,
+    WallBuildingTypeFactory,
+)
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.fixture
+def wall_building():
+    return BuildingFactory.create(building_type=WallBuildingTypeFactory.create(), level=1, maintenance_costs=3)
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_damages_all_walls(wall_building):
+    """Test that all walls of the savegame are damaged without explicit tiles."""
+    savegame = SavegameFactory.create()
+    tile1 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=100)
+    tile2 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=80)
+    other_tile = TileFactory.create(building=wall_building, wall_hitpoints=100)
+
+    WallDamageService(savegame=savegame, damage=30).process()
+
+    tile1.refresh_from_db()
+    tile2.refresh_from_db()
+    other_tile.refresh_from_db()
+    assert tile1.wall_hitpoints == 70
+    assert tile2.wall_hitpoints == 50
+    assert other_tile.wall_hitpoints == 100
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_damages_passed_tiles_only(wall_building):
+    """Test that only the passed tiles are damaged and updated in memory."""
+    savegame = SavegameFactory.create()
+    tile1 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=100)
+    tile2 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=80)
+    unfinished_tile = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=None)
+
+    WallDamageService(savegame=savegame, damage=30, tiles=[tile1, unfinished_tile]).process()
+
+    assert tile1.wall_hitpoints == 70
+    assert unfinished_tile.wall_hitpoints is None
+    tile1.refresh_from_db()
+    tile2.refresh_from_db()
+    assert tile1.wall_hitpoints == 70
+    assert tile2.wall_hitpoints == 80
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_skips_tiles_without_hitpoints(wall_building):
+    """Test that walls without hitpoints and non-wall tiles are left untouched."""
+    savegame = SavegameFactory.create()
+    wall_tile = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=None)
+    house_tile = TileFactory.create(savegame=savegame, building=BuildingFactory.create(), wall_hitpoints=None)
+
+    WallDamageService(savegame=savegame, damage=30, tiles=[wall_tile, house_tile]).process()
+
+    wall_tile.refresh_from_db()
+    assert wall_tile.wall_hitpoints is None
+    assert wall_tile.building == wall_building
+    assert savegame.map_revision == 0
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_converts_collapsed_walls_to_ruins(ruins_building, wall_building):
+    """Test that walls reaching exactly or below 0 hitpoints are turned into ruins, in memory as well."""
+    savegame = SavegameFactory.create()
+    exact_tile = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=30)
+    below_tile = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=10)
+    intact_tile = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=31)
+
+    WallDamageService(savegame=savegame, damage=30, tiles=[exact_tile, below_tile, intact_tile]).process()
+
+    for tile in (exact_tile, below_tile):
+        assert tile.building == ruins_building
+        assert tile.wall_hitpoints is None
+        tile.refresh_from_db()
+        assert tile.building == ruins_building
+        assert tile.wall_hitpoints is None
+    intact_tile.refresh_from_db()
+    assert intact_tile.wall_hitpoints == 1
+    assert intact_tile.building == wall_building
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_raises_when_no_ruins_type(wall_building):
+    """Test that DoesNotExist is raised before any change when no RUINS BuildingType exists."""
+    tile = TileFactory.create(building=wall_building, wall_hitpoints=30)
+
+    with pytest.raises(BuildingType.DoesNotExist):
+        WallDamageService(savegame=tile.savegame, damage=30).process()
+
+    tile.refresh_from_db()
+    assert tile.wall_hitpoints == 30
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_raises_when_no_ruins_building(wall_building):
+    """Test that DoesNotExist is raised when the RUINS BuildingType has no building."""
+    tile = TileFactory.create(building=wall_building, wall_hitpoints=30)
+    BuildingTypeFactory.create(type=BuildingType.Type.RUINS)
+
+    with pytest.raises(Building.DoesNotExist):
+        WallDamageService(savegame=tile.savegame, damage=30).process()
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_bumps_map_revision_once(wall_building):
+    """Test that the map revision is bumped once for all damaged walls."""
+    savegame = SavegameFactory.create()
+    tile1 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=100)
+    tile2 = TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=100)
+
+    WallDamageService(savegame=savegame, damage=10).process()
+
+    assert savegame.map_revision == 1
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=1) == {
+        tile1.id,
+        tile2.id,
+    }
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_updates_city_stats(ruins_building, wall_building):
+    """Test that the values of all collapsed walls are replaced with the ones of the ruins in the statistics."""
+    stats = CityStatsFactory(maintenance_costs=10)
+    TileFactory.create(savegame=stats.savegame, building=wall_building, wall_hitpoints=10)
+    TileFactory.create(savegame=stats.savegame, building=wall_building, wall_hitpoints=5)
+    TileFactory.create(savegame=stats.savegame, building=wall_building, wall_hitpoints=50)
+
+    WallDamageService(savegame=stats.savegame, damage=10).process()
+
+    stats.refresh_from_db()
+    assert stats.maintenance_costs == 4 + 2 * ruins_building.maintenance_costs
+
+
+@pytest.mark.django_db
+def test_wall_damage_service_query_count_independent_of_walls(ruins_building, wall_building, django_assert_num_queries):
+    """Test that damaging many walls runs a constant number of queries."""
+    savegame = SavegameFactory.create()
+    for hitpoints in [5] * 10 + [100] * 10:
+        TileFactory.create(savegame=savegame, building=wall_building, wall_hitpoints=hitpoints)
+    get_game_catalog()
+
+    # Select walls, damage walls, convert ruins, update statistics, bump map revision (update + select)
+    with django_assert_num_queries(6):
+        WallDamageService(savegame=savegame, damage=10).process()
+
+    assert savegame.tiles.filter(building=ruins_building).count() == 10
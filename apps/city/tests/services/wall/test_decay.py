@@ -74,3 +74,17 @@ def test_wall_decay_service_skips_wall_tiles_without_hitpoints():
 
     tile.refresh_from_db()
     assert tile.wall_hitpoints is None
+
+
+@pytest.mark.django_db
+def test_wall_decay_service_bumps_map_revision():
+    """Test decay bumps the map revision of the passed savegame once for all damaged walls."""
+    savegame = SavegameFactory()
+    wall_type = WallBuildingTypeFactory()
+    building = BuildingFactory(building_type=wall_type, level=1)
+    TileFactory(savegame=savegame, building=building, wall_hitpoints=100)
+    TileFactory(savegame=savegame, building=building, wall_hitpoints=100)
+
+    WallDecayService(savegame=savegame).process()
+
+    assert savegame.map_revision == 1
@@ -1,7 +1,10 @@
 import pytest
+from django.core.cache import caches
 
+from apps.city.constants import MAP_SIZE
 from apps.city.models import Tile
-from apps.city.services.wall.enclosure import WallEnclosureService
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.services.wall.enclosure import EnclosureTracker, WallEnclosureService
 from apps.city.tests.factories import (
     BuildingFactory,
     BuildingTypeFactory,
@@ -11,6 +14,8 @@ from apps.city.tests.factories import (
     WallBuildingTypeFactory,
     WaterTerrainFactory,
 )
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -254,8 +259,8 @@ def test_wall_enclosure_service_city_building_outside_wall():
 
 
 @pytest.mark.django_db
-def test_wall_enclosure_service_starts_from_unique_building():
-    """Test that service prefers starting from a unique building."""
+def test_wall_enclosure_service_unique_building_enclosed():
+    """Test that a unique building counts as city building inside the walls."""
     savegame = SavegameFactory.create()
     terrain = TerrainFactory.create()
 
@@ -289,17 +294,8 @@ def test_wall_enclosure_service_starts_from_unique_building():
     Tile.objects.bulk_create(tiles)
 
     service = WallEnclosureService(savegame=savegame)
-
-    # Get city building tiles
-    city_tiles = service._get_city_building_tiles()
-    assert len(city_tiles) == 1
-
-    # Get starting tile - should be the unique building
-    start_tile = service._get_starting_tile(city_tiles=city_tiles)
-    assert start_tile.building.building_type.is_unique is True
-
-    # Overall result should be True (enclosed)
     result = service.process()
+
     assert result is True
 
 
@@ -535,3 +531,230 @@ def test_wall_enclosure_service_with_missing_tiles():
 
     # The missing tile should be skipped, and enclosure should still be detected
     assert result is True
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_uses_injected_snapshot(django_assert_num_queries):
+    """Test that service runs the flood fill on an injected snapshot without querying."""
+    savegame = SavegameFactory.create()
+    terrain = TerrainFactory.create()
+    wall_type = WallBuildingTypeFactory(allowed_terrains=[terrain])
+    city_type = BuildingTypeFactory(is_city=True, is_wall=False, allowed_terrains=[terrain])
+    wall = BuildingFactory(building_type=wall_type)
+    city_building = BuildingFactory(building_type=city_type)
+
+    tiles = [
+        TileFactory.build(
+            savegame=savegame,
+            x=x,
+            y=y,
+            terrain=terrain,
+            building=wall
+            if (x == 1 or x == 3 or y == 1 or y == 3)
+            else (city_building if (x == 2 and y == 2) else None),
+        )
+        for y in range(5)
+        for x in range(5)
+    ]
+    Tile.objects.bulk_create(tiles)
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = WallEnclosureService(savegame=savegame, snapshot=snapshot).process()
+
+    assert result is True
+
+
+def build_tracker(*, walls, city, size=MAP_SIZE):
+    """Helper to build a tracker for a square map with the given wall and city cells."""
+    tracker = EnclosureTracker(width=size, height=size)
+    for y in range(size):
+        for x in range(size):
+            tracker.passable[y * size + x] = (x, y) not in walls
+            tracker.city[y * size + x] = (x, y) in city
+    tracker.rebuild()
+    return tracker
+
+
+def ring(*, start, end):
+    """Helper returning the coordinates of a square wall ring."""
+    return {
+        (x, y) for x in range(start, end + 1) for y in range(start, end + 1) if x in (start, end) or y in (start, end)
+    }
+
+
+def test_enclosure_tracker_no_city_buildings():
+    """Test that a map without city buildings is not enclosed."""
+    tracker = build_tracker(walls=ring(start=2, end=6), city=set())
+
+    assert tracker.is_enclosed() is False
+
+
+def test_enclosure_tracker_enclosed_and_open():
+    """Test enclosure detection for a closed ring and a city outside of it."""
+    assert build_tracker(walls=ring(start=2, end=6), city={(4, 4)}).is_enclosed() is True
+    assert build_tracker(walls=ring(start=2, end=6), city={(4, 4), (10, 10)}).is_enclosed() is False
+    assert build_tracker(walls=set(), city={(4, 4)}).is_enclosed() is False
+
+
+def test_enclosure_tracker_opening_a_wall_merges_components():
+    """Test that demolishing a wall is applied incrementally and opens the enclosure."""
+    tracker = build_tracker(walls=ring(start=2, end=6), city={(4, 4)})
+
+    tracker.set_cell(x=2, y=4, passable=True, city=False)
+
+    assert tracker.is_enclosed() is False
+
+
+def test_enclosure_tracker_closing_a_gap_rebuilds_components():
+    """Test that placing the last wall of a ring closes the enclosure."""
+    tracker = build_tracker(walls=ring(start=2, end=6) - {(6, 6)}, city={(4, 4)})
+    assert tracker.is_enclosed() is False
+
+    tracker.set_cell(x=6, y=6, passable=False, city=False)
+
+    assert tracker.is_enclosed() is True
+
+
+def test_enclosure_tracker_city_changes_on_passable_cell():
+    """Test that adding or removing city buildings updates the city count of the component."""
+    tracker = build_tracker(walls=ring(start=2, end=6), city={(4, 4)})
+
+    tracker.set_cell(x=10, y=10, passable=True, city=True)
+    assert tracker.is_enclosed() is False
+
+    tracker.set_cell(x=10, y=10, passable=True, city=False)
+    assert tracker.is_enclosed() is True
+
+    # Applying the same state again changes nothing
+    tracker.set_cell(x=10, y=10, passable=True, city=False)
+    tracker.set_cell(x=4, y=4, passable=True, city=True)
+    assert tracker.is_enclosed() is True
+
+    # Replacing a wall with another wall changes nothing either
+    tracker.set_cell(x=2, y=2, passable=False, city=False)
+    assert tracker.is_enclosed() is True
+
+
+def test_enclosure_tracker_cells_outside_map_area_are_isolated():
+    """Test that cells outside of the map area have no neighbours, like in MapCoordinatesService."""
+    tracker = build_tracker(walls=set(), city={(MAP_SIZE + 1, 5)}, size=MAP_SIZE + 3)
+
+    assert tracker.is_enclosed() is True
+
+
+def build_enclosed_map(*, savegame):
+    """Helper to create a 7x7 map with a wall ring at 1-5 and a city building in the center."""
+    terrain = TerrainFactory.create()
+    wall_type = WallBuildingTypeFactory(allowed_terrains=[terrain])
+    city_type = BuildingTypeFactory(is_city=True, is_wall=False, allowed_terrains=[terrain])
+    wall = BuildingFactory(building_type=wall_type)
+    city_building = BuildingFactory(building_type=city_type)
+    walls = ring(start=1, end=5)
+
+    tiles = [
+        TileFactory.build(
+            savegame=savegame,
+            x=x,
+            y=y,
+            terrain=terrain,
+            building=wall if (x, y) in walls else (city_building if (x, y) == (3, 3) else None),
+        )
+        for y in range(7)
+        for x in range(7)
+    ]
+    Tile.objects.bulk_create(tiles)
+    return city_building
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_process_caches_tracker(django_assert_num_queries):
+    """Test that process caches the components for the current map revision."""
+    savegame = SavegameFactory.create()
+    build_enclosed_map(savegame=savegame)
+
+    result = WallEnclosureService(savegame=savegame).process()
+
+    assert result is True
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="enclosure")).is_enclosed() is True
+
+    # The map did not change, so the cached components are reused
+    with django_assert_num_queries(0):
+        assert WallEnclosureService(savegame=savegame).process() is True
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_process_recalculates_after_map_change():
+    """Test that process ignores cached components of an older map revision."""
+    savegame = SavegameFactory.create()
+    build_enclosed_map(savegame=savegame)
+    assert WallEnclosureService(savegame=savegame).process() is True
+
+    Tile.objects.filter(savegame=savegame, x=1, y=3).update(building=None)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    assert WallEnclosureService(savegame=savegame).process() is False
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_update_tile_incremental(django_assert_num_queries):
+    """Test that update_tile applies a demolished wall without loading the map."""
+    savegame = SavegameFactory.create()
+    build_enclosed_map(savegame=savegame)
+    assert WallEnclosureService(savegame=savegame).process() is True
+
+    tile = Tile.objects.get(savegame=savegame, x=1, y=3)
+    tile.building = None
+    tile.save()
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+
+    assert result is False
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="enclosure")).is_enclosed() is False
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_update_tile_city_building():
+    """Test that update_tile handles a new city building outside the walls."""
+    savegame = SavegameFactory.create()
+    city_building = build_enclosed_map(savegame=savegame)
+    WallEnclosureService(savegame=savegame).process()
+
+    tile = Tile.objects.select_related("building__building_type").get(savegame=savegame, x=0, y=0)
+    tile.building = city_building
+    tile.save()
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    result = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+
+    assert result is False
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_update_tile_without_cache():
+    """Test that update_tile falls back to a full calculation if nothing is cached for the previous revision."""
+    savegame = SavegameFactory.create()
+    build_enclosed_map(savegame=savegame)
+    tile = Tile.objects.get(savegame=savegame, x=3, y=3)
+
+    result = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+
+    assert result is True
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="enclosure")) is not None
+
+
+@pytest.mark.django_db
+def test_wall_enclosure_service_update_tile_outside_cached_grid():
+    """Test that update_tile falls back to a full calculation for tiles outside the cached grid."""
+    savegame = SavegameFactory.create()
+    build_enclosed_map(savegame=savegame)
+    WallEnclosureService(savegame=savegame).process()
+    tile = TileFactory.create(savegame=savegame, x=MAP_SIZE + 2, y=0, building=None)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    result = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+
+    assert result is True
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="enclosure")).width == MAP_SIZE + 3
@@ -1,7 +1,10 @@
+from unittest import mock
+
 import pytest
 
 from apps.city.services.wall.repair_all import WallRepairAllService
-from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory, WallBuildingTypeFactory
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -16,6 +19,8 @@ def test_process_repairs_all_damaged_walls():
 
     tile.refresh_from_db()
     assert tile.wall_hitpoints == 100
+    assert savegame.map_revision == 1
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=1) == {tile.id}
 
 
 @pytest.mark.django_db
@@ -72,3 +77,20 @@ def test_process_does_nothing_when_no_damaged_walls():
     tile.refresh_from_db()
     assert savegame.coins == 500
     assert tile.wall_hitpoints == 100
+
+
+@pytest.mark.django_db
+def test_process_refreshes_defense():
+    """Test the stored defense is recalculated once for all repaired walls."""
+    savegame = SavegameFactory(coins=500)
+    stats = CityStatsFactory(savegame=savegame, defense=3, defense_map_revision=0)
+    building = BuildingFactory(building_type=WallBuildingTypeFactory(), level=1, building_costs=100)
+    TileFactory.create_batch(2, savegame=savegame, building=building, wall_hitpoints=50)
+
+    with mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=8) as mock_defense:
+        WallRepairAllService(savegame=savegame).process()
+
+    mock_defense.assert_called_once_with()
+    stats.refresh_from_db()
+    assert stats.defense == 8
+    assert stats.defense_map_revision == 1
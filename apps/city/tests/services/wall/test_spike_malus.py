@@ -1,7 +1,11 @@
+from unittest import mock
+
 import pytest
 
 from apps.city.models import Tile
+from apps.city.selectors.city_snapshot import get_city_snapshot
 from apps.city.services.wall.spike_malus import WallSpikeMalusService
+from apps.city.services.wall.topology import WallTopology
 from apps.city.tests.factories import BuildingFactory, TerrainFactory, TileFactory, WallBuildingTypeFactory
 from apps.savegame.tests.factories import SavegameFactory
 
@@ -367,3 +371,43 @@ def test_spike_malus_service_l_shape():
     # (2,2) has 1 neighbor - malus
     # Expected: 2 spikes * -10 malus = -20
     assert result == -20
+
+
+@pytest.mark.django_db
+def test_spike_malus_service_uses_injected_snapshot(django_assert_num_queries):
+    """Test that service counts wall neighbors on an injected snapshot without querying."""
+    savegame = SavegameFactory.create()
+    terrain = TerrainFactory.create()
+    wall = BuildingFactory(building_type=WallBuildingTypeFactory(allowed_terrains=[terrain]))
+
+    # Four isolated walls without any orthogonal neighbors
+    wall_coordinates = {(0, 0), (2, 0), (0, 2), (2, 2)}
+    tiles = [
+        TileFactory.build(
+            savegame=savegame, terrain=terrain, building=wall if (x, y) in wall_coordinates else None, x=x, y=y
+        )
+        for y in range(3)
+        for x in range(3)
+    ]
+    Tile.objects.bulk_create(tiles)
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = WallSpikeMalusService(savegame=savegame, snapshot=snapshot).process()
+
+    assert result == -10 * 4
+
+
+@pytest.mark.django_db
+def test_spike_malus_service_uses_injected_topology_service():
+    """Test that service derives its result from an injected topology service."""
+    savegame = SavegameFactory.create()
+    topology_service = mock.Mock()
+    topology_service.process.return_value = WallTopology(
+        neighbor_counts={(0, 0): 0, (1, 0): 1, (2, 0): 2, (3, 0): 2, (4, 0): 3}
+    )
+
+    result = WallSpikeMalusService(savegame=savegame, topology_service=topology_service).process()
+
+    topology_service.process.assert_called_once()
+    assert result == 2 * WallSpikeMalusService.SPIKE_MALUS
@@ -0,0 +1,93 @@
+import pytest
+
+from apps.city.models import Tile
+from apps.city.selectors.city_snapshot import get_city_snapshot
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.city.services.wall.topology import WallTopology, WallTopologyService
+from apps.city.tests.factories import BuildingFactory, TerrainFactory, TileFactory, WallBuildingTypeFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+def create_map(*, savegame, size, wall_coordinates):
+    """Helper to create a square map with walls at the given coordinates."""
+    terrain = TerrainFactory.create()
+    wall = BuildingFactory(building_type=WallBuildingTypeFactory(allowed_terrains=[terrain]))
+    house = BuildingFactory()
+    tiles = [
+        TileFactory.build(
+            savegame=savegame,
+            terrain=terrain,
+            building=wall if (x, y) in wall_coordinates else house,
+            x=x,
+            y=y,
+        )
+        for y in range(size)
+        for x in range(size)
+    ]
+    Tile.objects.bulk_create(tiles)
+
+
+def test_wall_topology_count_walls():
+    """Test count_walls filters wall tiles by their neighbour count."""
+    topology = WallTopology(neighbor_counts={(0, 0): 0, (1, 0): 1, (2, 0): 2, (3, 0): 2, (4, 0): 4})
+
+    assert topology.count_walls() == 5
+    assert topology.count_walls(min_neighbors=2, max_neighbors=2) == 2
+    assert topology.count_walls(max_neighbors=1) == 2
+
+
+@pytest.mark.django_db
+def test_wall_topology_service_no_walls():
+    """Test that a map without walls has an empty topology."""
+    savegame = SavegameFactory.create()
+    create_map(savegame=savegame, size=3, wall_coordinates=set())
+
+    result = WallTopologyService(savegame=savegame).process()
+
+    assert result.neighbor_counts == {}
+
+
+@pytest.mark.django_db
+def test_wall_topology_service_counts_orthogonal_neighbors():
+    """Test that only orthogonal wall neighbours are counted, including at the grid border."""
+    savegame = SavegameFactory.create()
+    # W W W
+    # . W .
+    # W . .
+    create_map(savegame=savegame, size=3, wall_coordinates={(0, 0), (1, 0), (2, 0), (1, 1), (0, 2)})
+
+    result = WallTopologyService(savegame=savegame).process()
+
+    assert result.neighbor_counts == {(0, 0): 1, (1, 0): 3, (2, 0): 1, (1, 1): 1, (0, 2): 0}
+
+
+@pytest.mark.django_db
+def test_wall_topology_service_calculates_once(django_assert_num_queries):
+    """Test that the topology of a city with close to 100 walls is calculated once from a single snapshot."""
+    savegame = SavegameFactory.create()
+    wall_coordinates = {(x, y) for x in range(20) for y in range(20) if x in (0, 19) or y in (0, 19)}
+    wall_coordinates |= {(x, 10) for x in range(1, 19)}
+    create_map(savegame=savegame, size=20, wall_coordinates=wall_coordinates)
+    service = WallTopologyService(savegame=savegame)
+    get_game_catalog()
+
+    # One tile query, the buildings are taken from the game catalog
+    with django_assert_num_queries(1):
+        first = service.process()
+        second = service.process()
+
+    assert first is second
+    assert len(first.neighbor_counts) == 94
+
+
+@pytest.mark.django_db
+def test_wall_topology_service_uses_injected_snapshot(django_assert_num_queries):
+    """Test that the topology is calculated from an injected snapshot without querying."""
+    savegame = SavegameFactory.create()
+    create_map(savegame=savegame, size=2, wall_coordinates={(0, 0), (0, 1)})
+    snapshot = get_city_snapshot(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        result = WallTopologyService(savegame=savegame, snapshot=snapshot).process()
+
+    assert result.neighbor_counts == {(0, 0): 1, (0, 1): 1}
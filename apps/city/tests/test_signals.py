@@ -0,0 +1,40 @@
+import pytest
+
+from apps.city.selectors.game_catalog import get_game_catalog
+from apps.city.tests.factories import BuildingFactory, BuildingTypeFactory, TerrainFactory
+
+
+@pytest.mark.django_db
+def test_invalidate_game_catalog_on_save():
+    """Test the game catalog is reloaded once a building is saved."""
+    building = BuildingFactory.create(name="Hut")
+    get_game_catalog()
+
+    building.name = "Cottage"
+    building.save()
+
+    assert get_game_catalog().buildings[building.id].name == "Cottage"
+
+
+@pytest.mark.django_db
+def test_invalidate_game_catalog_on_delete():
+    """Test the game catalog is reloaded once a terrain is deleted."""
+    terrain = TerrainFactory.create()
+    terrain_id = terrain.id
+    get_game_catalog()
+
+    terrain.delete()
+
+    assert terrain_id not in get_game_catalog().terrains
+
+
+@pytest.mark.django_db
+def test_invalidate_game_catalog_on_allowed_terrains_change():
+    """Test the game catalog is reloaded once the allowed terrains of a building type change."""
+    terrain = TerrainFactory.create()
+    building_type = BuildingTypeFactory.create()
+    get_game_catalog()
+
+    building_type.allowed_terrains.add(terrain)
+
+    assert get_game_catalog().allowed_terrain_ids[building_type.id] == frozenset({terrain.id})
@@ -1,4 +1,6 @@
-from apps.city.templatetags.tile_tags import wall_hp_percent
+from unittest import mock
+
+from apps.city.templatetags.tile_tags import city_map_grid, wall_hp_percent
 from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
 
 
@@ -46,3 +48,20 @@ def test_wall_hp_percent_scales_with_level(db):
     tile = TileFactory(building=building, wall_hitpoints=100)
 
     assert wall_hp_percent(tile) == 50
+
+
+def test_city_map_grid_without_savegame():
+    assert city_map_grid(None) == ""
+
+
+def test_city_map_grid_renders_map(db):
+    tile = TileFactory()
+
+    with mock.patch(
+        "apps.city.templatetags.tile_tags.CityMapRenderService.process", return_value="<div>grid</div>"
+    ) as mock_process:
+        result = city_map_grid(tile.savegame)
+
+    mock_process.assert_called_once()
+    assert result == "<div>grid</div>"
+    assert hasattr(result, "__html__")
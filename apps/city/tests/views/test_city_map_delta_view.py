@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from apps.city.tests.factories import TileFactory
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_city_map_delta_view_unchanged(authenticated_client, user):
+    """Test CityMapDeltaView sends nothing if the client shows the current revision."""
+    SavegameFactory(user=user, is_active=True, map_revision=2)
+
+    response = authenticated_client.get(reverse("city:city-map-delta"), {"revision": 2})
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+
+@pytest.mark.django_db
+def test_city_map_delta_view_changed_tiles(authenticated_client, user):
+    """Test CityMapDeltaView sends only the changed tiles and the new revision."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    changed_tile = TileFactory(savegame=savegame, x=1, y=2)
+    unchanged_tile = TileFactory(savegame=savegame, x=2, y=2)
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[changed_tile.id])
+
+    response = authenticated_client.get(reverse("city:city-map-delta"), {"revision": 0})
+
+    content = response.content.decode()
+    assert response.status_code == HTTPStatus.OK
+    assert "HX-Retarget" not in response
+    assert 'id="tile-1-2" hx-swap-oob="true"' in content
+    assert reverse("city:tile-build", args=[unchanged_tile.id]) not in content
+    assert 'id="city-map-sync" class="hidden" hx-swap-oob="true"' in content
+    assert f"{reverse('city:city-map-delta')}?revision=1" in content
+
+
+@pytest.mark.django_db
+def test_city_map_delta_view_unknown_changes(authenticated_client, user):
+    """Test CityMapDeltaView replaces the whole map if the changes are unknown."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    tile = TileFactory(savegame=savegame)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    response = authenticated_client.get(reverse("city:city-map-delta"), {"revision": 0})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["HX-Retarget"] == "#city-map"
+    assert response["HX-Reswap"] == "outerHTML"
+    assert reverse("city:tile-build", args=[tile.id]) in response.content.decode()
+    assert "city/partials/city/_city_map.html" in [t.name for t in response.templates]
+
+
+@pytest.mark.django_db
+def test_city_map_delta_view_invalid_revision(authenticated_client, user):
+    """Test CityMapDeltaView replaces the whole map if the client doesn't send a valid revision."""
+    SavegameFactory(user=user, is_active=True)
+
+    response = authenticated_client.get(reverse("city:city-map-delta"), {"revision": "abc"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["HX-Retarget"] == "#city-map"
@@ -1,6 +1,9 @@
 import pytest
 from django.urls import reverse
 
+from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.savegame.tests.factories import SavegameFactory
+
 
 # CityMapView Tests
 @pytest.mark.django_db
@@ -10,3 +13,27 @@ def test_city_map_view_response(authenticated_client):
 
     assert response.status_code == 200
     assert "city/partials/city/_city_map.html" in [t.name for t in response.templates]
+
+
+@pytest.mark.django_db
+def test_city_map_view_renders_map_tiles(authenticated_client, user):
+    """Test CityMapView renders the tiles of the active savegame."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    tile = TileFactory(savegame=savegame, building=BuildingFactory())
+    other_tile = TileFactory()
+
+    response = authenticated_client.get(reverse("city:city-map"))
+
+    assert response.status_code == 200
+    assert reverse("city:tile-build", args=[tile.id]) in response.content.decode()
+    assert reverse("city:tile-build", args=[other_tile.id]) not in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_city_map_view_renders_current_revision(authenticated_client, user):
+    """Test CityMapView tells the client which map revision it shows."""
+    SavegameFactory(user=user, is_active=True, map_revision=7)
+
+    response = authenticated_client.get(reverse("city:city-map"))
+
+    assert f"{reverse('city:city-map-delta')}?revision=7" in response.content.decode()
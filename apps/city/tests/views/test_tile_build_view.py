@@ -2,16 +2,20 @@ import json
 from unittest import mock
 
 import pytest
+from django.core.cache import caches
 from django.urls import reverse
 
+from apps.city.services.wall.enclosure import EnclosureTracker, WallEnclosureService
 from apps.city.tests.factories import (
     BuildingFactory,
     BuildingTypeFactory,
+    CityStatsFactory,
     TerrainFactory,
     TileFactory,
     WallBuildingTypeFactory,
 )
 from apps.city.views import TileBuildView
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -45,6 +49,7 @@ def test_tile_build_view_form_valid_with_building(request_factory, user):
     mock_form = mock.Mock()
     mock_form.cleaned_data = {"building": building}
     mock_form.initial = {"current_building": None}  # No initial building
+    mock_form.instance = tile
 
     request = request_factory.get("/")
     request.user = user
@@ -57,9 +62,10 @@ def test_tile_build_view_form_valid_with_building(request_factory, user):
 
         response = view.form_valid(mock_form)
 
-        # Verify coins were deducted
+        # Verify coins were deducted and the map revision was bumped
         savegame.refresh_from_db()
         assert savegame.coins == 50
+        assert savegame.map_revision == 1
 
         # Verify response headers
         assert response.status_code == 200
@@ -78,6 +84,7 @@ def test_tile_build_view_form_valid_without_building(request_factory, user):
     mock_form = mock.Mock()
     mock_form.cleaned_data = {"building": None}
     mock_form.initial = {"current_building": None}  # No initial building
+    mock_form.instance = tile
 
     request = request_factory.get("/")
     request.user = user
@@ -109,6 +116,7 @@ def test_tile_build_view_form_valid_demolish_with_costs(request_factory, user):
     mock_form = mock.Mock()
     mock_form.cleaned_data = {"building": None}
     mock_form.initial = {"current_building": old_building}
+    mock_form.instance = tile
 
     request = request_factory.get("/")
     request.user = user
@@ -227,3 +235,93 @@ def test_tile_build_view_post_request_authenticated(authenticated_client, user):
 
         # Should redirect or return success status
         assert response.status_code in [200, 302]
+
+
+@pytest.mark.django_db
+def test_tile_build_view_form_valid_updates_city_stats(request_factory, user):
+    """Test TileBuildView replaces the values of the old building with the new one in the city statistics."""
+    savegame = SavegameFactory(user=user, coins=100, is_active=True)
+    stats = CityStatsFactory(savegame=savegame, housing_space=10, prestige=1)
+    old_building = BuildingFactory(housing_space=2, prestige=0)
+    new_building = BuildingFactory(building_costs=0, housing_space=5, prestige=2)
+    tile = TileFactory.create(savegame=savegame, building=new_building)
+
+    mock_form = mock.Mock()
+    mock_form.cleaned_data = {"building": new_building}
+    mock_form.initial = {"current_building": old_building}
+    mock_form.instance = tile
+
+    request = request_factory.get("/")
+    request.user = user
+    view = TileBuildView()
+    view.object = tile
+    view.request = request
+
+    with mock.patch("apps.city.views.tile_build_view.generic.UpdateView.form_valid"):
+        view.form_valid(mock_form)
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 13
+    assert stats.prestige == 3
+
+
+@pytest.mark.django_db
+def test_tile_build_view_form_valid_refreshes_defense(request_factory, user):
+    """Test TileBuildView recalculates the stored defense once for the new map revision."""
+    savegame = SavegameFactory(user=user, coins=100, is_active=True)
+    stats = CityStatsFactory(savegame=savegame, defense=0, defense_map_revision=0)
+    building = BuildingFactory(building_costs=0)
+    tile = TileFactory.create(savegame=savegame, building=building)
+
+    mock_form = mock.Mock()
+    mock_form.cleaned_data = {"building": building}
+    mock_form.initial = {"current_building": None}
+    mock_form.instance = tile
+
+    request = request_factory.get("/")
+    request.user = user
+    view = TileBuildView()
+    view.object = tile
+    view.request = request
+
+    with (
+        mock.patch("apps.city.views.tile_build_view.generic.UpdateView.form_valid"),
+        mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=7) as mock_defense,
+    ):
+        view.form_valid(mock_form)
+
+    mock_defense.assert_called_once_with()
+    stats.refresh_from_db()
+    assert stats.defense == 7
+    assert stats.defense_map_revision == 1
+
+
+@pytest.mark.django_db
+def test_tile_build_view_form_valid_updates_enclosure_incrementally(request_factory, user):
+    """Test TileBuildView derives the enclosure of the new map revision from the one of the previous revision."""
+    savegame = SavegameFactory(user=user, coins=100, is_active=True)
+    CityStatsFactory(savegame=savegame)
+    building = BuildingFactory(building_costs=0)
+    tile = TileFactory.create(savegame=savegame, building=building)
+    WallEnclosureService(savegame=savegame).process()
+
+    mock_form = mock.Mock()
+    mock_form.cleaned_data = {"building": building}
+    mock_form.initial = {"current_building": None}
+    mock_form.instance = tile
+
+    request = request_factory.get("/")
+    request.user = user
+    view = TileBuildView()
+    view.object = tile
+    view.request = request
+
+    with (
+        mock.patch("apps.city.views.tile_build_view.generic.UpdateView.form_valid"),
+        mock.patch.object(EnclosureTracker, "from_snapshot") as mock_from_snapshot,
+    ):
+        view.form_valid(mock_form)
+
+    mock_from_snapshot.assert_not_called()
+    savegame.refresh_from_db()
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="enclosure")) is not None
@@ -7,11 +7,14 @@ from django.urls import reverse
 from apps.city.tests.factories import (
     BuildingFactory,
     BuildingTypeFactory,
+    CityStatsFactory,
     TileFactory,
     UniqueBuildingTypeFactory,
     WallBuildingTypeFactory,
 )
 from apps.city.views import TileDemolishView
+from apps.round.tests.factories import RoundJobFactory
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -197,3 +200,56 @@ def test_tile_demolish_view_clears_wall_hitpoints(user):
     tile.refresh_from_db()
     assert tile.building is None
     assert tile.wall_hitpoints is None
+
+
+@pytest.mark.django_db
+def test_tile_demolish_view_bumps_map_revision(user):
+    """Test TileDemolishView bumps the map revision of the savegame."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    tile = TileFactory(savegame=savegame, building=BuildingFactory(building_type=BuildingTypeFactory(is_unique=False)))
+
+    view = TileDemolishView()
+    request = RequestFactory().post("/")
+    request.user = user
+
+    view.post(request, pk=tile.pk)
+
+    savegame.refresh_from_db()
+    assert savegame.map_revision == 1
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=1) == {tile.id}
+
+
+@pytest.mark.django_db
+def test_tile_demolish_view_updates_city_stats(user):
+    """Test TileDemolishView removes the values of the demolished building from the city statistics."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    stats = CityStatsFactory(savegame=savegame, housing_space=10)
+    building = BuildingFactory(building_type=BuildingTypeFactory(is_unique=False), housing_space=4)
+    tile = TileFactory(savegame=savegame, building=building)
+
+    view = TileDemolishView()
+    request = RequestFactory().post("/")
+    request.user = user
+
+    view.post(request, pk=tile.pk)
+
+    stats.refresh_from_db()
+    assert stats.housing_space == 6
+
+
+@pytest.mark.django_db
+def test_tile_demolish_view_rejects_demolition_while_round_is_processed(authenticated_client, user, settings):
+    """Test TileDemolishView doesn't touch the map while a worker finishes the round of the savegame."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory(user=user, is_active=True, coins=100)
+    RoundJobFactory(savegame=savegame)
+    building = BuildingFactory(building_type=BuildingTypeFactory(is_unique=False))
+    tile = TileFactory(savegame=savegame, building=building)
+
+    response = authenticated_client.post(reverse("city:tile-demolish", kwargs={"pk": tile.pk}))
+
+    assert response.status_code == 409
+    tile.refresh_from_db()
+    assert tile.building == building
+    savegame.refresh_from_db()
+    assert savegame.coins == 100
@@ -1,9 +1,16 @@
 import json
+from unittest import mock
 
 import pytest
 from django.test import RequestFactory
 
-from apps.city.tests.factories import BuildingFactory, BuildingTypeFactory, TileFactory, WallBuildingTypeFactory
+from apps.city.tests.factories import (
+    BuildingFactory,
+    BuildingTypeFactory,
+    CityStatsFactory,
+    TileFactory,
+    WallBuildingTypeFactory,
+)
 from apps.city.views.tile_wall_repair_view import TileWallRepairView
 from apps.savegame.tests.factories import SavegameFactory
 
@@ -28,6 +35,7 @@ def test_tile_wall_repair_view_post_success(user):
 
     savegame.refresh_from_db()
     assert savegame.coins == 460  # 500 - round((100-60)/100 * 100) = 500 - 40
+    assert savegame.map_revision == 1
 
 
 @pytest.mark.django_db
@@ -178,3 +186,24 @@ def test_tile_wall_repair_view_post_level2_wall(user):
 
     savegame.refresh_from_db()
     assert savegame.coins == 1950  # 2000 - round((200-100)/200 * 100) = 2000 - 50
+
+
+@pytest.mark.django_db
+def test_tile_wall_repair_view_post_refreshes_defense(user):
+    """Test repair recalculates the stored defense, which depends on the hitpoints of the walls."""
+    savegame = SavegameFactory.create(user=user, is_active=True, coins=500)
+    stats = CityStatsFactory(savegame=savegame, defense=3, defense_map_revision=0)
+    wall_type = WallBuildingTypeFactory.create()
+    building = BuildingFactory.create(building_type=wall_type, level=1, building_costs=100)
+    tile = TileFactory.create(savegame=savegame, building=building, wall_hitpoints=60)
+
+    view = TileWallRepairView()
+    request = RequestFactory().post("/")
+    request.user = user
+
+    with mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=5):
+        view.post(request, pk=tile.pk)
+
+    stats.refresh_from_db()
+    assert stats.defense == 5
+    assert stats.defense_map_revision == 1
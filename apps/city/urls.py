@@ -10,6 +10,7 @@ urlpatterns = [
     path("defenses/", views.DefensesView.as_view(), name="defenses"),
     path("prestige/", views.PrestigeView.as_view(), name="prestige"),
     path("map/", views.CityMapView.as_view(), name="city-map"),
+    path("map/delta/", views.CityMapDeltaView.as_view(), name="city-map-delta"),
     path("messages/", views.CityMessagesView.as_view(), name="city-messages"),
     path("navbar-values/", views.NavbarValuesView.as_view(), name="navbar-values"),
     # Tiles
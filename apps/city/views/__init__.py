@@ -1,4 +1,5 @@
 from apps.city.views.balance_view import BalanceView
+from apps.city.views.city_map_delta_view import CityMapDeltaView
 from apps.city.views.city_map_view import CityMapView
 from apps.city.views.city_messages_view import CityMessagesView
 from apps.city.views.defenses_view import DefensesView
@@ -12,6 +13,7 @@ from apps.city.views.wall_repair_all_view import WallRepairAllView
 
 __all__ = [
     "BalanceView",
+    "CityMapDeltaView",
     "CityMapView",
     "CityMessagesView",
     "DefensesView",
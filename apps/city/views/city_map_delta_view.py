@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.views import generic
+
+from apps.city.services.map.rendering import CityMapRenderService
+from apps.savegame.mixins.savegame import SavegameRequiredMixin
+from apps.savegame.selectors.savegame import get_active_savegame
+
+
+class CityMapDeltaView(SavegameRequiredMixin, generic.View):
+    """
+    Send only the tiles which changed since the map revision the client shows, as out-of-band swaps.
+    Falls back to replacing the whole map if the changes since this revision are unknown.
+    """
+
+    http_method_names = ("get",)
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        savegame = get_active_savegame(request=request)
+
+        try:
+            revision = int(request.GET.get("revision", ""))
+        except ValueError:
+            revision = None
+
+        if revision == savegame.map_revision:
+            return HttpResponse(status=HTTPStatus.NO_CONTENT)
+
+        tiles = None
+        if revision is not None:
+            tiles = CityMapRenderService(savegame=savegame).render_changed_tiles(since_revision=revision)
+
+        if tiles is None:
+            response = render(request, "city/partials/city/_city_map.html")
+            response["HX-Retarget"] = "#city-map"
+            response["HX-Reswap"] = "outerHTML"
+            return response
+
+        sync = render_to_string(
+            "city/partials/city/_city_map_sync.html", {"savegame": savegame, "swap_oob": True}, request=request
+        )
+        return HttpResponse(tiles + sync)
@@ -1,9 +1,10 @@
 from django.views import generic
 
+from apps.city.selectors.city_snapshot import get_city_snapshot
 from apps.city.services.defense.calculation import DefenseCalculationService
 from apps.city.services.wall.condition import WallConditionService
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 class DefensesView(SavegameRequiredMixin, generic.TemplateView):
@@ -11,12 +12,13 @@ class DefensesView(SavegameRequiredMixin, generic.TemplateView):
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        savegame = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        savegame = get_active_savegame(request=self.request)
         if savegame:
-            defense_service = DefenseCalculationService(savegame=savegame)
+            snapshot = get_city_snapshot(savegame=savegame)
+            defense_service = DefenseCalculationService(savegame=savegame, snapshot=snapshot)
             breakdown = defense_service.get_breakdown()
             context["breakdown"] = breakdown
 
-            wall_condition = WallConditionService(savegame=savegame).process()
+            wall_condition = WallConditionService(savegame=savegame, snapshot=snapshot).process()
             context["wall_condition"] = wall_condition
         return context
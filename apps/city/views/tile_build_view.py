@@ -6,16 +6,19 @@ from django.http import HttpResponse
 from django.views import generic
 
 from apps.city.forms.tile import TileBuildingForm
-from apps.city.models import Tile
+from apps.city.models import CityStats, Tile
+from apps.city.services.city_stats import CityStatsDefenseRefreshService
 from apps.city.services.wall.enclosure import WallEnclosureService
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
 from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 if typing.TYPE_CHECKING:
     from django.db.models import QuerySet
 
 
-class TileBuildView(SavegameRequiredMixin, generic.UpdateView):
+class TileBuildView(SavegameRequiredMixin, RoundJobIdleRequiredMixin, generic.UpdateView):
     model = Tile
     form_class = TileBuildingForm
     template_name = "city/partials/tile/update_tile.html"
@@ -29,7 +32,7 @@ class TileBuildView(SavegameRequiredMixin, generic.UpdateView):
 
     def get_form_kwargs(self) -> dict:
         kwargs = super().get_form_kwargs()
-        kwargs["savegame"] = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        kwargs["savegame"] = get_active_savegame(request=self.request)
         return kwargs
 
     def form_valid(self, form) -> HttpResponse:
@@ -37,7 +40,15 @@ class TileBuildView(SavegameRequiredMixin, generic.UpdateView):
         tile = form.instance
         super().form_valid(form=form)
 
-        savegame = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        # Set or clear wall_hitpoints based on whether the new building is a wall
+        new_building = form.cleaned_data["building"]
+        if new_building and new_building.building_type.is_wall:
+            tile.wall_hitpoints = tile.wall_hitpoints_max
+        elif old_building and old_building.building_type.is_wall:
+            tile.wall_hitpoints = None
+        tile.save()
+
+        savegame = get_active_savegame(request=self.request)
         if savegame:
             # Charge building costs when building
             if form.cleaned_data["building"]:
@@ -47,17 +58,14 @@ class TileBuildView(SavegameRequiredMixin, generic.UpdateView):
             if old_building and not form.cleaned_data["building"]:
                 savegame.coins -= old_building.demolition_costs
 
-            savegame.is_enclosed = WallEnclosureService(savegame=savegame).process()
+            Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[tile.id])
+            CityStats.objects.apply_building_change(
+                savegame=savegame, old_building=old_building, new_building=new_building
+            )
+            savegame.is_enclosed = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+            CityStatsDefenseRefreshService(savegame=savegame).process()
             savegame.save()
 
-        # Set or clear wall_hitpoints based on whether the new building is a wall
-        new_building = form.cleaned_data["building"]
-        if new_building and new_building.building_type.is_wall:
-            tile.wall_hitpoints = tile.wall_hitpoints_max
-        elif old_building and old_building.building_type.is_wall:
-            tile.wall_hitpoints = None
-        tile.save()
-
         response = HttpResponse(status=HTTPStatus.OK)
         response["HX-Trigger"] = json.dumps(
             {
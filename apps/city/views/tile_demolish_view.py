@@ -4,16 +4,19 @@ from http import HTTPStatus
 from django.http import HttpResponse
 from django.views import generic
 
-from apps.city.models import Tile
+from apps.city.models import CityStats, Tile
+from apps.city.services.city_stats import CityStatsDefenseRefreshService
 from apps.city.services.wall.enclosure import WallEnclosureService
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
 from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
-class TileDemolishView(SavegameRequiredMixin, generic.View):
+class TileDemolishView(SavegameRequiredMixin, RoundJobIdleRequiredMixin, generic.View):
     def post(self, request, pk, *args, **kwargs) -> HttpResponse:
         tile = Tile.objects.get(pk=pk)
-        savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+        savegame = get_active_savegame(request=request)
 
         # Check if building can be demolished
         if tile.building:
@@ -33,13 +36,17 @@ class TileDemolishView(SavegameRequiredMixin, generic.View):
                 savegame.save()
 
             # Remove the building and clear any wall hitpoints
+            old_building = tile.building
             tile.building = None
             tile.wall_hitpoints = None
             tile.save()
 
             # Update enclosure status
             if savegame:
-                savegame.is_enclosed = WallEnclosureService(savegame=savegame).process()
+                Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[tile.id])
+                CityStats.objects.apply_building_change(savegame=savegame, old_building=old_building, new_building=None)
+                savegame.is_enclosed = WallEnclosureService(savegame=savegame).update_tile(tile=tile)
+                CityStatsDefenseRefreshService(savegame=savegame).process()
                 savegame.save()
 
         response = HttpResponse(status=HTTPStatus.OK)
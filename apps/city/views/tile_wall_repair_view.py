@@ -5,15 +5,18 @@ from django.http import HttpResponse
 from django.views import generic
 
 from apps.city.models import Tile
+from apps.city.services.city_stats import CityStatsDefenseRefreshService
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
 from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
-class TileWallRepairView(SavegameRequiredMixin, generic.View):
+class TileWallRepairView(SavegameRequiredMixin, RoundJobIdleRequiredMixin, generic.View):
     http_method_names = ("post",)
 
     def post(self, request, pk, *args, **kwargs) -> HttpResponse:
-        savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+        savegame = get_active_savegame(request=request)
         if not savegame:
             return HttpResponse("No active savegame found.", status=HTTPStatus.BAD_REQUEST)
 
@@ -41,6 +44,9 @@ class TileWallRepairView(SavegameRequiredMixin, generic.View):
 
         tile.wall_hitpoints = tile.wall_hitpoints_max
         tile.save()
+        Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[tile.id])
+        # Defense depends on the hitpoints of the walls
+        CityStatsDefenseRefreshService(savegame=savegame).process()
 
         response = HttpResponse(status=HTTPStatus.OK)
         response["HX-Trigger"] = json.dumps(
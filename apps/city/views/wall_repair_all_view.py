@@ -4,15 +4,16 @@ from django.http import HttpResponse
 from django.views import generic
 
 from apps.city.services.wall.repair_all import WallRepairAllService
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
-class WallRepairAllView(SavegameRequiredMixin, generic.View):
+class WallRepairAllView(SavegameRequiredMixin, RoundJobIdleRequiredMixin, generic.View):
     http_method_names = ("post",)
 
     def post(self, request, *args, **kwargs) -> HttpResponse:
-        savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+        savegame = get_active_savegame(request=request)
 
         try:
             WallRepairAllService(savegame=savegame).process()
@@ -41,6 +41,10 @@ class HeraldicShield:
 class CoatOfArmsGeneratorService:
     """Service for generating heraldic coat of arms shields as SVG files."""
 
+    def __init__(self, *, rng: random.Random | None = None):
+        # Pass a seeded generator to get the same shield again
+        self.rng = rng or random.Random()
+
     def process(self, *, output_path: str | Path = "shield.svg") -> Path:
         """
         Generate a coat of arms and save it as an SVG file.
@@ -50,15 +54,15 @@ class CoatOfArmsGeneratorService:
 
     def _generate_shield(self) -> HeraldicShield:
         """Generate a random heraldic shield with proper heraldic rules."""
-        shape = random.choice(SHIELD_SHAPES)
-        division = random.choice(DIVISIONS)
-        tinctures = random.sample(list(TINCTURES.keys()), k=2)
+        shape = self.rng.choice(SHIELD_SHAPES)
+        division = self.rng.choice(DIVISIONS)
+        tinctures = self.rng.sample(list(TINCTURES.keys()), k=2)
 
         # Apply heraldic rule: no metal on metal, no color on color
         tinctures = self._apply_heraldic_rules(tinctures=tinctures)
 
-        charges = random.sample(CHARGES, k=random.randint(1, 2))
-        motto = random.choice(MOTTOS)
+        charges = self.rng.sample(CHARGES, k=self.rng.randint(1, 2))
+        motto = self.rng.choice(MOTTOS)
 
         return HeraldicShield(shape=shape, division=division, tinctures=tinctures, charges=charges, motto=motto)
 
@@ -70,9 +74,9 @@ class CoatOfArmsGeneratorService:
         colors = set(TINCTURES.keys()) - metals
 
         if tinctures[0] in metals and tinctures[1] in metals:
-            tinctures[1] = random.choice(list(colors))
+            tinctures[1] = self.rng.choice(list(colors))
         elif tinctures[0] in colors and tinctures[1] in colors:
-            tinctures[1] = random.choice(list(metals))
+            tinctures[1] = self.rng.choice(list(metals))
 
         return tinctures
 
@@ -1,3 +1,4 @@
+import random
 from pathlib import Path
 from unittest import mock
 
@@ -391,3 +392,11 @@ def test_render_shield_svg_includes_shield_border(tmp_path):
     content = output_path.read_text()
     assert 'stroke="black"' in content
     assert 'fill="none"' in content
+
+
+def test_generate_shield_same_seed_same_shield():
+    """Test that generators seeded alike generate the same shield."""
+    first = CoatOfArmsGeneratorService(rng=random.Random(42))._generate_shield()
+    second = CoatOfArmsGeneratorService(rng=random.Random(42))._generate_shield()
+
+    assert first == second
@@ -68,6 +68,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.savegame.middleware.savegame.ActiveSavegameMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.contrib.auth.middleware.LoginRequiredMiddleware",
@@ -107,6 +108,32 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Rendered map tiles, keyed by their content. Kept apart from the default cache, so rendering a map (400 tiles)
+    # doesn't evict other entries. Large enough to hold the tiles of many maps.
+    "map_tiles": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "map-tiles",
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    },
+    # Shared by all processes on this host (web workers and `round_worker`), e.g. to invalidate the in-memory copies
+    # of reference data. Deployments with several hosts need a network cache like Redis or Memcached here.
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": ROOT_DIR / "cache",
+    },
+}
+
+# Seconds a process keeps using its in-memory reference data before it checks the shared cache for a newer version
+PROCESS_CACHE_VERSION_CHECK_INTERVAL = 5
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -166,6 +193,13 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CRISPY_ALLOWED_TEMPLATE_PACKS = "tailwind"
 CRISPY_TEMPLATE_PACK = "tailwind"
 
+# Rounds
+
+# Finish rounds in a `round_worker` process instead of the request, the client polls for the result
+ROUND_PROCESSING_ASYNC = False
+# Seconds after which a running round job counts as abandoned by its worker and is put back into the queue
+ROUND_JOB_TIMEOUT = 300
+
 # Authentication
 
 LOGIN_URL = "account:login"
@@ -0,0 +1,58 @@
+import time
+import typing
+import uuid
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Cache shared by all processes, like the web workers and the `round_worker`
+SHARED_CACHE_ALIAS = "shared"
+
+
+class ProcessCache:
+    """
+    Global data which every process loads once and keeps in memory, like reference data edited via the admin.
+
+    A version in the shared cache tells all processes to reload their copy as soon as `invalidate()` was called in any
+    of them. Every process looks up that version at most once per `PROCESS_CACHE_VERSION_CHECK_INTERVAL`, so reading the
+    data usually costs no I/O at all and other processes pick up an invalidation within that interval.
+    """
+
+    def __init__(self, *, version_cache_key: str, loader: Callable[[], typing.Any]) -> None:
+        self.version_cache_key = version_cache_key
+        self.loader = loader
+        self._value = None
+        self._version: str | None = None
+        self._checked_version: str | None = None
+        self._checked_at = 0.0
+
+    def get(self) -> typing.Any:
+        version = self.get_version()
+        if self._value is None or version != self._version:
+            self._value = self.loader()
+            self._version = version
+        return self._value
+
+    def get_version(self) -> str:
+        """Current version of the data, changes whenever it is invalidated in any process."""
+        now = time.monotonic()
+        if self._checked_version is None or now - self._checked_at >= settings.PROCESS_CACHE_VERSION_CHECK_INTERVAL:
+            version = caches[SHARED_CACHE_ALIAS].get(self.version_cache_key)
+            if version is None:
+                version = self._bump_version()
+            self._checked_version = version
+            self._checked_at = now
+        return self._checked_version
+
+    def invalidate(self) -> None:
+        """Make all processes reload the data, this one immediately and the others within the check interval."""
+        self._value = None
+        self._bump_version()
+
+    def _bump_version(self) -> str:
+        version = uuid.uuid4().hex
+        caches[SHARED_CACHE_ALIAS].set(self.version_cache_key, version, timeout=None)
+        self._checked_version = version
+        self._checked_at = time.monotonic()
+        return version
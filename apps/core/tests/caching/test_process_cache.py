@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.core.cache import caches
+
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS, ProcessCache
+
+
+def test_process_cache_get_loads_once():
+    """Test get loads the data on first access and keeps it as long as the version didn't change."""
+    loader = mock.Mock(side_effect=[["first"], ["second"]])
+    process_cache = ProcessCache(version_cache_key="test-version", loader=loader)
+
+    first = process_cache.get()
+    second = process_cache.get()
+
+    assert first == ["first"]
+    assert second is first
+    loader.assert_called_once_with()
+
+
+def test_process_cache_get_reloads_after_invalidation():
+    """Test get reloads the data after invalidate() was called."""
+    process_cache = ProcessCache(version_cache_key="test-version", loader=mock.Mock(side_effect=["first", "second"]))
+    process_cache.get()
+
+    process_cache.invalidate()
+
+    assert process_cache.get() == "second"
+
+
+def test_process_cache_invalidation_reaches_other_instances():
+    """Test an invalidation via one instance makes another one, like in another process, reload its data."""
+    loader = mock.Mock(side_effect=["first", "second"])
+    process_cache = ProcessCache(version_cache_key="test-version", loader=loader)
+    other_process_cache = ProcessCache(version_cache_key="test-version", loader=mock.Mock())
+    process_cache.get()
+
+    other_process_cache.invalidate()
+
+    assert process_cache.get() == "second"
+
+
+def test_process_cache_get_version_stored_in_shared_cache():
+    """Test the version is kept in the shared cache and recreated if it was evicted."""
+    process_cache = ProcessCache(version_cache_key="test-version", loader=mock.Mock())
+    version = process_cache.get_version()
+
+    assert caches[SHARED_CACHE_ALIAS].get("test-version") == version
+    assert process_cache.get_version() == version
+
+    caches[SHARED_CACHE_ALIAS].delete("test-version")
+
+    assert process_cache.get_version() != version
+
+
+def test_process_cache_get_version_checked_once_per_interval(settings):
+    """Test the version in the shared cache is looked up at most once per check interval."""
+    settings.PROCESS_CACHE_VERSION_CHECK_INTERVAL = 5
+    loader = mock.Mock(side_effect=["first", "second"])
+    process_cache = ProcessCache(version_cache_key="test-version", loader=loader)
+    other_process_cache = ProcessCache(version_cache_key="test-version", loader=mock.Mock())
+
+    with mock.patch("apps.core.caching.process_cache.time.monotonic", return_value=100.0):
+        process_cache.get()
+        other_process_cache.invalidate()
+        with mock.patch.object(caches[SHARED_CACHE_ALIAS], "get") as mock_get:
+            assert process_cache.get() == "first"
+        mock_get.assert_not_called()
+
+    with mock.patch("apps.core.caching.process_cache.time.monotonic", return_value=105.0):
+        assert process_cache.get() == "second"
+
+
+def test_process_cache_invalidate_applies_to_own_process_immediately(settings):
+    """Test invalidate makes the own process reload its data without waiting for the check interval."""
+    settings.PROCESS_CACHE_VERSION_CHECK_INTERVAL = 5
+    process_cache = ProcessCache(version_cache_key="test-version", loader=mock.Mock(side_effect=["first", "second"]))
+
+    with mock.patch("apps.core.caching.process_cache.time.monotonic", return_value=100.0):
+        process_cache.get()
+        version = process_cache.get_version()
+        process_cache.invalidate()
+
+        assert process_cache.get() == "second"
+        assert process_cache.get_version() != version
+        assert process_cache.get_version() == caches[SHARED_CACHE_ALIAS].get("test-version")
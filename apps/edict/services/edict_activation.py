@@ -89,10 +89,9 @@ class EdictActivationService:
         if self.edict.required_prestige is None:
             return EdictActivationResult(success=True, message="")
 
-        from apps.city.services.prestige import PrestigeCalculationService
+        from apps.city.selectors.city_stats import get_city_stats
 
-        prestige_service = PrestigeCalculationService(savegame=self.savegame)
-        current_prestige = prestige_service.process()
+        current_prestige = get_city_stats(savegame=self.savegame).prestige
 
         if current_prestige < self.edict.required_prestige:
             return EdictActivationResult(
@@ -8,17 +8,18 @@ from django.views import generic
 
 from apps.edict.models import Edict
 from apps.edict.services.edict_activation import EdictActivationService
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
-class EdictActivateView(SavegameRequiredMixin, generic.View):
+class EdictActivateView(SavegameRequiredMixin, RoundJobIdleRequiredMixin, generic.View):
     """Handle edict activation (POST only)."""
 
     http_method_names = ("post",)
 
     def post(self, request, *args, **kwargs) -> HttpResponse:
-        savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+        savegame = get_active_savegame(request=request)
         edict = get_object_or_404(Edict, pk=kwargs["pk"])
 
         # Process activation
@@ -2,7 +2,7 @@ from django.views import generic
 
 from apps.edict.selectors import get_available_edicts_for_savegame
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 class EdictListView(SavegameRequiredMixin, generic.TemplateView):
@@ -12,7 +12,7 @@ class EdictListView(SavegameRequiredMixin, generic.TemplateView):
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        savegame = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        savegame = get_active_savegame(request=self.request)
 
         context["edicts"] = get_available_edicts_for_savegame(savegame=savegame)
 
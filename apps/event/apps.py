@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EventConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.event"
+
+    def ready(self) -> None:
+        # Collect the events of all local apps once instead of on every round
+        from apps.event.events.registry import discover_events
+
+        discover_events()
@@ -0,0 +1,58 @@
+from collections.abc import Iterable
+
+from django.db.models import Expression, F
+from django.db.models.functions import Greatest, Least
+
+from apps.savegame.models import Savegame
+
+
+class EffectAccumulator:
+    """
+    Coalesces the changes of coins, population and unrest made by all effects of a round.
+
+    Effects keep changing the in-memory savegame, so events can report the change and later effects build on it. The
+    housing cap is applied there, since effects know the current housing space. On flush, only the differences to the
+    values at the start of the round are written as `F()` expressions within a single UPDATE. Changes made
+    concurrently, e.g. coins spent in another request, are kept and the database bounds are enforced once more.
+    """
+
+    FIELDS = ("coins", "population", "unrest")
+
+    def __init__(self, *, savegame: Savegame):
+        self.savegame = savegame
+        self.initial_values = self._get_values()
+
+    def get_deltas(self) -> dict[str, int]:
+        """Return the accumulated change per field, unchanged fields are left out."""
+        return {
+            field: value - self.initial_values[field]
+            for field, value in self._get_values().items()
+            if value != self.initial_values[field]
+        }
+
+    def flush(self, *, update_fields: Iterable[str] = ()) -> None:
+        """Persist the accumulated deltas together with the given plain fields of the savegame in one UPDATE."""
+        deltas = self.get_deltas()
+        update_fields = [*deltas, *update_fields]
+        if not update_fields:
+            return
+
+        for field, delta in deltas.items():
+            setattr(self.savegame, field, self._clamp(field=field, expression=F(field) + delta))
+        self.savegame.save(update_fields=update_fields)
+
+        if deltas:
+            # Resolve the expressions, the stored values may include concurrent changes
+            self.savegame.refresh_from_db(fields=list(deltas))
+        self.initial_values = self._get_values()
+
+    def _get_values(self) -> dict[str, int]:
+        return {field: getattr(self.savegame, field) for field in self.FIELDS}
+
+    @staticmethod
+    def _clamp(*, field: str, expression: Expression) -> Expression:
+        if field == "population":
+            return Greatest(expression, 0)
+        if field == "unrest":
+            return Least(Greatest(expression, 0), 100)
+        return expression
@@ -0,0 +1,59 @@
+import random
+from functools import cached_property
+
+from apps.city.models import CityStats, Tile
+from apps.city.selectors.city_stats import get_city_stats
+from apps.savegame.models import Savegame
+
+
+class EventContext:
+    """
+    Data of a savegame shared by all events of one round.
+
+    Every value is loaded lazily on first access and at most once per round, so events don't query the same tiles or
+    aggregates independently. The tile lists share their instances, so a tile changed by an effect is seen changed by
+    all events.
+
+    All random decisions of the round are drawn from `rng`, which is derived from the savegame seed and the current
+    year. Playing a round again from the same state gives the same result.
+    """
+
+    def __init__(self, *, savegame: Savegame, rng: random.Random | None = None):
+        self.savegame = savegame
+        self.rng = rng or savegame.get_random(stream="events")
+
+    @cached_property
+    def city_stats(self) -> CityStats:
+        """Housing capacity and balance figures at the start of the round."""
+        return get_city_stats(savegame=self.savegame)
+
+    @cached_property
+    def building_tiles(self) -> list[Tile]:
+        """All tiles having a building, ordered like the database returns them by default."""
+        return list(
+            self.savegame.tiles.filter(building__isnull=False).select_related("building__building_type").order_by("id")
+        )
+
+    @cached_property
+    def wall_tiles(self) -> list[Tile]:
+        return [tile for tile in self.building_tiles if tile.building.building_type.is_wall]
+
+    @cached_property
+    def house_tiles(self) -> list[Tile]:
+        return [tile for tile in self.building_tiles if tile.building.building_type.is_house]
+
+    @cached_property
+    def city_building_tiles(self) -> list[Tile]:
+        """Tiles having a pure city building, excluding walls, country and unique buildings."""
+        return [
+            tile
+            for tile in self.building_tiles
+            if tile.building.building_type.is_city
+            and not tile.building.building_type.is_wall
+            and not tile.building.building_type.is_country
+            and not tile.building.building_type.is_unique
+        ]
+
+    @cached_property
+    def non_unique_building_tiles(self) -> list[Tile]:
+        return [tile for tile in self.building_tiles if not tile.building.building_type.is_unique]
@@ -2,21 +2,35 @@ import inspect
 
 from django.contrib import messages
 
+from apps.event.events.context import EventContext
+
 
 class BaseEvent:
     """
     Prefix every method to instantiate a new event effect with "_prepare_effect"
+
+    Events are only instantiated if they occur, so expensive preparations like selecting affected tiles belong into
+    `__init__()` and not into `get_probability()`.
+
+    Effects change the savegame in memory only, persisting it is up to the caller, e.g. the `RoundEngineService`.
     """
 
     PROBABILITY = 0
     LEVEL = messages.INFO
     TITLE = "Missing title"
 
-    def __init__(self, *, savegame):
+    def __init__(self, *, savegame, context: EventContext | None = None):
         self.savegame = savegame
-
-    def get_probability(self) -> int | float:
-        return self.PROBABILITY
+        # Shared by all events of a round, an event on its own gets a private one
+        self.context = context or EventContext(savegame=savegame)
+
+    @classmethod
+    def get_probability(cls, *, context: EventContext) -> int | float:
+        """
+        Probability in percent for this event to occur.
+        Checked before the event is instantiated, so it may only look at the savegame and the shared context.
+        """
+        return cls.PROBABILITY
 
     def get_effects(self) -> list:
         methods = inspect.getmembers(self, predicate=inspect.ismethod)
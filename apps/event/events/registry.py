@@ -0,0 +1,72 @@
+import importlib
+from os.path import isdir
+from pathlib import Path
+
+from django.conf import settings
+
+from apps.event.events.events.base_event import BaseEvent
+
+_registered_events: tuple[type[BaseEvent], ...] | None = None
+
+
+def discover_events() -> tuple[type[BaseEvent], ...]:
+    """
+    Collect the event classes of all local apps and store them in the registry.
+    Title and probability are read from the classes themselves, so they are not stored separately.
+    Called once on startup in `EventConfig.ready()`, so finishing a round doesn't touch the filesystem.
+    """
+    global _registered_events
+
+    _registered_events = tuple(_scan_events())
+    return _registered_events
+
+
+def get_registered_events() -> tuple[type[BaseEvent], ...]:
+    if _registered_events is None:
+        return discover_events()
+    return _registered_events
+
+
+def _scan_events() -> list[type[BaseEvent]]:
+    # Get base dir and locally installed apps
+    root_dir = settings.ROOT_DIR
+    local_apps = settings.LOCAL_APPS
+
+    # Start collecting event classes...
+    registered_events = []
+
+    # Iterate over all local apps...
+    for app in local_apps:
+        # Search for "events/events" package
+        event_path = root_dir / app.replace(".", "/") / "events/events"
+
+        # If the app doesn't have it, continue
+        if not isdir(event_path):
+            continue
+
+        # Iterate all files within the package, sorted to get the same order on every system
+        for file in sorted(event_path.iterdir()):
+            file_path = Path(file)
+
+            # Ignore dunder and non-Python files
+            if file_path.name.startswith("__") or file_path.suffix != ".py":
+                continue
+
+            # Import file
+            module = importlib.import_module(
+                file_path.as_posix().replace(root_dir.as_posix(), "").replace("/", ".").strip(".").removesuffix(".py")
+            )
+
+            # Get event class
+            try:
+                event_class = module.Event
+            except AttributeError:
+                continue
+
+            # Check if the loaded class is really an event
+            if not isinstance(event_class, type) or not issubclass(event_class, BaseEvent):
+                continue
+
+            registered_events.append(event_class)
+
+    return registered_events
@@ -6,7 +6,7 @@ from apps.savegame.models import Savegame
 class NotificationCreationService:
     """
     Creates persistent EventNotification records from selected events.
-    Processes each event (runs effects) and stores the results.
+    Processes each event (runs effects) and stores the results with a single bulk insert.
     """
 
     def __init__(self, *, savegame: Savegame, events: list[BaseEvent]):
@@ -25,14 +25,14 @@ class NotificationCreationService:
             if not message:
                 continue
 
-            # Create notification record
-            notification = EventNotification.objects.create(
-                savegame=self.savegame,
-                year=self.savegame.current_year,
-                title=event.TITLE,
-                message=message,
-                acknowledged=False,
+            notifications.append(
+                EventNotification(
+                    savegame=self.savegame,
+                    year=self.savegame.current_year,
+                    title=event.TITLE,
+                    message=message,
+                    acknowledged=False,
+                )
             )
-            notifications.append(notification)
 
-        return notifications
+        return EventNotification.objects.bulk_create(notifications)
@@ -1,67 +1,27 @@
-import importlib
 import random
-from os.path import isdir
-from pathlib import Path
-
-from django.conf import settings
 
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
+from apps.event.events.registry import get_registered_events
 
 
 class EventSelectionService:
-    def __init__(self, *, savegame):
+    def __init__(self, *, savegame, rng: random.Random | None = None):
         self.savegame = savegame
+        # Shared by all events of this round, so they don't load the same data independently
+        self.context = EventContext(savegame=savegame, rng=rng)
 
     def _get_possible_events(self) -> list[BaseEvent]:
-        # Get base dir and locally installed apps
-        root_dir = settings.ROOT_DIR
-        local_apps = settings.LOCAL_APPS
-
-        # Start collecting event classes...
-        possible_event_classes = []
-
-        # Iterate over all local apps...
-        for app in local_apps:
-            # Search for "events/events" package
-            event_path = root_dir / app.replace(".", "/") / "events/events"
-
-            # If the app doesn't have it, continue
-            if not isdir(event_path):
-                continue
-
-            # Iterate all files within the package
-            for file in event_path.iterdir():
-                file_path = Path(file)
-
-                # Ignore dunder and non-Python files
-                if file_path.name.startswith("__") or file_path.suffix != ".py":
-                    continue
-
-                # Import file
-                module = importlib.import_module(
-                    file_path.as_posix()
-                    .replace(root_dir.as_posix(), "")
-                    .replace("/", ".")
-                    .strip(".")
-                    .removesuffix(".py")
-                )
-
-                # Get event class
-                try:
-                    event: BaseEvent = module.Event(savegame=self.savegame)
-                except AttributeError:
-                    continue
-
-                # Check if the loaded class is really an event
-                if not isinstance(event, BaseEvent):
-                    continue
+        possible_events = []
 
-                # Check probability and add event to possible events
-                probability = event.get_probability()
-                if probability >= random.randint(1, 100):
-                    possible_event_classes.append(event)
+        # The event classes are collected once on startup, see `EventConfig.ready()`
+        for event_class in get_registered_events():
+            # Check probability first, only events which occur are instantiated
+            probability = event_class.get_probability(context=self.context)
+            if probability >= self.context.rng.randint(1, 100):
+                possible_events.append(event_class(savegame=self.savegame, context=self.context))
 
-        return possible_event_classes
+        return possible_events
 
     def process(self) -> list[BaseEvent]:
         return self._get_possible_events()
@@ -1,5 +1,6 @@
 import factory
 
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.event.models import EventNotification
 
@@ -23,8 +24,8 @@ class MockEvent(BaseEvent):
     PROBABILITY = 50
     TITLE = "Mock Event"
 
-    def __init__(self, *, savegame, probability=None):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None, probability=None):
+        super().__init__(savegame=savegame, context=context)
         if probability is not None:
             self.PROBABILITY = probability
 
@@ -38,8 +39,8 @@ class HighProbabilityEvent(BaseEvent):
     PROBABILITY = 90
     TITLE = "High Probability Event"
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
 
     def get_verbose_text(self):
         return "High probability event occurred"
@@ -51,8 +52,8 @@ class LowProbabilityEvent(BaseEvent):
     PROBABILITY = 10
     TITLE = "Low Probability Event"
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
 
     def get_verbose_text(self):
         return "Low probability event occurred"
@@ -64,8 +65,8 @@ class ZeroProbabilityEvent(BaseEvent):
     PROBABILITY = 0
     TITLE = "Zero Probability Event"
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
 
     def get_verbose_text(self):
         return "Zero probability event occurred"
@@ -88,8 +89,8 @@ class EventWithEffect(BaseEvent):
     PROBABILITY = 50
     TITLE = "Event With Effect"
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.effect = MockEffect()
 
     def _prepare_effect_test(self):
@@ -0,0 +1,94 @@
+import pytest
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from apps.event.events.accumulator import EffectAccumulator
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_get_deltas():
+    """Test that only the changed fields are returned with their accumulated difference."""
+    savegame = SavegameFactory.create(coins=100, population=50, unrest=10)
+    accumulator = EffectAccumulator(savegame=savegame)
+
+    savegame.coins += 20
+    savegame.coins -= 5
+    savegame.unrest -= 10
+
+    assert accumulator.get_deltas() == {"coins": 15, "unrest": -10}
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_flush_single_update():
+    """Test that all deltas and plain fields are written with a single UPDATE."""
+    savegame = SavegameFactory.create(coins=100, population=50, unrest=10, current_year=1150)
+    accumulator = EffectAccumulator(savegame=savegame)
+    savegame.coins += 20
+    savegame.population += 5
+    savegame.current_year += 1
+
+    with CaptureQueriesContext(connection) as context:
+        accumulator.flush(update_fields=("current_year",))
+
+    updates = [query["sql"] for query in context.captured_queries if query["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert '"city_name"' not in updates[0]
+    assert '"unrest"' not in updates[0]
+    savegame.refresh_from_db()
+    assert (savegame.coins, savegame.population, savegame.unrest, savegame.current_year) == (120, 55, 10, 1151)
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_flush_keeps_concurrent_changes():
+    """Test that changes made concurrently in the database are not overwritten."""
+    savegame = SavegameFactory.create(coins=100)
+    accumulator = EffectAccumulator(savegame=savegame)
+    savegame.coins += 20
+    Savegame.objects.filter(pk=savegame.pk).update(coins=F("coins") - 50)
+
+    accumulator.flush()
+
+    assert savegame.coins == 70
+    assert Savegame.objects.get(pk=savegame.pk).coins == 70
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_flush_clamps_values():
+    """Test that population and unrest stay within their bounds even with concurrent changes."""
+    savegame = SavegameFactory.create(population=10, unrest=90)
+    accumulator = EffectAccumulator(savegame=savegame)
+    savegame.population -= 10
+    savegame.unrest += 10
+    Savegame.objects.filter(pk=savegame.pk).update(population=5, unrest=95)
+
+    accumulator.flush()
+
+    assert savegame.population == 0
+    assert savegame.unrest == 100
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_flush_resets_deltas():
+    """Test that the deltas start over after flushing."""
+    savegame = SavegameFactory.create(coins=100)
+    accumulator = EffectAccumulator(savegame=savegame)
+    savegame.coins += 20
+
+    accumulator.flush()
+
+    assert accumulator.get_deltas() == {}
+
+
+@pytest.mark.django_db
+def test_effect_accumulator_flush_without_changes(django_assert_num_queries):
+    """Test that nothing is written if nothing changed."""
+    savegame = SavegameFactory.create()
+    accumulator = EffectAccumulator(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        accumulator.flush()
+
+    assert accumulator.get_deltas() == {}
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from apps.city.tests.factories import (
+    BuildingFactory,
+    BuildingTypeFactory,
+    CityStatsFactory,
+    CountryBuildingTypeFactory,
+    HouseBuildingTypeFactory,
+    TileFactory,
+    UniqueBuildingTypeFactory,
+    WallBuildingTypeFactory,
+)
+from apps.event.events.context import EventContext
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_event_context_building_tiles_loaded_once(django_assert_num_queries):
+    """Test that all building tiles are loaded with a single query and reused by all categories."""
+    savegame = SavegameFactory.create()
+    wall_tile = TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=WallBuildingTypeFactory()))
+    house_tile = TileFactory.create(
+        savegame=savegame, building=BuildingFactory(building_type=HouseBuildingTypeFactory(is_city=True))
+    )
+    TileFactory.create(savegame=savegame, building=None)
+    TileFactory.create(building=BuildingFactory(building_type=WallBuildingTypeFactory()))
+    context = EventContext(savegame=savegame)
+
+    with django_assert_num_queries(1):
+        assert context.building_tiles == [wall_tile, house_tile]
+        assert context.wall_tiles == [wall_tile]
+        assert context.house_tiles == [house_tile]
+        assert context.wall_tiles[0] is context.building_tiles[0]
+
+
+@pytest.mark.django_db
+def test_event_context_city_building_tiles():
+    """Test that only pure city buildings count as city buildings."""
+    savegame = SavegameFactory.create()
+    city_tile = TileFactory.create(
+        savegame=savegame, building=BuildingFactory(building_type=BuildingTypeFactory(is_city=True))
+    )
+    TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=WallBuildingTypeFactory()))
+    TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=CountryBuildingTypeFactory()))
+    TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=UniqueBuildingTypeFactory()))
+
+    context = EventContext(savegame=savegame)
+
+    assert context.city_building_tiles == [city_tile]
+
+
+@pytest.mark.django_db
+def test_event_context_non_unique_building_tiles():
+    """Test that unique buildings are excluded from the non-unique building tiles."""
+    savegame = SavegameFactory.create()
+    tile = TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=BuildingTypeFactory()))
+    TileFactory.create(savegame=savegame, building=BuildingFactory(building_type=UniqueBuildingTypeFactory()))
+
+    context = EventContext(savegame=savegame)
+
+    assert context.non_unique_building_tiles == [tile]
+
+
+@pytest.mark.django_db
+def test_event_context_city_stats_loaded_once(django_assert_num_queries):
+    """Test that the city statistics are loaded once for all events."""
+    savegame = SavegameFactory.create()
+    CityStatsFactory.create(savegame=savegame, housing_space=50, taxes=20, maintenance_costs=5)
+    context = EventContext(savegame=savegame)
+
+    with django_assert_num_queries(1):
+        assert context.city_stats.housing_space == 50
+        assert context.city_stats.taxes == 20
+        assert context.city_stats.maintenance_costs == 5
+
+
+def test_event_context_rng_derived_from_savegame():
+    """Test that the random number generator is the "events" stream of the savegame for the current year."""
+    savegame = SavegameFactory.build(seed=42, current_year=1150)
+
+    context = EventContext(savegame=savegame)
+
+    assert context.rng.random() == savegame.get_random(stream="events").random()
+
+
+def test_event_context_uses_injected_rng():
+    """Test that an injected random number generator is used."""
+    rng = random.Random(1)
+    context = EventContext(savegame=SavegameFactory.build(), rng=rng)
+
+    assert context.rng is rng
@@ -0,0 +1,189 @@
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from apps.city.events.events.fire import Event as FireEvent
+from apps.event.events import registry
+from apps.event.events.registry import discover_events, get_registered_events
+from apps.event.tests.factories import HighProbabilityEvent, LowProbabilityEvent
+from apps.milestone.events.events.milestone_check import Event as MilestoneCheckEvent
+
+
+def test_discover_events_collects_events_of_local_apps():
+    """Test that the events of all local apps are registered."""
+    registered_events = discover_events()
+
+    assert FireEvent in registered_events
+    assert MilestoneCheckEvent in registered_events
+
+
+def test_get_registered_events_memoized():
+    """Test that the registry is built once and reused without scanning again."""
+    discover_events()
+
+    with mock.patch.object(registry, "_scan_events") as mock_scan:
+        first = get_registered_events()
+        second = get_registered_events()
+
+    assert first is second
+    mock_scan.assert_not_called()
+
+
+def test_get_registered_events_discovers_if_empty():
+    """Test that the registry is built on first access if it wasn't built on startup."""
+    with (
+        mock.patch.object(registry, "_registered_events", None),
+        mock.patch.object(registry, "_scan_events", return_value=[]) as mock_scan,
+    ):
+        result = get_registered_events()
+
+    assert result == ()
+    mock_scan.assert_called_once()
+
+
+def test_scan_events_with_no_apps():
+    """Test _scan_events when no local apps are configured."""
+    with mock.patch("django.conf.settings.LOCAL_APPS", []):
+        result = registry._scan_events()
+
+    assert result == []
+
+
+def test_scan_events_with_no_event_directories():
+    """Test _scan_events when apps have no events/events directories."""
+    with (
+        mock.patch("django.conf.settings.LOCAL_APPS", ["apps.nonexistent"]),
+        mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
+        mock.patch("apps.event.events.registry.isdir", return_value=False),
+    ):
+        result = registry._scan_events()
+
+    assert result == []
+
+
+def test_scan_events_ignores_dunder_and_non_python_files():
+    """Test that _scan_events ignores __pycache__, __init__.py and non-Python files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        events_dir = temp_path / "apps" / "test" / "events" / "events"
+        events_dir.mkdir(parents=True)
+
+        # Create files that should be ignored
+        (events_dir / "__init__.py").touch()
+        (events_dir / "__pycache__").mkdir()
+        (events_dir / "valid_event.txt").touch()
+
+        with (
+            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
+            mock.patch("django.conf.settings.ROOT_DIR", temp_path),
+        ):
+            result = registry._scan_events()
+
+    assert result == []
+
+
+def test_scan_events_propagates_import_errors():
+    """Test that _scan_events propagates import errors."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        events_dir = temp_path / "apps" / "test" / "events" / "events"
+        events_dir.mkdir(parents=True)
+        (events_dir / "broken_event.py").write_text("# This is a broken Python file")
+
+        with (
+            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
+            mock.patch("django.conf.settings.ROOT_DIR", temp_path),
+            mock.patch("importlib.import_module", side_effect=ImportError("Module not found")),
+            pytest.raises(ImportError),
+        ):
+            registry._scan_events()
+
+
+def test_scan_events_handles_missing_event_class():
+    """Test that _scan_events skips modules without Event class."""
+    mock_module = mock.MagicMock()
+    del mock_module.Event
+
+    with (
+        mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
+        mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
+        mock.patch("apps.event.events.registry.isdir", return_value=True),
+        mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
+        mock.patch("importlib.import_module", return_value=mock_module),
+    ):
+        result = registry._scan_events()
+
+    assert result == []
+
+
+def test_scan_events_handles_non_base_event_classes():
+    """Test that _scan_events skips Event attributes which aren't BaseEvent classes."""
+
+    class NotAnEvent:
+        pass
+
+    not_an_event_module = mock.MagicMock()
+    not_an_event_module.Event = NotAnEvent
+    instance_module = mock.MagicMock()
+    instance_module.Event = NotAnEvent()
+
+    with (
+        mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
+        mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
+        mock.patch("apps.event.events.registry.isdir", return_value=True),
+        mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/a_event.py"), Path("/tmp/b_event.py")]),
+        mock.patch("importlib.import_module", side_effect=[not_an_event_module, instance_module]),
+    ):
+        result = registry._scan_events()
+
+    assert result == []
+
+
+def test_scan_events_sorted_by_file_name():
+    """Test that events are registered in the order of their file names."""
+    high_prob_module = mock.MagicMock()
+    high_prob_module.Event = HighProbabilityEvent
+
+    low_prob_module = mock.MagicMock()
+    low_prob_module.Event = LowProbabilityEvent
+
+    def mock_import(module_name):
+        if "high" in module_name:
+            return high_prob_module
+        return low_prob_module
+
+    with (
+        mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
+        mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
+        mock.patch("apps.event.events.registry.isdir", return_value=True),
+        mock.patch(
+            "pathlib.Path.iterdir", return_value=[Path("/tmp/low_prob_event.py"), Path("/tmp/high_prob_event.py")]
+        ),
+        mock.patch("importlib.import_module", side_effect=mock_import),
+    ):
+        result = registry._scan_events()
+
+    assert result == [
+        HighProbabilityEvent,
+        LowProbabilityEvent,
+    ]
+
+
+def test_scan_events_file_path_construction():
+    """Test that file paths are correctly constructed for module importing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        events_dir = temp_path / "apps" / "testapp" / "events" / "events"
+        events_dir.mkdir(parents=True)
+        (events_dir / "sample_event.py").write_text("class Event: pass")
+
+        with (
+            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.testapp"]),
+            mock.patch("django.conf.settings.ROOT_DIR", temp_path),
+            mock.patch("importlib.import_module") as mock_import,
+        ):
+            registry._scan_events()
+
+    mock_import.assert_called_with("apps.testapp.events.events.sample_event")
@@ -1,9 +1,10 @@
-import tempfile
-from pathlib import Path
+import random
 from unittest import mock
 
 import pytest
 
+from apps.event.events.context import EventContext
+from apps.event.events.events.base_event import BaseEvent
 from apps.event.services.selection import EventSelectionService
 from apps.event.tests.factories import (
     HighProbabilityEvent,
@@ -14,6 +15,16 @@ from apps.event.tests.factories import (
 from apps.savegame.tests.factories import SavegameFactory
 
 
+class ExpensiveEvent(BaseEvent):
+    """Event which may never be instantiated if it doesn't occur."""
+
+    PROBABILITY = 10
+    TITLE = "Expensive Event"
+
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        raise AssertionError("Events which don't occur must not be instantiated")
+
+
 @pytest.mark.django_db
 class TestEventSelection:
     """Test suite for EventSelectionService."""
@@ -30,228 +41,115 @@ class TestEventSelection:
         assert len(result) == 1
         assert isinstance(result[0], MockEvent)
 
-    def test_get_possible_events_with_no_apps(self):
-        """Test _get_possible_events when no local apps are configured."""
+    def test_get_possible_events_with_no_registered_events(self):
+        """Test _get_possible_events when no events are registered."""
         savegame = SavegameFactory.create()
         service = EventSelectionService(savegame=savegame)
 
-        with mock.patch("django.conf.settings.LOCAL_APPS", []):
+        with mock.patch("apps.event.services.selection.get_registered_events", return_value=()):
             result = service._get_possible_events()
 
         assert result == []
 
-    def test_get_possible_events_with_no_event_directories(self):
-        """Test _get_possible_events when apps have no events/events directories."""
+    def test_get_possible_events_uses_registry(self):
+        """Test that _get_possible_events doesn't scan the filesystem but uses the prebuilt registry."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 1
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
         with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.nonexistent"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=False),
+            mock.patch(
+                "apps.event.services.selection.get_registered_events", return_value=(HighProbabilityEvent,)
+            ) as mock_registry,
+            mock.patch("apps.event.events.registry._scan_events") as mock_scan,
         ):
             result = service._get_possible_events()
 
-        assert result == []
-
-    def test_get_possible_events_with_empty_event_directory(self):
-        """Test _get_possible_events when events directory exists but is empty."""
-        savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            events_dir = temp_path / "apps" / "test" / "events" / "events"
-            events_dir.mkdir(parents=True)
-
-            with (
-                mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-                mock.patch("django.conf.settings.ROOT_DIR", temp_path),
-                mock.patch("apps.event.services.selection.isdir", return_value=True),
-            ):
-                result = service._get_possible_events()
-
-        assert result == []
-
-    def test_get_possible_events_ignores_dunder_files(self):
-        """Test that _get_possible_events ignores __pycache__ and __init__.py files."""
-        savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            events_dir = temp_path / "apps" / "test" / "events" / "events"
-            events_dir.mkdir(parents=True)
-
-            # Create files that should be ignored
-            (events_dir / "__init__.py").touch()
-            (events_dir / "__pycache__").mkdir()
-            (events_dir / "valid_event.txt").touch()  # Non-Python file
-
-            with (
-                mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-                mock.patch("django.conf.settings.ROOT_DIR", temp_path),
-                mock.patch("apps.event.services.selection.isdir", return_value=True),
-            ):
-                result = service._get_possible_events()
-
-        assert result == []
-
-    def test_get_possible_events_handles_import_errors(self):
-        """Test that _get_possible_events propagates import errors (current behavior)."""
-        savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
+        mock_registry.assert_called_once()
+        mock_scan.assert_not_called()
+        assert len(result) == 1
+        assert result[0].savegame == savegame
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            events_dir = temp_path / "apps" / "test" / "events" / "events"
-            events_dir.mkdir(parents=True)
-
-            # Create a Python file
-            event_file = events_dir / "broken_event.py"
-            event_file.write_text("# This is a broken Python file")
-
-            with (
-                mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-                mock.patch("django.conf.settings.ROOT_DIR", temp_path),
-                mock.patch("apps.event.services.selection.isdir", return_value=True),
-                mock.patch("importlib.import_module", side_effect=ImportError("Module not found")),
-                pytest.raises(ImportError),
-            ):
-                # Should raise ImportError since the code doesn't handle it
-                service._get_possible_events()
-
-    def test_get_possible_events_handles_missing_event_class(self):
-        """Test that _get_possible_events handles modules without Event class."""
+    def test_get_possible_events_probability_filtering_high_probability(self):
+        """Test that events with high probability are included."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 50  # Random roll of 50
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        mock_module = mock.MagicMock()
-        del mock_module.Event  # Remove Event attribute to trigger AttributeError
-
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
-            mock.patch("importlib.import_module", return_value=mock_module),
-        ):
+        with mock.patch("apps.event.services.selection.get_registered_events", return_value=(HighProbabilityEvent,)):
             result = service._get_possible_events()
 
-        assert result == []
+        assert len(result) == 1
+        assert isinstance(result[0], HighProbabilityEvent)
 
-    def test_get_possible_events_handles_non_base_event_classes(self):
-        """Test that _get_possible_events ignores classes that aren't BaseEvent instances."""
+    def test_get_possible_events_probability_filtering_low_probability(self):
+        """Test that events with low probability are excluded when random roll is high."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-
-        class NotAnEvent:
-            pass
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 50  # Random roll of 50
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        mock_module = mock.MagicMock()
-        mock_module.Event.return_value = NotAnEvent()
-
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
-            mock.patch("importlib.import_module", return_value=mock_module),
-        ):
+        with mock.patch("apps.event.services.selection.get_registered_events", return_value=(LowProbabilityEvent,)):
             result = service._get_possible_events()
 
-        assert result == []
+        assert len(result) == 0
 
-    @mock.patch("random.randint")
-    def test_get_possible_events_probability_filtering_high_probability(self, mock_random):
-        """Test that events with high probability are included."""
+    def test_get_possible_events_shares_context(self):
+        """Test that all events of a round share the context of the selection."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-        mock_random.return_value = 50  # Random roll of 50
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 1
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        mock_module = mock.MagicMock()
-        mock_module.Event = lambda savegame: HighProbabilityEvent(savegame=savegame)  # Probability 90
-
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
-            mock.patch("importlib.import_module", return_value=mock_module),
+        with mock.patch(
+            "apps.event.services.selection.get_registered_events",
+            return_value=(HighProbabilityEvent, MockEvent),
         ):
             result = service._get_possible_events()
 
-        assert len(result) == 1
-        assert isinstance(result[0], HighProbabilityEvent)
+        assert [event.context for event in result] == [service.context, service.context]
+        assert service.context.savegame == savegame
+        assert service.context.rng is rng
 
-    @mock.patch("random.randint")
-    def test_get_possible_events_probability_filtering_low_probability(self, mock_random):
-        """Test that events with low probability are excluded when random roll is high."""
+    def test_get_possible_events_only_instantiates_occurring_events(self):
+        """Test that the probability is checked on the event class before instantiating the event."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-        mock_random.return_value = 50  # Random roll of 50
-
-        mock_module = mock.MagicMock()
-        mock_module.Event = lambda savegame: LowProbabilityEvent(savegame=savegame)  # Probability 10
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 50  # Random roll of 50
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
-            mock.patch("importlib.import_module", return_value=mock_module),
+        with mock.patch(
+            "apps.event.services.selection.get_registered_events",
+            return_value=(ExpensiveEvent, HighProbabilityEvent),
         ):
             result = service._get_possible_events()
 
-        assert len(result) == 0
+        assert [type(event) for event in result] == [HighProbabilityEvent]
 
-    @mock.patch("random.randint")
-    def test_get_possible_events_probability_filtering_zero_probability(self, mock_random):
+    def test_get_possible_events_probability_filtering_zero_probability(self):
         """Test that events with zero probability are never included."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-        mock_random.return_value = 1  # Even lowest random roll
-
-        mock_module = mock.MagicMock()
-        mock_module.Event = lambda savegame: ZeroProbabilityEvent(savegame=savegame)  # Probability 0
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 1  # Even lowest random roll
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch("pathlib.Path.iterdir", return_value=[Path("/tmp/test_event.py")]),
-            mock.patch("importlib.import_module", return_value=mock_module),
-        ):
+        with mock.patch("apps.event.services.selection.get_registered_events", return_value=(ZeroProbabilityEvent,)):
             result = service._get_possible_events()
 
         assert len(result) == 0
 
-    @mock.patch("random.randint")
-    def test_get_possible_events_multiple_events_mixed_probabilities(self, mock_random):
+    def test_get_possible_events_multiple_events_mixed_probabilities(self):
         """Test probability filtering with multiple events of different probabilities."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-        mock_random.return_value = 50  # Random roll of 50
-
-        high_prob_module = mock.MagicMock()
-        high_prob_module.Event = lambda savegame: HighProbabilityEvent(savegame=savegame)
-
-        low_prob_module = mock.MagicMock()
-        low_prob_module.Event = lambda savegame: LowProbabilityEvent(savegame=savegame)
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 50  # Random roll of 50
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        def mock_import(module_name):
-            if "high" in module_name:
-                return high_prob_module
-            return low_prob_module
-
-        with (
-            mock.patch("django.conf.settings.LOCAL_APPS", ["apps.test"]),
-            mock.patch("django.conf.settings.ROOT_DIR", Path("/tmp")),
-            mock.patch("apps.event.services.selection.isdir", return_value=True),
-            mock.patch(
-                "pathlib.Path.iterdir", return_value=[Path("/tmp/high_prob_event.py"), Path("/tmp/low_prob_event.py")]
-            ),
-            mock.patch("importlib.import_module", side_effect=mock_import),
+        with mock.patch(
+            "apps.event.services.selection.get_registered_events",
+            return_value=(HighProbabilityEvent, LowProbabilityEvent),
         ):
             result = service._get_possible_events()
 
@@ -259,49 +157,18 @@ class TestEventSelection:
         assert len(result) == 1
         assert isinstance(result[0], HighProbabilityEvent)
 
-    def test_get_possible_events_file_path_construction(self):
-        """Test that file paths are correctly constructed for module importing."""
-        savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            events_dir = temp_path / "apps" / "testapp" / "events" / "events"
-            events_dir.mkdir(parents=True)
-
-            event_file = events_dir / "sample_event.py"
-            event_file.write_text("class Event: pass")
-
-            with (
-                mock.patch("django.conf.settings.LOCAL_APPS", ["apps.testapp"]),
-                mock.patch("django.conf.settings.ROOT_DIR", temp_path),
-                mock.patch("apps.event.services.selection.isdir", return_value=True),
-                mock.patch("importlib.import_module") as mock_import,
-            ):
-                service._get_possible_events()
-
-                # Verify the module path is correctly constructed
-                expected_module = "apps.testapp.events.events.sample_event"
-                mock_import.assert_called_with(expected_module)
-
-    @mock.patch("random.randint")
-    def test_process_end_to_end_integration(self, mock_random):
+    def test_process_end_to_end_integration(self):
         """Test the complete process method with real-world scenario simulation."""
         savegame = SavegameFactory.create()
-        service = EventSelectionService(savegame=savegame)
-        mock_random.return_value = 25  # Random roll of 25
+        rng = mock.Mock(wraps=random.Random(0))
+        rng.randint.return_value = 25  # Random roll of 25
+        service = EventSelectionService(savegame=savegame, rng=rng)
 
-        # Create mock events with different probabilities
-        mock_events = [
-            HighProbabilityEvent(savegame=savegame),  # 90% - should be included
-            MockEvent(savegame=savegame),  # 50% - should be included
-            LowProbabilityEvent(savegame=savegame),  # 10% - should be excluded
-        ]
-
-        with mock.patch.object(service, "_get_possible_events", return_value=mock_events):
+        with mock.patch(
+            "apps.event.services.selection.get_registered_events",
+            return_value=(HighProbabilityEvent, MockEvent, LowProbabilityEvent),
+        ):
             result = service.process()
 
-        # All mock events should be returned since we're mocking _get_possible_events
-        assert len(result) == 3
-        assert all(hasattr(event, "get_probability") for event in result)
-        assert all(hasattr(event, "get_verbose_text") for event in result)
+        # The 90% and 50% events are included, the 10% event is excluded
+        assert [type(event) for event in result] == [HighProbabilityEvent, MockEvent]
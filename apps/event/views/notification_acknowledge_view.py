@@ -5,7 +5,7 @@ from django.views import generic
 
 from apps.event.models import EventNotification
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 class NotificationAcknowledgeView(SavegameRequiredMixin, generic.View):
@@ -17,7 +17,7 @@ class NotificationAcknowledgeView(SavegameRequiredMixin, generic.View):
     http_method_names = ("post",)
 
     def post(self, request, pk, *args, **kwargs) -> HttpResponse:
-        savegame = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        savegame = get_active_savegame(request=self.request)
 
         # Get and acknowledge the notification
         notification = get_object_or_404(EventNotification, pk=pk, savegame=savegame)
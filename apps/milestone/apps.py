@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class RoundConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.milestone"
+
+    def ready(self) -> None:
+        # Resolve the condition classes once instead of on every milestone check
+        from apps.milestone.conditions.registry import discover_conditions
+
+        discover_conditions()
+
+        # Register signal receivers
+        from apps.milestone import signals  # noqa: F401
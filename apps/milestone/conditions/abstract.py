@@ -1,5 +1,6 @@
 import abc
 
+from apps.milestone.conditions.context import ConditionContext
 from apps.savegame.models import Savegame
 
 
@@ -9,17 +10,27 @@ class AbstractCondition(abc.ABC):
 
     Subclasses must define:
     - VERBOSE_NAME: Human-readable name for the condition
+    - DEPENDS_ON: Dimensions of the `ConditionContext` the condition reads, None if they are unknown
     - is_valid(): Method to check if condition is met
+
+    Conditions read the values of the savegame from the shared `context`, which is created for the savegame if none
+    is given.
     """
 
     VERBOSE_NAME: str = "Unknown Condition"
+    # Conditions which don't declare their inputs are checked on every milestone check
+    DEPENDS_ON: tuple[str, ...] | None = None
 
     savegame: Savegame
     value: int | str | float
+    context: ConditionContext
 
-    def __init__(self, *, savegame: Savegame, value: int | str | float) -> None:
+    def __init__(
+        self, *, savegame: Savegame, value: int | str | float, context: ConditionContext | None = None
+    ) -> None:
         self.savegame = savegame
         self.value = value
+        self.context = context or ConditionContext(savegame=savegame)
 
     @abc.abstractmethod
     def is_valid(self) -> bool:
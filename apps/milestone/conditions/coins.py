@@ -5,6 +5,7 @@ class MinCoinsCondition(AbstractCondition):
     """Check if savegame has at least the specified amount of coins."""
 
     VERBOSE_NAME = "Minimum Coins"
+    DEPENDS_ON = ("coins",)
 
     def is_valid(self) -> bool:
-        return self.savegame.coins >= self.value
+        return self.context.coins >= self.value
@@ -0,0 +1,35 @@
+from functools import cached_property
+
+from apps.city.selectors.city_stats import get_city_stats
+from apps.savegame.models import Savegame
+
+
+class ConditionContext:
+    """
+    Values of a savegame which milestone conditions are checked against.
+
+    Shared by all conditions of one milestone check, so every value is calculated at most once. Values which need a
+    query, like the prestige, are only loaded if a condition accesses them.
+    """
+
+    # Dimensions derived from the tiles of the map, they can only change together with the map revision
+    TILE_DIMENSIONS = ("prestige",)
+
+    def __init__(self, *, savegame: Savegame) -> None:
+        self.savegame = savegame
+        self.coins = savegame.coins
+        self.population = savegame.population
+        self.year = savegame.current_year
+
+    @cached_property
+    def prestige(self) -> int:
+        return get_city_stats(savegame=self.savegame).prestige
+
+    def get_state(self, *, dimension: str) -> int:
+        """
+        Value which changes whenever the given dimension might have changed.
+        Tile-derived dimensions are represented by the map revision, so they don't have to be calculated.
+        """
+        if dimension in self.TILE_DIMENSIONS:
+            return self.savegame.map_revision
+        return getattr(self, dimension)
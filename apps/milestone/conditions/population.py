@@ -5,6 +5,7 @@ class MinPopulationCondition(AbstractCondition):
     """Check if savegame has reached minimum population."""
 
     VERBOSE_NAME = "Minimum Population"
+    DEPENDS_ON = ("population",)
 
     def is_valid(self) -> bool:
-        return self.savegame.population >= self.value
+        return self.context.population >= self.value
@@ -1,4 +1,3 @@
-from apps.city.services.prestige import PrestigeCalculationService
 from apps.milestone.conditions.abstract import AbstractCondition
 
 
@@ -6,8 +5,7 @@ class MinPrestigeCondition(AbstractCondition):
     """Check if savegame has reached minimum prestige."""
 
     VERBOSE_NAME = "Minimum Prestige"
+    DEPENDS_ON = ("prestige",)
 
     def is_valid(self) -> bool:
-        service = PrestigeCalculationService(savegame=self.savegame)
-        current_prestige = service.process()
-        return current_prestige >= self.value
+        return self.context.prestige >= self.value
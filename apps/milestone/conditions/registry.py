@@ -0,0 +1,60 @@
+import importlib
+import inspect
+import pkgutil
+
+from apps.milestone import conditions
+from apps.milestone.conditions.abstract import AbstractCondition
+
+_registered_conditions: dict[str, type[AbstractCondition]] | None = None
+
+
+def discover_conditions() -> dict[str, type[AbstractCondition]]:
+    """
+    Collect all condition classes of the "conditions" package, keyed by their class path.
+    Called once on startup in `MilestoneConfig.ready()`, so checking milestones doesn't import anything.
+    """
+    global _registered_conditions
+
+    _registered_conditions = _scan_conditions()
+    return _registered_conditions
+
+
+def get_registered_conditions() -> dict[str, type[AbstractCondition]]:
+    if _registered_conditions is None:
+        return discover_conditions()
+    return _registered_conditions
+
+
+def get_condition_class(*, class_path: str) -> type[AbstractCondition] | None:
+    """Condition class registered for the class path stored on a `MilestoneCondition` or None if it's unknown."""
+    return get_registered_conditions().get(class_path)
+
+
+def parse_condition_value(*, value: str) -> int | float | str:
+    """Convert the stored value of a condition to int or float, keeping it as string if it's not a number."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _scan_conditions() -> dict[str, type[AbstractCondition]]:
+    registered_conditions = {}
+
+    # Sorted to get the same order on every system
+    for module_info in sorted(pkgutil.iter_modules(conditions.__path__), key=lambda module_info: module_info.name):
+        module = importlib.import_module(f"{conditions.__name__}.{module_info.name}")
+        for _name, condition_class in inspect.getmembers(module, inspect.isclass):
+            # Skip the abstract base class and classes imported from other modules
+            if (
+                not issubclass(condition_class, AbstractCondition)
+                or inspect.isabstract(condition_class)
+                or condition_class.__module__ != module.__name__
+            ):
+                continue
+            registered_conditions[f"{condition_class.__module__}.{condition_class.__name__}"] = condition_class
+
+    return registered_conditions
@@ -5,6 +5,7 @@ class MinYearCondition(AbstractCondition):
     """Check if savegame has reached at least the specified year."""
 
     VERBOSE_NAME = "Minimum Year"
+    DEPENDS_ON = ("year",)
 
     def is_valid(self) -> bool:
-        return self.savegame.current_year >= self.value
+        return self.context.year >= self.value
@@ -1,5 +1,6 @@
 from django.contrib import messages
 
+from apps.event.events.context import EventContext
 from apps.event.events.events.base_event import BaseEvent
 from apps.milestone.services.milestone_checker import MilestoneCheckerService
 
@@ -14,8 +15,8 @@ class Event(BaseEvent):
     LEVEL = messages.SUCCESS
     TITLE = "Milestone Achieved!"
 
-    def __init__(self, *, savegame):
-        super().__init__(savegame=savegame)
+    def __init__(self, *, savegame, context: EventContext | None = None):
+        super().__init__(savegame=savegame, context=context)
         self.completed_milestones = []
 
     def get_verbose_text(self) -> str | None:
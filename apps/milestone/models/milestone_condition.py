@@ -1,5 +1,8 @@
+from functools import cached_property
+
 from django.db import models
 
+from apps.milestone.conditions.registry import parse_condition_value
 from apps.milestone.models.milestone import Milestone
 
 
@@ -22,3 +25,8 @@ class MilestoneCondition(models.Model):
 
     def __str__(self) -> str:
         return f"{self.milestone.name}: {self.condition_class}({self.value})"
+
+    @cached_property
+    def parsed_value(self) -> int | float | str:
+        """Value converted to int or float once, keeps it as string if it's not a number."""
+        return parse_condition_value(value=self.value)
@@ -1,3 +1,5 @@
+from django.db.models import Q
+
 from apps.milestone.models import Milestone, MilestoneLog
 from apps.savegame.models import Savegame
 
@@ -18,24 +20,18 @@ def get_completed_milestone_ids(*, savegame: Savegame) -> set[int]:
 
 def get_available_milestones(*, savegame: Savegame) -> list[Milestone]:
     """
-    Get milestones that are available to check for a savegame.
+    Get milestones that are available to check for a savegame, with their conditions prefetched.
     A milestone is available if:
     - Its parent milestone is completed OR it has no parent
     - It has not been completed yet
     """
     completed_milestone_ids = get_completed_milestone_ids(savegame=savegame)
 
-    # Get root milestones (no parent) that aren't completed
-    available_milestones = list(Milestone.objects.filter(parent__isnull=True).exclude(id__in=completed_milestone_ids))
-
-    # Get milestones whose parents are completed but aren't completed themselves
-    if completed_milestone_ids:
-        child_milestones = Milestone.objects.filter(parent_id__in=completed_milestone_ids).exclude(
-            id__in=completed_milestone_ids
-        )
-        available_milestones.extend(child_milestones)
-
-    return available_milestones
+    return list(
+        Milestone.objects.filter(Q(parent__isnull=True) | Q(parent_id__in=completed_milestone_ids))
+        .exclude(id__in=completed_milestone_ids)
+        .prefetch_related("milestone_conditions")
+    )
 
 
 def get_root_milestones() -> list[Milestone]:
@@ -0,0 +1,81 @@
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.db.models import Prefetch
+
+from apps.core.caching.process_cache import ProcessCache
+from apps.edict.models import Edict
+from apps.milestone.conditions.registry import get_condition_class
+from apps.milestone.models import Milestone
+
+# Shared between all processes, a new version makes every process rebuild its milestone tree
+MILESTONE_TREE_VERSION_CACHE_KEY = "milestone-tree-version"
+
+
+@dataclass(kw_only=True, frozen=True)
+class MilestoneNode:
+    """Structure of one milestone in the global milestone tree, independent of any savegame."""
+
+    milestone: Milestone
+    conditions_verbose: tuple[dict, ...]
+    enabled_edicts: tuple[Edict, ...]
+    children: tuple["MilestoneNode", ...]
+
+
+def get_milestone_tree() -> tuple[MilestoneNode, ...]:
+    """
+    Return the root nodes of the milestone tree of this process.
+
+    Milestones and edicts are global data, so the tree costs a single lookup in the shared cache as long as they didn't
+    change. It's only rebuilt from the database (three queries) after `invalidate_milestone_tree()` was called in any
+    process.
+    """
+    return _tree_cache.get()
+
+
+def invalidate_milestone_tree() -> None:
+    """Make all processes rebuild the milestone tree on next access. Called whenever milestones or edicts change."""
+    _tree_cache.invalidate()
+
+
+def _get_condition_verbose_info(*, condition_model) -> dict:
+    """Human-readable name of the condition type and the condition value."""
+    condition_class = get_condition_class(class_path=condition_model.condition_class)
+    if condition_class is not None:
+        verbose_name = condition_class.get_verbose_name()
+    else:
+        # Fallback to class name for unknown condition classes
+        verbose_name = condition_model.condition_class.split(".")[-1]
+
+    return {
+        "verbose_name": verbose_name,
+        "value": condition_model.value,
+    }
+
+
+def _build_milestone_tree() -> tuple[MilestoneNode, ...]:
+    milestones = Milestone.objects.select_related("parent").prefetch_related(
+        "milestone_conditions",
+        Prefetch("edicts", queryset=Edict.objects.filter(is_active=True).order_by("name")),
+    )
+
+    # Index the children by their parent, so every milestone is visited once
+    children_by_parent_id = defaultdict(list)
+    for milestone in milestones:
+        children_by_parent_id[milestone.parent_id].append(milestone)
+
+    def build_node(*, milestone: Milestone) -> MilestoneNode:
+        return MilestoneNode(
+            milestone=milestone,
+            conditions_verbose=tuple(
+                _get_condition_verbose_info(condition_model=condition)
+                for condition in milestone.milestone_conditions.all()
+            ),
+            enabled_edicts=tuple(milestone.edicts.all()),
+            children=tuple(build_node(milestone=child) for child in children_by_parent_id[milestone.id]),
+        )
+
+    return tuple(build_node(milestone=root) for root in children_by_parent_id[None])
+
+
+_tree_cache = ProcessCache(version_cache_key=MILESTONE_TREE_VERSION_CACHE_KEY, loader=_build_milestone_tree)
@@ -1,6 +1,8 @@
-import importlib
+from django.core.cache import caches
 
-from apps.milestone.conditions.abstract import AbstractCondition
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+from apps.milestone.conditions.context import ConditionContext
+from apps.milestone.conditions.registry import get_condition_class
 from apps.milestone.models import Milestone, MilestoneLog
 from apps.milestone.selectors.milestone import get_available_milestones
 from apps.savegame.models import Savegame
@@ -9,12 +11,43 @@ from apps.savegame.models import Savegame
 class MilestoneCheckerService:
     """
     Checks which milestones have been accomplished for a savegame.
+
+    All available milestones are loaded with their conditions in one batch and checked against a single shared
+    condition context, so the number of queries doesn't grow with the milestone tree.
+
+    Every condition declares the state it depends on. For each milestone which stayed unfulfilled, the checker
+    remembers a signature of its conditions and of that state. A milestone is only checked again once its signature
+    changed, so milestones whose inputs didn't move cost nothing. The signatures are kept in the shared cache without
+    expiry, so they survive long breaks between two rounds and are used by web workers and the `round_worker` alike.
     """
 
     def __init__(self, *, savegame: Savegame) -> None:
         self.savegame = savegame
 
-    def _check_milestone_conditions(self, *, milestone: Milestone) -> bool:
+    def _get_cache_key(self) -> str:
+        return f"savegame-{self.savegame.pk}-milestone-signatures"
+
+    def _get_condition_class(self, *, class_path: str) -> type:
+        condition_class = get_condition_class(class_path=class_path)
+        if condition_class is None:
+            raise LookupError(f"Unknown milestone condition class {class_path!r}")
+        return condition_class
+
+    def _get_signature(self, *, milestone: Milestone, context: ConditionContext) -> tuple | None:
+        """
+        Signature of the conditions of a milestone and of the state they depend on.
+        Returns None if a condition doesn't declare its inputs, so the milestone has to be checked every time.
+        """
+        signature = []
+        for condition_model in milestone.milestone_conditions.all():
+            condition_class = self._get_condition_class(class_path=condition_model.condition_class)
+            if condition_class.DEPENDS_ON is None:
+                return None
+            state = tuple(context.get_state(dimension=dimension) for dimension in condition_class.DEPENDS_ON)
+            signature.append((condition_model.condition_class, condition_model.value, state))
+        return tuple(signature)
+
+    def _check_milestone_conditions(self, *, milestone: Milestone, context: ConditionContext) -> bool:
         """
         Check if all conditions for a milestone are met.
         """
@@ -24,23 +57,8 @@ class MilestoneCheckerService:
             return False
 
         for condition_model in conditions:
-            # Import the condition class dynamically
-            module_path, class_name = condition_model.condition_class.rsplit(".", 1)
-            module = importlib.import_module(module_path)
-            condition_class = getattr(module, class_name)
-
-            # Instantiate and check the condition
-            # Convert value to appropriate type (int, float, or keep as string)
-            try:
-                value = int(condition_model.value)
-            except ValueError:
-                try:
-                    value = float(condition_model.value)
-                except ValueError:
-                    value = condition_model.value
-
-            condition: AbstractCondition = condition_class(savegame=self.savegame, value=value)
-
+            condition_class = self._get_condition_class(class_path=condition_model.condition_class)
+            condition = condition_class(savegame=self.savegame, value=condition_model.parsed_value, context=context)
             if not condition.is_valid():
                 return False
 
@@ -52,13 +70,25 @@ class MilestoneCheckerService:
         Returns list of newly completed milestones.
         """
         available_milestones = get_available_milestones(savegame=self.savegame)
-        newly_completed = []
+        context = ConditionContext(savegame=self.savegame)
+        previous_signatures = caches[SHARED_CACHE_ALIAS].get(self._get_cache_key(), {})
 
+        newly_completed = []
+        signatures = {}
         for milestone in available_milestones:
-            if self._check_milestone_conditions(milestone=milestone):
-                MilestoneLog.objects.create(
-                    savegame=self.savegame, milestone=milestone, accomplished_at=self.savegame.current_year
-                )
+            signature = self._get_signature(milestone=milestone, context=context)
+            if signature is not None and previous_signatures.get(milestone.id) == signature:
+                # Nothing the milestone depends on changed since it was checked unfulfilled
+                signatures[milestone.id] = signature
+            elif self._check_milestone_conditions(milestone=milestone, context=context):
                 newly_completed.append(milestone)
+            elif signature is not None:
+                signatures[milestone.id] = signature
+
+        MilestoneLog.objects.bulk_create(
+            MilestoneLog(savegame=self.savegame, milestone=milestone, accomplished_at=self.savegame.current_year)
+            for milestone in newly_completed
+        )
+        caches[SHARED_CACHE_ALIAS].set(self._get_cache_key(), signatures, timeout=None)
 
         return newly_completed
@@ -1,86 +1,39 @@
-import importlib
-
-from apps.milestone.models import Milestone
-from apps.milestone.selectors.milestone import (
-    get_all_milestones_with_conditions,
-    get_completed_milestone_ids,
-    get_root_milestones,
-)
+from apps.milestone.selectors.milestone import get_completed_milestone_ids
+from apps.milestone.selectors.milestone_tree import MilestoneNode, get_milestone_tree
 from apps.savegame.models import Savegame
 
 
 class MilestoneTreeService:
     """
     Service to build a milestone tree structure with completion status.
+
+    The structure of the tree is global and cached, only the completion status of the savegame is added per call.
     """
 
     def __init__(self, *, savegame: Savegame) -> None:
         self.savegame = savegame
 
-    def _get_condition_verbose_info(self, *, condition_model) -> dict:
-        """
-        Get verbose information for a condition including human-readable name.
-
-        Returns dict with:
-        - verbose_name: Human-readable condition type name
-        - value: The condition value
-        """
-        try:
-            # Import the condition class dynamically
-            module_path, class_name = condition_model.condition_class.rsplit(".", 1)
-            module = importlib.import_module(module_path)
-            condition_class = getattr(module, class_name)
-
-            # Get verbose name from the class (all condition classes must inherit from AbstractCondition)
-            verbose_name = condition_class.get_verbose_name()
-
-        except (ImportError, AttributeError, ValueError):
-            # Fallback to class name if import fails
-            verbose_name = condition_model.condition_class.split(".")[-1]
-
-        return {
-            "verbose_name": verbose_name,
-            "value": condition_model.value,
-        }
-
-    def _build_milestone_node(
-        self, *, milestone: Milestone, all_milestones: list[Milestone], completed_milestone_ids: set[int]
-    ) -> dict:
+    def _build_milestone_node(self, *, node: MilestoneNode, completed_milestone_ids: set[int]) -> dict:
         """
         Build a single milestone node with its metadata and children.
         """
+        milestone = node.milestone
         is_completed = milestone.id in completed_milestone_ids
         parent_completed = milestone.parent_id is None or milestone.parent_id in completed_milestone_ids
 
-        # Get verbose condition information
-        conditions_verbose = [
-            self._get_condition_verbose_info(condition_model=condition)
-            for condition in milestone.milestone_conditions.all()
-        ]
-
-        # Get edicts enabled by this milestone
-        enabled_edicts = list(milestone.edicts.filter(is_active=True).order_by("name"))
-
-        milestone_data = {
+        return {
             "milestone": milestone,
             "is_completed": is_completed,
             "is_available": parent_completed and not is_completed,
             "is_locked": not parent_completed,
-            "conditions_verbose": conditions_verbose,
-            "enabled_edicts": enabled_edicts,
-            "children": [],
+            "conditions_verbose": list(node.conditions_verbose),
+            "enabled_edicts": list(node.enabled_edicts),
+            "children": [
+                self._build_milestone_node(node=child, completed_milestone_ids=completed_milestone_ids)
+                for child in node.children
+            ],
         }
 
-        # Recursively build children
-        children = [m for m in all_milestones if m.parent_id == milestone.id]
-        for child in children:
-            child_data = self._build_milestone_node(
-                milestone=child, all_milestones=all_milestones, completed_milestone_ids=completed_milestone_ids
-            )
-            milestone_data["children"].append(child_data)
-
-        return milestone_data
-
     def process(self) -> list[dict]:
         """
         Build the complete milestone tree structure.
@@ -95,14 +48,8 @@ class MilestoneTreeService:
         - children: List of child milestone nodes (recursive structure)
         """
         completed_milestone_ids = get_completed_milestone_ids(savegame=self.savegame)
-        all_milestones = get_all_milestones_with_conditions()
-        root_milestones = get_root_milestones()
 
-        milestone_tree = []
-        for root in root_milestones:
-            node = self._build_milestone_node(
-                milestone=root, all_milestones=all_milestones, completed_milestone_ids=completed_milestone_ids
-            )
-            milestone_tree.append(node)
-
-        return milestone_tree
+        return [
+            self._build_milestone_node(node=root, completed_milestone_ids=completed_milestone_ids)
+            for root in get_milestone_tree()
+        ]
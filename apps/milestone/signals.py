@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.edict.models import Edict
+from apps.milestone.models import Milestone, MilestoneCondition
+from apps.milestone.selectors.milestone_tree import invalidate_milestone_tree
+
+
+@receiver(post_save, sender=Milestone)
+@receiver(post_save, sender=MilestoneCondition)
+@receiver(post_save, sender=Edict)
+@receiver(post_delete, sender=Milestone)
+@receiver(post_delete, sender=MilestoneCondition)
+@receiver(post_delete, sender=Edict)
+def invalidate_milestone_tree_on_change(**kwargs) -> None:
+    """Rebuild the milestone tree in all processes once milestones or edicts are changed, e.g. via the admin."""
+    invalidate_milestone_tree()
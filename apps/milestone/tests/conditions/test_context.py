@@ -0,0 +1,40 @@
+import pytest
+
+from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.milestone.conditions.context import ConditionContext
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_condition_context_values():
+    """Test that the context takes coins, population and year from the savegame."""
+    savegame = SavegameFactory(coins=300, population=40, current_year=1200)
+
+    context = ConditionContext(savegame=savegame)
+
+    assert context.coins == 300
+    assert context.population == 40
+    assert context.year == 1200
+
+
+@pytest.mark.django_db
+def test_condition_context_prestige_loaded_once(django_assert_num_queries):
+    """Test that the prestige is loaded on first access and then reused."""
+    savegame = SavegameFactory.create()
+    TileFactory(savegame=savegame, building=BuildingFactory(prestige=7))
+    context = ConditionContext(savegame=savegame)
+    assert context.prestige == 7
+
+    with django_assert_num_queries(0):
+        assert context.prestige == 7
+
+
+@pytest.mark.django_db
+def test_condition_context_get_state():
+    """Test that plain dimensions return their value and tile-derived ones the map revision."""
+    savegame = SavegameFactory(coins=300, map_revision=4)
+
+    context = ConditionContext(savegame=savegame)
+
+    assert context.get_state(dimension="coins") == 300
+    assert context.get_state(dimension="prestige") == 4
@@ -0,0 +1,68 @@
+from unittest import mock
+
+import pytest
+
+from apps.milestone.conditions import registry
+from apps.milestone.conditions.coins import MinCoinsCondition
+from apps.milestone.conditions.population import MinPopulationCondition
+from apps.milestone.conditions.prestige import MinPrestigeCondition
+from apps.milestone.conditions.registry import (
+    discover_conditions,
+    get_condition_class,
+    get_registered_conditions,
+    parse_condition_value,
+)
+from apps.milestone.conditions.year import MinYearCondition
+
+
+def test_discover_conditions_collects_condition_classes():
+    """Test that all concrete condition classes are registered by their class path, without the abstract base."""
+    result = discover_conditions()
+
+    assert result == {
+        "apps.milestone.conditions.coins.MinCoinsCondition": MinCoinsCondition,
+        "apps.milestone.conditions.population.MinPopulationCondition": MinPopulationCondition,
+        "apps.milestone.conditions.prestige.MinPrestigeCondition": MinPrestigeCondition,
+        "apps.milestone.conditions.year.MinYearCondition": MinYearCondition,
+    }
+
+
+def test_get_registered_conditions_discovers_lazily():
+    """Test that the conditions are discovered on first access if the registry is still empty."""
+    with mock.patch.object(registry, "_registered_conditions", new=None):
+        result = get_registered_conditions()
+
+    assert MinCoinsCondition in result.values()
+
+
+def test_get_registered_conditions_reuses_registry():
+    """Test that the registry is not scanned again once it's filled."""
+    with mock.patch.object(registry, "_scan_conditions") as scan_conditions:
+        get_registered_conditions()
+
+    scan_conditions.assert_not_called()
+
+
+def test_get_condition_class_known():
+    """Test that a registered class path resolves to its condition class."""
+    assert (
+        get_condition_class(class_path="apps.milestone.conditions.population.MinPopulationCondition")
+        is MinPopulationCondition
+    )
+
+
+def test_get_condition_class_unknown():
+    """Test that an unknown class path resolves to None."""
+    assert get_condition_class(class_path="invalid.module.InvalidClass") is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("50", 50), ("50.5", 50.5), ("not_a_number", "not_a_number")],
+)
+def test_parse_condition_value(value, expected):
+    """Test that stored values are converted to int or float and kept as string otherwise."""
+    result = parse_condition_value(value=value)
+
+    assert result == expected
+    assert type(result) is type(expected)
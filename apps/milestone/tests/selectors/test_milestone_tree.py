@@ -0,0 +1,71 @@
+import pytest
+from django.core.cache import caches
+
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+from apps.edict.tests.factories import EdictFactory
+from apps.milestone.selectors.milestone_tree import (
+    MILESTONE_TREE_VERSION_CACHE_KEY,
+    get_milestone_tree,
+    invalidate_milestone_tree,
+)
+from apps.milestone.tests.factories import MilestoneConditionFactory, MilestoneFactory
+
+
+@pytest.mark.django_db
+def test_get_milestone_tree_builds_structure(django_assert_num_queries):
+    """Test get_milestone_tree builds the tree with conditions and active edicts with three queries."""
+    root = MilestoneFactory(name="Root", order=1)
+    other_root = MilestoneFactory(name="Other root", order=2)
+    child = MilestoneFactory(name="Child", parent=root)
+    MilestoneConditionFactory(
+        milestone=root, condition_class="apps.milestone.conditions.coins.MinCoinsCondition", value="100"
+    )
+    edict = EdictFactory(name="B edict", required_milestone=root)
+    other_edict = EdictFactory(name="A edict", required_milestone=root)
+    EdictFactory(required_milestone=root, is_active=False)
+    invalidate_milestone_tree()
+
+    with django_assert_num_queries(3):
+        tree = get_milestone_tree()
+
+    assert [node.milestone for node in tree] == [root, other_root]
+    assert tree[0].conditions_verbose == ({"verbose_name": "Minimum Coins", "value": "100"},)
+    assert tree[0].enabled_edicts == (other_edict, edict)
+    assert [node.milestone for node in tree[0].children] == [child]
+    assert tree[1].children == ()
+
+
+@pytest.mark.django_db
+def test_get_milestone_tree_memoized(django_assert_num_queries):
+    """Test get_milestone_tree returns the same tree without queries as long as nothing changed."""
+    MilestoneFactory.create()
+    first = get_milestone_tree()
+
+    with django_assert_num_queries(0):
+        second = get_milestone_tree()
+
+    assert first is second
+
+
+@pytest.mark.django_db
+def test_get_milestone_tree_rebuilds_on_new_version():
+    """Test get_milestone_tree rebuilds the tree if another process changed the version."""
+    MilestoneFactory.create()
+    first = get_milestone_tree()
+
+    caches[SHARED_CACHE_ALIAS].set(MILESTONE_TREE_VERSION_CACHE_KEY, "changed-by-another-process")
+
+    assert get_milestone_tree() is not first
+    assert get_milestone_tree() is get_milestone_tree()
+
+
+@pytest.mark.django_db
+def test_get_milestone_tree_rebuilds_on_missing_version():
+    """Test get_milestone_tree rebuilds the tree if the version was evicted from the cache."""
+    MilestoneFactory.create()
+    first = get_milestone_tree()
+
+    caches[SHARED_CACHE_ALIAS].delete(MILESTONE_TREE_VERSION_CACHE_KEY)
+
+    assert get_milestone_tree() is not first
+    assert caches[SHARED_CACHE_ALIAS].get(MILESTONE_TREE_VERSION_CACHE_KEY) is not None
@@ -1,8 +1,17 @@
+from unittest import mock
+
 import pytest
+from django.core.cache import caches
 
+from apps.city.models import CityStats
+from apps.city.selectors.city_stats import get_city_stats
+from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+from apps.milestone.conditions.population import MinPopulationCondition
 from apps.milestone.models import MilestoneLog
 from apps.milestone.services.milestone_checker import MilestoneCheckerService
 from apps.milestone.tests.factories import MilestoneConditionFactory, MilestoneFactory
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -191,3 +200,146 @@ def test_milestone_checker_service_process_unlocks_child_milestones():
     assert len(completed) == 1
     assert completed[0] == child_milestone
     assert MilestoneLog.objects.filter(savegame=savegame, milestone=child_milestone).exists()
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_unknown_condition_class():
+    """Test milestone checker raises for condition classes which are not registered."""
+    savegame = SavegameFactory(population=100)
+    MilestoneConditionFactory(condition_class="invalid.module.InvalidClass", value="50")
+
+    service = MilestoneCheckerService(savegame=savegame)
+
+    with pytest.raises(LookupError, match="Unknown milestone condition class"):
+        service.process()
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_constant_queries(django_assert_num_queries):
+    """Test milestone checker needs the same number of queries no matter how many milestones are checked."""
+    savegame = SavegameFactory(population=100, coins=500)
+    TileFactory(savegame=savegame, building=BuildingFactory(prestige=10))
+    get_city_stats(savegame=savegame)
+    for _ in range(20):
+        milestone = MilestoneFactory()
+        MilestoneConditionFactory(
+            milestone=milestone,
+            condition_class="apps.milestone.conditions.population.MinPopulationCondition",
+            value="50",
+        )
+        MilestoneConditionFactory(
+            milestone=milestone, condition_class="apps.milestone.conditions.prestige.MinPrestigeCondition", value="5"
+        )
+        MilestoneConditionFactory(
+            milestone=milestone, condition_class="apps.milestone.conditions.coins.MinCoinsCondition", value="100"
+        )
+
+    # Completed milestones, available milestones, their conditions, the city statistics and the new logs
+    with django_assert_num_queries(5):
+        completed = MilestoneCheckerService(savegame=savegame).process()
+
+    assert len(completed) == 20
+    assert MilestoneLog.objects.filter(savegame=savegame).count() == 20
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_skips_unchanged_milestones():
+    """Test milestone checker doesn't check unfulfilled milestones again if nothing they depend on changed."""
+    savegame = SavegameFactory(population=30, coins=500)
+    MilestoneConditionFactory(condition_class="apps.milestone.conditions.population.MinPopulationCondition", value="50")
+    MilestoneCheckerService(savegame=savegame).process()
+    savegame.coins = 100
+
+    with mock.patch.object(MinPopulationCondition, "is_valid") as is_valid:
+        completed = MilestoneCheckerService(savegame=savegame).process()
+
+    assert completed == []
+    is_valid.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_keeps_signatures_without_expiry():
+    """Test milestone checker keeps the signatures in the shared cache without a timeout."""
+    savegame = SavegameFactory(population=30)
+    MilestoneConditionFactory(condition_class="apps.milestone.conditions.population.MinPopulationCondition", value="50")
+
+    with mock.patch.object(caches[SHARED_CACHE_ALIAS], "set") as mock_set:
+        MilestoneCheckerService(savegame=savegame).process()
+
+    mock_set.assert_called_once_with(f"savegame-{savegame.pk}-milestone-signatures", mock.ANY, timeout=None)
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_skips_prestige_until_map_changes(django_assert_num_queries):
+    """Test milestone checker doesn't load the prestige again as long as the map revision stays the same."""
+    savegame = SavegameFactory.create()
+    TileFactory(savegame=savegame, building=BuildingFactory(prestige=5))
+    milestone = MilestoneFactory()
+    MilestoneConditionFactory(
+        milestone=milestone, condition_class="apps.milestone.conditions.prestige.MinPrestigeCondition", value="10"
+    )
+    MilestoneCheckerService(savegame=savegame).process()
+
+    # Completed milestones, available milestones and their conditions, no city statistics
+    with django_assert_num_queries(3):
+        assert MilestoneCheckerService(savegame=savegame).process() == []
+
+    TileFactory(savegame=savegame, building=BuildingFactory(prestige=5))
+    Savegame.objects.bump_map_revision(savegame=savegame)
+    CityStats.objects.filter(savegame=savegame).delete()
+
+    assert MilestoneCheckerService(savegame=savegame).process() == [milestone]
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_rechecks_changed_dependency():
+    """Test milestone checker checks a milestone again once a value it depends on changed."""
+    savegame = SavegameFactory(population=30)
+    milestone = MilestoneFactory()
+    MilestoneConditionFactory(
+        milestone=milestone,
+        condition_class="apps.milestone.conditions.population.MinPopulationCondition",
+        value="50",
+    )
+    MilestoneCheckerService(savegame=savegame).process()
+    savegame.population = 60
+
+    completed = MilestoneCheckerService(savegame=savegame).process()
+
+    assert completed == [milestone]
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_rechecks_changed_condition():
+    """Test milestone checker checks a milestone again once one of its conditions was edited."""
+    savegame = SavegameFactory(population=30)
+    milestone = MilestoneFactory()
+    condition = MilestoneConditionFactory(
+        milestone=milestone,
+        condition_class="apps.milestone.conditions.population.MinPopulationCondition",
+        value="50",
+    )
+    MilestoneCheckerService(savegame=savegame).process()
+    condition.value = "20"
+    condition.save()
+
+    completed = MilestoneCheckerService(savegame=savegame).process()
+
+    assert completed == [milestone]
+
+
+@pytest.mark.django_db
+def test_milestone_checker_service_process_always_checks_undeclared_conditions():
+    """Test milestone checker checks milestones every time if a condition doesn't declare its inputs."""
+    savegame = SavegameFactory(population=30)
+    MilestoneConditionFactory(condition_class="apps.milestone.conditions.population.MinPopulationCondition", value="50")
+    MilestoneCheckerService(savegame=savegame).process()
+
+    with (
+        mock.patch.object(MinPopulationCondition, "DEPENDS_ON", new=None),
+        mock.patch.object(MinPopulationCondition, "is_valid", return_value=False) as is_valid,
+    ):
+        MilestoneCheckerService(savegame=savegame).process()
+        MilestoneCheckerService(savegame=savegame).process()
+
+    assert is_valid.call_count == 2
@@ -137,3 +137,22 @@ def test_milestone_tree_service_process_builds_deep_tree():
     assert root_node["children"][0]["children"][0]["milestone"].id == child2.id
     assert len(root_node["children"][0]["children"][0]["children"]) == 1
     assert root_node["children"][0]["children"][0]["children"][0]["milestone"].id == child3.id
+
+
+@pytest.mark.django_db
+def test_milestone_tree_service_process_single_query(django_assert_num_queries):
+    """Test MilestoneTreeService only loads the completed milestones once the tree structure is cached."""
+    savegame = SavegameFactory.create()
+    root = MilestoneFactory(name="Root", parent=None)
+    for index in range(10):
+        MilestoneConditionFactory(milestone=MilestoneFactory(name=f"Child {index}", parent=root))
+    MilestoneLogFactory(savegame=savegame, milestone=root)
+    MilestoneTreeService(savegame=savegame).process()
+
+    with django_assert_num_queries(1):
+        tree = MilestoneTreeService(savegame=savegame).process()
+
+    root_node = next(node for node in tree if node["milestone"].id == root.id)
+    assert root_node["is_completed"] is True
+    assert len(root_node["children"]) == 10
+    assert all(child["is_available"] for child in root_node["children"])
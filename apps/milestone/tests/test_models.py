@@ -99,3 +99,11 @@ def test_milestone_condition_str_representation():
     )
 
     assert str(condition) == "Test Milestone: apps.milestone.conditions.population.MinPopulationCondition(100)"
+
+
+@pytest.mark.django_db
+def test_milestone_condition_parsed_value():
+    """Test that the stored value of a condition is parsed to its type."""
+    assert MilestoneConditionFactory(value="50").parsed_value == 50
+    assert MilestoneConditionFactory(value="50.5").parsed_value == 50.5
+    assert MilestoneConditionFactory(value="text").parsed_value == "text"
@@ -0,0 +1,41 @@
+import pytest
+
+from apps.edict.tests.factories import EdictFactory
+from apps.milestone.selectors.milestone_tree import get_milestone_tree
+from apps.milestone.tests.factories import MilestoneConditionFactory, MilestoneFactory
+
+
+@pytest.mark.django_db
+def test_invalidate_milestone_tree_on_milestone_save():
+    """Test the milestone tree is rebuilt once a milestone is saved."""
+    milestone = MilestoneFactory(name="Village")
+    get_milestone_tree()
+
+    milestone.name = "Town"
+    milestone.save()
+
+    assert get_milestone_tree()[0].milestone.name == "Town"
+
+
+@pytest.mark.django_db
+def test_invalidate_milestone_tree_on_condition_delete():
+    """Test the milestone tree is rebuilt once a condition is deleted."""
+    condition = MilestoneConditionFactory.create()
+    get_milestone_tree()
+
+    condition.delete()
+
+    assert get_milestone_tree()[0].conditions_verbose == ()
+
+
+@pytest.mark.django_db
+def test_invalidate_milestone_tree_on_edict_save():
+    """Test the milestone tree is rebuilt once an edict is saved."""
+    milestone = MilestoneFactory.create()
+    edict = EdictFactory(required_milestone=milestone)
+    get_milestone_tree()
+
+    edict.is_active = False
+    edict.save()
+
+    assert get_milestone_tree()[0].enabled_edicts == ()
@@ -2,7 +2,7 @@ from django.views import generic
 
 from apps.milestone.services.milestone_tree import MilestoneTreeService
 from apps.savegame.mixins.savegame import SavegameRequiredMixin
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 class MilestoneListView(SavegameRequiredMixin, generic.TemplateView):
@@ -10,7 +10,7 @@ class MilestoneListView(SavegameRequiredMixin, generic.TemplateView):
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        savegame = Savegame.objects.filter(user=self.request.user, is_active=True).first()
+        savegame = get_active_savegame(request=self.request)
 
         if not savegame:
             context["milestone_tree"] = []
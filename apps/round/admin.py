@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from apps.round.models import RoundJob
+
+
+@admin.register(RoundJob)
+class RoundJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "savegame", "status", "created_at", "finished_at")
+    list_filter = ("status",)
+    search_fields = ("savegame__city_name", "error")
+    list_select_related = ("savegame",)
+    ordering = ("-id",)
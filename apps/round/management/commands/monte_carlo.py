@@ -0,0 +1,75 @@
+import csv
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import TextIO
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.round.services.monte_carlo import MonteCarloResult, MonteCarloService
+from apps.savegame.models.savegame import generate_seed
+
+
+class Command(BaseCommand):
+    help = "Simulate many fresh savegames in parallel and export the distributions of their values per year"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=100, help="Number of games to simulate")
+        parser.add_argument("--years", type=int, default=100, help="Number of years to simulate per game")
+        parser.add_argument("--seed", type=int, help="Seed of the first game, the following ones count up")
+        parser.add_argument("--workers", type=int, help="Number of worker processes, defaults to the number of CPUs")
+        parser.add_argument("--format", choices=("json", "csv"), default="json", help="Format of the export")
+        parser.add_argument("--output", help="File to write the export to, defaults to stdout")
+
+    def handle(self, *args, **options):
+        if options["years"] < 1 or options["runs"] < 1 or (options["workers"] is not None and options["workers"] < 1):
+            raise CommandError("Years, runs and workers have to be positive.")
+
+        result = MonteCarloService(
+            runs=options["runs"],
+            years=options["years"],
+            seed=generate_seed() if options["seed"] is None else options["seed"],
+            workers=options["workers"],
+        ).process()
+
+        write = self.write_csv if options["format"] == "csv" else self.write_json
+        if options["output"]:
+            with Path(options["output"]).open("w", newline="") as stream:
+                write(result=result, stream=stream)
+        else:
+            write(result=result, stream=self.stdout)
+
+        # Keep stdout clean for the export
+        self.stderr.write(
+            f"Simulated {result.runs} games of {result.years} years with seed {result.seed} in "
+            f"{result.duration:.2f}s ({result.rounds_per_second:.1f} rounds per second).",
+            style_func=self.style.SUCCESS,
+        )
+
+    @staticmethod
+    def write_json(*, result: MonteCarloResult, stream: TextIO) -> None:
+        data = asdict(result)
+        data["rounds_per_second"] = result.rounds_per_second
+        stream.write(json.dumps(data, indent=2))
+
+    @staticmethod
+    def write_csv(*, result: MonteCarloResult, stream: TextIO) -> None:
+        """One row per year and value, event rates are rows with the event title as value."""
+        writer = csv.writer(stream)
+        writer.writerow(("year", "value", "mean", "minimum", "p10", "median", "p90", "maximum"))
+        for year_statistics in result.statistics:
+            for name, distribution in year_statistics.values.items():
+                writer.writerow(
+                    (
+                        year_statistics.year,
+                        name,
+                        distribution.mean,
+                        distribution.minimum,
+                        distribution.p10,
+                        distribution.median,
+                        distribution.p90,
+                        distribution.maximum,
+                    )
+                )
+            for title, rate in year_statistics.event_rates.items():
+                writer.writerow((year_statistics.year, f"event: {title}", rate, "", "", "", "", ""))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.round.models import RoundJob
+from apps.round.services.round_job import RoundJobProcessingService
+
+
+class Command(BaseCommand):
+    help = "Finish the rounds enqueued by the round view, if rounds are processed asynchronously"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Stop as soon as no job is pending")
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait for new jobs")
+
+    def handle(self, *args, **options):
+        while True:
+            job = RoundJob.objects.claim_next()
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+                continue
+
+            job = RoundJobProcessingService(job=job).process()
+            if job.status == RoundJob.Status.DONE:
+                self.stdout.write(self.style.SUCCESS(f"Finished round job #{job.pk} of savegame #{job.savegame_id}."))
+            elif job.status == RoundJob.Status.FAILED:
+                self.stderr.write(f"Round job #{job.pk} of savegame #{job.savegame_id} failed: {job.error}")
+            else:
+                self.stderr.write(f"Round job #{job.pk} of savegame #{job.savegame_id} was claimed by another worker.")
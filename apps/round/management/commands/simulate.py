@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.round.services.simulation import FreshSimulationService, SimulationResult, SimulationService
+from apps.savegame.models import Savegame
+from apps.savegame.models.savegame import generate_seed
+
+
+class Command(BaseCommand):
+    help = "Fast-forward a savegame or freshly generated savegames by a number of years and report the throughput"
+
+    def add_arguments(self, parser):
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--savegame", type=int, help="Id of the savegame to simulate")
+        source.add_argument("--fresh", action="store_true", help="Simulate freshly generated savegames")
+        parser.add_argument("--years", type=int, default=100, help="Number of years to simulate")
+        parser.add_argument("--runs", type=int, default=1, help="Number of fresh savegames to simulate")
+        parser.add_argument("--seed", type=int, help="Seed of the first fresh savegame, the following ones count up")
+        parser.add_argument(
+            "--write-back",
+            action="store_true",
+            help="Keep the simulated state of the savegame instead of discarding it",
+        )
+
+    def handle(self, *args, **options):
+        if options["years"] < 1 or options["runs"] < 1:
+            raise CommandError("Years and runs have to be positive.")
+
+        if options["fresh"]:
+            results = self.simulate_fresh(runs=options["runs"], years=options["years"], seed=options["seed"])
+        else:
+            savegame = Savegame.objects.filter(pk=options["savegame"]).first()
+            if savegame is None:
+                raise CommandError(f"Savegame #{options['savegame']} does not exist.")
+            results = [
+                SimulationService(savegame=savegame, years=options["years"], write_back=options["write_back"]).process()
+            ]
+
+        self.report(results=results)
+
+    def simulate_fresh(self, *, runs: int, years: int, seed: int | None) -> list[SimulationResult]:
+        return [
+            FreshSimulationService(seed=generate_seed() if seed is None else seed + run, years=years).process()
+            for run in range(runs)
+        ]
+
+    def report(self, *, results: list[SimulationResult]) -> None:
+        count = len(results)
+        years = sum(result.years for result in results)
+        duration = sum(result.duration for result in results)
+
+        self.stdout.write(
+            f"Average result: {sum(result.coins for result in results) / count:.0f} coins, "
+            f"{sum(result.population for result in results) / count:.0f} inhabitants, "
+            f"{sum(result.unrest for result in results) / count:.0f} unrest."
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Simulated {years} years of {count} savegame{'s' if count != 1 else ''} in {duration:.2f}s "
+                f"({years / duration if duration else 0:.1f} rounds per second)."
+            )
+        )
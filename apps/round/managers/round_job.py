@@ -0,0 +1,64 @@
+import typing
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+if typing.TYPE_CHECKING:
+    from apps.round.models import RoundJob
+    from apps.savegame.models import Savegame
+
+
+class RoundJobQuerySet(models.QuerySet):
+    def open(self) -> "RoundJobQuerySet":
+        """Jobs which are waiting for or being processed by a worker."""
+        return self.filter(status__in=(self.model.Status.PENDING, self.model.Status.RUNNING))
+
+
+class RoundJobManager(models.Manager):
+    def enqueue(self, *, savegame: "Savegame") -> "RoundJob":
+        """
+        Create a job to finish the round of the savegame.
+        A savegame has at most one open job, so finishing the round twice in a row returns the open one.
+        """
+        try:
+            with transaction.atomic():
+                return self.create(savegame=savegame)
+        except IntegrityError:
+            return self.open().get(savegame=savegame)
+
+    def requeue_stale(self) -> int:
+        """
+        Put running jobs back into the queue whose worker didn't finish them within `ROUND_JOB_TIMEOUT` seconds, e.g.
+        because it crashed. Returns the number of requeued jobs.
+        The round and the status of a job are committed together, so the round of a stale job was never applied.
+        """
+        stale_before = timezone.now() - timedelta(seconds=settings.ROUND_JOB_TIMEOUT)
+        return self.filter(status=self.model.Status.RUNNING, started_at__lt=stale_before).update(
+            status=self.model.Status.PENDING, started_at=None
+        )
+
+    def claim_next(self) -> "RoundJob | None":
+        """
+        Claim the oldest pending job for the calling worker, after requeueing stale jobs of crashed workers.
+        Rows locked by other workers are skipped. The status is switched with a conditional UPDATE, so a job is never
+        claimed twice, even on databases without row locks like SQLite.
+        """
+        self.requeue_stale()
+        while True:
+            with transaction.atomic():
+                job = self.select_for_update(skip_locked=True).filter(status=self.model.Status.PENDING).first()
+                if job is None:
+                    return None
+
+                started_at = timezone.now()
+                if self.filter(pk=job.pk, status=self.model.Status.PENDING).update(
+                    status=self.model.Status.RUNNING, started_at=started_at
+                ):
+                    job.status = self.model.Status.RUNNING
+                    job.started_at = started_at
+                    return job
+
+
+RoundJobManager = RoundJobManager.from_queryset(RoundJobQuerySet)
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('savegame', '0007_savegame_seed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('has_notifications', models.BooleanField(default=False, verbose_name='Has notifications')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished at')),
+                ('savegame', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='savegame.savegame')),
+            ],
+            options={
+                'ordering': ['id'],
+                'default_related_name': 'round_jobs',
+                'indexes': [models.Index(fields=['status', 'id'], name='round_round_status_966d0e_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('savegame',), name='round_job_one_open_job_per_savegame')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from http import HTTPStatus
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from apps.round.models import RoundJob
+from apps.savegame.selectors.savegame import get_active_savegame
+
+
+class RoundJobIdleRequiredMixin:
+    """
+    Mixin that rejects changes to the active savegame while a worker finishes its round.
+
+    Use this mixin for views which change the map or the resources of the savegame. Otherwise, their writes could
+    overwrite the results of the round, which was calculated from the state before. Only relevant if rounds are
+    processed asynchronously.
+    """
+
+    def dispatch(self, request, *args, **kwargs) -> HttpResponse:  # noqa: PBR001, PBR002
+        if settings.ROUND_PROCESSING_ASYNC and request.method == "POST":
+            savegame = get_active_savegame(request=request)
+            if savegame and RoundJob.objects.open().filter(savegame=savegame).exists():
+                return HttpResponse("Please wait until the round is finished", status=HTTPStatus.CONFLICT)
+        return super().dispatch(request, *args, **kwargs)
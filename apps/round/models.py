@@ -0,0 +1,49 @@
+from django.db import models
+from django.db.models import Q
+
+from apps.round.managers.round_job import RoundJobManager
+from apps.savegame.models import Savegame
+
+
+class RoundJob(models.Model):
+    """
+    Request to finish the round of a savegame in the background.
+    Created by the round view if rounds are processed asynchronously and processed by the `round_worker` command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    savegame = models.ForeignKey(Savegame, on_delete=models.CASCADE)
+    status = models.CharField("Status", max_length=10, choices=Status.choices, default=Status.PENDING)
+    has_notifications = models.BooleanField("Has notifications", default=False)
+    error = models.TextField("Error", blank=True)
+    created_at = models.DateTimeField("Created at", auto_now_add=True)
+    started_at = models.DateTimeField("Started at", null=True, blank=True)
+    finished_at = models.DateTimeField("Finished at", null=True, blank=True)
+
+    objects = RoundJobManager()
+
+    class Meta:
+        default_related_name = "round_jobs"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["status", "id"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["savegame"],
+                condition=Q(status__in=["pending", "running"]),
+                name="round_job_one_open_job_per_savegame",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Round job #{self.pk} of {self.savegame} ({self.get_status_display()})"
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in (self.Status.PENDING, self.Status.RUNNING)
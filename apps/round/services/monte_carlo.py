@@ -0,0 +1,158 @@
+import math
+import os
+import sqlite3
+import statistics
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import django
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.round.services.simulation import FreshSimulationService, YearRecord
+
+
+@dataclass(kw_only=True)
+class Distribution:
+    """Distribution of one value over all simulated games."""
+
+    mean: float
+    minimum: float
+    p10: float
+    median: float
+    p90: float
+    maximum: float
+
+    @classmethod
+    def from_values(cls, *, values: list[float]) -> "Distribution":
+        ordered = sorted(values)
+        return cls(
+            mean=statistics.fmean(ordered),
+            minimum=ordered[0],
+            p10=cls._percentile(ordered=ordered, fraction=0.1),
+            median=statistics.median(ordered),
+            p90=cls._percentile(ordered=ordered, fraction=0.9),
+            maximum=ordered[-1],
+        )
+
+    @staticmethod
+    def _percentile(*, ordered: list[float], fraction: float) -> float:
+        """Nearest-rank percentile, defined for any number of values."""
+        return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+@dataclass(kw_only=True)
+class YearStatistics:
+    """Distributions of the savegame values and the share of games in which each event fired, for one year."""
+
+    year: int
+    values: dict[str, Distribution]
+    event_rates: dict[str, float]
+
+
+@dataclass(kw_only=True)
+class MonteCarloResult:
+    runs: int
+    years: int
+    seed: int
+    duration: float
+    statistics: list[YearStatistics]
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.runs * self.years / self.duration if self.duration else 0.0
+
+
+class MonteCarloService:
+    """
+    Service to simulate many independent fresh savegames in parallel and aggregate their state per year.
+
+    The games are spread over a pool of worker processes. With SQLite, every worker plays on its own in-memory copy of
+    the database, so the workers never wait for each other's locks. Game n is played with the seed `seed + n`, so a
+    whole run can be repeated. A single worker plays all games in this process, on the configured database.
+    """
+
+    VALUES = ("coins", "population", "unrest", "defense", "prestige")
+
+    def __init__(self, *, runs: int, years: int, seed: int, workers: int | None = None):
+        self.runs = runs
+        self.years = years
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+
+    def process(self) -> MonteCarloResult:
+        seeds = range(self.seed, self.seed + self.runs)
+        started_at = time.perf_counter()
+
+        if self.workers == 1:
+            games = [_simulate_game(seed=seed, years=self.years) for seed in seeds]
+        else:
+            # Forked workers must not share the database connection of this process
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+                futures = [executor.submit(_simulate_game, seed=seed, years=self.years) for seed in seeds]
+                games = [future.result() for future in futures]
+
+        return MonteCarloResult(
+            runs=self.runs,
+            years=self.years,
+            seed=self.seed,
+            duration=time.perf_counter() - started_at,
+            statistics=self._aggregate(games=games),
+        )
+
+    def _aggregate(self, *, games: list[list[YearRecord]]) -> list[YearStatistics]:
+        records_per_year = defaultdict(list)
+        for records in games:
+            for record in records:
+                records_per_year[record.year].append(record)
+
+        year_statistics = []
+        for year, records in sorted(records_per_year.items()):
+            event_counts = defaultdict(int)
+            for record in records:
+                for title in record.events:
+                    event_counts[title] += 1
+            year_statistics.append(
+                YearStatistics(
+                    year=year,
+                    values={
+                        name: Distribution.from_values(values=[getattr(record, name) for record in records])
+                        for name in self.VALUES
+                    },
+                    event_rates={title: count / len(records) for title, count in sorted(event_counts.items())},
+                )
+            )
+        return year_statistics
+
+
+def _init_worker() -> None:
+    """Prepare a worker process of the pool."""
+    # Processes which are spawned instead of forked start without a configured Django
+    if not apps.ready:
+        django.setup()
+    _copy_database_into_memory(connection=connections[DEFAULT_DB_ALIAS])
+
+
+def _copy_database_into_memory(*, connection) -> None:
+    """Switch a SQLite connection of this process to a private in-memory copy of its database."""
+    if connection.vendor != "sqlite" or connection.is_in_memory_db():
+        return
+
+    memory_name = f"file:simulation_{os.getpid()}?mode=memory&cache=shared"
+    source = sqlite3.connect(f"file:{connection.settings_dict['NAME']}?mode=ro", uri=True)
+    target = sqlite3.connect(memory_name, uri=True)
+    source.backup(target)
+    source.close()
+
+    connection.settings_dict["NAME"] = memory_name
+    connection.connect()
+    # The in-memory database lives as long as one connection is open, so the copy can only be closed now
+    target.close()
+
+
+def _simulate_game(*, seed: int, years: int) -> list[YearRecord]:
+    """Play one fresh game, defined on module level so the worker processes can unpickle it."""
+    return FreshSimulationService(seed=seed, years=years, record_years=True).process().records
@@ -0,0 +1,60 @@
+from django.db import transaction
+
+from apps.city.services.city_stats import CityStatsDefenseRefreshService
+from apps.city.services.wall.decay import WallDecayService
+from apps.city.services.wall.enclosure import WallEnclosureService
+from apps.event.events.accumulator import EffectAccumulator
+from apps.event.models import EventNotification
+from apps.event.services.notification_creation import NotificationCreationService
+from apps.event.services.selection import EventSelectionService
+from apps.savegame.models import Savegame
+
+
+class RoundEngineService:
+    """
+    Service to finish the current round of a savegame.
+
+    Event selection, event effects, milestone checks, wall decay and the enclosure check all work on the same
+    in-memory savegame instance. Everything is persisted within one transaction, the savegame with a single UPDATE of
+    the fields a round can change and the notifications with a single bulk insert. So the number of savegame writes
+    doesn't grow with the number of events.
+
+    Coins, population and unrest are written as deltas via the `EffectAccumulator`, so concurrent changes are not lost.
+    """
+
+    # Savegame fields which are set by a round, the fields changed by effects are handled by the accumulator
+    ROUND_FIELDS = ("current_year", "is_enclosed")
+
+    def __init__(self, *, savegame: Savegame, create_notifications: bool = True):
+        self.savegame = savegame
+        # Headless rounds, e.g. of a simulation, only apply the event effects
+        self.create_notifications = create_notifications
+        # Events which took effect in the last headless round, others report them as notifications
+        self.events = []
+
+    def process(self) -> list[EventNotification]:
+        """Play the round and return the notifications created for the selected events."""
+        with transaction.atomic():
+            accumulator = EffectAccumulator(savegame=self.savegame)
+            self.savegame.current_year += 1
+
+            # Select events that should occur this round and apply their effects
+            events = EventSelectionService(savegame=self.savegame).process()
+            notifications = []
+            if not self.create_notifications:
+                # Like for notifications, only events which return a message took effect
+                self.events = [event for event in events if event.process()]
+            elif events:
+                notifications = NotificationCreationService(savegame=self.savegame, events=events).process()
+
+            # Decay wall hitpoints each round
+            WallDecayService(savegame=self.savegame).process()
+
+            # Update enclosure status after events (in case buildings were removed)
+            self.savegame.is_enclosed = WallEnclosureService(savegame=self.savegame).process()
+            # Events and decay may change the wall several times, the defense is only recalculated once
+            CityStatsDefenseRefreshService(savegame=self.savegame).process()
+
+            accumulator.flush(update_fields=self.ROUND_FIELDS)
+
+        return notifications
@@ -0,0 +1,49 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.round.models import RoundJob
+from apps.round.services.round_engine import RoundEngineService
+
+
+class RoundJobReclaimedError(Exception):
+    """The job was requeued as stale and claimed again while its round was played."""
+
+
+class RoundJobProcessingService:
+    """
+    Service to finish the round of a claimed job, used by the `round_worker` command.
+
+    The round and the new status of the job are committed together. A failing round is rolled back and the job is
+    marked as failed with the error. If the job was requeued as stale meanwhile, the round is rolled back as well and
+    the job is left to the worker which claimed it again.
+    """
+
+    def __init__(self, *, job: RoundJob):
+        self.job = job
+
+    def process(self) -> RoundJob:
+        try:
+            with transaction.atomic():
+                notifications = RoundEngineService(savegame=self.job.savegame).process()
+                if not self._finish(status=RoundJob.Status.DONE, has_notifications=bool(notifications)):
+                    raise RoundJobReclaimedError
+        except RoundJobReclaimedError:
+            self.job.refresh_from_db()
+        except Exception as e:
+            if not self._finish(status=RoundJob.Status.FAILED, error=f"{e.__class__.__name__}: {e}"):
+                self.job.refresh_from_db()
+        return self.job
+
+    def _finish(self, *, status: str, has_notifications: bool = False, error: str = "") -> bool:
+        """Set the final status, unless the job was claimed again meanwhile. Returns if the status was set."""
+        # Only the claim of this worker may be finished, it's identified by its start time
+        finished_at = timezone.now()
+        if not RoundJob.objects.filter(
+            pk=self.job.pk, status=RoundJob.Status.RUNNING, started_at=self.job.started_at
+        ).update(status=status, has_notifications=has_notifications, error=error, finished_at=finished_at):
+            return False
+        self.job.status = status
+        self.job.has_notifications = has_notifications
+        self.job.error = error
+        self.job.finished_at = finished_at
+        return True
@@ -0,0 +1,136 @@
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.city.selectors.city_stats import get_city_stats
+from apps.city.services.map.generation import MapGenerationService
+from apps.round.services.round_engine import RoundEngineService
+from apps.savegame.models import Savegame
+
+
+@dataclass(kw_only=True)
+class YearRecord:
+    """State of a savegame at the end of a simulated year and the titles of the events which took effect."""
+
+    year: int
+    coins: int
+    population: int
+    unrest: int
+    defense: int
+    prestige: int
+    events: list[str]
+
+
+@dataclass(kw_only=True)
+class SimulationResult:
+    """State of a savegame after fast-forwarding it, together with the time it took."""
+
+    years: int
+    duration: float
+    current_year: int
+    coins: int
+    population: int
+    unrest: int
+    records: list[YearRecord] = field(default_factory=list)
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.years / self.duration if self.duration else 0.0
+
+
+class SimulationService:
+    """
+    Service to play a savegame forward for a number of years without requests, templates or notifications.
+
+    Every year is a regular round of the `RoundEngineService`, so the simulation follows the game rules exactly: event
+    selection and effects (including the milestone check), wall decay and the enclosure check. All years run in one
+    transaction which is rolled back afterwards, unless `write_back` is set.
+
+    With `record_years`, the state after every year is recorded, which costs one statistics query per year.
+    """
+
+    def __init__(self, *, savegame: Savegame, years: int, write_back: bool = False, record_years: bool = False):
+        self.savegame = savegame
+        self.years = years
+        self.write_back = write_back
+        self.record_years = record_years
+
+    def process(self) -> SimulationResult:
+        initial_revision = self.savegame.map_revision
+        records = []
+        started_at = time.perf_counter()
+
+        with transaction.atomic():
+            for _ in range(self.years):
+                engine = RoundEngineService(savegame=self.savegame, create_notifications=False)
+                engine.process()
+                if self.record_years:
+                    records.append(self._record_year(events=engine.events))
+
+            result = SimulationResult(
+                years=self.years,
+                duration=time.perf_counter() - started_at,
+                current_year=self.savegame.current_year,
+                coins=self.savegame.coins,
+                population=self.savegame.population,
+                unrest=self.savegame.unrest,
+                records=records,
+            )
+            simulated_revision = self.savegame.map_revision
+            if not self.write_back:
+                transaction.set_rollback(True)
+
+        if not self.write_back:
+            self.savegame.refresh_from_db()
+            if simulated_revision != initial_revision:
+                self._skip_simulated_revisions(simulated_revision=simulated_revision)
+
+        return result
+
+    def _record_year(self, *, events: list) -> YearRecord:
+        city_stats = get_city_stats(savegame=self.savegame)
+        return YearRecord(
+            year=self.savegame.current_year,
+            coins=self.savegame.coins,
+            population=self.savegame.population,
+            unrest=self.savegame.unrest,
+            defense=city_stats.defense,
+            prestige=city_stats.prestige,
+            events=[event.TITLE for event in events],
+        )
+
+    def _skip_simulated_revisions(self, *, simulated_revision: int) -> None:
+        """
+        Cached map data is keyed by the map revision and survives the rollback. Continue counting after the simulated
+        revisions, so data of a discarded map state is never used for the real one.
+        """
+        Savegame.objects.filter(pk=self.savegame.pk).update(map_revision=simulated_revision)
+        Savegame.objects.bump_map_revision(savegame=self.savegame)
+
+
+class FreshSimulationService:
+    """
+    Service to simulate a new savegame on a freshly generated map.
+
+    The savegame belongs to a throwaway user, both are deleted again after the simulation. Deleting instead of rolling
+    back keeps their ids from being reused, so no cached map data of the simulation can ever match a real savegame.
+    """
+
+    def __init__(self, *, seed: int, years: int, record_years: bool = False):
+        self.seed = seed
+        self.years = years
+        self.record_years = record_years
+
+    def process(self) -> SimulationResult:
+        user = get_user_model().objects.create_user(username=f"simulation-{uuid.uuid4().hex[:12]}")
+        try:
+            savegame = Savegame.objects.create(user=user, city_name="Simulation", seed=self.seed)
+            MapGenerationService(savegame=savegame).process()
+            return SimulationService(
+                savegame=savegame, years=self.years, write_back=True, record_years=self.record_years
+            ).process()
+        finally:
+            user.delete()
@@ -0,0 +1,10 @@
+import factory
+
+from apps.round.models import RoundJob
+
+
+class RoundJobFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = RoundJob
+
+    savegame = factory.SubFactory("apps.savegame.tests.factories.SavegameFactory")
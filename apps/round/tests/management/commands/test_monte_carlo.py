@@ -0,0 +1,76 @@
+import csv
+import json
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.city.tests.factories import RiverTerrainFactory, TerrainFactory
+from apps.event.events.events.base_event import BaseEvent
+
+
+class AnnouncementEvent(BaseEvent):
+    """Event without effects, which always takes effect by returning a message."""
+
+    TITLE = "Announcement"
+
+    def get_verbose_text(self) -> str:
+        return "The herald made an announcement."
+
+
+@pytest.fixture
+def terrains():
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+
+@pytest.mark.django_db
+def test_monte_carlo_command_json(terrains):
+    """Test monte_carlo writes the statistics as JSON to stdout and the summary to stderr."""
+    out = StringIO()
+    err = StringIO()
+    call_command("monte_carlo", runs=2, years=3, seed=1, workers=1, stdout=out, stderr=err)
+
+    data = json.loads(out.getvalue())
+    assert data["runs"] == 2
+    assert data["seed"] == 1
+    assert [year["year"] for year in data["statistics"]] == [1151, 1152, 1153]
+    assert set(data["statistics"][0]["values"]["coins"]) == {"mean", "minimum", "p10", "median", "p90", "maximum"}
+    assert "rounds_per_second" in data
+    assert "Simulated 2 games of 3 years with seed 1 in " in err.getvalue()
+
+
+@pytest.mark.django_db
+def test_monte_carlo_command_csv_file(terrains, tmp_path):
+    """Test monte_carlo writes the statistics as CSV into a file."""
+    output = tmp_path / "statistics.csv"
+
+    with mock.patch(
+        "apps.round.services.round_engine.EventSelectionService.process",
+        autospec=True,
+        side_effect=lambda service: [AnnouncementEvent(savegame=service.savegame)],
+    ):
+        call_command(
+            "monte_carlo",
+            runs=1,
+            years=2,
+            workers=1,
+            format="csv",
+            output=str(output),
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+
+    rows = list(csv.reader(output.open()))
+    assert rows[0] == ["year", "value", "mean", "minimum", "p10", "median", "p90", "maximum"]
+    assert rows[1][:2] == ["1151", "coins"]
+    assert ["1151", "event: Announcement", "1.0", "", "", "", "", ""] in rows
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("options", [{"runs": 0}, {"years": 0}, {"workers": 0}])
+def test_monte_carlo_command_invalid_arguments(options):
+    """Test monte_carlo rejects non-positive numbers."""
+    with pytest.raises(CommandError, match="Years, runs and workers have to be positive"):
+        call_command("monte_carlo", stdout=StringIO(), **options)
@@ -0,0 +1,67 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+from apps.round.models import RoundJob
+from apps.round.tests.factories import RoundJobFactory
+
+
+@pytest.mark.django_db
+def test_round_worker_command_once():
+    """Test round_worker finishes all pending rounds and stops with --once."""
+    jobs = RoundJobFactory.create_batch(2, savegame__current_year=1150)
+
+    out = StringIO()
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        call_command("round_worker", "--once", stdout=out)
+
+    for job in jobs:
+        job.refresh_from_db()
+        job.savegame.refresh_from_db()
+        assert job.status == RoundJob.Status.DONE
+        assert job.savegame.current_year == 1151
+        assert f"Finished round job #{job.pk} of savegame #{job.savegame_id}." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_round_worker_command_reports_failed_job():
+    """Test round_worker reports failing rounds and continues."""
+    job = RoundJobFactory()
+
+    err = StringIO()
+    with mock.patch("apps.round.services.round_job.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.side_effect = ValueError("Broken event")
+        call_command("round_worker", "--once", stdout=StringIO(), stderr=err)
+
+    assert f"Round job #{job.pk} of savegame #{job.savegame_id} failed: ValueError: Broken event" in err.getvalue()
+
+
+@pytest.mark.django_db
+def test_round_worker_command_waits_for_jobs():
+    """Test round_worker waits for new jobs without --once."""
+    with (
+        mock.patch.object(RoundJob.objects, "claim_next", side_effect=[None, KeyboardInterrupt]),
+        mock.patch("apps.round.management.commands.round_worker.time.sleep") as sleep,
+        pytest.raises(KeyboardInterrupt),
+    ):
+        call_command("round_worker", interval=2.5, stdout=StringIO())
+
+    sleep.assert_called_once_with(2.5)
+
+
+@pytest.mark.django_db
+def test_round_worker_command_reports_reclaimed_job():
+    """Test round_worker reports jobs which another worker claimed again meanwhile."""
+    job = RoundJobFactory()
+
+    err = StringIO()
+    with mock.patch("apps.round.management.commands.round_worker.RoundJobProcessingService") as mock_service:
+        mock_service.return_value.process.return_value = RoundJobFactory.build(
+            pk=job.pk, savegame=job.savegame, status=RoundJob.Status.RUNNING
+        )
+        call_command("round_worker", "--once", stdout=StringIO(), stderr=err)
+
+    assert f"Round job #{job.pk} of savegame #{job.savegame_id} was claimed by another worker." in err.getvalue()
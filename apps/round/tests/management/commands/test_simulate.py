@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+
+from apps.city.tests.factories import RiverTerrainFactory, TerrainFactory
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_simulate_command_savegame():
+    """Test simulate fast-forwards a savegame and discards the result."""
+    savegame = SavegameFactory(current_year=1150)
+
+    out = StringIO()
+    call_command("simulate", savegame=savegame.id, years=20, stdout=out)
+
+    output = out.getvalue()
+    assert "Average result:" in output
+    assert "Simulated 20 years of 1 savegame in " in output
+    assert "rounds per second" in output
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1150
+
+
+@pytest.mark.django_db
+def test_simulate_command_savegame_write_back():
+    """Test simulate keeps the simulated state with --write-back."""
+    savegame = SavegameFactory(current_year=1150)
+
+    call_command("simulate", "--write-back", savegame=savegame.id, years=5, stdout=StringIO())
+
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1155
+
+
+@pytest.mark.django_db
+def test_simulate_command_unknown_savegame():
+    """Test simulate fails for a savegame which doesn't exist."""
+    with pytest.raises(CommandError, match="Savegame #999 does not exist"):
+        call_command("simulate", savegame=999, stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_simulate_command_invalid_years():
+    """Test simulate rejects a non-positive number of years."""
+    with pytest.raises(CommandError, match="Years and runs have to be positive"):
+        call_command("simulate", "--fresh", years=0, stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_simulate_command_fresh():
+    """Test simulate generates, simulates and deletes fresh savegames."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    out = StringIO()
+    call_command("simulate", "--fresh", runs=2, years=3, seed=42, stdout=out)
+
+    assert "Simulated 6 years of 2 savegames in " in out.getvalue()
+    assert not Savegame.objects.exists()
+    assert not User.objects.filter(username__startswith="simulation-").exists()
+
+
+@pytest.mark.django_db
+def test_simulate_command_fresh_is_reproducible():
+    """Test fresh savegames with the same seed give the same result."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    outputs = []
+    for _ in range(2):
+        out = StringIO()
+        call_command("simulate", "--fresh", years=10, seed=7, stdout=out)
+        outputs.append(out.getvalue().splitlines()[0])
+
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.django_db
+def test_simulate_command_fresh_random_seed():
+    """Test fresh savegames get a random seed without --seed."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    out = StringIO()
+    call_command("simulate", "--fresh", years=1, stdout=out)
+
+    assert "Simulated 1 years of 1 savegame in " in out.getvalue()
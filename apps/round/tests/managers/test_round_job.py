@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from apps.round.managers.round_job import RoundJobQuerySet
+from apps.round.models import RoundJob
+from apps.round.tests.factories import RoundJobFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_round_job_queryset_open():
+    """Test open() returns pending and running jobs only."""
+    pending = RoundJobFactory(status=RoundJob.Status.PENDING)
+    running = RoundJobFactory(status=RoundJob.Status.RUNNING)
+    RoundJobFactory(status=RoundJob.Status.DONE)
+    RoundJobFactory(status=RoundJob.Status.FAILED)
+
+    assert list(RoundJob.objects.open()) == [pending, running]
+
+
+@pytest.mark.django_db
+def test_round_job_manager_enqueue_creates_job():
+    """Test enqueue creates a pending job for the savegame."""
+    savegame = SavegameFactory()
+    RoundJobFactory(savegame=savegame, status=RoundJob.Status.DONE)
+
+    job = RoundJob.objects.enqueue(savegame=savegame)
+
+    assert job.savegame == savegame
+    assert job.status == RoundJob.Status.PENDING
+    assert RoundJob.objects.filter(savegame=savegame).count() == 2
+
+
+@pytest.mark.django_db
+def test_round_job_manager_enqueue_returns_open_job():
+    """Test enqueue returns the open job instead of finishing the round twice."""
+    job = RoundJobFactory(status=RoundJob.Status.RUNNING)
+
+    assert RoundJob.objects.enqueue(savegame=job.savegame) == job
+    assert RoundJob.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_round_job_manager_claim_next():
+    """Test claim_next marks the oldest pending job as running."""
+    RoundJobFactory(status=RoundJob.Status.DONE)
+    oldest = RoundJobFactory()
+    RoundJobFactory()
+
+    job = RoundJob.objects.claim_next()
+
+    assert job == oldest
+    assert job.status == RoundJob.Status.RUNNING
+    assert job.started_at is not None
+    job.refresh_from_db()
+    assert job.status == RoundJob.Status.RUNNING
+
+
+@pytest.mark.django_db
+def test_round_job_manager_claim_next_without_pending_jobs():
+    """Test claim_next returns None if no job is pending."""
+    RoundJobFactory(status=RoundJob.Status.RUNNING)
+
+    assert RoundJob.objects.claim_next() is None
+
+
+@pytest.mark.django_db
+def test_round_job_manager_claim_next_retries_lost_claim():
+    """Test claim_next tries again if another worker claimed the job in the meantime."""
+    job = RoundJobFactory()
+
+    with (
+        mock.patch.object(RoundJob.objects, "requeue_stale"),
+        mock.patch.object(RoundJobQuerySet, "update", side_effect=[0, 1]) as mock_update,
+    ):
+        claimed = RoundJob.objects.claim_next()
+
+    assert claimed == job
+    assert mock_update.call_count == 2
+
+
+@pytest.mark.django_db
+def test_round_job_manager_requeue_stale(settings):
+    """Test requeue_stale puts running jobs back into the queue once their worker exceeded the timeout."""
+    settings.ROUND_JOB_TIMEOUT = 60
+    stale = RoundJobFactory(status=RoundJob.Status.RUNNING, started_at=timezone.now() - timedelta(seconds=61))
+    running = RoundJobFactory(status=RoundJob.Status.RUNNING, started_at=timezone.now() - timedelta(seconds=30))
+    done = RoundJobFactory(status=RoundJob.Status.DONE, started_at=timezone.now() - timedelta(seconds=120))
+
+    assert RoundJob.objects.requeue_stale() == 1
+
+    stale.refresh_from_db()
+    running.refresh_from_db()
+    done.refresh_from_db()
+    assert stale.status == RoundJob.Status.PENDING
+    assert stale.started_at is None
+    assert running.status == RoundJob.Status.RUNNING
+    assert done.status == RoundJob.Status.DONE
+
+
+@pytest.mark.django_db
+def test_round_job_manager_claim_next_reclaims_stale_job(settings):
+    """Test a job left running by a crashed worker is claimed again, so its savegame can finish rounds again."""
+    settings.ROUND_JOB_TIMEOUT = 60
+    stuck = RoundJobFactory(status=RoundJob.Status.RUNNING, started_at=timezone.now() - timedelta(seconds=61))
+
+    assert RoundJob.objects.enqueue(savegame=stuck.savegame) == stuck
+    job = RoundJob.objects.claim_next()
+
+    assert job == stuck
+    assert job.status == RoundJob.Status.RUNNING
+    assert job.started_at > timezone.now() - timedelta(seconds=60)
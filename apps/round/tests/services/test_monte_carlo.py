@@ -0,0 +1,188 @@
+import sqlite3
+from concurrent.futures import Future
+from unittest import mock
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.city.tests.factories import RiverTerrainFactory, TerrainFactory
+from apps.round.services.monte_carlo import (
+    Distribution,
+    MonteCarloResult,
+    MonteCarloService,
+    _copy_database_into_memory,
+    _init_worker,
+)
+from apps.round.services.simulation import YearRecord
+
+
+class InProcessExecutor:
+    """Stand-in for the process pool which runs all tasks in the test process."""
+
+    def __init__(self, *, max_workers, initializer):
+        self.max_workers = max_workers
+        self.initializer = initializer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, fn, **kwargs):
+        future = Future()
+        future.set_result(fn(**kwargs))
+        return future
+
+
+def build_record(*, year, coins, events=()):
+    return YearRecord(year=year, coins=coins, population=0, unrest=0, defense=0, prestige=0, events=list(events))
+
+
+def test_distribution_from_values():
+    """Test mean, extremes, median and nearest-rank percentiles of the values."""
+    distribution = Distribution.from_values(values=list(range(1, 11)))
+
+    assert distribution == Distribution(mean=5.5, minimum=1, p10=1, median=5.5, p90=9, maximum=10)
+
+
+def test_distribution_from_single_value():
+    """Test that a single value is its own distribution."""
+    distribution = Distribution.from_values(values=[7])
+
+    assert distribution == Distribution(mean=7, minimum=7, p10=7, median=7, p90=7, maximum=7)
+
+
+def test_monte_carlo_result_rounds_per_second():
+    """Test the throughput counts the years of all games."""
+    result = MonteCarloResult(runs=10, years=50, seed=1, duration=2.0, statistics=[])
+
+    assert result.rounds_per_second == 250
+    assert MonteCarloResult(runs=1, years=1, seed=1, duration=0.0, statistics=[]).rounds_per_second == 0
+
+
+def test_monte_carlo_service_defaults_to_cpu_count():
+    """Test that one worker per CPU is used by default."""
+    with mock.patch("apps.round.services.monte_carlo.os.cpu_count", return_value=6):
+        service = MonteCarloService(runs=1, years=1, seed=1)
+
+    assert service.workers == 6
+
+
+def test_monte_carlo_service_aggregates_per_year():
+    """Test that the games are grouped by year into value distributions and event rates."""
+    games = {
+        1: [build_record(year=1151, coins=100, events=["Fire"]), build_record(year=1152, coins=50)],
+        2: [build_record(year=1151, coins=300, events=["Fire", "Plague"]), build_record(year=1152, coins=70)],
+    }
+
+    with mock.patch("apps.round.services.monte_carlo._simulate_game", side_effect=lambda *, seed, years: games[seed]):
+        result = MonteCarloService(runs=2, years=2, seed=1, workers=1).process()
+
+    assert [year_statistics.year for year_statistics in result.statistics] == [1151, 1152]
+    first_year = result.statistics[0]
+    assert first_year.values["coins"].mean == 200
+    assert set(first_year.values) == set(MonteCarloService.VALUES)
+    assert first_year.event_rates == {"Fire": 1.0, "Plague": 0.5}
+    assert result.statistics[1].event_rates == {}
+
+
+@pytest.mark.django_db
+def test_monte_carlo_service_simulates_fresh_games():
+    """Test that fresh games are simulated and recorded year by year."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    result = MonteCarloService(runs=2, years=3, seed=5, workers=1).process()
+
+    assert result.runs == 2
+    assert result.seed == 5
+    assert [year_statistics.year for year_statistics in result.statistics] == [1151, 1152, 1153]
+    assert all(0 < rate <= 1 for rate in result.statistics[0].event_rates.values())
+
+
+@pytest.mark.django_db
+def test_monte_carlo_service_same_seed_same_result():
+    """Test that a run with the same seed gives the same statistics."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    first = MonteCarloService(runs=2, years=3, seed=5, workers=1).process()
+    second = MonteCarloService(runs=2, years=3, seed=5, workers=1).process()
+
+    assert first.statistics == second.statistics
+
+
+@pytest.mark.django_db
+def test_monte_carlo_service_uses_process_pool():
+    """Test that several workers play the games in a process pool."""
+    TerrainFactory(probability=100)
+    RiverTerrainFactory()
+
+    with (
+        mock.patch("apps.round.services.monte_carlo.ProcessPoolExecutor", InProcessExecutor) as executor_class,
+        mock.patch("apps.round.services.monte_carlo.connections") as mock_connections,
+    ):
+        result = MonteCarloService(runs=3, years=2, seed=1, workers=2).process()
+
+    assert executor_class is InProcessExecutor
+    mock_connections.close_all.assert_called_once_with()
+    assert len(result.statistics) == 2
+
+
+def test_init_worker_sets_up_spawned_process():
+    """Test that a spawned worker configures Django before copying the database."""
+    with (
+        mock.patch("apps.round.services.monte_carlo.apps.ready", new=False),
+        mock.patch("apps.round.services.monte_carlo.django.setup") as mock_setup,
+        mock.patch("apps.round.services.monte_carlo._copy_database_into_memory") as mock_copy,
+    ):
+        _init_worker()
+
+    mock_setup.assert_called_once_with()
+    mock_copy.assert_called_once_with(connection=connections[DEFAULT_DB_ALIAS])
+
+
+def test_init_worker_forked_process():
+    """Test that a forked worker keeps the configured Django."""
+    with (
+        mock.patch("apps.round.services.monte_carlo.django.setup") as mock_setup,
+        mock.patch("apps.round.services.monte_carlo._copy_database_into_memory") as mock_copy,
+    ):
+        _init_worker()
+
+    mock_setup.assert_not_called()
+    mock_copy.assert_called_once()
+
+
+def test_copy_database_into_memory(tmp_path):
+    """Test that a SQLite database file is copied into a private in-memory database."""
+    database_path = tmp_path / "db.sqlite3"
+    with sqlite3.connect(database_path) as database:
+        database.execute("CREATE TABLE terrain (name TEXT)")
+        database.execute("INSERT INTO terrain VALUES ('Forest')")
+    database.close()
+
+    opened = []
+    connection = mock.Mock(vendor="sqlite", settings_dict={"NAME": str(database_path)})
+    connection.is_in_memory_db.return_value = False
+    connection.connect.side_effect = lambda: opened.append(sqlite3.connect(connection.settings_dict["NAME"], uri=True))
+
+    _copy_database_into_memory(connection=connection)
+
+    assert connection.settings_dict["NAME"].startswith("file:simulation_")
+    assert "mode=memory" in connection.settings_dict["NAME"]
+    assert opened[0].execute("SELECT name FROM terrain").fetchall() == [("Forest",)]
+    opened[0].close()
+
+
+@pytest.mark.parametrize("vendor,in_memory", [("postgresql", False), ("sqlite", True)])
+def test_copy_database_into_memory_skips_other_databases(vendor, in_memory):
+    """Test that other database vendors and in-memory databases are used as they are."""
+    connection = mock.Mock(vendor=vendor, settings_dict={"NAME": "norimberga"})
+    connection.is_in_memory_db.return_value = in_memory
+
+    _copy_database_into_memory(connection=connection)
+
+    assert connection.settings_dict["NAME"] == "norimberga"
+    connection.connect.assert_not_called()
@@ -0,0 +1,246 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from apps.city.constants import WALL_DECAY_PER_ROUND
+from apps.city.events.effects.savegame.increase_coins import IncreaseCoins
+from apps.city.tests.factories import BuildingFactory, CityStatsFactory, TileFactory, WallBuildingTypeFactory
+from apps.event.events.events.base_event import BaseEvent
+from apps.event.models import EventNotification
+from apps.round.services.round_engine import RoundEngineService
+from apps.savegame.models import Savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+class CoinsEvent(BaseEvent):
+    """Event changing the savegame via an effect."""
+
+    TITLE = "Coins"
+
+    def _prepare_effect_increase_coins(self) -> IncreaseCoins:
+        return IncreaseCoins(coins=10)
+
+    def get_verbose_text(self) -> str:
+        return "The city received coins."
+
+
+class SilentEvent(BaseEvent):
+    """Event which occurred, but had nothing to do, e.g. a milestone check without achieved milestones."""
+
+    TITLE = "Silent"
+
+    def get_verbose_text(self) -> None:
+        return None
+
+
+@pytest.mark.django_db
+def test_round_engine_service_increments_year():
+    """Test that the round increments and persists the current year."""
+    savegame = SavegameFactory.create(current_year=1150)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        RoundEngineService(savegame=savegame).process()
+
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1151
+    mock_selection.assert_called_once_with(savegame=savegame)
+
+
+@pytest.mark.django_db
+def test_round_engine_service_applies_all_events_with_single_savegame_update():
+    """Test that the effects of all events are persisted with one savegame UPDATE and one notification INSERT."""
+    savegame = SavegameFactory.create(coins=100, current_year=1150)
+    events = [CoinsEvent(savegame=savegame) for _ in range(5)]
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = events
+        with CaptureQueriesContext(connection) as context:
+            notifications = RoundEngineService(savegame=savegame).process()
+
+    savegame_updates = [query for query in context.captured_queries if query["sql"].startswith('UPDATE "savegame_')]
+    notification_inserts = [
+        query for query in context.captured_queries if query["sql"].startswith('INSERT INTO "event_')
+    ]
+    assert len(savegame_updates) == 1
+    assert len(notification_inserts) == 1
+    assert len(notifications) == 5
+    assert EventNotification.objects.filter(savegame=savegame, year=1151).count() == 5
+    savegame.refresh_from_db()
+    assert savegame.coins == 150
+
+
+@pytest.mark.django_db
+def test_round_engine_service_without_notifications():
+    """Test that headless rounds apply the event effects without creating notifications."""
+    savegame = SavegameFactory.create(coins=100)
+    events = [CoinsEvent(savegame=savegame) for _ in range(2)]
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = events
+        notifications = RoundEngineService(savegame=savegame, create_notifications=False).process()
+
+    assert notifications == []
+    assert not EventNotification.objects.filter(savegame=savegame).exists()
+    savegame.refresh_from_db()
+    assert savegame.coins == 120
+
+
+@pytest.mark.django_db
+def test_round_engine_service_without_notifications_remembers_events_which_took_effect():
+    """Test that headless rounds only remember events which returned a message, not all selected ones."""
+    savegame = SavegameFactory.create()
+    coins_event = CoinsEvent(savegame=savegame)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = [coins_event, SilentEvent(savegame=savegame)]
+        engine = RoundEngineService(savegame=savegame, create_notifications=False)
+        engine.process()
+
+    assert engine.events == [coins_event]
+
+
+@pytest.mark.django_db
+def test_round_engine_service_without_events():
+    """Test that no notifications are created if no event was selected."""
+    savegame = SavegameFactory.create()
+
+    with (
+        mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection,
+        mock.patch("apps.round.services.round_engine.NotificationCreationService") as mock_notification_service,
+    ):
+        mock_selection.return_value.process.return_value = []
+        notifications = RoundEngineService(savegame=savegame).process()
+
+    assert notifications == []
+    mock_notification_service.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_round_engine_service_decays_walls():
+    """Test that the walls decay each round."""
+    savegame = SavegameFactory.create()
+    wall = BuildingFactory.create(building_type=WallBuildingTypeFactory.create())
+    tile = TileFactory.create(savegame=savegame, building=wall, wall_hitpoints=100)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        RoundEngineService(savegame=savegame).process()
+
+    tile.refresh_from_db()
+    assert tile.wall_hitpoints == 100 - WALL_DECAY_PER_ROUND
+
+
+@pytest.mark.django_db
+def test_round_engine_service_updates_enclosure():
+    """Test that the enclosure status is calculated after the events and persisted."""
+    savegame = SavegameFactory.create(is_enclosed=False)
+
+    with (
+        mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection,
+        mock.patch("apps.round.services.round_engine.WallEnclosureService") as mock_enclosure,
+    ):
+        mock_selection.return_value.process.return_value = []
+        mock_enclosure.return_value.process.return_value = True
+        RoundEngineService(savegame=savegame).process()
+
+    savegame.refresh_from_db()
+    assert savegame.is_enclosed is True
+
+
+@pytest.mark.django_db
+def test_round_engine_service_refreshes_defense_once():
+    """Test that the defense is recalculated once at the end of the round, even if the walls changed several times."""
+    savegame = SavegameFactory.create()
+    stats = CityStatsFactory.create(savegame=savegame, defense=0, defense_map_revision=0)
+    wall = BuildingFactory.create(building_type=WallBuildingTypeFactory.create())
+    TileFactory.create_batch(2, savegame=savegame, building=wall, wall_hitpoints=100)
+
+    with (
+        mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection,
+        mock.patch("apps.city.services.city_stats.DefenseCalculationService.process", return_value=4) as mock_defense,
+    ):
+        mock_selection.return_value.process.return_value = []
+        RoundEngineService(savegame=savegame).process()
+
+    mock_defense.assert_called_once_with()
+    stats.refresh_from_db()
+    assert stats.defense == 4
+    assert stats.defense_map_revision == savegame.map_revision
+
+
+@pytest.mark.django_db
+def test_round_engine_service_keeps_other_fields():
+    """Test that fields which are not changed by a round are not overwritten."""
+    savegame = SavegameFactory.create(city_name="Nuremberg")
+    Savegame.objects.filter(pk=savegame.pk).update(city_name="Norimberga")
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        RoundEngineService(savegame=savegame).process()
+
+    savegame.refresh_from_db()
+    assert savegame.city_name == "Norimberga"
+
+
+@pytest.mark.django_db
+def test_round_engine_service_keeps_concurrent_coin_changes():
+    """Test that coins changed by another request during the round are not overwritten by the event effects."""
+    savegame = SavegameFactory.create(coins=100)
+
+    def spend_coins():
+        Savegame.objects.filter(pk=savegame.pk).update(coins=F("coins") - 30)
+
+    with (
+        mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection,
+        mock.patch("apps.round.services.round_engine.WallDecayService") as mock_decay,
+    ):
+        mock_selection.return_value.process.return_value = [CoinsEvent(savegame=savegame)]
+        mock_decay.return_value.process.side_effect = spend_coins
+        RoundEngineService(savegame=savegame).process()
+
+    assert savegame.coins == 80
+    assert Savegame.objects.get(pk=savegame.pk).coins == 80
+
+
+@pytest.mark.django_db
+def test_round_engine_service_rolls_back_on_error():
+    """Test that nothing of the round is persisted if any step fails."""
+    savegame = SavegameFactory.create(coins=100, current_year=1150)
+
+    with (
+        mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection,
+        mock.patch("apps.round.services.round_engine.WallDecayService") as mock_decay,
+    ):
+        mock_selection.return_value.process.return_value = [CoinsEvent(savegame=savegame)]
+        mock_decay.return_value.process.side_effect = RuntimeError
+        with pytest.raises(RuntimeError):
+            RoundEngineService(savegame=savegame).process()
+
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1150
+    assert savegame.coins == 100
+    assert EventNotification.objects.filter(savegame=savegame).exists() is False
+
+
+@pytest.mark.django_db
+def test_round_engine_service_replays_round_with_same_seed():
+    """Test that playing the same round from the same state and seed gives the same result."""
+    results = []
+    for _ in range(2):
+        savegame = SavegameFactory.create(seed=42, current_year=1150, coins=500, population=80, unrest=40)
+        notifications = RoundEngineService(savegame=savegame).process()
+        savegame.refresh_from_db()
+        results.append(
+            (
+                [(notification.title, notification.message) for notification in notifications],
+                savegame.coins,
+                savegame.population,
+                savegame.unrest,
+            )
+        )
+
+    assert results[0] == results[1]
@@ -0,0 +1,73 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from apps.event.tests.factories import EventNotificationFactory
+from apps.round.models import RoundJob
+from apps.round.services.round_job import RoundJobProcessingService
+from apps.round.tests.factories import RoundJobFactory
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("notification_count,has_notifications", [(0, False), (2, True)])
+def test_round_job_processing_service_finishes_round(notification_count, has_notifications):
+    """Test the round of the job is finished and the job is marked as done."""
+    job = RoundJobFactory(status=RoundJob.Status.RUNNING)
+
+    with mock.patch("apps.round.services.round_job.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = EventNotificationFactory.build_batch(notification_count)
+        RoundJobProcessingService(job=job).process()
+
+    mock_engine.assert_called_once_with(savegame=job.savegame)
+    job.refresh_from_db()
+    assert job.status == RoundJob.Status.DONE
+    assert job.has_notifications is has_notifications
+    assert job.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_round_job_processing_service_marks_failed_job():
+    """Test a failing round marks the job as failed with the error."""
+    job = RoundJobFactory(status=RoundJob.Status.RUNNING)
+
+    with mock.patch("apps.round.services.round_job.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.side_effect = ValueError("Broken event")
+        result = RoundJobProcessingService(job=job).process()
+
+    assert result is job
+    job.refresh_from_db()
+    assert job.status == RoundJob.Status.FAILED
+    assert job.error == "ValueError: Broken event"
+    assert job.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_round_job_processing_service_rolls_back_reclaimed_job():
+    """Test the round is rolled back if the job was requeued and claimed by another worker meanwhile."""
+    job = RoundJobFactory(status=RoundJob.Status.RUNNING, started_at=timezone.now(), savegame__current_year=1150)
+    RoundJob.objects.filter(pk=job.pk).update(started_at=timezone.now() + timedelta(seconds=1))
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        result = RoundJobProcessingService(job=job).process()
+
+    job.savegame.refresh_from_db()
+    assert job.savegame.current_year == 1150
+    assert result.status == RoundJob.Status.RUNNING
+    assert result.finished_at is None
+
+
+@pytest.mark.django_db
+def test_round_job_processing_service_failed_reclaimed_job():
+    """Test a failing round doesn't mark a job as failed which was claimed by another worker meanwhile."""
+    job = RoundJobFactory(status=RoundJob.Status.RUNNING, started_at=timezone.now())
+    RoundJob.objects.filter(pk=job.pk).update(status=RoundJob.Status.PENDING, started_at=None)
+
+    with mock.patch("apps.round.services.round_job.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.side_effect = ValueError("Broken event")
+        result = RoundJobProcessingService(job=job).process()
+
+    assert result.status == RoundJob.Status.PENDING
+    assert result.error == ""
@@ -0,0 +1,126 @@
+from unittest import mock
+
+import pytest
+
+from apps.city.constants import WALL_DECAY_PER_ROUND
+from apps.city.tests.factories import BuildingFactory, TileFactory, WallBuildingTypeFactory
+from apps.event.models import EventNotification
+from apps.milestone.events.events.milestone_check import Event as MilestoneCheckEvent
+from apps.round.services.simulation import SimulationResult, SimulationService, YearRecord
+from apps.savegame.tests.factories import SavegameFactory
+
+
+def test_simulation_result_rounds_per_second():
+    """Test the throughput is calculated from years and duration."""
+    result = SimulationResult(years=100, duration=4.0, current_year=1250, coins=0, population=0, unrest=0)
+
+    assert result.rounds_per_second == 25
+
+
+def test_simulation_result_rounds_per_second_without_duration():
+    """Test the throughput of an immeasurably fast simulation is zero instead of failing."""
+    result = SimulationResult(years=1, duration=0.0, current_year=1151, coins=0, population=0, unrest=0)
+
+    assert result.rounds_per_second == 0
+
+
+@pytest.mark.django_db
+def test_simulation_service_discards_state_by_default():
+    """Test that the simulated years are reported, but the savegame is left unchanged."""
+    savegame = SavegameFactory.create(current_year=1150, coins=1000)
+
+    result = SimulationService(savegame=savegame, years=10).process()
+
+    assert result.years == 10
+    assert result.current_year == 1160
+    assert result.duration > 0
+    assert savegame.current_year == 1150
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1150
+    assert savegame.coins == 1000
+
+
+@pytest.mark.django_db
+def test_simulation_service_write_back():
+    """Test that the simulated state is kept with write-back."""
+    savegame = SavegameFactory.create(current_year=1150)
+
+    result = SimulationService(savegame=savegame, years=5, write_back=True).process()
+
+    savegame.refresh_from_db()
+    assert savegame.current_year == result.current_year == 1155
+    assert savegame.coins == result.coins
+
+
+@pytest.mark.django_db
+def test_simulation_service_creates_no_notifications():
+    """Test that simulated rounds don't create notifications."""
+    savegame = SavegameFactory.create()
+
+    with mock.patch("apps.round.services.simulation.RoundEngineService") as mock_engine:
+        SimulationService(savegame=savegame, years=3, write_back=True).process()
+
+    assert mock_engine.call_count == 3
+    mock_engine.assert_called_with(savegame=savegame, create_notifications=False)
+    assert not EventNotification.objects.filter(savegame=savegame).exists()
+
+
+@pytest.mark.django_db
+def test_simulation_service_skips_simulated_map_revisions():
+    """Test that discarded map changes leave the map revision behind the simulated ones."""
+    savegame = SavegameFactory.create()
+    wall = BuildingFactory.create(building_type=WallBuildingTypeFactory.create())
+    tile = TileFactory.create(savegame=savegame, building=wall, wall_hitpoints=100)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        SimulationService(savegame=savegame, years=3).process()
+
+    tile.refresh_from_db()
+    assert tile.wall_hitpoints == 100
+    assert savegame.map_revision == 4
+    savegame.refresh_from_db()
+    assert savegame.map_revision == 4
+
+
+@pytest.mark.django_db
+def test_simulation_service_write_back_keeps_map_changes():
+    """Test that map changes of the simulation are kept with write-back."""
+    savegame = SavegameFactory.create()
+    wall = BuildingFactory.create(building_type=WallBuildingTypeFactory.create())
+    tile = TileFactory.create(savegame=savegame, building=wall, wall_hitpoints=100)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        SimulationService(savegame=savegame, years=3, write_back=True).process()
+
+    tile.refresh_from_db()
+    assert tile.wall_hitpoints == 100 - 3 * WALL_DECAY_PER_ROUND
+    assert savegame.map_revision == 3
+
+
+@pytest.mark.django_db
+def test_simulation_service_records_years():
+    """Test that the state and the events which took effect of every year are recorded on request."""
+    savegame = SavegameFactory.create(current_year=1150, coins=500, population=0, unrest=0)
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
+        result = SimulationService(savegame=savegame, years=2, record_years=True).process()
+
+    assert result.records == [
+        YearRecord(year=1151, coins=500, population=0, unrest=0, defense=0, prestige=0, events=[]),
+        YearRecord(year=1152, coins=500, population=0, unrest=0, defense=0, prestige=0, events=[]),
+    ]
+
+
+@pytest.mark.django_db
+def test_simulation_service_records_only_events_which_took_effect():
+    """Test that the milestone check, which runs every year, is only recorded once a milestone was achieved."""
+    savegame = SavegameFactory.create()
+
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.side_effect = lambda: [MilestoneCheckEvent(savegame=savegame)]
+        result = SimulationService(savegame=savegame, years=2, record_years=True).process()
+
+    assert [record.events for record in result.records] == [[], []]
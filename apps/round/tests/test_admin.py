@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from apps.round.admin import RoundJobAdmin
+from apps.round.models import RoundJob
+
+
+def test_round_job_admin_is_registered():
+    """Test that RoundJob is registered in Django admin."""
+    assert isinstance(admin.site._registry[RoundJob], RoundJobAdmin)
@@ -0,0 +1,93 @@
+from http import HTTPStatus
+
+import pytest
+from django.http import HttpResponse
+from django.views import generic
+
+from apps.round.mixins.round_job import RoundJobIdleRequiredMixin
+from apps.round.models import RoundJob
+from apps.round.tests.factories import RoundJobFactory
+from apps.savegame.tests.factories import SavegameFactory
+
+
+class _TestView(RoundJobIdleRequiredMixin, generic.View):
+    """Test view that uses RoundJobIdleRequiredMixin."""
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        return HttpResponse("ok")
+
+    def post(self, request, *args, **kwargs) -> HttpResponse:
+        return HttpResponse("ok")
+
+
+# RoundJobIdleRequiredMixin Tests
+@pytest.mark.django_db
+def test_round_job_idle_required_mixin_rejects_post_while_job_is_open(request_factory, user, settings):
+    """Test RoundJobIdleRequiredMixin rejects changes while a round job of the active savegame is open."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory(user=user, is_active=True)
+    RoundJobFactory(savegame=savegame, status=RoundJob.Status.RUNNING)
+    request = request_factory.post("/")
+    request.user = user
+
+    response = _TestView.as_view()(request)
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.content.decode() == "Please wait until the round is finished"
+
+
+@pytest.mark.django_db
+def test_round_job_idle_required_mixin_allows_get_while_job_is_open(request_factory, user, settings):
+    """Test RoundJobIdleRequiredMixin doesn't block read-only requests."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory(user=user, is_active=True)
+    RoundJobFactory(savegame=savegame)
+    request = request_factory.get("/")
+    request.user = user
+
+    response = _TestView.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_round_job_idle_required_mixin_allows_post_after_job_is_done(request_factory, user, settings):
+    """Test RoundJobIdleRequiredMixin allows changes once the round job is finished."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory(user=user, is_active=True)
+    RoundJobFactory(savegame=savegame, status=RoundJob.Status.DONE)
+    request = request_factory.post("/")
+    request.user = user
+
+    response = _TestView.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_round_job_idle_required_mixin_ignores_jobs_of_other_savegames(request_factory, user, settings):
+    """Test RoundJobIdleRequiredMixin only looks at round jobs of the active savegame."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    SavegameFactory(user=user, is_active=True)
+    RoundJobFactory()
+    request = request_factory.post("/")
+    request.user = user
+
+    response = _TestView.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_round_job_idle_required_mixin_skips_check_in_synchronous_mode(
+    request_factory, user, settings, django_assert_num_queries
+):
+    """Test RoundJobIdleRequiredMixin doesn't query anything when rounds are processed synchronously."""
+    settings.ROUND_PROCESSING_ASYNC = False
+    request = request_factory.post("/")
+    request.user = user
+
+    with django_assert_num_queries(0):
+        response = _TestView.as_view()(request)
+
+    assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,38 @@
+import pytest
+from django.db import IntegrityError
+
+from apps.round.models import RoundJob
+from apps.round.tests.factories import RoundJobFactory
+
+
+@pytest.mark.django_db
+def test_round_job_str():
+    """Test string representation contains id, savegame and status."""
+    job = RoundJobFactory(savegame__city_name="Nuremberg")
+
+    assert str(job) == f"Round job #{job.pk} of Nuremberg (Pending)"
+
+
+@pytest.mark.parametrize(
+    "status,is_open",
+    [
+        (RoundJob.Status.PENDING, True),
+        (RoundJob.Status.RUNNING, True),
+        (RoundJob.Status.DONE, False),
+        (RoundJob.Status.FAILED, False),
+    ],
+)
+def test_round_job_is_open(status, is_open):
+    """Test pending and running jobs are open."""
+    assert RoundJob(status=status).is_open is is_open
+
+
+@pytest.mark.django_db
+def test_round_job_one_open_job_per_savegame():
+    """Test a savegame can't have two open jobs, but any number of finished ones."""
+    job = RoundJobFactory(status=RoundJob.Status.DONE)
+    RoundJobFactory(savegame=job.savegame, status=RoundJob.Status.DONE)
+    RoundJobFactory(savegame=job.savegame, status=RoundJob.Status.RUNNING)
+
+    with pytest.raises(IntegrityError):
+        RoundJobFactory(savegame=job.savegame, status=RoundJob.Status.PENDING)
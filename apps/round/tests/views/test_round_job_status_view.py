@@ -0,0 +1,67 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from apps.round.models import RoundJob
+from apps.round.tests.factories import RoundJobFactory
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("status", [RoundJob.Status.PENDING, RoundJob.Status.RUNNING])
+def test_round_job_status_view_open_job(authenticated_client, user, status):
+    """Test an open job renders the polling element again."""
+    job = RoundJobFactory(savegame__user=user, status=status)
+
+    response = authenticated_client.get(reverse("round:job-status", kwargs={"pk": job.pk}))
+
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert reverse("round:job-status", kwargs={"pk": job.pk}) in content
+    assert 'hx-trigger="every 1s"' in content
+    assert "HX-Trigger" not in response
+
+
+@pytest.mark.django_db
+def test_round_job_status_view_done_job(authenticated_client, user):
+    """Test a finished job stops polling and refreshes the UI."""
+    job = RoundJobFactory(savegame__user=user, status=RoundJob.Status.DONE)
+
+    response = authenticated_client.get(reverse("round:job-status", kwargs={"pk": job.pk}))
+
+    assert response.status_code == 200
+    assert "hx-get" not in response.content.decode()
+    assert json.loads(response["HX-Trigger"]) == {"refreshMap": "-", "updateNavbarValues": "-"}
+
+
+@pytest.mark.django_db
+def test_round_job_status_view_done_job_with_notifications(authenticated_client, user):
+    """Test a finished job with notifications redirects to the notification board."""
+    job = RoundJobFactory(savegame__user=user, status=RoundJob.Status.DONE, has_notifications=True)
+
+    response = authenticated_client.get(reverse("round:job-status", kwargs={"pk": job.pk}))
+
+    assert response["HX-Redirect"] == reverse("event:notification-board")
+
+
+@pytest.mark.django_db
+def test_round_job_status_view_failed_job(authenticated_client, user):
+    """Test a failed job stops polling and shows an error."""
+    job = RoundJobFactory(savegame__user=user, status=RoundJob.Status.FAILED)
+
+    response = authenticated_client.get(reverse("round:job-status", kwargs={"pk": job.pk}))
+
+    content = response.content.decode()
+    assert "The round could not be finished." in content
+    assert "hx-get" not in content
+    assert "HX-Trigger" not in response
+
+
+@pytest.mark.django_db
+def test_round_job_status_view_foreign_job(authenticated_client):
+    """Test jobs of other users are not found."""
+    job = RoundJobFactory()
+
+    response = authenticated_client.get(reverse("round:job-status", kwargs={"pk": job.pk}))
+
+    assert response.status_code == 404
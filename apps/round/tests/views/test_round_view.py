@@ -4,7 +4,11 @@ from unittest import mock
 import pytest
 from django.urls import reverse
 
+from apps.account.tests.factories import UserFactory
+from apps.event.tests.factories import EventNotificationFactory
+from apps.round.models import RoundJob
 from apps.round.views import RoundView
+from apps.savegame.tests.factories import SavegameFactory
 
 
 @pytest.mark.django_db
@@ -15,162 +19,67 @@ def test_round_view_http_method_names():
 
 
 @pytest.mark.django_db
-def test_round_view_post_with_events(request_factory):
-    """Test RoundView creates notifications for events and increments year."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame
-    user = UserFactory.create()
-    savegame = SavegameFactory(user=user, is_active=True, current_year=1150)
-
-    # Create mock events
-    mock_event1 = mock.Mock()
-    mock_event1.process.return_value = "Event 1 happened"
-    mock_event1.TITLE = "Event 1"
-
-    mock_event2 = mock.Mock()
-    mock_event2.process.return_value = "Event 2 happened"
-    mock_event2.TITLE = "Event 2"
-
-    events = [mock_event1, mock_event2]
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = events
-
-        # Mock NotificationCreationService
-        with mock.patch("apps.round.views.round_view.NotificationCreationService") as mock_notification_service:
-            # Create mock notifications
-            mock_notification_service.return_value.process.return_value = [mock.Mock(), mock.Mock()]
-
-            # Mock WallEnclosureService
-            with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-                mock_wall_service.return_value.process.return_value = True
-
-                # Create request and view
-                request = request_factory.post("/")
-                request.user = user
-                view = RoundView()
-                view.request = request
-
-                response = view.post(request)
-
-            # Verify year was incremented
-            savegame.refresh_from_db()
-            assert savegame.current_year == 1151
-
-            # Verify services were called
-            mock_service.assert_called_once_with(savegame=savegame)
-            mock_service_instance.process.assert_called_once()
-            mock_notification_service.assert_called_once_with(savegame=savegame, events=events)
-            mock_notification_service.return_value.process.assert_called_once()
-
-            # Verify response is successful
-            assert response.status_code == 200
-
-
-@pytest.mark.django_db
-def test_round_view_post_with_no_events(request_factory):
-    """Test RoundView handles case when no events occur."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame
+def test_round_view_post_plays_round(request_factory):
+    """Test RoundView plays the round of the active savegame via the RoundEngineService."""
     user = UserFactory.create()
     savegame = SavegameFactory(user=user, is_active=True)
 
-    # Mock EventSelectionService to return empty list
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = []
 
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
+        request = request_factory.post("/")
+        request.user = user
+        view = RoundView()
+        view.request = request
 
-            # Create request and view
-            request = request_factory.post("/")
-            request.user = user
-            view = RoundView()
-            view.request = request
+        response = view.post(request)
 
-            response = view.post(request)
-
-        # Verify service was called
-        mock_service.assert_called_once_with(savegame=savegame)
-        mock_service_instance.process.assert_called_once()
-
-        # Verify response triggers UI updates (no redirect)
-        assert response.status_code == 200
-        assert "HX-Trigger" in response
-        hx_trigger = json.loads(response["HX-Trigger"])
-        assert "refreshMap" in hx_trigger
-        assert "updateNavbarValues" in hx_trigger
+    mock_engine.assert_called_once_with(savegame=savegame)
+    mock_engine.return_value.process.assert_called_once()
+    assert response.status_code == 200
 
 
 @pytest.mark.django_db
 def test_round_view_post_response_headers(request_factory):
-    """Test RoundView sets correct HTMX trigger headers."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame
+    """Test RoundView sets correct HTMX trigger headers if no notifications were created."""
     user = UserFactory.create()
     SavegameFactory(user=user, is_active=True)
 
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = []
 
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
+        request = request_factory.post("/")
+        request.user = user
+        view = RoundView()
+        view.request = request
 
-            # Create request and view
-            request = request_factory.post("/")
-            request.user = user
-            view = RoundView()
-            view.request = request
+        response = view.post(request)
 
-            response = view.post(request)
-
-        # Verify response headers
-        assert response.status_code == 200
-        assert "HX-Trigger" in response
-
-        hx_trigger = json.loads(response["HX-Trigger"])
-        assert hx_trigger == {
-            "refreshMap": "-",
-            "updateNavbarValues": "-",
-        }
+    assert response.status_code == 200
+    assert "HX-Redirect" not in response
+    hx_trigger = json.loads(response["HX-Trigger"])
+    assert hx_trigger == {
+        "refreshMap": "-",
+        "updateNavbarValues": "-",
+    }
 
 
 @pytest.mark.django_db
 def test_round_view_post_via_client(authenticated_client, user):
-    """Test RoundView responds correctly via Django test client."""
-    from apps.savegame.tests.factories import SavegameFactory
-
-    # Create savegame
-    SavegameFactory(user=user, is_active=True)
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
+    """Test RoundView plays a real round via Django test client."""
+    savegame = SavegameFactory(user=user, is_active=True, current_year=1150)
 
-            response = authenticated_client.post(reverse("round:finish"))
+    with mock.patch("apps.round.services.round_engine.EventSelectionService") as mock_selection:
+        mock_selection.return_value.process.return_value = []
 
-            # Verify successful response
-            assert response.status_code == 200
-            assert "HX-Trigger" in response
+        response = authenticated_client.post(reverse("round:finish"))
 
-            hx_trigger = json.loads(response["HX-Trigger"])
-            assert "refreshMap" in hx_trigger
-            assert "updateNavbarValues" in hx_trigger
+    assert response.status_code == 200
+    hx_trigger = json.loads(response["HX-Trigger"])
+    assert "refreshMap" in hx_trigger
+    assert "updateNavbarValues" in hx_trigger
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1151
 
 
 @pytest.mark.django_db
@@ -180,107 +89,11 @@ def test_round_view_get_not_allowed(authenticated_client):
     assert response.status_code == 405  # Method Not Allowed
 
 
-@pytest.mark.django_db
-def test_round_view_event_processing_order(request_factory):
-    """Test RoundView processes events in the order returned by service."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame
-    user = UserFactory.create()
-    SavegameFactory(user=user, is_active=True)
-
-    # Create mock events with different processing order
-    mock_event1 = mock.Mock()
-    mock_event1.process.return_value = "First event"
-    mock_event1.TITLE = "First"
-
-    mock_event2 = mock.Mock()
-    mock_event2.process.return_value = "Second event"
-    mock_event2.TITLE = "Second"
-
-    events = [mock_event1, mock_event2]
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = events
-
-        # Mock NotificationCreationService to track event order
-        with mock.patch("apps.round.views.round_view.NotificationCreationService") as mock_notification_service:
-            # Mock WallEnclosureService
-            with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-                mock_wall_service.return_value.process.return_value = True
-
-                # Create request and view
-                request = request_factory.post("/")
-                request.user = user
-                view = RoundView()
-                view.request = request
-
-                # Track call order
-                call_order = []
-                mock_event1.process.side_effect = lambda: call_order.append("event1")
-                mock_event2.process.side_effect = lambda: call_order.append("event2")
-
-                view.post(request)
-
-            # Verify events were passed to notification service in correct order
-            mock_notification_service.assert_called_once()
-            call_args = mock_notification_service.call_args
-            assert call_args[1]["events"] == events
-
-
-@pytest.mark.django_db
-def test_round_view_single_event(request_factory):
-    """Test RoundView handles single event correctly."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame
-    user = UserFactory.create()
-    savegame = SavegameFactory(user=user, is_active=True)
-
-    # Create single mock event
-    mock_event = mock.Mock()
-    mock_event.process.return_value = "Single event occurred"
-    mock_event.TITLE = "Single Event"
-
-    events = [mock_event]
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = events
-
-        # Mock NotificationCreationService
-        with mock.patch("apps.round.views.round_view.NotificationCreationService") as mock_notification_service:
-            # Mock WallEnclosureService
-            with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-                mock_wall_service.return_value.process.return_value = True
-
-                # Create request and view
-                request = request_factory.post("/")
-                request.user = user
-                view = RoundView()
-                view.request = request
-
-                response = view.post(request)
-
-            # Verify notification service was called
-            mock_notification_service.assert_called_once_with(savegame=savegame, events=events)
-
-            # Verify response is successful
-            assert response.status_code == 200
-
-
 @pytest.mark.django_db
 def test_round_view_no_active_savegame(request_factory):
     """Test RoundView returns 400 when no active savegame found."""
-    from apps.account.tests.factories import UserFactory
-
-    # Create user without active savegame
     user = UserFactory.create()
 
-    # Create request and view
     request = request_factory.post("/")
     request.user = user
     view = RoundView()
@@ -288,95 +101,23 @@ def test_round_view_no_active_savegame(request_factory):
 
     response = view.post(request)
 
-    # Verify error response
     assert response.status_code == 400
     assert response.content == b"No active savegame found"
 
 
-@pytest.mark.django_db
-def test_round_view_increments_year(request_factory):
-    """Test RoundView increments the current year."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame with initial year
-    user = UserFactory.create()
-    savegame = SavegameFactory(user=user, is_active=True, current_year=1150)
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
-
-            # Create request and view
-            request = request_factory.post("/")
-            request.user = user
-            view = RoundView()
-            view.request = request
-
-            response = view.post(request)
-
-        # Verify year was incremented
-        savegame.refresh_from_db()
-        assert savegame.current_year == 1151
-
-        # Verify successful response
-        assert response.status_code == 200
-
-
-@pytest.mark.django_db
-def test_round_view_triggers_navbar_update(request_factory):
-    """Test RoundView triggers navbar update event."""
-    from apps.savegame.tests.factories import SavegameFactory, UserFactory
-
-    # Create user and savegame with initial year
-    user = UserFactory.create()
-    savegame = SavegameFactory(user=user, is_active=True, current_year=1150)
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
-
-            # Create request and view
-            request = request_factory.post("/")
-            request.user = user
-            view = RoundView()
-            view.request = request
-
-            response = view.post(request)
-
-        # Verify year was incremented
-        savegame.refresh_from_db()
-        assert savegame.current_year == 1151
-
-        # Verify updateNavbarValues event is triggered
-        assert response.status_code == 200
-        hx_trigger = json.loads(response["HX-Trigger"])
-        assert "updateNavbarValues" in hx_trigger
-
-
 # Notification Blocking Tests
 @pytest.mark.django_db
 def test_round_view_prevents_round_progression_with_unacknowledged_notifications(authenticated_client, user):
     """Test that round cannot be finished when there are unacknowledged notifications."""
-    from apps.event.tests.factories import EventNotificationFactory
-    from apps.savegame.tests.factories import SavegameFactory
-
     savegame = SavegameFactory.create(user=user, is_active=True, current_year=1200)
     EventNotificationFactory.create(savegame=savegame, acknowledged=False)
 
-    response = authenticated_client.post(reverse("round:finish"))
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        response = authenticated_client.post(reverse("round:finish"))
 
     assert response.status_code == 400
     assert "acknowledge all notifications" in response.content.decode().lower()
+    mock_engine.assert_not_called()
 
     # Year should not have incremented
     savegame.refresh_from_db()
@@ -386,118 +127,79 @@ def test_round_view_prevents_round_progression_with_unacknowledged_notifications
 @pytest.mark.django_db
 def test_round_view_allows_round_progression_with_acknowledged_notifications(authenticated_client, user):
     """Test that round can be finished when all notifications are acknowledged."""
-    from apps.event.tests.factories import EventNotificationFactory
-    from apps.savegame.tests.factories import SavegameFactory
-
     savegame = SavegameFactory.create(user=user, is_active=True, current_year=1200)
     EventNotificationFactory.create(savegame=savegame, acknowledged=True)
 
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
-
-            response = authenticated_client.post(reverse("round:finish"))
-
-            assert response.status_code == 200
-
-            # Year should have incremented
-            savegame.refresh_from_db()
-            assert savegame.current_year == 1201
-
-
-@pytest.mark.django_db
-def test_round_view_allows_round_progression_with_no_notifications(authenticated_client, user):
-    """Test that round can be finished when there are no notifications at all."""
-    from apps.savegame.tests.factories import SavegameFactory
-
-    savegame = SavegameFactory.create(user=user, is_active=True, current_year=1200)
-
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
-
-            response = authenticated_client.post(reverse("round:finish"))
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = []
 
-            assert response.status_code == 200
+        response = authenticated_client.post(reverse("round:finish"))
 
-            # Year should have incremented
-            savegame.refresh_from_db()
-            assert savegame.current_year == 1201
+    assert response.status_code == 200
+    mock_engine.assert_called_once_with(savegame=savegame)
 
 
 @pytest.mark.django_db
 def test_round_view_checks_only_current_savegame_notifications(authenticated_client, user):
     """Test that only current savegame's notifications are checked."""
-    from apps.event.tests.factories import EventNotificationFactory
-    from apps.savegame.tests.factories import SavegameFactory
-
     savegame1 = SavegameFactory.create(user=user, is_active=True, current_year=1200)
     savegame2 = SavegameFactory.create(user=user, is_active=False, current_year=1150)
 
     # Create unacknowledged notification for inactive savegame
     EventNotificationFactory.create(savegame=savegame2, acknowledged=False)
 
-    # Mock EventSelectionService
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = []
-
-        # Mock WallEnclosureService
-        with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-            mock_wall_service.return_value.process.return_value = True
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = []
 
-            # Should succeed since active savegame has no unacknowledged notifications
-            response = authenticated_client.post(reverse("round:finish"))
+        # Should succeed since active savegame has no unacknowledged notifications
+        response = authenticated_client.post(reverse("round:finish"))
 
-            assert response.status_code == 200
-            savegame1.refresh_from_db()
-            assert savegame1.current_year == 1201
+    assert response.status_code == 200
+    mock_engine.assert_called_once_with(savegame=savegame1)
 
 
 @pytest.mark.django_db
 def test_round_view_redirects_to_notification_board_after_creating_notifications(authenticated_client, user):
     """Test that round view redirects to notification board when new notifications are created."""
-    from apps.event.tests.factories import EventNotificationFactory
-    from apps.savegame.tests.factories import SavegameFactory
-
     savegame = SavegameFactory.create(user=user, is_active=True, current_year=1200)
 
-    # Create mock events
-    mock_event = mock.Mock()
-    mock_event.process.return_value = "Event happened"
-    mock_event.TITLE = "Event"
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        mock_engine.return_value.process.return_value = [EventNotificationFactory.build(savegame=savegame)]
 
-    # Mock EventSelectionService to return events
-    with mock.patch("apps.round.views.round_view.EventSelectionService") as mock_service:
-        mock_service_instance = mock_service.return_value
-        mock_service_instance.process.return_value = [mock_event]
+        response = authenticated_client.post(reverse("round:finish"))
 
-        # Mock NotificationCreationService to simulate creating notifications
-        def create_notification(*args, **kwargs):
-            # Create notification when the service's process() is called
-            EventNotificationFactory.create(savegame=savegame, acknowledged=False)
-            return []
+    assert response.status_code == 200
+    assert "HX-Redirect" in response
+    assert response["HX-Redirect"] == reverse("event:notification-board")
 
-        with mock.patch("apps.round.views.round_view.NotificationCreationService") as mock_notif_service:
-            mock_notif_service.return_value.process.side_effect = create_notification
 
-            # Mock WallEnclosureService
-            with mock.patch("apps.round.views.round_view.WallEnclosureService") as mock_wall_service:
-                mock_wall_service.return_value.process.return_value = True
+@pytest.mark.django_db
+def test_round_view_async_enqueues_job(authenticated_client, user, settings):
+    """Test that asynchronous round processing enqueues a job and returns the polling element."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory.create(user=user, is_active=True, current_year=1200)
+
+    with mock.patch("apps.round.views.round_view.RoundEngineService") as mock_engine:
+        response = authenticated_client.post(reverse("round:finish"))
 
-                response = authenticated_client.post(reverse("round:finish"))
+    mock_engine.assert_not_called()
+    job = RoundJob.objects.get(savegame=savegame)
+    assert response.status_code == 202
+    content = response.content.decode()
+    assert reverse("round:job-status", kwargs={"pk": job.pk}) in content
+    assert 'hx-swap-oob="true"' in content
+    savegame.refresh_from_db()
+    assert savegame.current_year == 1200
+
+
+@pytest.mark.django_db
+def test_round_view_async_reuses_open_job(authenticated_client, user, settings):
+    """Test that finishing the round again while a job is open doesn't enqueue a second one."""
+    settings.ROUND_PROCESSING_ASYNC = True
+    savegame = SavegameFactory.create(user=user, is_active=True)
+
+    authenticated_client.post(reverse("round:finish"))
+    response = authenticated_client.post(reverse("round:finish"))
 
-                # Should redirect to notification board
-                assert response.status_code == 200
-                assert "HX-Redirect" in response
-                assert response["HX-Redirect"] == reverse("event:notification-board")
+    assert response.status_code == 202
+    assert RoundJob.objects.filter(savegame=savegame).count() == 1
@@ -6,4 +6,5 @@ app_name = "round"
 
 urlpatterns = [
     path("finish/", views.RoundView.as_view(), name="finish"),
+    path("jobs/<int:pk>/", views.RoundJobStatusView.as_view(), name="job-status"),
 ]
@@ -1,3 +1,4 @@
+from apps.round.views.round_job_status_view import RoundJobStatusView
 from apps.round.views.round_view import RoundView
 
-__all__ = ["RoundView"]
+__all__ = ["RoundJobStatusView", "RoundView"]
@@ -0,0 +1,21 @@
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.views import generic
+
+from apps.round.models import RoundJob
+from apps.round.views.round_view import get_round_finished_response
+
+
+class RoundJobStatusView(generic.View):
+    """Polled by the client while a round job of the `round_worker` is open."""
+
+    http_method_names = ("get",)
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        job = get_object_or_404(RoundJob, pk=kwargs["pk"], savegame__user=request.user)
+        content = render_to_string("round/partials/_round_job.html", {"job": job}, request=request)
+
+        if job.status == RoundJob.Status.DONE:
+            return get_round_finished_response(has_notifications=job.has_notifications, content=content)
+        return HttpResponse(content)
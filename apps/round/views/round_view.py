@@ -1,22 +1,41 @@
 import json
 from http import HTTPStatus
 
+from django.conf import settings
 from django.http import HttpResponse
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.views import generic
 
-from apps.city.services.wall.decay import WallDecayService
-from apps.city.services.wall.enclosure import WallEnclosureService
-from apps.event.services.notification_creation import NotificationCreationService
-from apps.event.services.selection import EventSelectionService
-from apps.savegame.models import Savegame
+from apps.round.models import RoundJob
+from apps.round.services.round_engine import RoundEngineService
+from apps.savegame.selectors.savegame import get_active_savegame
+
+
+def get_round_finished_response(*, has_notifications: bool, content: str = "") -> HttpResponse:
+    """Response after a finished round, shows the new notifications or refreshes the UI."""
+    response = HttpResponse(content, status=HTTPStatus.OK)
+
+    if has_notifications:
+        # Redirect to notification board
+        response["HX-Redirect"] = reverse("event:notification-board")
+    else:
+        # No notifications, just refresh the UI
+        response["HX-Trigger"] = json.dumps(
+            {
+                "refreshMap": "-",
+                "updateNavbarValues": "-",
+            }
+        )
+
+    return response
 
 
 class RoundView(generic.View):
     http_method_names = ("post",)
 
     def post(self, request, *args, **kwargs) -> HttpResponse:
-        savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+        savegame = get_active_savegame(request=request)
         if not savegame:
             return HttpResponse("No active savegame found", status=400)
 
@@ -25,39 +44,12 @@ class RoundView(generic.View):
         if has_unacknowledged:
             return HttpResponse("Please acknowledge all notifications before finishing the round", status=400)
 
-        # Increment the year
-        savegame.current_year += 1
-        savegame.save()
-
-        # Select events that should occur this round
-        events = EventSelectionService(savegame=savegame).process()
-
-        # Create persistent notifications from events
-        if events:
-            NotificationCreationService(savegame=savegame, events=events).process()
-
-        # Decay wall hitpoints each round
-        WallDecayService(savegame=savegame).process()
-
-        # Update enclosure status after events (in case buildings were removed)
-        savegame.is_enclosed = WallEnclosureService(savegame=savegame).process()
-        savegame.save()
-
-        # Check if there are unacknowledged notifications
-        has_notifications = savegame.event_notifications.filter(acknowledged=False).exists()
-
-        response = HttpResponse(status=HTTPStatus.OK)
-
-        if has_notifications:
-            # Redirect to notification board
-            response["HX-Redirect"] = reverse("event:notification-board")
-        else:
-            # No notifications, just refresh the UI
-            response["HX-Trigger"] = json.dumps(
-                {
-                    "refreshMap": "-",
-                    "updateNavbarValues": "-",
-                }
-            )
+        if settings.ROUND_PROCESSING_ASYNC:
+            # A worker finishes the round, the client polls the job until it is done
+            job = RoundJob.objects.enqueue(savegame=savegame)
+            content = render_to_string("round/partials/_round_job.html", {"job": job, "oob": True}, request=request)
+            return HttpResponse(content, status=HTTPStatus.ACCEPTED)
 
-        return response
+        # All notifications were acknowledged before, so every notification of this round is new
+        notifications = RoundEngineService(savegame=savegame).process()
+        return get_round_finished_response(has_notifications=bool(notifications))
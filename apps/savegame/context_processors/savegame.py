@@ -1,39 +1,45 @@
-from apps.savegame.models import Savegame
+from django.utils.functional import SimpleLazyObject
+
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 def get_current_savegame(request) -> dict:
+    """
+    Provide the active savegame and its derived values to all templates.
+
+    The derived values are lazy and only calculated if a template accesses them. The context is memoized on the
+    request, so rendering several templates within one request doesn't repeat any work.
+    """
+    if not hasattr(request, "_current_savegame_context"):
+        request._current_savegame_context = _build_savegame_context(request=request)
+    return request._current_savegame_context
+
+
+def _build_savegame_context(*, request) -> dict:
     # Import here to avoid circular imports
-    from apps.city.services.building.housing import BuildingHousingService
-    from apps.city.services.defense.calculation import DefenseCalculationService
-    from apps.city.services.prestige import PrestigeCalculationService
-
-    savegame = None
-    is_enclosed = False
-    max_housing_space = 0
-    defense_value = 0
-    prestige = 0
-    unacknowledged_notifications_count = 0
-    if hasattr(request, "user") and request.user.is_authenticated:
-        savegame = (
-            Savegame.objects.filter(user=request.user, is_active=True)
-            .prefetch_related(
-                "tiles__terrain",
-                "tiles__building",
-                "tiles__building__building_type",
-            )
-            .first()
-        )
-        if savegame:
-            is_enclosed = savegame.is_enclosed
-            max_housing_space = BuildingHousingService(savegame=savegame).calculate_max_space()
-            defense_value = DefenseCalculationService(savegame=savegame).process()
-            prestige = PrestigeCalculationService(savegame=savegame).process()
-            unacknowledged_notifications_count = savegame.event_notifications.filter(acknowledged=False).count()
+    from apps.city.selectors.city_stats import get_city_stats
+
+    # Shares the savegame which the middleware or the view already resolved for this request
+    savegame = get_active_savegame(request=request)
+    if savegame is None:
+        return {
+            "savegame": None,
+            "is_enclosed": False,
+            "max_housing_space": 0,
+            "defense_value": 0,
+            "prestige": 0,
+            "unacknowledged_notifications_count": 0,
+        }
+
+    # All derived values are read from the materialized statistics, loaded once on first access
+    city_stats = SimpleLazyObject(lambda: get_city_stats(savegame=savegame))
     return {
         "savegame": savegame,
-        "is_enclosed": is_enclosed,
-        "max_housing_space": max_housing_space,
-        "defense_value": defense_value,
-        "prestige": prestige,
-        "unacknowledged_notifications_count": unacknowledged_notifications_count,
+        "is_enclosed": savegame.is_enclosed,
+        "max_housing_space": SimpleLazyObject(lambda: city_stats.housing_space),
+        "defense_value": SimpleLazyObject(lambda: city_stats.defense),
+        "prestige": SimpleLazyObject(lambda: city_stats.prestige),
+        "unacknowledged_notifications_count": SimpleLazyObject(
+            lambda: savegame.event_notifications.filter(acknowledged=False).count()
+        ),
     }
@@ -1,5 +1,14 @@
+import typing
+from collections.abc import Iterable
+
+from django.core.cache import caches
 from django.db import models
-from django.db.models import Sum
+from django.db.models import F
+
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
+
+if typing.TYPE_CHECKING:
+    from apps.savegame.models import Savegame
 
 
 class SavegameQuerySet(models.QuerySet):
@@ -7,17 +16,42 @@ class SavegameQuerySet(models.QuerySet):
 
 
 class SavegameManager(models.Manager):
-    def aggregate_taxes(self, *, savegame) -> int:
-        """Aggregate total tax income from all buildings in the savegame."""
-        result = savegame.tiles.aggregate(sum_taxes=Sum("building__taxes"))["sum_taxes"]
-        # Avoid leaking None from ORM
-        return result if result is not None else 0
-
-    def aggregate_maintenance_costs(self, *, savegame) -> int:
-        """Aggregate total maintenance costs from all buildings in the savegame."""
-        result = savegame.tiles.aggregate(sum_maintenance=Sum("building__maintenance_costs"))["sum_maintenance"]
-        # Avoid leaking None from ORM
-        return result if result is not None else 0
+    CHANGED_TILES_CACHE_NAME = "changed-tiles"
+
+    def get_active(self, *, user) -> "Savegame | None":
+        """Active savegame of the given user or None, served by the partial index on active savegames."""
+        return self.filter(user=user, is_active=True).first()
+
+    def bump_map_revision(self, *, savegame, changed_tile_ids: Iterable[int] | None = None) -> None:
+        """
+        Increase the map revision of the savegame. Has to be called whenever a tile of the savegame changes.
+        The ids of the changed tiles are remembered for the new revision in the cache shared by all processes, so the
+        changes of e.g. the `round_worker` reach every web worker. Without them, the whole map counts as changed.
+        """
+        self.filter(pk=savegame.pk).update(map_revision=F("map_revision") + 1)
+        savegame.map_revision = self.filter(pk=savegame.pk).values_list("map_revision", flat=True).get()
+        if changed_tile_ids is not None:
+            caches[SHARED_CACHE_ALIAS].set(
+                savegame.get_map_cache_key(name=self.CHANGED_TILES_CACHE_NAME), list(changed_tile_ids)
+            )
+
+    def get_changed_tile_ids(self, *, savegame, since_revision: int, max_revisions: int) -> set[int] | None:
+        """
+        Collect the ids of all tiles which changed after the given map revision.
+        Returns None if the changes are not completely known, e.g. if too many revisions passed or the whole map
+        changed.
+        """
+        if not 0 <= savegame.map_revision - since_revision <= max_revisions:
+            return None
+
+        cache_keys = [
+            savegame.get_map_cache_key(name=self.CHANGED_TILES_CACHE_NAME, revision=revision)
+            for revision in range(since_revision + 1, savegame.map_revision + 1)
+        ]
+        changes = caches[SHARED_CACHE_ALIAS].get_many(cache_keys)
+        if len(changes) != len(cache_keys):
+            return None
+        return set().union(*changes.values())
 
 
 SavegameManager = SavegameManager.from_queryset(SavegameQuerySet)
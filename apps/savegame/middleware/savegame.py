@@ -0,0 +1,20 @@
+from django.http import HttpResponse
+from django.utils.functional import SimpleLazyObject
+
+from apps.savegame.selectors.savegame import get_active_savegame
+
+
+class ActiveSavegameMiddleware:
+    """
+    Expose the active savegame of the user lazily as `request.savegame`, like `request.user` of Django.
+
+    It's only queried once it's accessed and at most once per request, views, mixins and context processors share it
+    via `get_active_savegame()`. Has to be placed after the `AuthenticationMiddleware`.
+    """
+
+    def __init__(self, get_response) -> None:  # noqa: PBR001
+        self.get_response = get_response
+
+    def __call__(self, request) -> HttpResponse:  # noqa: PBR001
+        request.savegame = SimpleLazyObject(lambda: get_active_savegame(request=request))
+        return self.get_response(request)
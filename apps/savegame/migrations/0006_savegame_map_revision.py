@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savegame', '0005_alter_savegame_coat_of_arms'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savegame',
+            name='map_revision',
+            field=models.PositiveIntegerField(default=0, help_text='Increased whenever a tile of this savegame changes.', verbose_name='Map revision'),
+        ),
+    ]
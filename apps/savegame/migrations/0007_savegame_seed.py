@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:03
+
+import apps.savegame.models.savegame
+from apps.savegame.models.savegame import generate_seed
+from django.db import migrations, models
+
+
+def populate_seeds(apps, schema_editor):
+    """Adding the field sets the same seed for all existing savegames, give each one its own."""
+    Savegame = apps.get_model("savegame", "Savegame")
+
+    savegames = list(Savegame.objects.only("id"))
+    for savegame in savegames:
+        savegame.seed = generate_seed()
+    Savegame.objects.bulk_update(savegames, ["seed"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savegame', '0006_savegame_map_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savegame',
+            name='seed',
+            field=models.PositiveBigIntegerField(default=apps.savegame.models.savegame.generate_seed, help_text='Base of all random decisions, replaying a round with it is identical.', verbose_name='Seed'),
+        ),
+        migrations.RunPython(populate_seeds, migrations.RunPython.noop),
+    ]
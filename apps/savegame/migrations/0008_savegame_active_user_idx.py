@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('savegame', '0007_savegame_seed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savegame',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user'], name='savegame_active_user_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.http import HttpResponse, HttpResponseRedirect
 from django.urls import reverse_lazy
 
-from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame
 
 
 class SavegameRequiredMixin:
@@ -13,7 +13,7 @@ class SavegameRequiredMixin:
 
     def dispatch(self, request, *args, **kwargs) -> HttpResponse:  # noqa: PBR001, PBR002
         if request.user.is_authenticated:
-            savegame = Savegame.objects.filter(user=request.user, is_active=True).first()
+            savegame = get_active_savegame(request=request)
             if not savegame:
                 return HttpResponseRedirect(reverse_lazy("savegame:savegame-list"))
         return super().dispatch(request, *args, **kwargs)
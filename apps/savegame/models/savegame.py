@@ -1,3 +1,6 @@
+import random
+import secrets
+
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -5,6 +8,11 @@ from django.db import models
 from apps.savegame.managers.savegame import SavegameManager
 
 
+def generate_seed() -> int:
+    """Random seed which fits into a signed 64 bit column."""
+    return secrets.randbits(63)
+
+
 class Savegame(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     city_name = models.CharField(max_length=100)
@@ -18,11 +26,49 @@ class Savegame(models.Model):
 
     is_active = models.BooleanField("Is active", default=False)
     is_enclosed = models.BooleanField("Is enclosed by wall", default=False)
+    map_revision = models.PositiveIntegerField(
+        "Map revision", default=0, help_text="Increased whenever a tile of this savegame changes."
+    )
+    seed = models.PositiveBigIntegerField(
+        "Seed", default=generate_seed, help_text="Base of all random decisions, replaying a round with it is identical."
+    )
 
     objects = SavegameManager()
 
     class Meta:
         default_related_name = "savegames"
+        indexes = (
+            # Every request looks up the active savegame of its user, inactive savegames are never part of it
+            models.Index(fields=("user",), condition=models.Q(is_active=True), name="savegame_active_user_idx"),
+        )
 
     def __str__(self) -> str:
         return self.city_name
+
+    def save(self, *args, **kwargs) -> None:
+        # The map revision is only changed via `SavegameManager.bump_map_revision()`, so saving an instance which was
+        # loaded before a tile changed must not reset it
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "map_revision"
+            ]
+        super().save(*args, **kwargs)
+
+    def get_map_cache_key(self, *, name: str, revision: int | None = None) -> str:
+        """
+        Cache key for data derived from the map of this savegame.
+        Becomes stale automatically as soon as a tile changes.
+        """
+        revision = self.map_revision if revision is None else revision
+        return f"savegame-{self.pk}-map-{revision}-{name}"
+
+    def get_random(self, *, stream: str, year: int | None = None) -> random.Random:
+        """
+        Random number generator for one stream of random decisions, like the events of a round or the map.
+        Derived from the seed, the year and the stream name, so every stream is reproducible and independent of the
+        global `random` module and of all other streams.
+        """
+        year = self.current_year if year is None else year
+        return random.Random(f"{self.seed}-{year}-{stream}")
@@ -1,8 +1,30 @@
 from collections import defaultdict
 
+from django.core.cache import cache
+from django.db.models import Count
+
+from apps.city.selectors.game_catalog import get_game_catalog_version
 from apps.savegame.models import Savegame
 
 
+def get_active_savegame(*, request) -> Savegame | None:
+    """
+    Active savegame of the requesting user.
+
+    Resolved on first access and memoized on the request, so it's queried at most once per request. The lazy
+    `request.savegame` of the `ActiveSavegameMiddleware` resolves it via this function as well.
+    """
+    if not hasattr(request, "_cached_savegame"):
+        user = getattr(request, "user", None)
+        request._cached_savegame = (
+            Savegame.objects.get_active(user=user) if user is not None and user.is_authenticated else None
+        )
+    return request._cached_savegame
+
+
+BALANCE_CACHE_NAME = "balance"
+
+
 def get_balance_data(*, savegame: Savegame) -> dict:
     """
     Calculate the balance per round for a savegame with detailed breakdown.
@@ -14,32 +36,69 @@ def get_balance_data(*, savegame: Savegame) -> dict:
     - balance: Net balance (taxes - maintenance)
     - tax_by_building_type: Dict mapping building type names to lists of building tax data
     - maintenance_by_building_type: Dict mapping building type names to lists of building maintenance data
-    """
-
-    # Use manager methods for aggregations
-    taxes = Savegame.objects.aggregate_taxes(savegame=savegame)
-    maintenance = Savegame.objects.aggregate_maintenance_costs(savegame=savegame)
 
-    # Get detailed breakdown by building type and building
-    tax_by_building_type = _get_tax_by_building_type(savegame=savegame)
-    maintenance_by_building_type = _get_maintenance_by_building_type(savegame=savegame)
+    Both breakdowns and totals are derived from a single grouped query. They are cached per map revision and version
+    of the game catalog, so changed taxes or maintenance costs of a building are picked up as well.
+    """
+    cache_key = savegame.get_map_cache_key(name=f"{BALANCE_CACHE_NAME}-{get_game_catalog_version()}")
+    balance_data = cache.get(cache_key)
+    if balance_data is None:
+        balance_data = _calculate_balance_data(savegame=savegame)
+        cache.set(cache_key, balance_data)
+
+    return {"savegame": savegame, **balance_data}
+
+
+def _calculate_balance_data(*, savegame: Savegame) -> dict:
+    # One row per building with the number of tiles it is placed on
+    rows = (
+        savegame.tiles.filter(building__isnull=False)
+        .values(
+            "building_id",
+            "building__name",
+            "building__level",
+            "building__taxes",
+            "building__maintenance_costs",
+            "building__building_type__name",
+        )
+        .annotate(count=Count("id"))
+        .order_by()
+    )
 
-    # Calculate balance
-    balance = taxes - maintenance
+    # Group by building type and building name
+    taxes_grouped = defaultdict(lambda: defaultdict(lambda: {"count": 0, "value": 0, "level": 0}))
+    maintenance_grouped = defaultdict(lambda: defaultdict(lambda: {"count": 0, "value": 0, "level": 0}))
+    # The breakdowns only list buildings with a value, the totals sum up all buildings like the round does
+    taxes = 0
+    maintenance = 0
+    for row in rows:
+        taxes += row["count"] * row["building__taxes"]
+        maintenance += row["count"] * row["building__maintenance_costs"]
+        for grouped, value in (
+            (taxes_grouped, row["building__taxes"]),
+            (maintenance_grouped, row["building__maintenance_costs"]),
+        ):
+            if value > 0:
+                data = grouped[row["building__building_type__name"]][row["building__name"]]
+                data["count"] += row["count"]
+                data["value"] = value
+                data["level"] = row["building__level"]
+
+    tax_by_building_type = _get_breakdown(grouped=taxes_grouped, value_name="taxes_per_building")
+    maintenance_by_building_type = _get_breakdown(grouped=maintenance_grouped, value_name="maintenance_per_building")
 
     return {
-        "savegame": savegame,
         "taxes": taxes,
         "maintenance": maintenance,
-        "balance": balance,
+        "balance": taxes - maintenance,
         "tax_by_building_type": tax_by_building_type,
         "maintenance_by_building_type": maintenance_by_building_type,
     }
 
 
-def _get_tax_by_building_type(*, savegame) -> dict:
+def _get_breakdown(*, grouped: dict, value_name: str) -> dict:
     """
-    Get tax income grouped by building type and then by individual buildings.
+    Convert the grouped buildings to a breakdown by building type and then by individual buildings.
 
     Returns a dict like:
     {
@@ -53,89 +112,19 @@ def _get_tax_by_building_type(*, savegame) -> dict:
         "Workshop": {...}
     }
     """
-    tiles = savegame.tiles.select_related("building__building_type").filter(building__isnull=False)
-
-    # Group by building type and building name
-    grouped = defaultdict(lambda: defaultdict(lambda: {"count": 0, "taxes": 0, "level": 0}))
-
-    for tile in tiles:
-        building = tile.building
-        if building.taxes > 0:
-            building_type_name = building.building_type.name
-            building_name = building.name
-            grouped[building_type_name][building_name]["count"] += 1
-            grouped[building_type_name][building_name]["taxes"] = building.taxes
-            grouped[building_type_name][building_name]["level"] = building.level
-
-    # Convert to final structure with subtotals
-    result = {}
-    for building_type_name, buildings in sorted(grouped.items()):
-        buildings_data = []
-        subtotal = 0
-        for building_name, data in sorted(buildings.items()):
-            total = data["count"] * data["taxes"]
-            subtotal += total
-            buildings_data.append(
-                {
-                    "name": building_name,
-                    "level": data["level"],
-                    "count": data["count"],
-                    "taxes_per_building": data["taxes"],
-                    "total": total,
-                }
-            )
-        result[building_type_name] = {
-            "buildings": buildings_data,
-            "subtotal": subtotal,
-        }
-
-    return result
-
-
-def _get_maintenance_by_building_type(*, savegame) -> dict:
-    """
-    Get maintenance costs grouped by building type and then by individual buildings.
-
-    Returns a dict like:
-    {
-        "House": {
-            "buildings": [
-                {"name": "Small House", "level": 1, "count": 3, "maintenance_per_building": 5, "total": 15},
-                {"name": "Large House", "level": 2, "count": 1, "maintenance_per_building": 10, "total": 10},
-            ],
-            "subtotal": 25
-        },
-        "Workshop": {...}
-    }
-    """
-    tiles = savegame.tiles.select_related("building__building_type").filter(building__isnull=False)
-
-    # Group by building type and building name
-    grouped = defaultdict(lambda: defaultdict(lambda: {"count": 0, "maintenance": 0, "level": 0}))
-
-    for tile in tiles:
-        building = tile.building
-        if building.maintenance_costs > 0:
-            building_type_name = building.building_type.name
-            building_name = building.name
-            grouped[building_type_name][building_name]["count"] += 1
-            grouped[building_type_name][building_name]["maintenance"] = building.maintenance_costs
-            grouped[building_type_name][building_name]["level"] = building.level
-
-    # Convert to final structure with subtotals
     result = {}
     for building_type_name, buildings in sorted(grouped.items()):
         buildings_data = []
         subtotal = 0
         for building_name, data in sorted(buildings.items()):
-            total = data["count"] * data["maintenance"]
+            total = data["count"] * data["value"]
             subtotal += total
             buildings_data.append(
                 {
                     "name": building_name,
                     "level": data["level"],
                     "count": data["count"],
-                    "maintenance_per_building": data["maintenance"],
+                    value_name: data["value"],
                     "total": total,
                 }
             )
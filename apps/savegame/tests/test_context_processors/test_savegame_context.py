@@ -1,5 +1,9 @@
 import pytest
 
+from apps.city.services.defense.calculation import DefenseCalculationService
+from apps.city.services.prestige import PrestigeCalculationService
+from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.event.tests.factories import EventNotificationFactory
 from apps.savegame.context_processors.savegame import get_current_savegame
 from apps.savegame.tests.factories import SavegameFactory
 
@@ -117,3 +121,52 @@ def test_get_current_savegame_returns_none_when_no_user_attribute(request_factor
     assert result["is_enclosed"] is False
     assert "max_housing_space" in result
     assert result["max_housing_space"] == 0
+
+
+@pytest.mark.django_db
+def test_get_current_savegame_derived_values_are_lazy(request_factory, user, django_assert_num_queries):
+    """Test get_current_savegame only loads the savegame until a derived value is accessed."""
+    SavegameFactory(user=user, is_active=True)
+
+    request = request_factory.get("/")
+    request.user = user
+
+    with django_assert_num_queries(1):
+        result = get_current_savegame(request)
+
+    assert result["savegame"] is not None
+
+
+@pytest.mark.django_db
+def test_get_current_savegame_derived_values(request_factory, user):
+    """Test get_current_savegame calculates the derived values on access."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    TileFactory(savegame=savegame, building=BuildingFactory(housing_space=4))
+    EventNotificationFactory(savegame=savegame, acknowledged=False)
+    EventNotificationFactory(savegame=savegame, acknowledged=True)
+
+    request = request_factory.get("/")
+    request.user = user
+
+    result = get_current_savegame(request)
+
+    assert result["max_housing_space"] == 4
+    assert result["defense_value"] == DefenseCalculationService(savegame=savegame).process()
+    assert result["prestige"] == PrestigeCalculationService(savegame=savegame).process()
+    assert result["unacknowledged_notifications_count"] == 1
+
+
+@pytest.mark.django_db
+def test_get_current_savegame_memoized_per_request(request_factory, user, django_assert_num_queries):
+    """Test get_current_savegame evaluates the context once per request."""
+    SavegameFactory(user=user, is_active=True)
+
+    request = request_factory.get("/")
+    request.user = user
+
+    result = get_current_savegame(request)
+    assert result["unacknowledged_notifications_count"] == 0
+
+    with django_assert_num_queries(0):
+        assert get_current_savegame(request) is result
+        assert result["unacknowledged_notifications_count"] == 0
@@ -1,7 +1,9 @@
 import pytest
+from django.core.cache import cache, caches
 
-from apps.city.tests.factories import BuildingFactory, TileFactory
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
 from apps.savegame.managers.savegame import SavegameManager
+from apps.savegame.models import Savegame
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -10,217 +12,101 @@ def test_savegame_manager_from_queryset():
     manager = SavegameManager()
 
     # Should have manager methods
-    assert hasattr(manager, "aggregate_taxes")
-    assert hasattr(manager, "aggregate_maintenance_costs")
+    assert hasattr(manager, "bump_map_revision")
+    assert hasattr(manager, "get_changed_tile_ids")
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_taxes_with_buildings():
-    """Test aggregate_taxes returns sum of taxes from all buildings."""
+def test_savegame_manager_bump_map_revision():
+    """Test bump_map_revision increases the revision in the database and on the instance."""
     savegame = SavegameFactory.create()
+    other_savegame = SavegameFactory.create()
 
-    # Create tiles with buildings that have taxes
-    building1 = BuildingFactory(taxes=10)
-    building2 = BuildingFactory(taxes=25)
-    building3 = BuildingFactory(taxes=15)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+    Savegame.objects.bump_map_revision(savegame=savegame)
 
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=building2)
-    TileFactory(savegame=savegame, building=building3)
-
-    result = SavegameManager().aggregate_taxes(savegame=savegame)
-
-    assert result == 50  # 10 + 25 + 15
-
-
-@pytest.mark.django_db
-def test_savegame_manager_aggregate_taxes_no_buildings():
-    """Test aggregate_taxes returns 0 when no buildings exist."""
-    savegame = SavegameFactory.create()
-
-    # Create tiles without buildings
-    TileFactory(savegame=savegame, building=None)
-    TileFactory(savegame=savegame, building=None)
-
-    result = SavegameManager().aggregate_taxes(savegame=savegame)
-
-    # Should return 0, not None
-    assert result == 0
-
-
-@pytest.mark.django_db
-def test_savegame_manager_aggregate_taxes_empty_savegame():
-    """Test aggregate_taxes returns 0 for savegame with no tiles."""
-    savegame = SavegameFactory.create()
-
-    result = SavegameManager().aggregate_taxes(savegame=savegame)
-
-    # Should return 0, not None
-    assert result == 0
-
-
-@pytest.mark.django_db
-def test_savegame_manager_aggregate_taxes_zero_taxes():
-    """Test aggregate_taxes handles buildings with zero taxes."""
-    savegame = SavegameFactory.create()
-
-    # Create buildings with zero taxes
-    building1 = BuildingFactory(taxes=0)
-    building2 = BuildingFactory(taxes=0)
-
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=building2)
-
-    result = SavegameManager().aggregate_taxes(savegame=savegame)
-
-    assert result == 0
+    assert savegame.map_revision == 2
+    assert Savegame.objects.get(pk=savegame.pk).map_revision == 2
+    assert Savegame.objects.get(pk=other_savegame.pk).map_revision == 0
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_taxes_mixed():
-    """Test aggregate_taxes with mix of buildings and empty tiles."""
+def test_savegame_manager_bump_map_revision_outdated_instance():
+    """Test bump_map_revision picks up revisions bumped via other instances."""
     savegame = SavegameFactory.create()
+    Savegame.objects.bump_map_revision(savegame=Savegame.objects.get(pk=savegame.pk))
 
-    # Create tiles with and without buildings
-    building1 = BuildingFactory(taxes=20)
-    building2 = BuildingFactory(taxes=30)
+    Savegame.objects.bump_map_revision(savegame=savegame)
 
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=None)
-    TileFactory(savegame=savegame, building=building2)
-    TileFactory(savegame=savegame, building=None)
-
-    result = SavegameManager().aggregate_taxes(savegame=savegame)
-
-    assert result == 50  # 20 + 30
+    assert savegame.map_revision == 2
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_maintenance_costs_with_buildings():
-    """Test aggregate_maintenance_costs returns sum of maintenance costs."""
+def test_savegame_manager_get_changed_tile_ids():
+    """Test get_changed_tile_ids collects the tiles changed in all revisions after the given one."""
     savegame = SavegameFactory.create()
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[1])
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[2, 3])
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[3])
 
-    # Create tiles with buildings that have maintenance costs
-    building1 = BuildingFactory(maintenance_costs=5)
-    building2 = BuildingFactory(maintenance_costs=8)
-    building3 = BuildingFactory(maintenance_costs=12)
-
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=building2)
-    TileFactory(savegame=savegame, building=building3)
-
-    result = SavegameManager().aggregate_maintenance_costs(savegame=savegame)
-
-    assert result == 25  # 5 + 8 + 12
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=10) == {1, 2, 3}
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=1, max_revisions=10) == {2, 3}
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=3, max_revisions=10) == set()
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_maintenance_costs_no_buildings():
-    """Test aggregate_maintenance_costs returns 0 when no buildings exist."""
+def test_savegame_manager_get_changed_tile_ids_shared_between_processes():
+    """Test the changed tiles are kept in the shared cache, so they survive the local cache of a process."""
     savegame = SavegameFactory.create()
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[1])
 
-    # Create tiles without buildings
-    TileFactory(savegame=savegame, building=None)
-    TileFactory(savegame=savegame, building=None)
-
-    result = SavegameManager().aggregate_maintenance_costs(savegame=savegame)
+    cache.clear()
 
-    # Should return 0, not None
-    assert result == 0
+    assert caches[SHARED_CACHE_ALIAS].get(savegame.get_map_cache_key(name="changed-tiles")) == [1]
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=10) == {1}
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_maintenance_costs_empty_savegame():
-    """Test aggregate_maintenance_costs returns 0 for savegame with no tiles."""
+def test_savegame_manager_get_changed_tile_ids_gap_too_large():
+    """Test get_changed_tile_ids gives up if more revisions than allowed passed."""
     savegame = SavegameFactory.create()
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[1])
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[2])
 
-    result = SavegameManager().aggregate_maintenance_costs(savegame=savegame)
-
-    # Should return 0, not None
-    assert result == 0
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=1) is None
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_maintenance_costs_zero_costs():
-    """Test aggregate_maintenance_costs handles buildings with zero costs."""
+def test_savegame_manager_get_changed_tile_ids_future_revision():
+    """Test get_changed_tile_ids gives up for revisions the savegame didn't reach yet."""
     savegame = SavegameFactory.create()
 
-    # Create buildings with zero maintenance costs
-    building1 = BuildingFactory(maintenance_costs=0)
-    building2 = BuildingFactory(maintenance_costs=0)
-
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=building2)
-
-    result = SavegameManager().aggregate_maintenance_costs(savegame=savegame)
-
-    assert result == 0
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=5, max_revisions=10) is None
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_maintenance_costs_mixed():
-    """Test aggregate_maintenance_costs with mix of buildings and empty tiles."""
+def test_savegame_manager_get_changed_tile_ids_whole_map_changed():
+    """Test get_changed_tile_ids gives up if a revision changed the whole map."""
     savegame = SavegameFactory.create()
+    Savegame.objects.bump_map_revision(savegame=savegame, changed_tile_ids=[1])
+    Savegame.objects.bump_map_revision(savegame=savegame)
 
-    # Create tiles with and without buildings
-    building1 = BuildingFactory(maintenance_costs=7)
-    building2 = BuildingFactory(maintenance_costs=13)
-
-    TileFactory(savegame=savegame, building=building1)
-    TileFactory(savegame=savegame, building=None)
-    TileFactory(savegame=savegame, building=building2)
-    TileFactory(savegame=savegame, building=None)
-
-    result = SavegameManager().aggregate_maintenance_costs(savegame=savegame)
-
-    assert result == 20  # 7 + 13
+    assert Savegame.objects.get_changed_tile_ids(savegame=savegame, since_revision=0, max_revisions=10) is None
 
 
 @pytest.mark.django_db
-def test_savegame_manager_aggregate_multiple_savegames():
-    """Test aggregate methods only count buildings from specified savegame."""
-    savegame1 = SavegameFactory.create()
-    savegame2 = SavegameFactory.create()
-
-    # Create buildings for savegame1
-    building1 = BuildingFactory(taxes=10, maintenance_costs=5)
-    building2 = BuildingFactory(taxes=20, maintenance_costs=8)
-
-    # Create buildings for savegame2
-    building3 = BuildingFactory(taxes=30, maintenance_costs=12)
-
-    TileFactory(savegame=savegame1, building=building1)
-    TileFactory(savegame=savegame1, building=building2)
-    TileFactory(savegame=savegame2, building=building3)
-
-    # Test savegame1
-    taxes1 = SavegameManager().aggregate_taxes(savegame=savegame1)
-    maintenance1 = SavegameManager().aggregate_maintenance_costs(savegame=savegame1)
-
-    assert taxes1 == 30  # 10 + 20
-    assert maintenance1 == 13  # 5 + 8
+def test_savegame_manager_get_active_returns_active_savegame(user):
+    """Test get_active returns the active savegame of the user and ignores inactive ones and other users."""
+    SavegameFactory(user=user, is_active=False)
+    SavegameFactory(is_active=True)
+    active = SavegameFactory(user=user, is_active=True)
 
-    # Test savegame2
-    taxes2 = SavegameManager().aggregate_taxes(savegame=savegame2)
-    maintenance2 = SavegameManager().aggregate_maintenance_costs(savegame=savegame2)
-
-    assert taxes2 == 30
-    assert maintenance2 == 12
+    assert Savegame.objects.get_active(user=user) == active
 
 
 @pytest.mark.django_db
-def test_savegame_manager_integration():
-    """Test SavegameManager works with actual model queries."""
-    from apps.savegame.models import Savegame
-
-    savegame = SavegameFactory.create()
-
-    building = BuildingFactory(taxes=15, maintenance_costs=7)
-    TileFactory(savegame=savegame, building=building)
-
-    # Test manager methods work on actual model
-    taxes = Savegame.objects.aggregate_taxes(savegame=savegame)
-    maintenance = Savegame.objects.aggregate_maintenance_costs(savegame=savegame)
+def test_savegame_manager_get_active_without_active_savegame(user):
+    """Test get_active returns None if the user has no active savegame."""
+    SavegameFactory(user=user, is_active=False)
 
-    assert taxes == 15
-    assert maintenance == 7
+    assert Savegame.objects.get_active(user=user) is None
@@ -0,0 +1,69 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.urls import reverse
+
+from apps.city.tests.factories import TileFactory
+from apps.savegame.middleware.savegame import ActiveSavegameMiddleware
+from apps.savegame.selectors.savegame import get_active_savegame
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_active_savegame_middleware_sets_savegame(request_factory, user):
+    """Test the middleware exposes the active savegame as request.savegame before calling the view."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    request = request_factory.get("/")
+    request.user = user
+    get_response = mock.Mock(return_value=HttpResponse())
+
+    response = ActiveSavegameMiddleware(get_response)(request)
+
+    assert response is get_response.return_value
+    get_response.assert_called_once_with(request)
+    assert request.savegame == savegame
+    assert request.savegame.pk == savegame.pk
+
+
+@pytest.mark.django_db
+def test_active_savegame_middleware_resolves_lazily(request_factory, user, django_assert_num_queries):
+    """Test the middleware doesn't query the savegame until request.savegame is accessed."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    request = request_factory.get("/")
+    request.user = user
+
+    with django_assert_num_queries(0):
+        ActiveSavegameMiddleware(mock.Mock(return_value=HttpResponse()))(request)
+
+    with django_assert_num_queries(1):
+        assert request.savegame.current_year == savegame.current_year
+        assert get_active_savegame(request=request) == savegame
+
+
+@pytest.mark.django_db
+def test_active_savegame_middleware_anonymous_user(request_factory):
+    """Test the middleware sets request.savegame to None for anonymous users."""
+    request = request_factory.get("/")
+    request.user = AnonymousUser()
+
+    ActiveSavegameMiddleware(mock.Mock(return_value=HttpResponse()))(request)
+
+    assert not request.savegame
+    assert get_active_savegame(request=request) is None
+
+
+@pytest.mark.django_db
+def test_active_savegame_middleware_resolves_once_per_request(client, user):
+    """Test a tile build request looks up the active savegame once for the mixin, the form and the view."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    tile = TileFactory(savegame=savegame, building=None)
+    client.force_login(user)
+
+    with mock.patch(
+        "apps.savegame.managers.savegame.SavegameManager.get_active", autospec=True, return_value=savegame
+    ) as get_active:
+        client.post(reverse("city:tile-build", kwargs={"pk": tile.pk}), data={"building": ""})
+
+    get_active.assert_called_once()
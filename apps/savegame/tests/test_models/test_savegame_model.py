@@ -0,0 +1,95 @@
+import pytest
+
+from apps.savegame.models import Savegame
+from apps.savegame.models.savegame import generate_seed
+from apps.savegame.tests.factories import SavegameFactory
+
+
+@pytest.mark.django_db
+def test_savegame_str():
+    """Test string representation is the city name."""
+    savegame = SavegameFactory.build(city_name="Nuremberg")
+
+    assert str(savegame) == "Nuremberg"
+
+
+@pytest.mark.django_db
+def test_savegame_save_does_not_reset_map_revision():
+    """Test that saving an outdated instance keeps the map revision bumped in the meantime."""
+    savegame = SavegameFactory.create()
+    outdated_savegame = Savegame.objects.get(pk=savegame.pk)
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    outdated_savegame.coins = 42
+    outdated_savegame.save()
+
+    savegame.refresh_from_db()
+    assert savegame.coins == 42
+    assert savegame.map_revision == 1
+
+
+@pytest.mark.django_db
+def test_savegame_save_with_update_fields():
+    """Test that explicit update_fields are passed on unchanged."""
+    savegame = SavegameFactory.create(coins=10, population=10)
+    savegame.coins = 20
+    savegame.population = 20
+
+    savegame.save(update_fields=["coins"])
+
+    savegame.refresh_from_db()
+    assert savegame.coins == 20
+    assert savegame.population == 10
+
+
+@pytest.mark.django_db
+def test_savegame_get_map_cache_key():
+    """Test the map cache key contains savegame, map revision and name."""
+    savegame = SavegameFactory.create()
+
+    assert savegame.get_map_cache_key(name="defense") == f"savegame-{savegame.pk}-map-0-defense"
+    assert savegame.get_map_cache_key(name="defense", revision=7) == f"savegame-{savegame.pk}-map-7-defense"
+
+    Savegame.objects.bump_map_revision(savegame=savegame)
+
+    assert savegame.get_map_cache_key(name="defense") == f"savegame-{savegame.pk}-map-1-defense"
+
+
+def test_generate_seed_fits_into_column():
+    """Test that generated seeds fit into a signed 64 bit column."""
+    assert all(0 <= generate_seed() < 2**63 for _ in range(20))
+
+
+@pytest.mark.django_db
+def test_savegame_seed_differs_per_savegame():
+    """Test that every savegame gets its own seed."""
+    assert SavegameFactory.create().seed != SavegameFactory.create().seed
+
+
+def test_savegame_get_random_is_reproducible():
+    """Test that the same seed, year and stream always give the same random numbers."""
+    first = SavegameFactory.build(seed=42, current_year=1150).get_random(stream="events")
+    second = SavegameFactory.build(seed=42, current_year=1150).get_random(stream="events")
+
+    assert [first.random() for _ in range(5)] == [second.random() for _ in range(5)]
+
+
+def test_savegame_get_random_streams_are_independent():
+    """Test that seed, year and stream name all change the random numbers."""
+    savegame = SavegameFactory.build(seed=42, current_year=1150)
+
+    values = {
+        savegame.get_random(stream="events").random(),
+        savegame.get_random(stream="map").random(),
+        savegame.get_random(stream="events", year=1151).random(),
+        SavegameFactory.build(seed=43, current_year=1150).get_random(stream="events").random(),
+    }
+
+    assert len(values) == 4
+
+
+def test_savegame_get_random_defaults_to_current_year():
+    """Test that the current year is used if no year is passed."""
+    savegame = SavegameFactory.build(seed=42, current_year=1150)
+
+    assert savegame.get_random(stream="events").random() == savegame.get_random(stream="events", year=1150).random()
@@ -1,7 +1,11 @@
 import pytest
+from django.contrib.auth.models import AnonymousUser
 
+from apps.city.models import Building
+from apps.city.selectors.game_catalog import invalidate_game_catalog
 from apps.city.tests.factories import BuildingFactory, TileFactory
-from apps.savegame.selectors.savegame import get_balance_data
+from apps.savegame.models import Savegame
+from apps.savegame.selectors.savegame import get_active_savegame, get_balance_data
 from apps.savegame.tests.factories import SavegameFactory
 
 
@@ -457,3 +461,113 @@ def test_get_balance_data_subtotals_calculated_correctly():
 
     # Check maintenance subtotal: (3 * 5) + (2 * 12) = 15 + 24 = 39
     assert result["maintenance_by_building_type"]["House"]["subtotal"] == 39
+
+
+@pytest.mark.django_db
+def test_get_balance_data_single_query(django_assert_num_queries):
+    """Test get_balance_data calculates totals and both breakdowns with a single query."""
+    savegame = SavegameFactory.create()
+    TileFactory.create_batch(3, savegame=savegame, building=BuildingFactory(taxes=10, maintenance_costs=2))
+    TileFactory(savegame=savegame, building=BuildingFactory(taxes=0, maintenance_costs=5))
+
+    with django_assert_num_queries(1):
+        result = get_balance_data(savegame=savegame)
+
+    assert result["taxes"] == 30
+    assert result["maintenance"] == 11
+    assert result["balance"] == 19
+
+
+@pytest.mark.django_db
+def test_get_balance_data_cached_per_map_revision(django_assert_num_queries):
+    """Test get_balance_data is served from the cache until the map revision changes."""
+    savegame = SavegameFactory.create()
+    tile = TileFactory(savegame=savegame, building=BuildingFactory(taxes=10, maintenance_costs=0))
+    get_balance_data(savegame=savegame)
+
+    with django_assert_num_queries(0):
+        cached = get_balance_data(savegame=savegame)
+
+    tile.building = BuildingFactory(taxes=25, maintenance_costs=0)
+    tile.save()
+    Savegame.objects.bump_map_revision(savegame=savegame)
+    result = get_balance_data(savegame=savegame)
+
+    assert cached["taxes"] == 10
+    assert cached["savegame"] is savegame
+    assert result["taxes"] == 25
+
+
+@pytest.mark.django_db
+def test_get_balance_data_cache_invalidated_by_game_catalog():
+    """Test get_balance_data picks up changed taxes of a building, e.g. via the admin, for the same map revision."""
+    savegame = SavegameFactory.create()
+    building = BuildingFactory(taxes=10, maintenance_costs=0)
+    TileFactory(savegame=savegame, building=building)
+    get_balance_data(savegame=savegame)
+
+    building.taxes = 15
+    building.save()
+    result = get_balance_data(savegame=savegame)
+
+    assert result["taxes"] == 15
+
+
+@pytest.mark.django_db
+def test_get_balance_data_cache_uses_game_catalog_version():
+    """Test get_balance_data recalculates once the game catalog was invalidated in another process."""
+    savegame = SavegameFactory.create()
+    building = BuildingFactory(taxes=10, maintenance_costs=0)
+    TileFactory(savegame=savegame, building=building)
+    get_balance_data(savegame=savegame)
+
+    Building.objects.filter(pk=building.pk).update(taxes=20)
+    invalidate_game_catalog()
+    result = get_balance_data(savegame=savegame)
+
+    assert result["taxes"] == 20
+
+
+@pytest.mark.django_db
+def test_get_active_savegame_resolves_once(request_factory, user, django_assert_num_queries):
+    """Test get_active_savegame queries the active savegame once and memoizes it on the request."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    request = request_factory.get("/")
+    request.user = user
+
+    with django_assert_num_queries(1):
+        first = get_active_savegame(request=request)
+        second = get_active_savegame(request=request)
+
+    assert first == savegame
+    assert second is first
+    assert request._cached_savegame is first
+
+
+@pytest.mark.django_db
+def test_get_active_savegame_uses_resolved_savegame(request_factory, user, django_assert_num_queries):
+    """Test get_active_savegame returns the savegame which was already resolved for the request."""
+    savegame = SavegameFactory(user=user, is_active=True)
+    request = request_factory.get("/")
+    request.user = user
+    request._cached_savegame = savegame
+
+    with django_assert_num_queries(0):
+        assert get_active_savegame(request=request) is savegame
+
+
+@pytest.mark.django_db
+def test_get_active_savegame_anonymous_user(request_factory, django_assert_num_queries):
+    """Test get_active_savegame returns None without querying for anonymous users."""
+    request = request_factory.get("/")
+    request.user = AnonymousUser()
+
+    with django_assert_num_queries(0):
+        assert get_active_savegame(request=request) is None
+
+
+def test_get_active_savegame_without_user(request_factory):
+    """Test get_active_savegame returns None for requests without a user."""
+    request = request_factory.get("/")
+
+    assert get_active_savegame(request=request) is None
@@ -27,7 +27,7 @@ class SavegameCreateView(generic.CreateView):
         self.object = form.save()
 
         # Generate coat of arms
-        coat_service = CoatOfArmsGeneratorService()
+        coat_service = CoatOfArmsGeneratorService(rng=self.object.get_random(stream="coat_of_arms"))
         temp_path = Path(f"temp_coat_of_arms_{self.object.id}.svg")
         coat_service.process(output_path=temp_path)
 
@@ -1,5 +1,11 @@
+import copy
+
 import pytest
 from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+
+from apps.core.caching.process_cache import SHARED_CACHE_ALIAS
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -11,6 +17,25 @@ def _fast_password_hasher(django_db_setup, django_db_blocker):
         ]
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _shared_cache_location(tmp_path_factory):
+    """
+    Keep the shared file cache of the tests apart from the one of the local installation.
+    The version of in-memory reference data is checked on every access, since the caches are cleared after each test.
+    """
+    cache_settings = copy.deepcopy(settings.CACHES)
+    cache_settings[SHARED_CACHE_ALIAS]["LOCATION"] = tmp_path_factory.mktemp("shared-cache")
+    with override_settings(CACHES=cache_settings, PROCESS_CACHE_VERSION_CHECK_INTERVAL=0):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with empty caches, since savegame ids are reused between tests."""
+    for cache in caches.all():
+        cache.clear()
+
+
 @pytest.fixture
 def client():
     """Provide Django test client."""